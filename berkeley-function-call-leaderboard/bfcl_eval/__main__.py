@@ -11,6 +11,7 @@ from bfcl_eval.constants.category_mapping import TEST_COLLECTION_MAPPING
 from bfcl_eval.constants.eval_config import (
     DOTENV_PATH,
     PROJECT_ROOT,
+    RESULT_FILE_PATTERN,
     RESULT_PATH,
     SCORE_PATH,
 )
@@ -29,6 +30,8 @@ class ExecutionOrderGroup(typer.core.TyperGroup):
             "results",
             "evaluate",
             "scores",
+            "profile",
+            "serve",
             "version",
         ]
 
@@ -148,6 +151,41 @@ def generate(
         "--run-ids",
         help="If true, also run the test entry mentioned in the test_case_ids_to_generate.json file, in addition to the --test_category argument.",
     ),
+    batch_api: bool = typer.Option(
+        False,
+        "--batch-api",
+        help="Send the single-turn test cases through the provider's batch API (cheaper, but results can take up to 24h); multi-turn and agentic test cases still run one request at a time. Only supported by OpenAI-style handlers.",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Stream the model responses to record the time to first token and the decode speed (output tokens/s) of each request, next to the total latency. Supported by the OpenAI-compatible, Claude, Gemini and locally-hosted model handlers.",
+    ),
+    pipeline: bool = typer.Option(
+        False,
+        "--pipeline",
+        help="Run the multi-turn test cases as pipelined state machines on shared thread pools: the CPU work of a test case (parsing, decoding, backend execution, prompt rendering) overlaps with the model requests of the others, and --num-threads bounds the requests in flight rather than the test cases.",
+    ),
+    pipeline_cpu_threads: Optional[int] = typer.Option(
+        None,
+        "--pipeline-cpu-threads",
+        help="With --pipeline, the number of threads running the CPU work. Defaults to the number of CPUs + 4 (at most 32), as the backend execution can also wait on the network.",
+    ),
+    trace_file: Optional[str] = typer.Option(
+        None,
+        "--trace-file",
+        help="Write a Chrome trace of the inference phases (pre-processing, prompt rendering, network request, decode, backend execution, ...) to this file; open it in chrome://tracing or ui.perfetto.dev.",
+    ),
+    metrics_port: Optional[int] = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve the duration histograms of the inference phases for Prometheus on this port, at /metrics.",
+    ),
+    otlp_endpoint: Optional[str] = typer.Option(
+        None,
+        "--otlp-endpoint",
+        help="Send the inference phase spans to this OTLP/HTTP endpoint (eg. http://localhost:4318/v1/traces). Requires opentelemetry-sdk and opentelemetry-exporter-otlp-proto-http.",
+    ),
 ):
     """
     Generate the LLM response for one or more models on a test-category (same as openfunctions_evaluation.py).
@@ -168,6 +206,13 @@ def generate(
         result_dir=result_dir,
         allow_overwrite=allow_overwrite,
         run_ids=run_ids,
+        batch_api=batch_api,
+        stream=stream,
+        pipeline=pipeline,
+        pipeline_cpu_threads=pipeline_cpu_threads,
+        trace_file=trace_file,
+        metrics_port=metrics_port,
+        otlp_endpoint=otlp_endpoint,
     )
     load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
     generation_main(args)
@@ -316,5 +361,303 @@ def scores(
         print(f"\nFile {file} not found.\n")
 
 
+@cli.command()
+def profile(
+    model: str = typer.Option(
+        "bfcl-mock-model",
+        help="The model to run under the profiler. The default mock model replays the ground truth from a local server, so only the harness itself is profiled.",
+    ),
+    test_category: List[str] = typer.Option(
+        ["single_turn", "multi_turn"],
+        help="A list of test categories to profile. Use commas to separate multiple test categories.",
+        callback=handle_multiple_input,
+    ),
+    stage: List[str] = typer.Option(
+        ["generate", "evaluate"],
+        help="The stages to profile, `generate` and/or `evaluate`. Use commas to separate them.",
+        callback=handle_multiple_input,
+    ),
+    profiler: str = typer.Option(
+        "sampling",
+        help="`sampling` samples the stacks of all threads at a fixed interval; `cprofile` records every function call (exact call counts, higher overhead).",
+    ),
+    interval: float = typer.Option(
+        0.005, help="The time between two stack samples, in seconds (sampling profiler only)."
+    ),
+    clock: str = typer.Option(
+        "cpu",
+        help="`cpu` weights each stack sample by the CPU time of its thread, to see what the harness computes; `wall` by the elapsed time, to also see where the threads wait (sampling profiler only).",
+    ),
+    num_threads: Optional[int] = typer.Option(None, help="The number of threads to use."),
+    output_dir: str = typer.Option(
+        "profile",
+        "--output-dir",
+        help="Path to the folder where the profiles, summary and the results of the profiled run will be stored; Path should be relative to the `berkeley-function-call-leaderboard` root folder",
+    ),
+    baseline: Optional[str] = typer.Option(
+        None,
+        "--baseline",
+        help="Path to the `profile_summary.json` of a previous run; exit with a non-zero code if the time per entry of a subsystem regressed.",
+    ),
+    tolerance: float = typer.Option(
+        1.5,
+        help="Report a regression when the time per entry of a subsystem exceeds the baseline by this factor.",
+    ),
+):
+    """
+    Profile generation and/or evaluation, and summarize where the harness spends its time per subsystem (ast_checker, multi_turn_utils, parsers, func_source_code, handlers, utils I/O, ...).
+    """
+    import json
+    import time
+
+    from bfcl_eval.profiling import (
+        build_stage_summary,
+        compare_with_baseline,
+        count_result_entries,
+        create_profiler,
+        format_stage_summary,
+    )
+
+    if model not in MODEL_CONFIG_MAPPING:
+        raise typer.BadParameter(f"Unknown model_name '{model}'.")
+    for stage_name in stage:
+        if stage_name not in ("generate", "evaluate"):
+            raise typer.BadParameter(
+                f"Unknown stage '{stage_name}'. Choose from 'generate' or 'evaluate'."
+            )
+    load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
+
+    output_path = (PROJECT_ROOT / output_dir).resolve()
+    result_dir = output_path / "result"
+    score_dir = output_path / "score"
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    stage_runners = {
+        "generate": lambda: generation_main(
+            SimpleNamespace(
+                model=[model],
+                test_category=test_category,
+                temperature=0.001,
+                include_input_log=False,
+                exclude_state_log=False,
+                num_gpus=1,
+                num_threads=num_threads,
+                gpu_memory_utilization=0.9,
+                backend="sglang",
+                skip_server_setup=False,
+                local_model_path=None,
+                result_dir=str(result_dir),
+                allow_overwrite=True,
+                run_ids=False,
+                batch_api=False,
+                stream=False,
+                pipeline=False,
+                pipeline_cpu_threads=None,
+                trace_file=None,
+                metrics_port=None,
+                otlp_endpoint=None,
+            )
+        ),
+        "evaluate": lambda: evaluation_main(
+            [model], test_category, str(result_dir), str(score_dir), True
+        ),
+    }
+
+    summary = {}
+    for stage_name in ["generate", "evaluate"]:
+        if stage_name not in stage:
+            continue
+        stage_profiler = create_profiler(profiler, interval, clock)
+        start_time = time.perf_counter()
+        stage_profiler.start()
+        try:
+            stage_runners[stage_name]()
+        finally:
+            stage_profiler.stop()
+        wall_seconds = time.perf_counter() - start_time
+
+        profile_file = stage_profiler.write(output_path / f"{stage_name}_profile")
+        entry_count = count_result_entries(
+            result_dir / model.replace("/", "_"), RESULT_FILE_PATTERN
+        )
+        summary[stage_name] = build_stage_summary(
+            stage_profiler.summarize(), entry_count, wall_seconds
+        )
+        profiler_description = stage_profiler.name
+        if hasattr(stage_profiler, "clock"):
+            profiler_description += f" ({stage_profiler.clock} clock)"
+        print(
+            f"\n📊 {stage_name}: {entry_count} entries in {wall_seconds:.1f}s, profiled with {profiler_description}. Profile written to {profile_file}"
+        )
+        print(
+            tabulate(
+                format_stage_summary(summary[stage_name]),
+                headers=[
+                    "Subsystem",
+                    "Self (s)",
+                    "Self (%)",
+                    "Inclusive (s)",
+                    "Self per entry (ms)",
+                ],
+                tablefmt="pretty",
+                colalign=("left", "right", "right", "right", "right"),
+            )
+        )
+
+    summary_file = output_path / "profile_summary.json"
+    with open(summary_file, "w") as f:
+        json.dump(
+            {
+                "metadata": {
+                    "timestamp": datetime.now().isoformat(timespec="seconds"),
+                    "model": model,
+                    "test_category": test_category,
+                    "profiler": profiler,
+                    "interval": interval,
+                    "clock": clock,
+                    "num_threads": num_threads,
+                },
+                "results": summary,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Summary saved to {summary_file}")
+
+    if baseline:
+        with open(baseline) as f:
+            baseline_summary = json.load(f)["results"]
+        regressions = compare_with_baseline(summary, baseline_summary, tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) compared to {baseline}:")
+            for regression in regressions:
+                print(f"    {regression}")
+            raise typer.Exit(code=1)
+        print(f"✅ No regression compared to {baseline}.")
+
+
+serve_cli = typer.Typer(
+    context_settings=dict(help_option_names=["-h", "--help"]),
+    no_args_is_help=True,
+    help="Manage persistent vLLM/SGLang model servers, which `bfcl generate` reuses instead of loading the weights again.",
+)
+cli.add_typer(serve_cli, name="serve")
+
+
+@serve_cli.command("start")
+def serve_start(
+    model: str = typer.Option(..., help="The name of the (locally-hosted) model to serve."),
+    num_gpus: int = typer.Option(1, help="The number of GPUs to use."),
+    gpu_memory_utilization: float = typer.Option(0.9, help="The GPU memory utilization."),
+    backend: str = typer.Option("sglang", help="The backend to use for the model."),
+    local_model_path: Optional[str] = typer.Option(
+        None,
+        "--local-model-path",
+        help="Specify the path to a local directory containing the model's config/tokenizer/weights for fully offline inference.",
+    ),
+    wait: bool = typer.Option(
+        True, "--wait/--no-wait", help="Wait until the server is ready before returning."
+    ),
+):
+    """
+    Start a model server in the background and keep it running across `bfcl generate` runs. The server is reused when `bfcl generate` is run with the same model and settings.
+    """
+    from bfcl_eval._llm_response_generation import build_handler
+    from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+    from bfcl_eval.model_handler.local_inference.server_manager import (
+        LocalServerSpec,
+        start_persistent_server,
+    )
+
+    if model not in MODEL_CONFIG_MAPPING:
+        raise typer.BadParameter(f"Unknown model_name '{model}'.")
+    load_dotenv(dotenv_path=DOTENV_PATH, verbose=True, override=True)  # Load the .env file
+    handler = build_handler(model, 0.001)
+    if not isinstance(handler, OSSHandler):
+        raise typer.BadParameter(f"{model} is not a locally-hosted model.")
+
+    spec = LocalServerSpec(
+        backend=getattr(handler, "server_backend", backend),
+        model_path_or_id=(
+            local_model_path
+            if local_model_path is not None
+            else handler.model_name_huggingface
+        ),
+        port=int(handler.local_server_port),
+        dtype=str(handler.dtype),
+        num_gpus=num_gpus,
+        gpu_memory_utilization=gpu_memory_utilization,
+    )
+    record = start_persistent_server(spec, handler.base_url, wait=wait)
+    print(
+        f"Serving {spec.model_path_or_id} with {spec.backend} on port {spec.port} (pid {record['pid']}). Logs: {record['log_file']}"
+    )
+
+
+@serve_cli.command("stop")
+def serve_stop(
+    port: Optional[int] = typer.Option(
+        None, help="The port of the server to stop. Stop all recorded servers if not set."
+    ),
+):
+    """
+    Stop model servers started with `bfcl serve start`.
+    """
+    from bfcl_eval.model_handler.local_inference.server_manager import (
+        list_server_records,
+        stop_persistent_server,
+    )
+
+    ports = (
+        [port]
+        if port is not None
+        else [record["spec"]["port"] for record in list_server_records()]
+    )
+    for server_port in ports:
+        if stop_persistent_server(server_port):
+            print(f"Stopped the server on port {server_port}.")
+        else:
+            print(f"No server started with `bfcl serve start` was found on port {server_port}.")
+
+
+@serve_cli.command("status")
+def serve_status():
+    """
+    List the model servers started with `bfcl serve start`.
+    """
+    from bfcl_eval.model_handler.local_inference.server_manager import (
+        get_served_model_ids,
+        is_process_alive,
+        list_server_records,
+    )
+
+    rows = []
+    for record in list_server_records():
+        if not is_process_alive(record["pid"]):
+            status = "exited"
+        elif get_served_model_ids(record["base_url"]) is None:
+            status = "starting"
+        else:
+            status = "ready"
+        spec = record["spec"]
+        rows.append(
+            (
+                spec["port"],
+                spec["model_path_or_id"],
+                spec["backend"],
+                record["pid"],
+                status,
+                datetime.fromtimestamp(record["started_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        )
+    print(
+        tabulate(
+            rows,
+            headers=["Port", "Model", "Backend", "PID", "Status", "Started at"],
+            tablefmt="pretty",
+        )
+    )
+
+
 if __name__ == "__main__":
     cli()
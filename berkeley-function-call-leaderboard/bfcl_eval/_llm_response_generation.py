@@ -8,9 +8,10 @@ from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import threading
 import queue
 from copy import deepcopy
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from bfcl_eval.constants.eval_config import (
+    BATCH_API_WORK_PATH,
     PROJECT_ROOT,
     RESULT_PATH,
     TEST_IDS_TO_GENERATE_PATH,
@@ -19,11 +20,27 @@ from bfcl_eval.constants.eval_config import (
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
 from bfcl_eval.eval_checker.eval_runner_helper import load_file
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.batch_api import (
+    build_batch_request_line,
+    run_batch_requests,
+)
+from bfcl_eval.model_handler.http_transport import (
+    SHARED_HTTP_TRANSPORT,
+    configure_http_transport,
+)
+from bfcl_eval.model_handler.local_inference.server_manager import LOCAL_SERVER_POOL
+from bfcl_eval.model_handler.local_inference.server_metrics import (
+    compute_prefix_cache_hit_rate,
+)
+from bfcl_eval.model_handler.pipeline import PipelinedInferenceExecutor
+from bfcl_eval.model_handler.tracing import TRACER, configure_tracing, trace_span
 from bfcl_eval.utils import *
 from tqdm import tqdm
 
 from bfcl_eval.model_handler.base_handler import BaseHandler
-from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+
+if TYPE_CHECKING:
+    from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
 
 
 def get_args():
@@ -39,17 +56,60 @@ def get_args():
     parser.add_argument("--exclude-state-log", action="store_true", default=False)
     parser.add_argument("--num-threads", required=False, type=int)
     parser.add_argument("--num-gpus", default=1, type=int)
-    parser.add_argument("--backend", default="sglang", type=str, choices=["vllm", "sglang"])
+    parser.add_argument("--backend", default="sglang", type=str, choices=["vllm", "sglang", "mock"])
     parser.add_argument("--gpu-memory-utilization", default=0.9, type=float)
     parser.add_argument("--result-dir", default=None, type=str)
     parser.add_argument("--run-ids", action="store_true", default=False)
     parser.add_argument("--allow-overwrite", "-o", action="store_true", default=False)
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        default=False,
+        help="Send the single-turn test cases through the provider's batch API instead of one request at a time.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="Stream the model responses to record the time to first token and the decode speed of each request.",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        default=False,
+        help="Run the multi-turn test cases as pipelined state machines on shared thread pools, overlapping their CPU work with the model requests of other test cases.",
+    )
+    parser.add_argument(
+        "--pipeline-cpu-threads",
+        type=int,
+        default=None,
+        help="With --pipeline, the number of threads running the CPU work (parsing, decoding, backend execution, prompt rendering).",
+    )
     parser.add_argument(
         "--skip-server-setup",
         action="store_true",
         default=False,
         help="Skip vLLM/SGLang server setup and use existing endpoint specified by the LOCAL_SERVER_ENDPOINT and LOCAL_SERVER_PORT environment variables.",
     )
+    # Tracing of the inference phases, see `bfcl_eval.model_handler.tracing`
+    parser.add_argument(
+        "--trace-file",
+        type=str,
+        default=None,
+        help="Write a Chrome trace of the inference phases to this file (open it in chrome://tracing or ui.perfetto.dev).",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve the duration histograms of the inference phases for Prometheus on this port.",
+    )
+    parser.add_argument(
+        "--otlp-endpoint",
+        type=str,
+        default=None,
+        help="Send the inference phase spans to this OTLP/HTTP endpoint (eg. http://localhost:4318/v1/traces).",
+    )
     # Optional local model path
     parser.add_argument(
         "--local-model-path",
@@ -64,7 +124,7 @@ def get_args():
 
 def build_handler(model_name, temperature):
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler = config.model_handler(
+    handler = config.get_model_handler()(
         model_name=config.model_name,
         temperature=temperature,
         registry_name=model_name,
@@ -172,25 +232,14 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
     assert type(test_case["function"]) is list
 
     try:
-        result, metadata = handler.inference(
-            deepcopy(test_case), include_input_log, exclude_state_log
-        )
+        with trace_span(
+            "inference", model=handler.registry_name, test_entry_id=test_case["id"]
+        ):
+            result, metadata = handler.inference(
+                deepcopy(test_case), include_input_log, exclude_state_log
+            )
     except Exception as e:
-        # This is usually the case when the model getting stuck on one particular test case.
-        # For example, timeout error or FC model returning invalid JSON response.
-        # Since temperature is already set to 0.001, retrying the same test case will not help.
-        # So we continue the generation process and record the error message as the model response
-        error_block = (
-            "-" * 100
-            + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
-            + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
-            + traceback.format_exc(limit=10)
-            + "-" * 100
-        )
-        tqdm.write(error_block)
-
-        result = f"Error during inference: {str(e)}"
-        metadata = {"traceback": traceback.format_exc()}
+        result, metadata = _handle_inference_error(test_case, e)
 
     result_to_write = {
         "id": test_case["id"],
@@ -201,24 +250,231 @@ def multi_threaded_inference(handler, test_case, include_input_log, exclude_stat
     return result_to_write
 
 
+def pipelined_inference(
+    executor: PipelinedInferenceExecutor,
+    handler,
+    test_case,
+    include_input_log,
+    exclude_state_log,
+) -> Future:
+    """
+    Same as `multi_threaded_inference`, but run on the shared pools of `executor`; returns a future of the result to write.
+    """
+    assert type(test_case["function"]) is list
+
+    if not contain_multi_turn_interaction(test_case["id"]):
+        # A single model request, there is no CPU work of this test case to overlap it with
+        return executor.submit_blocking(
+            multi_threaded_inference, handler, test_case, include_input_log, exclude_state_log
+        )
+
+    result_future = Future()
+
+    def _on_done(inference_future: Future):
+        try:
+            result, metadata = inference_future.result()
+        except Exception as e:
+            result, metadata = _handle_inference_error(test_case, e)
+        result_future.set_result({"id": test_case["id"], "result": result, **metadata})
+
+    executor.submit_steps(
+        lambda: handler.inference_steps(
+            deepcopy(test_case), include_input_log, exclude_state_log
+        ),
+        model=handler.registry_name,
+        test_entry_id=test_case["id"],
+    ).add_done_callback(_on_done)
+
+    return result_future
+
+
+def _handle_inference_error(test_case, e: Exception) -> tuple[str, dict]:
+    """
+    Report an inference error and return the `(result, metadata)` recorded for the test case. Must be called from the `except` block that caught `e`.
+    """
+    # This is usually the case when the model getting stuck on one particular test case.
+    # For example, timeout error or FC model returning invalid JSON response.
+    # Since temperature is already set to 0.001, retrying the same test case will not help.
+    # So we continue the generation process and record the error message as the model response
+    error_block = (
+        "-" * 100
+        + "\n❗️❗️ Error occurred during inference. Continuing to next test case.\n"
+        + f"❗️❗️ Test case ID: {test_case['id']}, Error: {str(e)}\n"
+        + traceback.format_exc(limit=10)
+        + "-" * 100
+    )
+    tqdm.write(error_block)
+
+    result = f"Error during inference: {str(e)}"
+    metadata = {"traceback": traceback.format_exc()}
+    return result, metadata
+
+
+def batch_api_inference(handler, test_cases_total, include_input_log, write_queue):
+    """
+    Run the single-turn test cases through the provider's batch API, and hand their results to `write_queue` like the threaded inference does.
+
+    Returns:
+        list: The test cases left for the regular inference: multi-turn/agentic ones, those involved in a dependency, and those the batch did not run (eg. because it expired).
+    """
+    if not handler.supports_batch_api():
+        tqdm.write(
+            f"⚠️ Warning: {handler.registry_name} does not support the batch API. Falling back to regular inference."
+        )
+        return test_cases_total
+
+    depended_on = {
+        dependency_id
+        for test_case in test_cases_total
+        for dependency_id in test_case.get("depends_on", [])
+    }
+    remaining_test_cases = []
+    request_lines = []
+    inference_data_of = {}
+    for test_case in test_cases_total:
+        if (
+            contain_multi_turn_interaction(test_case["id"])
+            or test_case.get("depends_on")
+            or test_case["id"] in depended_on
+        ):
+            remaining_test_cases.append(test_case)
+            continue
+        body, inference_data_of[test_case["id"]] = handler.build_batch_request(
+            deepcopy(test_case)
+        )
+        request_lines.append(
+            build_batch_request_line(test_case["id"], handler._batch_api_endpoint(), body)
+        )
+
+    if not request_lines:
+        return remaining_test_cases
+
+    tqdm.write(
+        f"📦 Sending {len(request_lines)} single-turn test cases for {handler.registry_name} through the batch API."
+    )
+    try:
+        results, batch_id_of = run_batch_requests(
+            handler.client,
+            request_lines,
+            handler._batch_api_endpoint(),
+            BATCH_API_WORK_PATH / handler.registry_dir_name,
+        )
+    except Exception as e:
+        tqdm.write(
+            f"⚠️ Warning: The batch API failed for {handler.registry_name} ({e}). Falling back to regular inference."
+        )
+        return test_cases_total
+
+    id_to_test_case = {test_case["id"]: test_case for test_case in test_cases_total}
+    for request_line in request_lines:
+        test_case_id = request_line["custom_id"]
+        if test_case_id not in results:
+            remaining_test_cases.append(id_to_test_case[test_case_id])
+            continue
+
+        batch_result = results[test_case_id]
+        if "error" in batch_result:
+            result = f"Error during inference: {batch_result['error']}"
+            metadata = {"traceback": batch_result["error"]}
+        else:
+            try:
+                result, metadata = handler.ingest_batch_response(
+                    inference_data_of[test_case_id], batch_result["body"], include_input_log
+                )
+            except Exception as e:
+                result = f"Error during inference: {str(e)}"
+                metadata = {"traceback": traceback.format_exc()}
+        metadata["batch_id"] = batch_id_of[test_case_id]
+        write_queue.put({"id": test_case_id, "result": result, **metadata})
+
+    if len(remaining_test_cases) > 0:
+        tqdm.write(
+            f"📦 Batch API done; {len(remaining_test_cases)} test cases left for regular inference."
+        )
+    return remaining_test_cases
+
+
+class PrefixGroupedReadyQueue:
+    """
+    Ready queue of test case ids that hands out test cases sharing the same prompt prefix back to back.
+
+    Test cases are grouped by `key_fn`; groups are served in the order they first became ready, and within a group test cases keep their ready order.
+    This keeps requests that share a long system prompt and function docs close together in time, which lets the model server reuse its prefix cache instead of evicting it between them.
+    It exposes the same `append` / `popleft` interface as the `deque` used otherwise.
+    """
+
+    def __init__(self, test_case_ids, key_fn):
+        self._key_fn = key_fn
+        # prefix key -> ready test case ids; dicts keep insertion order, so groups are served first-come, first-served
+        self._groups: dict[Any, deque] = {}
+        self._size = 0
+        for test_case_id in test_case_ids:
+            self.append(test_case_id)
+
+    def append(self, test_case_id) -> None:
+        key = self._key_fn(test_case_id)
+        if key not in self._groups:
+            self._groups[key] = deque()
+        self._groups[key].append(test_case_id)
+        self._size += 1
+
+    def popleft(self):
+        key = next(iter(self._groups))
+        group = self._groups[key]
+        test_case_id = group.popleft()
+        if not group:
+            del self._groups[key]
+        self._size -= 1
+        return test_case_id
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def _make_prompt_prefix_key_fn(handler: "OSSHandler", id_to_test_case: dict):
+    def key_fn(test_case_id):
+        try:
+            return handler.prompt_prefix_key(id_to_test_case[test_case_id])
+        except Exception:
+            # Grouping is only an optimization, entries whose prefix can't be computed are kept in their own group
+            return test_case_id
+
+    return key_fn
+
+
 def generate_results(args, model_name, test_cases_total):
+    # Imported here as it pulls in the OpenAI SDK, which is not needed for the other CLI commands
+    from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+
     handler = build_handler(model_name, args.temperature)
+    if args.stream:
+        if handler.supports_streaming():
+            handler.streaming = True
+        else:
+            tqdm.write(
+                f"⚠️ Warning: {handler.registry_name} does not support streaming. Only the total latency of each request will be recorded."
+            )
 
     if isinstance(handler, OSSHandler):
         handler: OSSHandler
         is_oss_model = True
         # For OSS models, if the user didn't explicitly set the number of threads,
-        # we default to 100 threads to speed up the inference.
+        # we default to 100 threads per endpoint (or the per-endpoint caps, when set) to speed up the inference.
         num_threads = (
             args.num_threads
             if args.num_threads is not None
-            else LOCAL_SERVER_MAX_CONCURRENT_REQUEST
+            else handler.endpoint_pool.total_capacity
+            or LOCAL_SERVER_MAX_CONCURRENT_REQUEST * len(handler.endpoint_pool)
         )
     else:
         handler: BaseHandler
         is_oss_model = False
         num_threads = args.num_threads if args.num_threads is not None else 1
 
+    # Size the shared HTTP connection pool so that no thread has to wait for a connection
+    configure_http_transport(num_threads)
+    http_stats_before = SHARED_HTTP_TRANSPORT.stats()
+
     # Use a separate thread to write the results to the file to avoid concurrent IO issues
     def _writer():
         """Consume result dicts from the queue and write them with exclusive access."""
@@ -226,7 +482,8 @@ def generate_results(args, model_name, test_cases_total):
             item = write_queue.get()
             if item is None:
                 break
-            handler.write(item, result_dir=args.result_dir, update_mode=args.run_ids)
+            with trace_span("result_write", test_entry_id=item["id"]):
+                handler.write(item, result_dir=args.result_dir, update_mode=args.run_ids)
             write_queue.task_done()
 
     write_queue: queue.Queue = queue.Queue()
@@ -244,6 +501,11 @@ def generate_results(args, model_name, test_cases_total):
                 local_model_path=args.local_model_path,
             )
 
+        if args.batch_api:
+            test_cases_total = batch_api_inference(
+                handler, test_cases_total, args.include_input_log, write_queue
+            )
+
         # ───── dependency bookkeeping ──────────────────────────────
         dependencies = {
             test_case["id"]: set(test_case.get("depends_on", []))
@@ -256,17 +518,51 @@ def generate_results(args, model_name, test_cases_total):
 
         id_to_test_case = {test_case["id"]: test_case for test_case in test_cases_total}
 
-        ready_queue = deque(
-            [
-                test_case_id
-                for test_case_id, dependency_ids in dependencies.items()
-                if not dependency_ids
-            ]
-        )
+        initially_ready_ids = [
+            test_case_id
+            for test_case_id, dependency_ids in dependencies.items()
+            if not dependency_ids
+        ]
+        if is_oss_model:
+            # Send entries that share a prompt prefix together, to make the best use of the local server's prefix cache
+            ready_queue = PrefixGroupedReadyQueue(
+                initially_ready_ids,
+                _make_prompt_prefix_key_fn(handler, id_to_test_case),
+            )
+            prefix_cache_stats_before = handler.read_prefix_cache_stats()
+        else:
+            ready_queue = deque(initially_ready_ids)
         in_flight: dict[Future, str] = {}  # future -> test_case_id
         completed = set()
 
-        with ThreadPoolExecutor(max_workers=num_threads) as pool, tqdm(
+        if args.pipeline:
+            # `num_threads` bounds the model requests in flight; more test cases are active, so that some are always ready to send one
+            pool = PipelinedInferenceExecutor(num_threads, args.pipeline_cpu_threads)
+            max_in_flight = pool.max_active_test_entries
+
+            def submit_inference(test_case):
+                return pipelined_inference(
+                    pool,
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                )
+
+        else:
+            pool = ThreadPoolExecutor(max_workers=num_threads)
+            max_in_flight = num_threads
+
+            def submit_inference(test_case):
+                return pool.submit(
+                    multi_threaded_inference,
+                    handler,
+                    test_case,
+                    args.include_input_log,
+                    args.exclude_state_log,
+                )
+
+        with pool, tqdm(
             total=len(test_cases_total),
             desc=f"Generating results for {model_name}",
             position=0,         
@@ -278,16 +574,10 @@ def generate_results(args, model_name, test_cases_total):
         ) as pbar:
 
             # seed initial ready tasks
-            while ready_queue and len(in_flight) < num_threads:
+            while ready_queue and len(in_flight) < max_in_flight:
                 test_case_id = ready_queue.popleft()
                 test_case = id_to_test_case[test_case_id]
-                future = pool.submit(
-                    multi_threaded_inference,
-                    handler,
-                    test_case,
-                    args.include_input_log,
-                    args.exclude_state_log,
-                )
+                future = submit_inference(test_case)
                 in_flight[future] = test_case_id
 
             # main scheduler loop
@@ -298,7 +588,8 @@ def generate_results(args, model_name, test_cases_total):
                     result_dict = future.result()
 
                     # Enqueue the result for the writer thread to handle file IO
-                    write_queue.put(result_dict)
+                    with trace_span("writer_enqueue", test_entry_id=test_case_id):
+                        write_queue.put(result_dict)
 
                     # Update progress bar right after inference completes
                     pbar.update()
@@ -310,19 +601,24 @@ def generate_results(args, model_name, test_cases_total):
                         if not dependencies[child_id]:
                             ready_queue.append(child_id)
 
-                # refill the pool up to max_workers
-                while ready_queue and len(in_flight) < num_threads:
+                # refill the pool up to max_in_flight
+                while ready_queue and len(in_flight) < max_in_flight:
                     test_case_id = ready_queue.popleft()
                     test_case = id_to_test_case[test_case_id]
-                    future = pool.submit(
-                        multi_threaded_inference,
-                        handler,
-                        test_case,
-                        args.include_input_log,
-                        args.exclude_state_log,
-                    )
+                    future = submit_inference(test_case)
                     in_flight[future] = test_case_id
 
+        if is_oss_model:
+            prefix_cache_hit_rate = compute_prefix_cache_hit_rate(
+                prefix_cache_stats_before, handler.read_prefix_cache_stats()
+            )
+            if prefix_cache_hit_rate is not None:
+                tqdm.write(f"🗄️ Server prefix cache hit rate: {prefix_cache_hit_rate:.2%}")
+
+        http_stats = SHARED_HTTP_TRANSPORT.format_stats(since=http_stats_before)
+        if http_stats is not None:
+            tqdm.write(f"🔌 HTTP connection reuse: {http_stats}")
+
     finally:
         # Signal writer thread to finish and wait for it
         write_queue.put(None)
@@ -380,20 +676,38 @@ def main(args):
     else:
         args.result_dir = RESULT_PATH
 
-    for model_name in args.model:
-        test_cases_total = collect_test_cases(
-            args,
-            model_name,
-            all_test_categories,
-            all_test_entries_involved,
-        )
+    configure_tracing(
+        trace_file=args.trace_file,
+        metrics_port=args.metrics_port,
+        otlp_endpoint=args.otlp_endpoint,
+    )
 
-        if len(test_cases_total) == 0:
-            tqdm.write(
-                f"✅ All selected test cases have been previously generated for {model_name}. No new test cases to generate."
+    try:
+        for model_name in args.model:
+            test_cases_total = collect_test_cases(
+                args,
+                model_name,
+                all_test_categories,
+                all_test_entries_involved,
             )
-        else:
-            generate_results(args, model_name, test_cases_total)
-            # Sort the result files by id at the end
-            for model_result_json in args.result_dir.rglob(RESULT_FILE_PATTERN):
-                sort_file_content_by_id(model_result_json)
+
+            if len(test_cases_total) == 0:
+                tqdm.write(
+                    f"✅ All selected test cases have been previously generated for {model_name}. No new test cases to generate."
+                )
+            else:
+                generate_results(args, model_name, test_cases_total)
+                # Sort the result files by id at the end
+                for model_result_json in args.result_dir.rglob(RESULT_FILE_PATTERN):
+                    sort_file_content_by_id(model_result_json)
+    finally:
+        # Local model servers are kept warm between models that share the same weights; stop them once all models are done
+        LOCAL_SERVER_POOL.shutdown_all()
+
+        if TRACER.enabled:
+            phase_summary = TRACER.phase_stats.format_summary()
+            if phase_summary is not None:
+                tqdm.write(f"⏱️ Time spent in each phase:\n{phase_summary}")
+            TRACER.close()
+            if args.trace_file:
+                tqdm.write(f"📈 Chrome trace written to {args.trace_file}")
@@ -68,6 +68,9 @@ COLUMNS_OVERALL = [
     "Latency Mean (s)",
     "Latency Standard Deviation (s)",
     "Latency 95th Percentile (s)",
+    "Time to First Token Mean (s)",
+    "Time to First Token 95th Percentile (s)",
+    "Output Tokens per Second Mean",
     "Non-Live AST Acc",
     "Non-Live Simple AST",
     "Non-Live Multiple AST",
@@ -33,6 +33,19 @@ FORMAT_SENSITIVITY_IDS_PATH = PROMPT_PATH / f"{VERSION_PREFIX}_format_sensitivit
 
 RESULT_FILE_PATTERN = f"{VERSION_PREFIX}_*_result.json"
 
+# Process-wide caches that are safe to reuse across runs (e.g. text embeddings)
+CACHE_PATH = Path(os.getenv("BFCL_CACHE_DIR", PROJECT_ROOT / ".cache"))
+EMBEDDING_CACHE_PATH = CACHE_PATH / "embedding"
+# Records of the model servers started with `bfcl serve start`, one JSON file per port
+LOCAL_SERVER_REGISTRY_PATH = CACHE_PATH / "local_servers"
+# Input and output files of the batches submitted by `bfcl generate --batch-api`, kept for inspection
+BATCH_API_WORK_PATH = CACHE_PATH / "batch_api"
+
+# Recorded web search responses, used by `WebSearchAPI` in record/replay mode (see BFCL_WEB_SEARCH_MODE)
+WEB_SEARCH_CORPUS_PATH = Path(
+    os.getenv("BFCL_WEB_SEARCH_CORPUS_DIR", PROJECT_ROOT / "web_search_corpus")
+)
+
 RED_FONT = "\033[91m"
 RESET = "\033[0m"
 
@@ -1,3 +1,5 @@
+import os
+
 MULTI_TURN_FUNC_DOC_FILE_MAPPING = {
     "GorillaFileSystem": "gorilla_file_system.json",
     "MathAPI": "math_api.json",
@@ -44,3 +46,7 @@ OMIT_STATE_INFO_CLASSES = [
     "MemoryAPI_rec_sum",
     "WebSearchAPI",
 ]
+
+# Maximum number of read-only calls of one model step executed concurrently (see `func_source_code/method_annotations.py`)
+# Set to 1 to execute every call sequentially
+MAX_CONCURRENT_READ_ONLY_CALLS = int(os.getenv("BFCL_MAX_CONCURRENT_READ_ONLY_CALLS", "8"))
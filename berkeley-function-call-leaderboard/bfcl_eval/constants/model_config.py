@@ -1,69 +1,15 @@
+import importlib
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Type
 
-from bfcl_eval.model_handler.api_inference.claude import ClaudeHandler
-from bfcl_eval.model_handler.api_inference.cohere import CohereHandler
-from bfcl_eval.model_handler.api_inference.deepseek import DeepSeekAPIHandler
-from bfcl_eval.model_handler.api_inference.dm_cito import DMCitoHandler
-from bfcl_eval.model_handler.api_inference.fireworks import FireworksHandler
-from bfcl_eval.model_handler.api_inference.functionary import FunctionaryHandler
-from bfcl_eval.model_handler.api_inference.gemini import GeminiHandler
-from bfcl_eval.model_handler.api_inference.glm import GLMAPIHandler
-from bfcl_eval.model_handler.api_inference.gogoagent import GoGoAgentHandler
-from bfcl_eval.model_handler.api_inference.gorilla import GorillaHandler
-from bfcl_eval.model_handler.api_inference.grok import GrokHandler
-from bfcl_eval.model_handler.api_inference.kimi import KimiHandler
-from bfcl_eval.model_handler.api_inference.ling import LingAPIHandler
-from bfcl_eval.model_handler.api_inference.mining import MiningHandler
-from bfcl_eval.model_handler.api_inference.mistral import MistralHandler
-from bfcl_eval.model_handler.api_inference.nemotron import NemotronHandler
-from bfcl_eval.model_handler.api_inference.nova import NovaHandler
-from bfcl_eval.model_handler.api_inference.novita import NovitaHandler
-from bfcl_eval.model_handler.api_inference.nvidia import NvidiaHandler
-from bfcl_eval.model_handler.api_inference.openai_completion import (
-    OpenAICompletionsHandler,
-)
-from bfcl_eval.model_handler.api_inference.openai_response import OpenAIResponsesHandler
-from bfcl_eval.model_handler.api_inference.openrouter import OpenRouterHandler
-from bfcl_eval.model_handler.api_inference.qwen import (
-    QwenAgentNoThinkHandler,
-    QwenAgentThinkHandler,
-    QwenAPIHandler,
-)
-from bfcl_eval.model_handler.api_inference.writer import WriterHandler
-from bfcl_eval.model_handler.local_inference.arch import ArchHandler
-from bfcl_eval.model_handler.local_inference.bielik import BielikHandler
-from bfcl_eval.model_handler.local_inference.bitagent import BitAgentHandler
-from bfcl_eval.model_handler.local_inference.deepseek_reasoning import (
-    DeepseekReasoningHandler,
-)
-from bfcl_eval.model_handler.local_inference.falcon_fc import Falcon3FCHandler
-from bfcl_eval.model_handler.local_inference.gemma import GemmaHandler
-from bfcl_eval.model_handler.local_inference.glm import GLMHandler
-from bfcl_eval.model_handler.local_inference.granite import (
-    GraniteFunctionCallingHandler,
-)
-from bfcl_eval.model_handler.local_inference.granite_3 import Granite3FCHandler
-from bfcl_eval.model_handler.local_inference.hammer import HammerHandler
-from bfcl_eval.model_handler.local_inference.llama import LlamaHandler
-from bfcl_eval.model_handler.local_inference.llama_3_1 import LlamaHandler_3_1
-from bfcl_eval.model_handler.local_inference.minicpm import MiniCPMHandler
-from bfcl_eval.model_handler.local_inference.minicpm_fc import MiniCPMFCHandler
-from bfcl_eval.model_handler.local_inference.mistral_fc import MistralFCHandler
-from bfcl_eval.model_handler.local_inference.phi import PhiHandler
-from bfcl_eval.model_handler.local_inference.phi_fc import PhiFCHandler
-from bfcl_eval.model_handler.local_inference.quick_testing_oss import (
-    QuickTestingOSSHandler,
-)
-from bfcl_eval.model_handler.local_inference.qwen import QwenHandler
-from bfcl_eval.model_handler.local_inference.qwen_fc import QwenFCHandler
-from bfcl_eval.model_handler.local_inference.salesforce_llama import (
-    SalesforceLlamaHandler,
-)
-from bfcl_eval.model_handler.local_inference.salesforce_qwen import (
-    SalesforceQwenHandler,
-)
-from bfcl_eval.model_handler.local_inference.think_agent import ThinkAgentHandler
+if TYPE_CHECKING:
+    from bfcl_eval.model_handler.base_handler import BaseHandler
+
+# Handler classes are referenced by their dotted path and only imported on first use (see `ModelConfig.get_model_handler`).
+# Importing all of them eagerly would pull in every vendor SDK, which makes even `bfcl models` take several seconds to start.
+API_INFERENCE_PATH_PREFIX = "bfcl_eval.model_handler.api_inference"
+LOCAL_INFERENCE_PATH_PREFIX = "bfcl_eval.model_handler.local_inference"
 
 # -----------------------------------------------------------------------------
 # A mapping of model identifiers to their respective model configurations.
@@ -84,7 +30,7 @@ class ModelConfig:
         url (str): Reference URL for the model or hosting service.
         org (str): Organization providing the model.
         license (str): License under which the model is released.
-        model_handler (str): Handler name for invoking the model.
+        model_handler (str): Dotted import path of the handler class for invoking the model (eg. `bfcl_eval.model_handler.api_inference.claude.ClaudeHandler`). The class is only imported when `get_model_handler` is called. A handler class can also be passed directly.
         input_price (Optional[float]): USD per million input tokens (None for open source models).
         output_price (Optional[float]): USD per million output tokens (None for open source models).
         is_fc_model (bool): True if this model is used in Function-Calling mode, otherwise False for Prompt-based mode.
@@ -110,6 +56,21 @@ class ModelConfig:
     # True if this model does not allow '.' in function names
     underscore_to_dot: bool = False
 
+    def get_model_handler(self) -> Type["BaseHandler"]:
+        """
+        Return the handler class for this model, importing its module on first use.
+        """
+        if isinstance(self.model_handler, str):
+            return _import_handler_class(self.model_handler)
+        return self.model_handler
+
+
+@lru_cache(maxsize=None)
+def _import_handler_class(handler_path: str) -> Type["BaseHandler"]:
+    module_name, class_name = handler_path.rsplit(".", 1)
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
 
 # Inference through API calls
 api_inference_model_map = {
@@ -119,7 +80,7 @@ api_inference_model_map = {
         url="https://gorilla.cs.berkeley.edu/blogs/7_open_functions_v2.html",
         org="Gorilla LLM",
         license="Apache 2.0",
-        model_handler=GorillaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gorilla.GorillaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -131,7 +92,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -143,7 +104,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250528",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepSeekAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -155,7 +116,7 @@ api_inference_model_map = {
         url="https://api-docs.deepseek.com/news/news250325",
         org="DeepSeek",
         license="DeepSeek License",
-        model_handler=DeepSeekAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.deepseek.DeepSeekAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -167,7 +128,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=1.25,
         output_price=10,
         is_fc_model=True,
@@ -179,7 +140,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=1.25,
         output_price=10,
         is_fc_model=False,
@@ -191,7 +152,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=True,
@@ -203,7 +164,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.25,
         output_price=2,
         is_fc_model=False,
@@ -215,7 +176,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=True,
@@ -227,7 +188,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-gpt-5/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.05,
         output_price=0.4,
         is_fc_model=False,
@@ -239,7 +200,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -251,7 +212,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -263,7 +224,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=True,
@@ -275,7 +236,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.4,
         output_price=1.6,
         is_fc_model=False,
@@ -287,7 +248,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -299,7 +260,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4-1/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -311,7 +272,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=False,
@@ -323,7 +284,7 @@ api_inference_model_map = {
         url="https://openai.com/index/hello-gpt-4o/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -335,7 +296,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=False,
@@ -347,7 +308,7 @@ api_inference_model_map = {
         url="https://openai.com/index/gpt-4o-mini-advancing-cost-efficient-intelligence/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=0.15,
         output_price=0.6,
         is_fc_model=True,
@@ -359,7 +320,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=False,
@@ -371,7 +332,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=2,
         output_price=8,
         is_fc_model=True,
@@ -383,7 +344,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=False,
@@ -395,7 +356,7 @@ api_inference_model_map = {
         url="https://openai.com/index/introducing-o3-and-o4-mini/",
         org="OpenAI",
         license="Proprietary",
-        model_handler=OpenAIResponsesHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openai_response.OpenAIResponsesHandler",
         input_price=1.10,
         output_price=4.40,
         is_fc_model=True,
@@ -407,7 +368,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.claude.ClaudeHandler",
         input_price=15,
         output_price=75,
         is_fc_model=False,
@@ -419,7 +380,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.claude.ClaudeHandler",
         input_price=15,
         output_price=75,
         is_fc_model=True,
@@ -431,7 +392,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -443,7 +404,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/claude-4",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.claude.ClaudeHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -455,7 +416,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/3-5-models-and-computer-use",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=False,
@@ -467,7 +428,7 @@ api_inference_model_map = {
         url="https://www.anthropic.com/news/3-5-models-and-computer-use",
         org="Anthropic",
         license="Proprietary",
-        model_handler=ClaudeHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.claude.ClaudeHandler",
         input_price=0.8,
         output_price=4,
         is_fc_model=True,
@@ -479,7 +440,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.nova.NovaHandler",
         input_price=0.8,
         output_price=3.2,
         is_fc_model=True,
@@ -491,7 +452,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.nova.NovaHandler",
         input_price=0.06,
         output_price=0.24,
         is_fc_model=True,
@@ -503,7 +464,7 @@ api_inference_model_map = {
         url="https://aws.amazon.com/cn/ai/generative-ai/nova/",
         org="Amazon",
         license="Proprietary",
-        model_handler=NovaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.nova.NovaHandler",
         input_price=0.035,
         output_price=0.14,
         is_fc_model=True,
@@ -515,7 +476,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=False,
@@ -527,7 +488,7 @@ api_inference_model_map = {
         url="https://mistral.ai/news/mistral-nemo/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=0.15,
         output_price=0.15,
         is_fc_model=True,
@@ -539,7 +500,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=False,
@@ -551,7 +512,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=2,
         output_price=6,
         is_fc_model=True,
@@ -563,7 +524,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=False,
@@ -575,7 +536,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=0.1,
         output_price=0.3,
         is_fc_model=True,
@@ -587,7 +548,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=False,
@@ -599,7 +560,7 @@ api_inference_model_map = {
         url="https://docs.mistral.ai/guides/model-selection/",
         org="Mistral AI",
         license="Proprietary",
-        model_handler=MistralHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mistral.MistralHandler",
         input_price=0.4,
         output_price=2,
         is_fc_model=True,
@@ -611,7 +572,7 @@ api_inference_model_map = {
         url="https://huggingface.co/fireworks-ai/firefunction-v2",
         org="Fireworks",
         license="Apache 2.0",
-        model_handler=FireworksHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.fireworks.FireworksHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -623,7 +584,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=True,
@@ -635,7 +596,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash-lite/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gemini.GeminiHandler",
         input_price=0.1,
         output_price=0.4,
         is_fc_model=False,
@@ -647,7 +608,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=True,
@@ -659,7 +620,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/flash/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gemini.GeminiHandler",
         input_price=0.3,
         output_price=2.5,
         is_fc_model=False,
@@ -671,7 +632,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gemini.GeminiHandler",
         input_price=1.5,
         output_price=10,
         is_fc_model=True,
@@ -683,7 +644,7 @@ api_inference_model_map = {
         url="https://deepmind.google/technologies/gemini/pro/",
         org="Google",
         license="Proprietary",
-        model_handler=GeminiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gemini.GeminiHandler",
         input_price=1.5,
         output_price=10,
         is_fc_model=False,
@@ -695,7 +656,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-small-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -707,7 +668,7 @@ api_inference_model_map = {
         url="https://huggingface.co/meetkai/functionary-medium-v3.1",
         org="MeetKai",
         license="MIT",
-        model_handler=FunctionaryHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.functionary.FunctionaryHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -719,7 +680,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-r7b",
         org="Cohere",
         license="cc-by-nc-4.0",
-        model_handler=CohereHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.cohere.CohereHandler",
         input_price=0.0375,
         output_price=0.15,
         is_fc_model=True,
@@ -731,7 +692,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.cohere.CohereHandler",
         input_price=2.5,
         output_price=10,
         is_fc_model=True,
@@ -743,7 +704,7 @@ api_inference_model_map = {
         url="https://cohere.com/blog/command-a-reasoning",
         org="Cohere",
         license="CC-BY-NC 4.0 License (w/ Acceptable Use Addendum)",
-        model_handler=CohereHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.cohere.CohereHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -755,7 +716,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/Llama-3_1-Nemotron-Ultra-253B-v1",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NemotronHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.nemotron.NemotronHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -767,7 +728,7 @@ api_inference_model_map = {
         url="https://huggingface.co/nvidia/nemotron-4-340b-instruct",
         org="NVIDIA",
         license="nvidia-open-model-license",
-        model_handler=NvidiaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.nvidia.NvidiaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -779,7 +740,7 @@ api_inference_model_map = {
         url="https://gogoagent.ai",
         org="BitAgent",
         license="Proprietary",
-        model_handler=GoGoAgentHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.gogoagent.GoGoAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -791,7 +752,7 @@ api_inference_model_map = {
         url="https://writer.com/engineering/actions-with-palmyra-x-004/",
         org="Writer",
         license="Proprietary",
-        model_handler=WriterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.writer.WriterHandler",
         input_price=5,
         output_price=12,
         is_fc_model=True,
@@ -803,7 +764,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=True,
@@ -815,7 +776,7 @@ api_inference_model_map = {
         url="https://docs.x.ai/docs/models",
         org="xAI",
         license="Proprietary",
-        model_handler=GrokHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.grok.GrokHandler",
         input_price=3,
         output_price=15,
         is_fc_model=False,
@@ -827,7 +788,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -839,7 +800,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -851,7 +812,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -863,7 +824,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -875,7 +836,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -887,7 +848,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -899,7 +860,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -911,7 +872,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -923,7 +884,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -935,7 +896,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -947,7 +908,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -959,7 +920,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -971,7 +932,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -983,7 +944,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -995,7 +956,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1007,7 +968,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1019,7 +980,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1031,7 +992,7 @@ api_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1043,7 +1004,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=MiningHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.mining.MiningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1055,7 +1016,7 @@ api_inference_model_map = {
         url="https://www.mininglamp.com/",
         org="Mininglamp",
         license="Proprietary",
-        model_handler=DMCitoHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.dm_cito.DMCitoHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1067,7 +1028,7 @@ api_inference_model_map = {
         url="https://huggingface.co/inclusionAI/Ling-lite-1.5",
         org="Ling",
         license="MIT",
-        model_handler=LingAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.ling.LingAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1079,7 +1040,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1091,7 +1052,7 @@ api_inference_model_map = {
         url="https://huggingface.co/zai-org/GLM-4.5-Air",
         org="Zhipu AI",
         license="MIT",
-        model_handler=GLMAPIHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.glm.GLMAPIHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1103,7 +1064,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1115,7 +1076,7 @@ api_inference_model_map = {
         url="https://huggingface.co/moonshotai/Kimi-K2-Instruct",
         org="MoonshotAI",
         license="modified-mit",
-        model_handler=KimiHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.kimi.KimiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1128,7 +1089,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-72b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1140,7 +1101,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-72b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1152,7 +1113,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-32b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1164,7 +1125,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-32b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1176,7 +1137,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-14b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1188,7 +1149,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-14b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1200,7 +1161,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-7b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1212,7 +1173,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2.5-7b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1224,7 +1185,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-72b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1236,7 +1197,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-72b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1248,7 +1209,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-32b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1260,7 +1221,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-32b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1272,7 +1233,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-14b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1284,7 +1245,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-14b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1296,7 +1257,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-7b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1308,7 +1269,7 @@ api_inference_model_map = {
         url="https://openrouter.ai/models/qwen/qwen-2-7b-instruct",
         org="Qwen",
         license="apache-2.0",
-        model_handler=OpenRouterHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.openrouter.OpenRouterHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1324,7 +1285,7 @@ local_inference_model_map = {
         url="https://huggingface.co/deepseek-ai/DeepSeek-R1",
         org="DeepSeek",
         license="MIT",
-        model_handler=DeepseekReasoningHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.deepseek_reasoning.DeepseekReasoningHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1336,7 +1297,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1348,7 +1309,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1360,7 +1321,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1372,7 +1333,7 @@ local_inference_model_map = {
         url="https://blog.google/technology/developers/gemma-3/",
         org="Google",
         license="gemma-terms-of-use",
-        model_handler=GemmaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.gemma.GemmaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1384,7 +1345,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1396,7 +1357,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1408,7 +1369,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler_3_1,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama_3_1.LlamaHandler_3_1",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1420,7 +1381,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1432,7 +1393,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1444,7 +1405,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1456,7 +1417,7 @@ local_inference_model_map = {
         url="https://llama.meta.com/llama3",
         org="Meta",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1468,7 +1429,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1480,7 +1441,7 @@ local_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1492,7 +1453,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-70b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1504,7 +1465,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/Llama-xLAM-2-8b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceLlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.salesforce_llama.SalesforceLlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1516,7 +1477,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-32b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1528,7 +1489,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-3b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1540,7 +1501,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Salesforce/xLAM-2-1b-fc-r",
         org="Salesforce",
         license="cc-by-nc-4.0",
-        model_handler=SalesforceQwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.salesforce_qwen.SalesforceQwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1552,7 +1513,7 @@ local_inference_model_map = {
         url="https://huggingface.co/mistralai/Ministral-8B-Instruct-2410",
         org="Mistral AI",
         license="Mistral AI Research License",
-        model_handler=MistralFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.mistral_fc.MistralFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1564,7 +1525,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/phi-4",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1576,7 +1537,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.phi.PhiHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1588,7 +1549,7 @@ local_inference_model_map = {
         url="https://huggingface.co/microsoft/Phi-4-mini-instruct",
         org="Microsoft",
         license="MIT",
-        model_handler=PhiFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.phi_fc.PhiFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1600,7 +1561,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.2-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1612,7 +1573,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-3.1-8b-instruct",
         org="IBM",
         license="Apache-2.0",
-        model_handler=Granite3FCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.granite_3.Granite3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1624,7 +1585,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ibm-granite/granite-20b-functioncalling",
         org="IBM",
         license="Apache-2.0",
-        model_handler=GraniteFunctionCallingHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.granite.GraniteFunctionCallingHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1636,7 +1597,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-7b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1648,7 +1609,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-3b",
         org="MadeAgents",
         license="qwen-research",
-        model_handler=HammerHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1660,7 +1621,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-1.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1672,7 +1633,7 @@ local_inference_model_map = {
         url="https://huggingface.co/MadeAgents/Hammer2.1-0.5b",
         org="MadeAgents",
         license="cc-by-nc-4.0",
-        model_handler=HammerHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.hammer.HammerHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1684,7 +1645,7 @@ local_inference_model_map = {
         url="https://huggingface.co/THUDM/glm-4-9b-chat",
         org="THUDM",
         license="glm-4",
-        model_handler=GLMHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.glm.GLMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1696,7 +1657,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1708,7 +1669,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-0.6B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1720,7 +1681,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1732,7 +1693,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-1.7B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1744,7 +1705,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1756,7 +1717,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1768,7 +1729,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1780,7 +1741,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-8B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1792,7 +1753,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1804,7 +1765,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-14B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1816,7 +1777,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1828,7 +1789,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1840,7 +1801,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1852,7 +1813,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-30B-A3B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1864,7 +1825,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen_fc.QwenFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1876,7 +1837,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-235B-A22B-Instruct-2507",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1888,7 +1849,7 @@ local_inference_model_map = {
         url="https://huggingface.co/Team-ACE/ToolACE-2-8B",
         org="Huawei Noah & USTC",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1900,7 +1861,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.minicpm.MiniCPMHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1912,7 +1873,7 @@ local_inference_model_map = {
         url="https://huggingface.co/openbmb/MiniCPM3-4B",
         org="openbmb",
         license="Apache-2.0",
-        model_handler=MiniCPMFCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.minicpm_fc.MiniCPMFCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1924,7 +1885,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-8B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1936,7 +1897,7 @@ local_inference_model_map = {
         url="https://huggingface.co/watt-ai/watt-tool-70B/",
         org="Watt AI Lab",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1948,7 +1909,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ZJared/Haha-7B",
         org="TeleAI",
         license="Apache 2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1960,7 +1921,7 @@ local_inference_model_map = {
         url="https://huggingface.co/speakleash/Bielik-11B-v2.3-Instruct",
         org="SpeakLeash & ACK Cyfronet AGH",
         license="Apache 2.0",
-        model_handler=BielikHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.bielik.BielikHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1972,7 +1933,7 @@ local_inference_model_map = {
         url="https://huggingface.co/NovaSky-AI/Sky-T1-32B-Preview",
         org="NovaSky-AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -1984,7 +1945,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-10B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1996,7 +1957,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-7B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2008,7 +1969,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-3B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2020,7 +1981,7 @@ local_inference_model_map = {
         url="https://huggingface.co/tiiuae/Falcon3-1B-Instruct",
         org="TII UAE",
         license="falcon-llm-license",
-        model_handler=Falcon3FCHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.falcon_fc.Falcon3FCHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2032,7 +1993,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-8B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2044,7 +2005,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-70B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2056,7 +2017,7 @@ local_inference_model_map = {
         url="https://huggingface.co/uiuc-convai/CoALM-405B",
         org="UIUC + Oumi",
         license="Meta Llama 3 Community",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2068,7 +2029,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-1.5B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2080,7 +2041,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-3B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2092,7 +2053,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-7B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2104,7 +2065,7 @@ local_inference_model_map = {
         url="https://huggingface.co/katanemo/Arch-Agent-32B",
         org="katanemo",
         license="katanemo-research",
-        model_handler=ArchHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.arch.ArchHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2116,7 +2077,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-8B/",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=LlamaHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.llama.LlamaHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2128,7 +2089,7 @@ local_inference_model_map = {
         url="https://huggingface.co/BitAgent/BitAgent-Bounty-8B",
         org="Bittensor",
         license="Apache-2.0",
-        model_handler=BitAgentHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.bitagent.BitAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2140,7 +2101,7 @@ local_inference_model_map = {
         url="https://huggingface.co/ThinkAgents/ThinkAgent-1B",
         org="ThinkAgents",
         license="apache-2.0",
-        model_handler=ThinkAgentHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.think_agent.ThinkAgentHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2152,7 +2113,20 @@ local_inference_model_map = {
         url="https://huggingface.co/phronetic-ai/RZN-T",
         org="Phronetic AI",
         license="apache-2.0",
-        model_handler=QwenHandler,
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.qwen.QwenHandler",
+        input_price=None,
+        output_price=None,
+        is_fc_model=False,
+        underscore_to_dot=False,
+    ),
+    # Not a real model: replays the ground truth from a local mock server, to load-test the pipeline offline (see `mock_server`)
+    "bfcl-mock-model": ModelConfig(
+        model_name="bfcl-mock-model",
+        display_name="BFCL Mock Model (Prompt) (Local)",
+        url="https://github.com/ShishirPatil/gorilla/tree/main/berkeley-function-call-leaderboard",
+        org="BFCL",
+        license="apache-2.0",
+        model_handler=f"{LOCAL_INFERENCE_PATH_PREFIX}.mock_model.MockModelHandler",
         input_price=None,
         output_price=None,
         is_fc_model=False,
@@ -2169,7 +2143,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=False,
@@ -2181,7 +2155,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Maverick-17B-128E-Instruct-FP8",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.novita.NovitaHandler",
         input_price=0.2,
         output_price=0.85,
         is_fc_model=True,
@@ -2193,7 +2167,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=False,
@@ -2205,7 +2179,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/meta-llama/Llama-4-Scout-17B-16E-Instruct",
         org="Meta",
         license="Meta Llama 4 Community",
-        model_handler=NovitaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.novita.NovitaHandler",
         input_price=0.1,
         output_price=0.5,
         is_fc_model=True,
@@ -2217,7 +2191,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=True,
@@ -2229,7 +2203,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/QwQ-32B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=NovitaHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.novita.NovitaHandler",
         input_price=0.18,
         output_price=0.2,
         is_fc_model=False,
@@ -2242,7 +2216,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentThinkHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAgentThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -2254,7 +2228,7 @@ third_party_inference_model_map = {
         url="https://huggingface.co/Qwen/Qwen3-4B",
         org="Qwen",
         license="apache-2.0",
-        model_handler=QwenAgentNoThinkHandler,
+        model_handler=f"{API_INFERENCE_PATH_PREFIX}.qwen.QwenAgentNoThinkHandler",
         input_price=None,
         output_price=None,
         is_fc_model=True,
@@ -1,4 +1,7 @@
 import re
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Callable, Optional
 
 from bfcl_eval.constants.enums import Language
 from bfcl_eval.constants.model_config import MODEL_CONFIG_MAPPING
@@ -28,6 +31,12 @@ PYTHON_NESTED_TYPE_CHECK_LIST = ["array", "tuple"]
 
 NESTED_CONVERSION_TYPE_LIST = ["Array", "ArrayList", "array"]
 
+# Maximum number of per-model-output error details reported when a parallel function call can't be matched
+MAX_PARALLEL_ERROR_DETAILS = 10
+
+# Characters removed by `standardize_string`
+STANDARDIZE_STRING_DELETION_TABLE = str.maketrans("", "", " ,./-_*^")
+
 
 #### Main function ####
 def ast_checker(
@@ -39,13 +48,19 @@ def ast_checker(
     model_name: str,
 ):
     if "parallel" in test_category:
+        function_matchers = compile_ground_truth(
+            func_description, possible_answer, language, "parallel"
+        )
         return parallel_function_checker_no_order(
-            func_description, model_output, possible_answer, language, model_name
+            function_matchers, model_output, language, model_name
         )
 
     elif "multiple" in test_category:
+        function_matchers = compile_ground_truth(
+            func_description, possible_answer, language, "multiple"
+        )
         return multiple_function_checker(
-            func_description, model_output, possible_answer, language, model_name
+            function_matchers, model_output, language, model_name
         )
 
     else:
@@ -56,21 +71,206 @@ def ast_checker(
                 "error_type": "simple_function_checker:wrong_count",
             }
 
+        function_matchers = compile_ground_truth(
+            func_description, possible_answer, language, "simple"
+        )
         return simple_function_checker(
-            func_description[0], model_output[0], possible_answer[0], language, model_name
+            function_matchers[0], model_output[0], language, model_name
+        )
+
+
+#### Compiled ground truth ####
+# Maximum number of test entries whose compiled matchers are kept in memory
+MAX_COMPILED_GROUND_TRUTH_CACHE_ENTRIES = 20000
+
+# The compiled matchers are keyed by the identity of the ground truth objects, which is much cheaper than hashing their content.
+# The cache keeps a reference to those objects, so their ids can't be reused while the entry is cached.
+# The eval runner loads the single-turn test entries once per process, so the matchers are shared by every model evaluated in the same run.
+_COMPILED_GROUND_TRUTH_CACHE: OrderedDict[tuple, tuple] = OrderedDict()
+
+
+def compile_ground_truth(
+    func_descriptions, possible_answers: list, language: Language, checker_type: str
+) -> list["FunctionMatcher"]:
+    """
+    Compile the ground truth of a test entry into one `FunctionMatcher` per expected function call.
+    The ground truth must not be mutated once it has been compiled.
+
+    Args:
+        func_descriptions (list | dict): The function descriptions of the test entry.
+        possible_answers (list): The possible answers, one `{function_name: {param: [possible values]}}` dict per expected call.
+        language (Language): The language of the test entry.
+        checker_type (str): One of "simple", "multiple" or "parallel". For "simple", the first (and only) function description is used; otherwise the description is looked up by the expected function name.
+
+    Returns:
+        list[FunctionMatcher]: The compiled matchers. For "simple", only the first possible answer is compiled, as the others are never checked.
+    """
+    cache_key = (checker_type, language, id(func_descriptions), id(possible_answers))
+    cached = _COMPILED_GROUND_TRUTH_CACHE.get(cache_key)
+    if cached is not None:
+        _COMPILED_GROUND_TRUTH_CACHE.move_to_end(cache_key)
+        return cached[2]
+
+    if checker_type == "simple":
+        function_matchers = [
+            FunctionMatcher(func_descriptions[0], possible_answers[0], language)
+        ]
+    else:
+        description_by_name = build_description_lookup(func_descriptions)
+        function_matchers = [
+            FunctionMatcher(
+                description_by_name(list(possible_answer.keys())[0]),
+                possible_answer,
+                language,
+            )
+            for possible_answer in possible_answers
+        ]
+
+    _COMPILED_GROUND_TRUTH_CACHE[cache_key] = (
+        func_descriptions,
+        possible_answers,
+        function_matchers,
+    )
+    if len(_COMPILED_GROUND_TRUTH_CACHE) > MAX_COMPILED_GROUND_TRUTH_CACHE_ENTRIES:
+        _COMPILED_GROUND_TRUTH_CACHE.popitem(last=False)
+    return function_matchers
+
+
+class FunctionMatcher:
+    """
+    The ground truth for one expected function call, pre-processed so that checking a model output only needs lookups.
+
+    It holds the parameter details from the function description, and one `ParamMatcher` per parameter in the possible answer.
+    """
+
+    def __init__(self, func_description: dict, possible_answer: dict, language: Language):
+        self.func_description = func_description
+        self.possible_answer_item = possible_answer
+        self.func_name = func_description["name"]
+        self.param_details = func_description["parameters"]["properties"]
+        self.required_params = func_description["parameters"]["required"]
+        self.language = language
+
+        # {param: [possible values]}
+        self.possible_answer = list(possible_answer.values())[0]
+        self.param_matchers = {
+            param: ParamMatcher(param, possible_values, self.param_details.get(param), language)
+            for param, possible_values in self.possible_answer.items()
+        }
+        # Parameters that must be present in the model output, ie. those not marked as optional with ""
+        self.non_optional_params = [
+            param
+            for param, possible_values in self.possible_answer.items()
+            if "" not in possible_values
+        ]
+        # Used by the parallel checker's prefilter: the parameters the model output may contain, and those it must contain
+        self.allowed_params = frozenset(
+            param for param in self.possible_answer if param in self.param_details
+        )
+        self.mandatory_params = frozenset(self.required_params).union(
+            self.non_optional_params
         )
 
 
+class ParamMatcher:
+    """
+    The possible values of one parameter, with its expected types and the standardized forms of the values.
+    Everything is computed on first use and then reused for every model output checked against it.
+    """
+
+    def __init__(
+        self, param: str, possible_answer: list, param_details: Optional[dict], language: Language
+    ):
+        self.param = param
+        self.possible_answer = possible_answer
+        self.param_details = param_details
+        self.language = language
+
+    @cached_property
+    def types(self) -> tuple:
+        """
+        (expected_type_description, expected_type_converted, nested_type, nested_type_converted) for this parameter.
+        """
+        expected_type_description = self.param_details["type"]
+        if self.language == Language.JAVA:
+            type_mapping = JAVA_TYPE_CONVERSION
+            nested_type_list = NESTED_CONVERSION_TYPE_LIST
+        elif self.language == Language.JAVASCRIPT:
+            type_mapping = JS_TYPE_CONVERSION
+            nested_type_list = NESTED_CONVERSION_TYPE_LIST
+        elif self.language == Language.PYTHON:
+            type_mapping = PYTHON_TYPE_MAPPING
+            nested_type_list = PYTHON_NESTED_TYPE_CHECK_LIST
+        else:
+            raise ValueError(f"Unsupported language: {self.language}")
+
+        expected_type_converted = type_mapping[expected_type_description]
+        nested_type = nested_type_converted = None
+        if expected_type_description in nested_type_list:
+            nested_type = self.param_details["items"]["type"]
+            nested_type_converted = type_mapping[nested_type]
+        return (
+            expected_type_description,
+            expected_type_converted,
+            nested_type,
+            nested_type_converted,
+        )
+
+    @cached_property
+    def standardized_strings(self) -> frozenset:
+        return frozenset(
+            standardize_string(answer) for answer in self.possible_answer if type(answer) == str
+        )
+
+    @cached_property
+    def standardized_lists(self) -> list:
+        # Note: a string possible answer (eg. "" for an optional parameter) is iterated character by character, so "" matches an empty list
+        return [
+            [standardize_string(item) if type(item) == str else item for item in answer]
+            for answer in self.possible_answer
+        ]
+
+    @cached_property
+    def hashed_lists(self) -> Optional[frozenset]:
+        """
+        The hashable forms of `standardized_lists`, or None if some of them are not hashable.
+        """
+        try:
+            return frozenset(_freeze(answer) for answer in self.standardized_lists)
+        except TypeError:
+            return None
+
+
+def _freeze(value):
+    """
+    Convert a value into a hashable form, such that two values are equal if and only if their frozen forms are equal.
+    The container type is part of the frozen form, since eg. a list is never equal to a tuple.
+    Raises TypeError if the value contains something unhashable that is not a list, tuple or dict.
+    """
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, tuple):
+        return (tuple, tuple(_freeze(item) for item in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((key, _freeze(item)) for key, item in value.items()))
+    hash(value)
+    return value
+
+
 #### Helper functions for AST ####
-def find_description(func_descriptions, name):
+def build_description_lookup(func_descriptions):
+    """
+    Return a function mapping a function name to its description, or None if there is no such function.
+    """
     if type(func_descriptions) == list:
+        description_by_name = {}
         for func_description in func_descriptions:
-            if func_description["name"] == name:
-                return func_description
-        return None
+            # Keep the first description if there are duplicates
+            description_by_name.setdefault(func_description["name"], func_description)
+        return description_by_name.get
     else:
         # it is a dict, there is only one function
-        return func_descriptions
+        return lambda name: func_descriptions
 
 
 def get_possible_answer_type(possible_answer: list):
@@ -80,6 +280,7 @@ def get_possible_answer_type(possible_answer: list):
     return None
 
 
+@lru_cache(maxsize=None)
 def convert_func_name(function_name, model_name: str):
     model_name_escaped = model_name.replace("_", "/")
     if "." in function_name:
@@ -178,22 +379,22 @@ def standardize_string(input_string: str):
     This is used to compare the model output with the possible answers
     We don't want to punish model for answer like April 1, 2024 vs April 1,2024, vs April 1 2024
     """
-    regex_string = r"[ \,\.\/\-\_\*\^]"
-    return re.sub(regex_string, "", input_string).lower().replace("'", '"')
+    # Equivalent to removing the characters matching r"[ \,\.\/\-\_\*\^]", but much faster than a regex
+    return (
+        input_string.translate(STANDARDIZE_STRING_DELETION_TABLE)
+        .lower()
+        .replace("'", '"')
+    )
 
 
-def string_checker(param: str, model_output: str, possible_answer: list):
-    standardize_possible_answer = []
+def string_checker(param: str, model_output: str, param_matcher: "ParamMatcher"):
     standardize_model_output = standardize_string(model_output)
-    for i in range(len(possible_answer)):
-        if type(possible_answer[i]) == str:
-            standardize_possible_answer.append(standardize_string(possible_answer[i]))
 
-    if standardize_model_output not in standardize_possible_answer:
+    if standardize_model_output not in param_matcher.standardized_strings:
         return {
             "valid": False,
             "error": [
-                f"Invalid value for parameter {repr(param)}: {repr(model_output)}. Expected one of {possible_answer}. Case insensitive."
+                f"Invalid value for parameter {repr(param)}: {repr(model_output)}. Expected one of {param_matcher.possible_answer}. Case insensitive."
             ],
             "error_type": "value_error:string",
         }
@@ -201,7 +402,7 @@ def string_checker(param: str, model_output: str, possible_answer: list):
     return {"valid": True, "error": []}
 
 
-def list_checker(param: str, model_output: list, possible_answer: list):
+def list_checker(param: str, model_output: list, param_matcher: "ParamMatcher"):
     # Convert the tuple to a list
 
     standardize_model_output = list(model_output)
@@ -211,23 +412,20 @@ def list_checker(param: str, model_output: list, possible_answer: list):
         if type(standardize_model_output[i]) == str:
             standardize_model_output[i] = standardize_string(model_output[i])
 
-    standardize_possible_answer = []
-    # We also need to standardize the possible answers
-    for i in range(len(possible_answer)):
-        standardize_possible_answer.append([])
-        for j in range(len(possible_answer[i])):
-            if type(possible_answer[i][j]) == str:
-                standardize_possible_answer[i].append(
-                    standardize_string(possible_answer[i][j])
-                )
-            else:
-                standardize_possible_answer[i].append(possible_answer[i][j])
+    # The possible answers are standardized once, and looked up by their hashable form when possible
+    hashed_lists = param_matcher.hashed_lists
+    try:
+        if hashed_lists is None:
+            raise TypeError
+        is_match = _freeze(standardize_model_output) in hashed_lists
+    except TypeError:
+        is_match = standardize_model_output in param_matcher.standardized_lists
 
-    if standardize_model_output not in standardize_possible_answer:
+    if not is_match:
         return {
             "valid": False,
             "error": [
-                f"Invalid value for parameter {repr(param)}: {repr(model_output)}. Expected one of {possible_answer}."
+                f"Invalid value for parameter {repr(param)}: {repr(model_output)}. Expected one of {param_matcher.possible_answer}."
             ],
             "error_type": "value_error:list/tuple",
         }
@@ -331,17 +529,17 @@ def list_dict_checker(param: str, model_output: list, possible_answers: list):
 
 
 def simple_function_checker(
-    func_description: dict,
+    function_matcher: FunctionMatcher,
     model_output: dict,
-    possible_answer: dict,
     language: Language,
     model_name: str,
 ):
-    possible_answer = list(possible_answer.values())[0]
-    # Extract function name and parameters details
-    func_name = func_description["name"]
-    param_details = func_description["parameters"]["properties"]
-    required_params = func_description["parameters"]["required"]
+    # The function name, parameters details and possible answer are all pre-processed in the matcher
+    possible_answer = function_matcher.possible_answer
+    param_matchers = function_matcher.param_matchers
+    func_name = function_matcher.func_name
+    param_details = function_matcher.param_details
+    required_params = function_matcher.required_params
 
     # Initialize a result dictionary
     result = {
@@ -379,59 +577,42 @@ def simple_function_checker(
             result["error_type"] = "simple_function_checker:unexpected_param"
             return result
 
-        full_param_details = param_details[param]
-        expected_type_description = full_param_details["type"]  # This is a string
+        param_matcher = param_matchers[param]
+        (
+            expected_type_description,
+            expected_type_converted,
+            nested_type,
+            nested_type_converted,
+        ) = param_matcher.types
         is_variable = False
-        nested_type_converted = None
 
         if language == Language.JAVA:
-            expected_type_converted = JAVA_TYPE_CONVERSION[expected_type_description]
-
-            if expected_type_description in JAVA_TYPE_CONVERSION:
-                if type(value) != str:
-                    result["valid"] = False
-                    result["error"].append(
-                        f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
-                    )
-                    result["error_type"] = "type_error:java"
-                    return result
+            if type(value) != str:
+                result["valid"] = False
+                result["error"].append(
+                    f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
+                )
+                result["error_type"] = "type_error:java"
+                return result
 
-                if expected_type_description in NESTED_CONVERSION_TYPE_LIST:
-                    nested_type = param_details[param]["items"]["type"]
-                    nested_type_converted = JAVA_TYPE_CONVERSION[nested_type]
-                    value = java_type_converter(
-                        value, expected_type_description, nested_type
-                    )
-                else:
-                    value = java_type_converter(value, expected_type_description)
+            if nested_type is not None:
+                value = java_type_converter(value, expected_type_description, nested_type)
+            else:
+                value = java_type_converter(value, expected_type_description)
 
         elif language == Language.JAVASCRIPT:
-            expected_type_converted = JS_TYPE_CONVERSION[expected_type_description]
-
-            if expected_type_description in JS_TYPE_CONVERSION:
-                if type(value) != str:
-                    result["valid"] = False
-                    result["error"].append(
-                        f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
-                    )
-                    result["error_type"] = "type_error:js"
-                    return result
-
-                if expected_type_description in NESTED_CONVERSION_TYPE_LIST:
-                    nested_type = param_details[param]["items"]["type"]
-                    nested_type_converted = JS_TYPE_CONVERSION[nested_type]
-                    value = js_type_converter(value, expected_type_description, nested_type)
-                else:
-                    value = js_type_converter(value, expected_type_description)
-
-        elif language == Language.PYTHON:
-            expected_type_converted = PYTHON_TYPE_MAPPING[expected_type_description]
-            if expected_type_description in PYTHON_NESTED_TYPE_CHECK_LIST:
-                nested_type = param_details[param]["items"]["type"]
-                nested_type_converted = PYTHON_TYPE_MAPPING[nested_type]
+            if type(value) != str:
+                result["valid"] = False
+                result["error"].append(
+                    f"Incorrect type for parameter {repr(param)}. Expected type String, got {type(value).__name__}. Parameter value: {repr(value)}."
+                )
+                result["error_type"] = "type_error:js"
+                return result
 
-        else:
-            raise ValueError(f"Unsupported language: {language}")
+            if nested_type is not None:
+                value = js_type_converter(value, expected_type_description, nested_type)
+            else:
+                value = js_type_converter(value, expected_type_description)
 
         # We convert all tuple value to list when the expected type is tuple.
         # The conversion is necessary because any tuple in the possible answer would become a list after being processed through json.dump() and json.load().
@@ -482,13 +663,13 @@ def simple_function_checker(
             # Special handle for strings
             elif expected_type_converted == str:
                 # We don't check for case sensitivity for string, as long as it's not a variable
-                result = string_checker(param, value, possible_answer[param])
+                result = string_checker(param, value, param_matcher)
                 if not result["valid"]:
                     return result
                 continue
 
             elif expected_type_converted == list:
-                result = list_checker(param, value, possible_answer[param])
+                result = list_checker(param, value, param_matcher)
                 if not result["valid"]:
                     return result
                 continue
@@ -503,8 +684,8 @@ def simple_function_checker(
             return result
 
     # Check for optional parameters not provided but allowed
-    for param in possible_answer:
-        if param not in model_params and "" not in possible_answer[param]:
+    for param in function_matcher.non_optional_params:
+        if param not in model_params:
             result["valid"] = False
             result["error"].append(
                 f"Optional parameter {repr(param)} not provided and not marked as optional."
@@ -529,19 +710,16 @@ def parallel_function_checker_enforce_order(
             "error_type": "parallel_function_checker_enforce_order:wrong_count",
         }
 
-    func_name_list = list(possible_answers.keys())
-    possible_answers_list = []
-
-    for key, value in possible_answers.items():
-        possible_answers_list.append({key: value})
+    description_by_name = build_description_lookup(func_descriptions)
 
-    for i in range(len(possible_answers_list)):
-        func_description = find_description(func_descriptions, func_name_list[i])
+    for i, (func_name, possible_answer) in enumerate(possible_answers.items()):
+        function_matcher = FunctionMatcher(
+            description_by_name(func_name), {func_name: possible_answer}, language
+        )
 
         result = simple_function_checker(
-            func_description,
+            function_matcher,
             model_output[i],
-            possible_answers_list[i],
             language,
             model_name,
         )
@@ -552,95 +730,159 @@ def parallel_function_checker_enforce_order(
 
 
 def parallel_function_checker_no_order(
-    func_descriptions: list,
+    function_matchers: list[FunctionMatcher],
     model_output: list,
-    possible_answers: list,
     language: Language,
     model_name: str,
 ):
-    if len(model_output) != len(possible_answers):
+    if len(model_output) != len(function_matchers):
         return {
             "valid": False,
             "error": ["Wrong number of functions."],
             "error_type": "parallel_function_checker_no_order:wrong_count",
         }
 
-    matched_indices = []
+    # The compatibility matrix between possible answers and model outputs is filled lazily, only for the pairs the matching reaches.
+    # The cheap prefilter on function name and parameter names rules out most incompatible pairs before the full checker runs.
+    compatibility = {}
+
+    def is_compatible(i: int, index: int) -> bool:
+        if (i, index) not in compatibility:
+            compatibility[(i, index)] = is_candidate_match(
+                function_matchers[i], model_output[index], model_name
+            ) and simple_function_checker(
+                function_matchers[i], model_output[index], language, model_name
+            )["valid"]
+        return compatibility[(i, index)]
+
+    # Each possible answer must be matched to a distinct model output.
+    # Unlike greedily taking the first passing model output, this finds a full matching whenever one exists.
+    # We only need to know whether every possible answer can be matched, so stop at the first one that can't.
+    answer_to_output = maximum_bipartite_matching(
+        len(function_matchers), len(model_output), is_compatible, stop_at_unmatched=True
+    )
+    if None not in answer_to_output:
+        return {"valid": True, "error": []}
+
+    # Report the first possible answer that can't be matched, against the model outputs left unmatched
+    i = answer_to_output.index(None)
+    function_matcher = function_matchers[i]
+    matched_indices = set(index for index in answer_to_output if index is not None)
+    considered_indices = [
+        index for index in range(len(model_output)) if index not in matched_indices
+    ]
+
+    all_errors = [
+        f"Could not find a matching function among index {considered_indices} of model output for index {i} of possible answers."
+    ]
+    for index in considered_indices[:MAX_PARALLEL_ERROR_DETAILS]:
+        result = simple_function_checker(
+            function_matcher, model_output[index], language, model_name
+        )
+        all_errors.append(
+            {
+                f"Model Result Index {index}": {
+                    "sub_error": result["error"],
+                    "sub_error_type": result["error_type"],
+                    "model_output_item": model_output[index],
+                    "possible_answer_item": function_matcher.possible_answer_item,
+                }
+            }
+        )
+    if len(considered_indices) > MAX_PARALLEL_ERROR_DETAILS:
+        all_errors.append(
+            f"Error details for the other {len(considered_indices) - MAX_PARALLEL_ERROR_DETAILS} model outputs are omitted."
+        )
 
-    # We go throught the possible answers one by one, and eliminate the model output that matches the possible answer
-    # It must be this way because we need ground truth to fetch the correct function description
-    for i in range(len(possible_answers)):
-        # possible_answers[i] is a dictionary with only one key
-        func_name_expected = list(possible_answers[i].keys())[0]
-        func_description = find_description(func_descriptions, func_name_expected)
+    return {
+        "valid": False,
+        "error": all_errors,
+        "error_type": "parallel_function_checker_no_order:cannot_find_match",
+    }
 
-        all_errors = []
 
-        for index in range(len(model_output)):
-            if index in matched_indices:
-                continue
+def is_candidate_match(
+    function_matcher: FunctionMatcher, model_output: dict, model_name: str
+) -> bool:
+    """
+    Cheap prefilter for `simple_function_checker`, only looking at the function name and the parameter names.
+    Returns False exactly when `simple_function_checker` would fail with a wrong function name, a missing or unexpected parameter; a True result still needs the full check.
+    """
+    func_name = convert_func_name(function_matcher.func_name, model_name)
+    if func_name not in model_output:
+        return False
 
-            result = simple_function_checker(
-                func_description,
-                model_output[index],
-                possible_answers[i],
-                language,
-                model_name,
-            )
+    model_params = model_output[func_name]
+    return function_matcher.allowed_params.issuperset(
+        model_params
+    ) and function_matcher.mandatory_params.issubset(model_params)
 
-            if result["valid"]:
-                matched_indices.append(index)
-                break
-            else:
-                all_errors.append(
-                    {
-                        f"Model Result Index {index}": {
-                            "sub_error": result["error"],
-                            "sub_error_type": result["error_type"],
-                            "model_output_item": model_output[index],
-                            "possible_answer_item": possible_answers[i],
-                        }
-                    }
-                )
 
-        if not result["valid"]:
-            considered_indices = [
-                i for i in range(len(model_output)) if i not in matched_indices
-            ]
-            all_errors.insert(
-                0,
-                f"Could not find a matching function among index {considered_indices} of model output for index {i} of possible answers.",
-            )
-            return {
-                "valid": False,
-                "error": all_errors,
-                "error_type": "parallel_function_checker_no_order:cannot_find_match",
-            }
+def maximum_bipartite_matching(
+    left_count: int,
+    right_count: int,
+    is_edge: Callable[[int, int], bool],
+    stop_at_unmatched: bool = False,
+) -> list[Optional[int]]:
+    """
+    Find a maximum matching in a bipartite graph, using augmenting paths (Kuhn's algorithm).
+    The left vertices are processed in order. Each one is first matched greedily to the first free right vertex it has an edge to, and augmenting paths are only searched when there is none, so a matching that greedy finds costs no more than greedy.
+    A left vertex that can't be matched when it is processed can never be matched, so if `stop_at_unmatched` is True, the search stops there and the following left vertices are left unmatched.
+
+    Args:
+        left_count (int): The number of left vertices.
+        right_count (int): The number of right vertices.
+        is_edge (Callable[[int, int], bool]): Whether there is an edge between a left and a right vertex. It is only called for the pairs the search reaches, and can be called more than once per pair, so expensive checks should be memoized by the caller.
+        stop_at_unmatched (bool): Whether to stop at the first left vertex that can't be matched.
+
+    Returns:
+        list[Optional[int]]: For each left vertex, the right vertex it is matched to, or None if it is unmatched.
+    """
+    right_to_left: list[Optional[int]] = [None] * right_count
 
-    return {"valid": True, "error": []}
+    def try_augment(left: int, visited: list[bool]) -> bool:
+        for right in range(right_count):
+            if visited[right] or not is_edge(left, right):
+                continue
+            visited[right] = True
+            if right_to_left[right] is None or try_augment(right_to_left[right], visited):
+                right_to_left[right] = left
+                return True
+        return False
+
+    for left in range(left_count):
+        for right in range(right_count):
+            if right_to_left[right] is None and is_edge(left, right):
+                right_to_left[right] = left
+                break
+        else:
+            if not try_augment(left, [False] * right_count) and stop_at_unmatched:
+                break
+
+    left_to_right: list[Optional[int]] = [None] * left_count
+    for right, left in enumerate(right_to_left):
+        if left is not None:
+            left_to_right[left] = right
+    return left_to_right
 
 
 def multiple_function_checker(
-    func_descriptions: list,
+    function_matchers: list[FunctionMatcher],
     model_output: list,
-    possible_answers: list,
     language: Language,
     model_name: str,
 ):
-    if len(model_output) != len(possible_answers):
+    if len(model_output) != len(function_matchers):
         return {
             "valid": False,
             "error": ["Wrong number of functions."],
             "error_type": "multiple_function_checker:wrong_count",
         }
 
-    # possible_answers is a list of only one dictionary with only one key
-    func_name_expected = list(possible_answers[0].keys())[0]
-    func_description = find_description(func_descriptions, func_name_expected)
+    # possible_answers is a list of only one dictionary with only one key, so there is only one matcher
     return simple_function_checker(
-        func_description,
+        function_matchers[0],
         model_output[0],
-        possible_answers[0],
         language,
         model_name,
     )
@@ -0,0 +1,29 @@
+from copy import deepcopy
+from functools import lru_cache, wraps
+
+# Maximum number of (raw value, expected type, nested type) conversions kept per converter
+TYPE_CONVERTER_CACHE_SIZE = 100000
+
+
+def memoize_type_converter(converter):
+    """
+    Memoize a Java/JS type converter on (raw value, expected type, nested type).
+
+    The same literals show up again and again when evaluating many models on the same test entries (and across the candidates of a parallel entry), so each distinct literal is only parsed once per process.
+    Converted lists and dicts are copied before being returned, so callers can never modify the cached value.
+    Non-string raw values are not cached, and exceptions are never cached, so they are raised again on every call, same as without the cache.
+    """
+    cached_converter = lru_cache(maxsize=TYPE_CONVERTER_CACHE_SIZE)(converter)
+
+    @wraps(converter)
+    def wrapper(value, expected_type, nested_type=None):
+        if not isinstance(value, str):
+            return converter(value, expected_type, nested_type)
+        result = cached_converter(value, expected_type, nested_type)
+        if isinstance(result, (list, dict)):
+            return deepcopy(result)
+        return result
+
+    wrapper.cache_info = cached_converter.cache_info
+    wrapper.cache_clear = cached_converter.cache_clear
+    return wrapper
@@ -1,8 +1,12 @@
 import re
 from typing import List, Dict, Union
 from bfcl_eval.constants.type_mappings import JAVA_TYPE_CONVERSION
+from bfcl_eval.eval_checker.ast_eval.type_convertor.converter_cache import (
+    memoize_type_converter,
+)
 
 
+@memoize_type_converter
 def java_type_converter(value, expected_type, nested_type=None):
     if expected_type not in JAVA_TYPE_CONVERSION:
         raise ValueError(f"Unsupported type: {expected_type}")
@@ -1,7 +1,11 @@
 import re
 from bfcl_eval.constants.type_mappings import JS_TYPE_CONVERSION
+from bfcl_eval.eval_checker.ast_eval.type_convertor.converter_cache import (
+    memoize_type_converter,
+)
 
 
+@memoize_type_converter
 def js_type_converter(value, expected_type, nested_type=None):
     if expected_type not in JS_TYPE_CONVERSION:
         raise ValueError(f"Unsupported type: {expected_type}")
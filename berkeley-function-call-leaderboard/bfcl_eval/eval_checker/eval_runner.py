@@ -1,6 +1,7 @@
 import argparse
 import statistics
 from collections import defaultdict
+from functools import lru_cache
 
 from bfcl_eval.constants.enums import Language, ReturnFormat
 from bfcl_eval.constants.eval_config import *
@@ -16,6 +17,7 @@ from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     is_empty_execute_response,
 )
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.decode_stats import DECODE_THROUGHPUT_STATS
 from bfcl_eval.model_handler.utils import parse_prompt_variation_params
 from bfcl_eval.utils import *
 from dotenv import load_dotenv
@@ -24,7 +26,7 @@ from tqdm import tqdm
 
 def get_handler(model_name: str) -> BaseHandler:
     config = MODEL_CONFIG_MAPPING[model_name]
-    handler: BaseHandler = config.model_handler(
+    handler: BaseHandler = config.get_model_handler()(
         model_name=config.model_name,
         temperature=0,
         registry_name=model_name,
@@ -69,10 +71,31 @@ def _subset_entries_by_model_ids(
     return filtered_prompt_entries, filtered_ground_truth_entries
 
 
+def _decode_execute_steps(handler: BaseHandler, step_lists: list[list]) -> list[list]:
+    """
+    Decode the steps of many entries with a single `decode_execute_batch` call.
+
+    Args:
+        step_lists (list[list]): For each entry, the flat list of per-step model responses.
+
+    Returns:
+        list[list]: For each entry, the decoded result (or the decoding exception) of each step, in the same order.
+    """
+    decoded_steps = handler.decode_execute_batch(
+        [step for steps in step_lists for step in steps], has_tool_call_tag=False
+    )
+    decoded_step_lists = []
+    offset = 0
+    for steps in step_lists:
+        decoded_step_lists.append(decoded_steps[offset : offset + len(steps)])
+        offset += len(steps)
+    return decoded_step_lists
+
+
 def _evaluate_single_agentic_entry(
-    handler: BaseHandler,
     index,
     model_result_list,
+    decoded_step_results,
     possible_answer_item,
     prompt_entry,
     model_name,
@@ -101,7 +124,7 @@ def _evaluate_single_agentic_entry(
             "possible_answer": possible_answer_item,
         }
 
-    # Try decoding the model results into executable function calls
+    # The model results have already been decoded into executable function calls by the runner
     # Note: We only care about the last non-function-call message, which should fail to get decoded.
     # We don't care about the function calls in the middle of the conversation.
     # We only check if the expected answer is mentioned in the last message.
@@ -109,19 +132,16 @@ def _evaluate_single_agentic_entry(
     model_result_list_decoded: list[list[str]] = []
     last_unsuccessful_decoding_message = None
 
-    for model_result_item in model_result_list[0]:
+    for model_result_item, decoded_result in zip(
+        model_result_list[0], decoded_step_results
+    ):
         # model_result_item is per step
-        try:
-            decoded_result: list[str] = handler.decode_execute(
-                model_result_item, has_tool_call_tag=False
-            )
-            if is_empty_execute_response(decoded_result):
-                last_unsuccessful_decoding_message = model_result_item
-                continue
-            model_result_list_decoded.append(decoded_result)
-        except Exception as e:
+        if isinstance(decoded_result, Exception) or is_empty_execute_response(
+            decoded_result
+        ):
             last_unsuccessful_decoding_message = model_result_item
             continue
+        model_result_list_decoded.append(decoded_result)
 
     if not last_unsuccessful_decoding_message:
         return {
@@ -164,9 +184,9 @@ def _evaluate_single_agentic_entry(
 
 
 def _evaluate_single_multi_turn_entry(
-    handler: BaseHandler,
     test_entry_id,
     model_result_list,
+    decoded_step_results,
     ground_truth_list,
     prompt_entry,
     model_name,
@@ -216,23 +236,21 @@ def _evaluate_single_multi_turn_entry(
 
     # decode_execute returns a list of strings
     multi_turn_model_result_list_decoded: list[list[list[str]]] = []
-    # Try decoding the model results into executable function calls
+    # `decoded_step_results` holds the decoded result (or the decoding exception) of every step, flattened across turns
+    decoded_step_iter = iter(decoded_step_results)
     for single_turn_model_result_list in model_result_list:
         single_turn_model_result_list_decoded = []
-        for model_result_item in single_turn_model_result_list:
-            # model_result_item is per step
-            try:
-                decoded_result: list[str] = handler.decode_execute(
-                    model_result_item, has_tool_call_tag=False
-                )
-                if is_empty_execute_response(decoded_result):
-                    # Empty output is not considered as a valid function call
-                    continue
-                single_turn_model_result_list_decoded.append(decoded_result)
-            except Exception as e:
+        for _ in single_turn_model_result_list:
+            # each item is per step
+            decoded_result = next(decoded_step_iter)
+            if isinstance(decoded_result, Exception):
                 # Ignore any failed decoding and continue to the next message
                 # We only care about the decoded function call, not the error message or if the model is chatting
                 continue
+            if is_empty_execute_response(decoded_result):
+                # Empty output is not considered as a valid function call
+                continue
+            single_turn_model_result_list_decoded.append(decoded_result)
         multi_turn_model_result_list_decoded.append(single_turn_model_result_list_decoded)
 
     # Check if the model output the correct function calls
@@ -261,9 +279,9 @@ def _evaluate_single_multi_turn_entry(
 
 
 def _evaluate_single_relevance_entry(
-    handler: BaseHandler,
     index,
     model_result_item,
+    decoded_model_result,
     prompt_entry,
     model_name,
     test_category,
@@ -273,19 +291,17 @@ def _evaluate_single_relevance_entry(
     decoded_result = None
     decode_error = None
 
-    try:
-        decoded_result = handler.decode_ast(
-            model_result_item, language=ReturnFormat.PYTHON, has_tool_call_tag=False
-        )
+    if isinstance(decoded_model_result, Exception):
+        # Decode failed, which means the model output is not in valid function call format
+        contain_func_call = False
+        decode_error = str(decoded_model_result)
+    else:
+        decoded_result = decoded_model_result
         # Decode successfully, which means the model output is in valid function call format
         contain_func_call = True
         if is_empty_output(decoded_result):
             # Empty output is not considered as a valid function call
             contain_func_call = False
-    except Exception as e:
-        # Decode failed, which means the model output is not in valid function call format
-        contain_func_call = False
-        decode_error = str(e)
 
     # irrelevance test means no function call outputted
     if "irrelevance" in test_category:
@@ -317,37 +333,32 @@ def _evaluate_single_relevance_entry(
 
 
 def _evaluate_single_ast_entry(
-    handler: BaseHandler,
     index,
     model_result_item,
+    decoded_model_result,
     possible_answer_item,
     prompt_entry,
     model_name,
     test_category,
     language: Language,
-    return_format: ReturnFormat,
-    has_tool_call_tag=False,
 ):
     """Helper method to process a single AST entry."""
     prompt_function = prompt_entry["function"]
 
-    try:
-        model_result_item_raw = model_result_item
-        model_result_item = handler.decode_ast(
-            model_result_item, return_format, has_tool_call_tag
-        )
-    except Exception as e:
+    model_result_item_raw = model_result_item
+    if isinstance(decoded_model_result, Exception):
         return {
             "id": index,
             "model_name": model_name,
             "test_category": test_category,
             "valid": False,
-            "error": [f"Invalid syntax. Failed to decode AST. {str(e)}"],
+            "error": [f"Invalid syntax. Failed to decode AST. {str(decoded_model_result)}"],
             "error_type": "ast_decoder:decoder_failed",
             "prompt": prompt_entry,
             "model_result_raw": model_result_item_raw,
             "possible_answer": possible_answer_item,
         }
+    model_result_item = decoded_model_result
 
     decoder_output_valid = is_function_calling_format_output(model_result_item)
     if not decoder_output_valid:
@@ -413,39 +424,57 @@ def format_sensitivity_runner(
         lambda: {"correct": 0, "total": 0}
     )
 
+    # Entries sharing the same (return format, tool call tag) pair are decoded together in one batch
+    entry_indices_by_decode_params: dict[tuple, list[int]] = defaultdict(list)
     for i in range(len(model_result)):
         index = model_result[i]["id"]
-        model_result_item = model_result[i]["result"]
-        prompt_entry = prompt[i]
-        possible_answer_item = possible_answer[i]["ground_truth"]
 
         assert (
             ":" in index and len(index.split(":")) == 3
         ), f"Test entry ID {index} should contain exactly two colons, since they are supposed to be the format sensitivity ids."
 
-        format_sensitivity_config = index.split(":")[1]
         (
             return_format,
             has_tool_call_tag,
             function_doc_format,
             prompt_format,
             prompt_style,
-        ) = parse_prompt_variation_params(format_sensitivity_config)
+        ) = parse_prompt_variation_params(index.split(":")[1])
+
+        entry_indices_by_decode_params[
+            (ReturnFormat(return_format), has_tool_call_tag)
+        ].append(i)
+
+    decoded_model_results = [None] * len(model_result)
+    for (
+        return_format,
+        has_tool_call_tag,
+    ), entry_indices in entry_indices_by_decode_params.items():
+        decoded_batch = handler.decode_ast_batch(
+            [model_result[i]["result"] for i in entry_indices],
+            return_format,
+            has_tool_call_tag,
+        )
+        for i, decoded_model_result in zip(entry_indices, decoded_batch):
+            decoded_model_results[i] = decoded_model_result
 
-        return_format = ReturnFormat(return_format)
+    for i in range(len(model_result)):
+        index = model_result[i]["id"]
+        model_result_item = model_result[i]["result"]
+        prompt_entry = prompt[i]
+        possible_answer_item = possible_answer[i]["ground_truth"]
+        format_sensitivity_config = index.split(":")[1]
 
         entry_result = _evaluate_single_ast_entry(
-            handler,
             index,
             model_result_item,
+            decoded_model_results[i],
             possible_answer_item,
             prompt_entry,
             model_name,
             test_category,
             # Format sensitivity tests are all python tests
             language=Language.PYTHON,
-            return_format=return_format,
-            has_tool_call_tag=has_tool_call_tag,
         )
 
         # Update stats for this configuration
@@ -510,6 +539,19 @@ def agentic_runner(
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
 
+    # Agentic test is a single-turn multi-step test, so only well-formed results (a list of one element) have steps to decode
+    decoded_step_results = _decode_execute_steps(
+        handler,
+        [
+            (
+                entry["result"][0]
+                if type(entry["result"]) == list and len(entry["result"]) == 1
+                else []
+            )
+            for entry in model_result
+        ],
+    )
+
     result = []
     correct_count = 0
     for i in range(len(model_result)):
@@ -519,9 +561,9 @@ def agentic_runner(
         test_entry = prompt[i]
 
         entry_result = _evaluate_single_agentic_entry(
-            handler,
             index,
             model_result_list,
+            decoded_step_results[i],
             possible_answer_item,
             test_entry,
             model_name,
@@ -552,6 +594,24 @@ def multi_turn_runner(
         len(model_result) == len(prompt) == len(possible_answer)
     ), f"The length of the model result ({len(model_result)}) does not match the length of the prompt ({len(prompt)}) or possible answer ({len(possible_answer)}). Please check the input files for completeness."
 
+    # Steps are flattened across turns; malformed results are rejected by the entry helper before their steps are looked at
+    decoded_step_results = _decode_execute_steps(
+        handler,
+        [
+            (
+                [
+                    step
+                    for single_turn_model_result_list in entry["result"]
+                    for step in single_turn_model_result_list
+                ]
+                if type(entry["result"]) == list
+                and len(entry["result"]) == len(ground_truth_entry["ground_truth"])
+                else []
+            )
+            for entry, ground_truth_entry in zip(model_result, possible_answer)
+        ],
+    )
+
     result = []
     correct_count = 0
     for i in range(len(model_result)):
@@ -561,9 +621,9 @@ def multi_turn_runner(
         test_entry = prompt[i]
 
         entry_result = _evaluate_single_multi_turn_entry(
-            handler,
             index,
             multi_turn_model_result_list,
+            decoded_step_results[i],
             multi_turn_ground_truth_list,
             test_entry,
             model_name,
@@ -588,6 +648,12 @@ def relevance_file_runner(
     # If `test_category` is "irrelevance", the model is expected to output no function call.
     # No function call means either the AST decoding fails (a error message is generated) or the decoded AST does not contain any function call (such as a empty list, `[]`).
     # If `test_category` is "relevance", the model is expected to output to a function call, and empty list doesn't count as a function call.
+    decoded_model_results = handler.decode_ast_batch(
+        [entry["result"] for entry in model_result],
+        language=ReturnFormat.PYTHON,
+        has_tool_call_tag=False,
+    )
+
     result = []
     correct_count = 0
     for i in range(len(model_result)):
@@ -596,7 +662,12 @@ def relevance_file_runner(
         prompt_entry = prompt[i]
 
         entry_result = _evaluate_single_relevance_entry(
-            handler, index, model_result_item, prompt_entry, model_name, test_category
+            index,
+            model_result_item,
+            decoded_model_results[i],
+            prompt_entry,
+            model_name,
+            test_category,
         )
 
         if entry_result["valid"]:
@@ -632,6 +703,10 @@ def ast_file_runner(
         language = Language.PYTHON
         return_format = ReturnFormat.PYTHON
 
+    decoded_model_results = handler.decode_ast_batch(
+        [entry["result"] for entry in model_result], return_format, has_tool_call_tag=False
+    )
+
     result = []
     correct_count = 0
     for i in range(len(model_result)):
@@ -641,16 +716,14 @@ def ast_file_runner(
         possible_answer_item = possible_answer[i]["ground_truth"]
 
         entry_result = _evaluate_single_ast_entry(
-            handler,
             index,
             model_result_item,
+            decoded_model_results[i],
             possible_answer_item,
             prompt_entry,
             model_name,
             test_category,
             language=language,
-            return_format=return_format,
-            has_tool_call_tag=False,
         )
 
         if entry_result["valid"]:
@@ -663,6 +736,31 @@ def ast_file_runner(
     )
 
 
+def _is_ast_test_category(test_category: str) -> bool:
+    """
+    Whether the test category is evaluated by `ast_file_runner`.
+    """
+    return not (
+        is_relevance_or_irrelevance(test_category)
+        or is_format_sensitivity(test_category)
+        or is_multi_turn(test_category)
+        or is_agentic(test_category)
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_ast_test_entries(test_category: str) -> tuple[list[dict], list[dict]]:
+    """
+    Load the prompt and ground truth entries of a single-turn AST category once per process.
+    Every model is then evaluated against the same entry objects, so that `ast_checker` can reuse the matchers it compiled for them. The entries must therefore be treated as read-only.
+    """
+    prompt = load_dataset_entry(
+        test_category, include_prereq=False, include_language_specific_hint=False
+    )
+    possible_answer = load_ground_truth_entry(test_category)
+    return prompt, possible_answer
+
+
 #### Main runner function ####
 def evaluate_task(
     test_category,
@@ -679,9 +777,12 @@ def evaluate_task(
     record_cost_latency(leaderboard_table, model_name, model_result)
 
     # Find the corresponding prompt entries
-    prompt = load_dataset_entry(
-        test_category, include_prereq=False, include_language_specific_hint=False
-    )
+    if _is_ast_test_category(test_category):
+        prompt, possible_answer = _load_ast_test_entries(test_category)
+    else:
+        prompt = load_dataset_entry(
+            test_category, include_prereq=False, include_language_specific_hint=False
+        )
 
     if is_relevance_or_irrelevance(test_category):
         prompt, _ = _subset_entries_by_model_ids(
@@ -694,7 +795,8 @@ def evaluate_task(
 
     else:
         # Find the corresponding possible answer entries
-        possible_answer = load_ground_truth_entry(test_category)
+        if not _is_ast_test_category(test_category):
+            possible_answer = load_ground_truth_entry(test_category)
         # Sanity: prompt and ground truth should be 1:1
         assert len(prompt) == len(
             possible_answer
@@ -819,6 +921,11 @@ def runner(
     # Write the leaderboard table to a file
     generate_leaderboard_csv(leaderboard_table, score_dir)
 
+    decode_throughput_summary = DECODE_THROUGHPUT_STATS.format_summary()
+    if decode_throughput_summary:
+        print("⏱️ Decode throughput per handler (slowest first):")
+        print(decode_throughput_summary)
+
 
 def main(model, test_categories, result_dir, score_dir, partial_eval: bool = False):
     if result_dir is None:
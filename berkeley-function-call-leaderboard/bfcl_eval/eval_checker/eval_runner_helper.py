@@ -4,7 +4,6 @@ from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.column_headers import *
 from bfcl_eval.constants.eval_config import *
@@ -147,18 +146,29 @@ def record_cost_latency(leaderboard_table, model_name, model_output_data):
         leaderboard_table[model_name] = {}
         leaderboard_table[model_name]["cost"] = {"input_data": [], "output_data": []}
         leaderboard_table[model_name]["latency"] = {"data": []}
+        # Only recorded for results generated with `--stream`
+        leaderboard_table[model_name]["time_to_first_token"] = {"data": []}
+        leaderboard_table[model_name]["output_tokens_per_second"] = {"data": []}
 
     input_token = []
     output_token = []
     latency = []
+    time_to_first_token = []
+    output_tokens_per_second = []
     for data in model_output_data:
         process_data("latency", data, latency)
         process_data("input_token_count", data, input_token)
         process_data("output_token_count", data, output_token)
+        process_data("time_to_first_token", data, time_to_first_token)
+        process_data("output_tokens_per_second", data, output_tokens_per_second)
 
     leaderboard_table[model_name]["cost"]["input_data"].extend(input_token)
     leaderboard_table[model_name]["cost"]["output_data"].extend(output_token)
     leaderboard_table[model_name]["latency"]["data"].extend(latency)
+    leaderboard_table[model_name]["time_to_first_token"]["data"].extend(time_to_first_token)
+    leaderboard_table[model_name]["output_tokens_per_second"]["data"].extend(
+        output_tokens_per_second
+    )
 
 
 def save_eval_results(
@@ -193,8 +203,12 @@ def save_eval_results(
     return accuracy, len(model_result)
 
 
-def get_cost_latency_info(model_name, cost_data, latency_data):
+def get_cost_latency_info(
+    model_name, cost_data, latency_data, time_to_first_token_data, output_tokens_per_second_data
+):
     cost, mean_latency, std_latency, percentile_95_latency = "N/A", "N/A", "N/A", "N/A"
+    mean_time_to_first_token, percentile_95_time_to_first_token = "N/A", "N/A"
+    mean_output_tokens_per_second = "N/A"
     model_config = MODEL_CONFIG_MAPPING[model_name]
 
     # For API models, we use the input and output token counts to calculate the cost
@@ -227,7 +241,26 @@ def get_cost_latency_info(model_name, cost_data, latency_data):
         std_latency = round(std_latency, 2)
         percentile_95_latency = round(percentile_95_latency, 2)
 
-    return cost, mean_latency, std_latency, percentile_95_latency
+    # Streaming metrics, only available if the results were generated with `--stream`
+    if len(time_to_first_token_data["data"]) != 0:
+        mean_time_to_first_token = round(statistics.mean(time_to_first_token_data["data"]), 2)
+        percentile_95_time_to_first_token = round(
+            np.percentile(time_to_first_token_data["data"], 95), 2
+        )
+    if len(output_tokens_per_second_data["data"]) != 0:
+        mean_output_tokens_per_second = round(
+            statistics.mean(output_tokens_per_second_data["data"]), 2
+        )
+
+    return (
+        cost,
+        mean_latency,
+        std_latency,
+        percentile_95_latency,
+        mean_time_to_first_token,
+        percentile_95_time_to_first_token,
+        mean_output_tokens_per_second,
+    )
 
 
 def get_category_score(score_dict: dict, test_category: str) -> dict:
@@ -302,8 +335,22 @@ def generate_leaderboard_csv(leaderboard_table, output_path):
 
         cost_data = value.get("cost", {"input_data": [], "output_data": []})
         latency_data = value.get("latency", {"data": []})
-        cost, latency_mean, latency_std, percentile_95_latency = get_cost_latency_info(
-            model_name_escaped, cost_data, latency_data
+        time_to_first_token_data = value.get("time_to_first_token", {"data": []})
+        output_tokens_per_second_data = value.get("output_tokens_per_second", {"data": []})
+        (
+            cost,
+            latency_mean,
+            latency_std,
+            percentile_95_latency,
+            time_to_first_token_mean,
+            percentile_95_time_to_first_token,
+            output_tokens_per_second_mean,
+        ) = get_cost_latency_info(
+            model_name_escaped,
+            cost_data,
+            latency_data,
+            time_to_first_token_data,
+            output_tokens_per_second_data,
         )
 
         # Non-Live Score
@@ -528,6 +575,9 @@ def generate_leaderboard_csv(leaderboard_table, output_path):
                 latency_mean,
                 latency_std,
                 percentile_95_latency,
+                time_to_first_token_mean,
+                percentile_95_time_to_first_token,
+                output_tokens_per_second_mean,
                 summary_ast_non_live["display_accuracy"],
                 simple_ast_non_live["display_accuracy"],
                 multiple_ast_non_live["display_accuracy"],
@@ -610,11 +660,12 @@ def generate_leaderboard_csv(leaderboard_table, output_path):
         file_path=output_path / "data_overall.csv",
         header=COLUMNS_OVERALL,
         sort_column_index=1,
-        no_conversion_numeric_column_index=[4, 5, 6, 7, 32, 33],
+        no_conversion_numeric_column_index=[4, 5, 6, 7, 8, 9, 10, 35, 36],
     )
 
     wandb_project = os.getenv("WANDB_BFCL_PROJECT")
     if wandb_project and wandb_project != "ENTITY:PROJECT":
+        import pandas as pd
         import wandb
 
         # Initialize WandB run
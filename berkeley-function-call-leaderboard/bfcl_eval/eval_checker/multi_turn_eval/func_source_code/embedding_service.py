@@ -0,0 +1,225 @@
+import hashlib
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+DEFAULT_MAX_CACHE_ENTRIES = 20000
+DEFAULT_MAX_BATCH_SIZE = 64
+# How long the worker waits for more requests to join a batch once it has received the first one
+DEFAULT_BATCH_WINDOW_SECONDS = 0.005
+
+
+class EmbeddingService:
+    """
+    A process-wide text embedding service shared by all vector stores.
+
+    Lookups go through an in-memory LRU cache and an optional on-disk cache, both keyed by the content hash of the text.
+    Texts that miss both caches are handed to a dedicated worker thread, which micro-batches the pending requests from all inference threads into a single `encode` call.
+    All returned embeddings are L2-normalised float32 vectors.
+    The encoder itself is only loaded on first use, so that creating the service (or importing its module) is cheap.
+    """
+
+    def __init__(
+        self,
+        encoder_factory: Callable[[], Any],
+        model_name: str,
+        cache_dir: Optional[Path] = None,
+        max_cache_entries: int = DEFAULT_MAX_CACHE_ENTRIES,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+    ):
+        """
+        Args:
+            encoder_factory (Callable): A zero-argument callable returning the encoder, an object exposing `encode(list[str], normalize_embeddings=True)` and `get_sentence_embedding_dimension()`, eg. a `SentenceTransformer`.
+            model_name (str): The encoder name, used to namespace the on-disk cache.
+            cache_dir (Path, optional): Root folder of the on-disk cache. If None, only the in-memory cache is used.
+            max_cache_entries (int): Maximum number of embeddings kept in the in-memory LRU cache.
+            max_batch_size (int): Maximum number of unique texts encoded in one `encode` call.
+            batch_window_seconds (float): How long to wait for concurrent requests to join a batch.
+        """
+        self._encoder_factory = encoder_factory
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        self.model_name = model_name
+        self.cache_dir = (
+            Path(cache_dir) / model_name.replace("/", "_") if cache_dir is not None else None
+        )
+        self.max_cache_entries = max_cache_entries
+        self.max_batch_size = max_batch_size
+        self.batch_window_seconds = batch_window_seconds
+
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._request_queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+        # Simple counters, useful to check the cache is doing its job
+        self.stats = {"memory_hit": 0, "disk_hit": 0, "miss": 0, "encode_calls": 0}
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            with self._encoder_lock:
+                if self._encoder is None:
+                    self._encoder = self._encoder_factory()
+        return self._encoder
+
+    @property
+    def dimension(self) -> int:
+        return self.encoder.get_sentence_embedding_dimension()
+
+    def encode(self, texts: str | list[str]) -> np.ndarray:
+        """
+        Return the embeddings for `texts` as a float32 array of shape (len(texts), dimension).
+        A single string is treated as a list of one.
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+
+        keys = [self._hash(text) for text in texts]
+        vectors: dict[str, np.ndarray] = {}
+        pending: dict[str, str] = {}  # key -> text, deduplicated
+
+        for key, text in zip(keys, texts):
+            if key in vectors or key in pending:
+                continue
+            vector = self._get_from_memory(key)
+            if vector is None:
+                vector = self._get_from_disk(key)
+                if vector is not None:
+                    self._record("disk_hit")
+                    self._put_in_memory(key, vector)
+            else:
+                self._record("memory_hit")
+
+            if vector is None:
+                pending[key] = text
+            else:
+                vectors[key] = vector
+
+        if pending:
+            self._record("miss", len(pending))
+            future = self._submit(list(pending.values()))
+            for key, vector in zip(pending.keys(), future.result()):
+                vectors[key] = vector
+                self._put_in_memory(key, vector)
+                self._put_on_disk(key, vector)
+
+        return np.stack([vectors[key] for key in keys]).astype(np.float32, copy=False)
+
+    #### Cache helpers ####
+
+    def _record(self, stat_name: str, count: int = 1) -> None:
+        with self._cache_lock:
+            self.stats[stat_name] += count
+
+    def _hash(self, text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _get_from_memory(self, key: str) -> Optional[np.ndarray]:
+        with self._cache_lock:
+            vector = self._cache.get(key)
+            if vector is not None:
+                self._cache.move_to_end(key)
+            return vector
+
+    def _put_in_memory(self, key: str, vector: np.ndarray) -> None:
+        with self._cache_lock:
+            self._cache[key] = vector
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.npy"
+
+    def _get_from_disk(self, key: str) -> Optional[np.ndarray]:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+        try:
+            return np.load(path)
+        except (OSError, ValueError):
+            # A corrupted cache file is treated as a miss and will be overwritten
+            return None
+
+    def _put_on_disk(self, key: str, vector: np.ndarray) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that concurrent readers (or processes) never see a partial file
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, vector)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # The disk cache is best-effort; failing to write it should never fail the inference
+            print(f"Failed to write embedding cache file {path}: {e}")
+
+    #### Batching worker ####
+
+    def _submit(self, texts: list[str]) -> Future:
+        self._ensure_worker()
+        future = Future()
+        self._request_queue.put((texts, future))
+        return future
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="bfcl-embedding-service", daemon=True
+                )
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            batch = [self._request_queue.get()]
+            batch_size = len(batch[0][0])
+
+            # Collect more requests that arrive within the batching window
+            deadline = time.monotonic() + self.batch_window_seconds
+            while batch_size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._request_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(request)
+                batch_size += len(request[0])
+
+            self._encode_batch(batch)
+
+    def _encode_batch(self, batch: list[tuple[list[str], Future]]) -> None:
+        unique_texts = list(dict.fromkeys(text for texts, _ in batch for text in texts))
+        try:
+            vectors = self.encoder.encode(unique_texts, normalize_embeddings=True)
+            vectors = np.asarray(vectors, dtype=np.float32)
+            self._record("encode_calls")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        text_to_vector = dict(zip(unique_texts, vectors))
+        for texts, future in batch:
+            future.set_result([text_to_vector[text] for text in texts])
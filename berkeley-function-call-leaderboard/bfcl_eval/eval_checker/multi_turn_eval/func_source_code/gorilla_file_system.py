@@ -8,6 +8,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     FILES_TAIL_USED,
     POPULATE_FILE_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 
 class File:
@@ -252,6 +255,7 @@ class GorillaFileSystem:
             file_name = f"{name}"
             directory._add_file(file_name)
 
+    @read_only
     def pwd(self):
         """
         Return the current working directory path.
@@ -268,6 +272,7 @@ class GorillaFileSystem:
             dir = dir.parent
         return {"current_working_directory": "/" + "/".join(reversed(path))}
 
+    @read_only
     def ls(self, a: bool = False) -> Dict[str, List[str]]:
         """
         List the contents of the current directory.
@@ -385,6 +390,7 @@ class GorillaFileSystem:
         else:
             return {"terminal_output": content}
 
+    @read_only
     def cat(self, file_name: str) -> Dict[str, str]:
         """
         Display the contents of a file of any extension from currrent directory.
@@ -407,6 +413,7 @@ class GorillaFileSystem:
         else:
             return {"error": f"cat: '{file_name}': No such file or directory"}
 
+    @read_only
     def find(self, path: str = ".", name: Optional[str] = None) -> Dict[str, List[str]]:
         """
         Find any file or directories under specific path that contain name in its file name.
@@ -446,6 +453,7 @@ class GorillaFileSystem:
         recursive_search(target_dir, path.rstrip("/"))
         return {"matches": matches}
 
+    @read_only
     def wc(self, file_name: str, mode: str = "l") -> Dict[str, Union[int, str]]:
         """
         Count the number of lines, words, and characters in a file of any extension from current directory.
@@ -480,6 +488,7 @@ class GorillaFileSystem:
 
         return {"error": f"wc: {file_name}: No such file or directory"}
 
+    @read_only
     def sort(self, file_name: str) -> Dict[str, str]:
         """
         Sort the contents of a file line by line.
@@ -501,6 +510,7 @@ class GorillaFileSystem:
 
         return {"error": f"sort: {file_name}: No such file or directory"}
 
+    @read_only
     def grep(self, file_name: str, pattern: str) -> Dict[str, List[str]]:
         """
         Search for lines in a file of any extension at current directory that contain the specified pattern.
@@ -523,6 +533,7 @@ class GorillaFileSystem:
 
         return {"error": f"grep: {file_name}: No such file or directory"}
 
+    @read_only
     def du(self, human_readable: bool = False) -> Dict[str, str]:
         """
         Estimate the disk usage of a directory and its contents.
@@ -560,6 +571,7 @@ class GorillaFileSystem:
 
         return {"disk_usage": size_str}
 
+    @read_only
     def tail(self, file_name: str, lines: int = 10) -> Dict[str, str]:
         """
         Display the last part of a file of any extension.
@@ -584,6 +596,7 @@ class GorillaFileSystem:
 
         return {"error": f"tail: {file_name}: No such file or directory"}
 
+    @read_only
     def diff(self, file_name1: str, file_name2: str) -> Dict[str, str]:
         """
         Compare two files of any extension line by line at the current directory.
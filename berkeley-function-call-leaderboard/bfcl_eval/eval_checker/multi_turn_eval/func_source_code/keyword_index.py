@@ -0,0 +1,88 @@
+from collections import defaultdict
+from typing import Any, Hashable
+
+DEFAULT_NGRAM_SIZE = 3
+
+
+class KeywordIndex:
+    """
+    An inverted index from character n-grams to document keys, used by the multi-turn backends to answer case-insensitive substring queries (`keyword.lower() in text.lower()`) without scanning every document.
+
+    The candidates sharing all n-grams of the keyword are verified against their lower-cased text, so the results are exactly those of a full scan.
+    Keywords shorter than the n-gram size are answered by scanning the pre-lowered texts.
+    """
+
+    def __init__(self, ngram_size: int = DEFAULT_NGRAM_SIZE):
+        self.ngram_size = ngram_size
+        self._texts: dict[Hashable, str] = {}
+        self._postings: defaultdict[str, set[Hashable]] = defaultdict(set)
+        # Documents whose text is not a string cannot be split into n-grams.
+        # As long as there are any, `search` does a full scan, which fails on them exactly like the original linear scan would.
+        self._unindexed_texts: dict[Hashable, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts) + len(self._unindexed_texts)
+
+    def add(self, key: Hashable, text: str) -> None:
+        """
+        Add (or replace) the document `key` with content `text`.
+        """
+        self.remove(key)
+        if not isinstance(text, str):
+            self._unindexed_texts[key] = text
+            return
+
+        text = text.lower()
+        self._texts[key] = text
+        for ngram in self._ngrams(text):
+            self._postings[ngram].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove the document `key` from the index. Unknown keys are ignored.
+        """
+        if key in self._unindexed_texts:
+            del self._unindexed_texts[key]
+            return
+
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for ngram in self._ngrams(text):
+            postings = self._postings[ngram]
+            postings.discard(key)
+            if not postings:
+                del self._postings[ngram]
+
+    def search(self, keyword: str) -> set[Hashable]:
+        """
+        Return the keys of all documents whose text contains `keyword`, ignoring case.
+        The result is unordered; callers are responsible for restoring the order of their underlying collection.
+        """
+        keyword = keyword.lower()
+
+        if self._unindexed_texts:
+            all_texts = {**self._texts, **self._unindexed_texts}
+            return {key for key, text in all_texts.items() if keyword in text.lower()}
+
+        ngrams = self._ngrams(keyword)
+        if not ngrams:
+            return {key for key, text in self._texts.items() if keyword in text}
+
+        postings = []
+        for ngram in ngrams:
+            ngram_postings = self._postings.get(ngram)
+            if not ngram_postings:
+                return set()
+            postings.append(ngram_postings)
+        # Intersect starting from the rarest n-gram to keep the intermediate sets small
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+
+        return {key for key in candidates if keyword in self._texts[key]}
+
+    def _ngrams(self, text: str) -> set[str]:
+        return {
+            text[i : i + self.ngram_size]
+            for i in range(len(text) - self.ngram_size + 1)
+        }
@@ -4,11 +4,16 @@ from typing import Dict, List, Optional, Union
 
 import mpmath
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
+
 
 class MathAPI:
     def __init__(self):
         self._api_description = "This tool belongs to the Math API, which provides various mathematical operations."
         
+    # Not read-only: the mpmath precision it sets is process-wide
     def logarithm(
         self, value: float, base: float, precision: int
     ) -> Dict[str, float]:
@@ -34,6 +39,7 @@ class MathAPI:
         except Exception as e:
             return {"error": str(e)}
 
+    @read_only
     def mean(self, numbers: List[float]) -> Dict[str, float]:
         """
         Calculate the mean of a list of numbers.
@@ -51,6 +57,7 @@ class MathAPI:
         except TypeError:
             return {"error": "All elements in the list must be numbers"}
 
+    @read_only
     def standard_deviation(self, numbers: List[float]) -> Dict[str, float]:
         """
         Calculate the standard deviation of a list of numbers.
@@ -70,6 +77,7 @@ class MathAPI:
         except TypeError:
             return {"error": "All elements in the list must be numbers"}
 
+    @read_only
     def si_unit_conversion(
         self, value: float, unit_in: str, unit_out: str
     ) -> Dict[str, float]:
@@ -102,6 +110,7 @@ class MathAPI:
         except OverflowError:
             return {"error": "Conversion resulted in a value too large to represent"}
 
+    @read_only
     def imperial_si_conversion(
         self, value: float, unit_in: str, unit_out: str
     ) -> Dict[str, float]:
@@ -155,6 +164,7 @@ class MathAPI:
         except OverflowError:
             return {"error": "Conversion resulted in a value too large to represent"}
 
+    @read_only
     def add(self, a: float, b: float) -> Dict[str, float]:
         """
         Add two numbers.
@@ -171,6 +181,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Both inputs must be numbers"}
 
+    @read_only
     def subtract(self, a: float, b: float) -> Dict[str, float]:
         """
         Subtract one number from another.
@@ -187,6 +198,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Both inputs must be numbers"}
 
+    @read_only
     def multiply(self, a: float, b: float) -> Dict[str, float]:
         """
         Multiply two numbers.
@@ -206,6 +218,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Both inputs must be numbers"}
 
+    @read_only
     def divide(self, a: float, b: float) -> Dict[str, float]:
         """
         Divide one number by another.
@@ -224,6 +237,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Both inputs must be numbers"}
 
+    @read_only
     def power(self, base: float, exponent: float) -> Dict[str, float]:
         """
         Raise a number to a power.
@@ -240,6 +254,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Both inputs must be numbers"}
 
+    @read_only
     def square_root(self, number: float, precision: int) -> Dict[str, float]:
         """
         Calculate the square root of a number with adjustable precision using the decimal module.
@@ -268,6 +283,7 @@ class MathAPI:
                 "error": "Input must be a number or computation resulted in an invalid operation"
             }
 
+    @read_only
     def absolute_value(self, number: float) -> Dict[str, float]:
         """
         Calculate the absolute value of a number.
@@ -283,6 +299,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Input must be a number"}
 
+    @read_only
     def round_number(
         self, number: float, decimal_places: int = 0
     ) -> Dict[str, float]:
@@ -303,6 +320,7 @@ class MathAPI:
                 "error": "First input must be a number, second input must be an integer"
             }
 
+    @read_only
     def percentage(self, part: float, whole: float) -> Dict[str, float]:
         """
         Calculate the percentage of a part relative to a whole.
@@ -321,6 +339,7 @@ class MathAPI:
         except TypeError:
             return {"error": "Both inputs must be numbers"}
 
+    @read_only
     def min_value(self, numbers: List[float]) -> Dict[str, float]:
         """
         Find the minimum value in a list of numbers.
@@ -338,6 +357,7 @@ class MathAPI:
         except TypeError:
             return {"error": "All elements in the list must be numbers"}
 
+    @read_only
     def max_value(self, numbers: List[float]) -> Dict[str, float]:
         """
         Find the maximum value in a list of numbers.
@@ -355,6 +375,7 @@ class MathAPI:
         except TypeError:
             return {"error": "All elements in the list must be numbers"}
 
+    @read_only
     def sum_values(self, numbers: List[float]) -> Dict[str, float]:
         """
         Calculate the sum of a list of numbers.
@@ -6,7 +6,9 @@ from typing import Dict, List, Tuple
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
     MemoryAPI,
 )
-from rank_bm25 import BM25Plus
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 # https://lilianweng.github.io/posts/2023-06-23-agent/#component-two-memory
 MAX_CORE_MEMORY_SIZE = 7
@@ -80,6 +82,9 @@ class MemoryAPI_kv(MemoryAPI):
         Returns:
             ranked_results (list[tuple[float, str]]): A list of tuples containing the BM25+ score and the text string.
         """
+        # Imported here so that loading the backend doesn't pay for it until the first search
+        from rank_bm25 import BM25Plus
+
         tokenized_corpus = [text.replace("_", " ").lower().split() for text in corpus]
         bm25 = BM25Plus(tokenized_corpus)
         tokenized_query = query.replace("_", " ").lower().split()
@@ -170,6 +175,7 @@ class MemoryAPI_kv(MemoryAPI):
         self.core_memory = {}
         return {"status": "Short term memory cleared."}
 
+    @read_only
     def core_memory_retrieve(self, key: str) -> Dict[str, str]:
         """
         Retrieve the value associated with a key from the short-term memory. This function does not support partial key matching or similarity search.
@@ -185,6 +191,7 @@ class MemoryAPI_kv(MemoryAPI):
             return {"error": "Key not found."}
         return {"value": self.core_memory[key]}
 
+    @read_only
     def core_memory_list_keys(self) -> Dict[str, List[str]]:
         """
         List all keys currently in the short-term memory.
@@ -194,6 +201,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         return {"keys": list(self.core_memory.keys())}
 
+    @read_only
     def core_memory_key_search(
         self, query: str, k: int = 5
     ) -> Dict[str, List[Tuple[float, str]]]:
@@ -210,6 +218,7 @@ class MemoryAPI_kv(MemoryAPI):
         keys = deepcopy(list(self.core_memory.keys()))
         return self._similarity_search(query, keys, k)
 
+    @read_only
     def core_memory_retrieve_all(self) -> Dict[str, str]:
         """
         Retrieve all key-value pairs from the short-term memory.
@@ -294,6 +303,7 @@ class MemoryAPI_kv(MemoryAPI):
         self.archival_memory = {}
         return {"status": "Long term memory cleared."}
 
+    @read_only
     def archival_memory_retrieve(self, key: str) -> Dict[str, str]:
         """
         Retrieve the value associated with a key from the long-term memory. This function does not support partial key matching or similarity search.
@@ -308,6 +318,7 @@ class MemoryAPI_kv(MemoryAPI):
             return {"error": "Key not found."}
         return {"value": self.archival_memory[key]}
 
+    @read_only
     def archival_memory_list_keys(self) -> Dict[str, List[str]]:
         """
         List all keys currently in the long-term memory.
@@ -317,6 +328,7 @@ class MemoryAPI_kv(MemoryAPI):
         """
         return {"keys": list(self.archival_memory.keys())}
 
+    @read_only
     def archival_memory_key_search(
         self, query: str, k: int = 5
     ) -> Dict[str, List[Tuple[float, str]]]:
@@ -5,6 +5,9 @@ from typing import Dict
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
     MemoryAPI,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 MAX_MEMORY_ENTRY_LENGTH = 10000  # 10k characters
 
@@ -133,6 +136,7 @@ class MemoryAPI_rec_sum(MemoryAPI):
         self.memory = self.memory.replace(old_text, new_text)
         return {"status": "Memory updated."}
 
+    @read_only
     def memory_retrieve(self) -> Dict[str, str]:
         """
         Retrieve the current content of the memory.
@@ -2,18 +2,16 @@ import json
 from typing import List, Optional
 
 import numpy as np
+from bfcl_eval.constants.eval_config import EMBEDDING_CACHE_PATH
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.embedding_service import (
+    EmbeddingService,
+)
 from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.memory_api_metaclass import (
     MemoryAPI,
 )
-
-# isort: off
-# Note: This import order is necessary to avoid segfault issue due to FAISS and PyTorch each load a different OpenMP runtime
-# See https://github.com/pytorch/pytorch/issues/149201#issuecomment-2725586827
-# TODO: Find a common OpenMP runtime to avoid this issue
-from sentence_transformers import SentenceTransformer
-import faiss
-
-# isort: on
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 # https://lilianweng.github.io/posts/2023-06-23-agent/#component-two-memory
 MAX_CORE_MEMORY_SIZE = 7
@@ -22,9 +20,37 @@ MAX_ARCHIVAL_MEMORY_SIZE = 50
 MAX_ARCHIVAL_MEMORY_ENTRY_LENGTH = 2000
 
 
-# Use a global SentenceTransformer model for all vector stores.
-ENCODER = SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
-ENCODER_DIM = ENCODER.get_sentence_embedding_dimension()
+ENCODER_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+def _import_faiss():
+    """
+    PyTorch (via sentence-transformers) and FAISS are heavy, so they are only imported on the first vector operation.
+    """
+    # isort: off
+    # Note: This import order is necessary to avoid segfault issue due to FAISS and PyTorch each load a different OpenMP runtime
+    # See https://github.com/pytorch/pytorch/issues/149201#issuecomment-2725586827
+    # TODO: Find a common OpenMP runtime to avoid this issue
+    import sentence_transformers
+    import faiss
+
+    # isort: on
+    return faiss
+
+
+def _load_encoder():
+    # Go through `_import_faiss` first so that the import order above is always respected
+    _import_faiss()
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(ENCODER_MODEL_NAME, device="cpu")
+
+
+# Use a global SentenceTransformer model for all vector stores, loaded on first use.
+# All encode requests go through this service, so that concurrent requests from different inference threads are batched together and repeated texts are never re-encoded
+EMBEDDING_SERVICE = EmbeddingService(
+    _load_encoder, model_name=ENCODER_MODEL_NAME, cache_dir=EMBEDDING_CACHE_PATH
+)
 
 
 class MemoryAPI_vector(MemoryAPI):
@@ -131,6 +157,7 @@ class MemoryAPI_vector(MemoryAPI):
         """
         return self.core_memory.clear()
 
+    @read_only
     def core_memory_retrieve(
         self, query: str, top_k: Optional[int] = 5
     ) -> list[dict[str, str]]:
@@ -149,6 +176,7 @@ class MemoryAPI_vector(MemoryAPI):
         """
         return {"result": self.core_memory.retrieve(query, top_k)}
 
+    @read_only
     def core_memory_retrieve_all(self) -> list[dict[str, str]]:
         """
         Retrieve all entries from the core memory.
@@ -206,6 +234,7 @@ class MemoryAPI_vector(MemoryAPI):
         """
         return self.archival_memory.clear()
 
+    @read_only
     def archival_memory_retrieve(
         self, query: str, top_k: Optional[int] = 5
     ) -> list[dict[str, str]]:
@@ -222,6 +251,7 @@ class MemoryAPI_vector(MemoryAPI):
         """
         return {"result": self.archival_memory.retrieve(query, top_k)}
 
+    @read_only
     def archival_memory_retrieve_all(self) -> list[dict[str, str]]:
         """
         Retrieve all entries from the archival memory.
@@ -240,20 +270,24 @@ class VectorStore:
         self.max_size = max_size
         self.max_entry_length = max_entry_length
 
-        # Cosine similarity via inner product on L2‑normalised vectors.
-        index_flat = faiss.IndexFlatIP(ENCODER_DIM)
-        self._index = faiss.IndexIDMap(index_flat)
+        # The FAISS index is created on first use, see `_get_index`
+        self._index = None
 
         self._store: dict[int, str] = {}
         # _next_id will always be unique and sequential
         self._next_id: int = 0
 
+    def _get_index(self):
+        if self._index is None:
+            faiss = _import_faiss()
+            # Cosine similarity via inner product on L2‑normalised vectors.
+            index_flat = faiss.IndexFlatIP(EMBEDDING_SERVICE.dimension)
+            self._index = faiss.IndexIDMap(index_flat)
+        return self._index
+
     def _embed(self, text: str | List[str]) -> np.ndarray:
         """Return an L2-normalised NumPy array suitable for FAISS."""
-        vecs = ENCODER.encode(
-            text if isinstance(text, list) else [text], normalize_embeddings=True
-        )
-        return np.asarray(vecs, dtype=np.float32)
+        return EMBEDDING_SERVICE.encode(text)
 
     def add(self, text: str) -> dict[str, str]:
         if len(text) > self.max_entry_length:
@@ -270,7 +304,7 @@ class VectorStore:
         self._next_id += 1
 
         vector = self._embed(text)
-        self._index.add_with_ids(vector, np.array([vec_id], dtype=np.int64))
+        self._get_index().add_with_ids(vector, np.array([vec_id], dtype=np.int64))
         self._store[vec_id] = text
 
         return {"id": vec_id}
@@ -279,7 +313,7 @@ class VectorStore:
         if vec_id not in self._store:
             return {"error": f"ID {vec_id} not present in store."}
 
-        self._index.remove_ids(np.array([vec_id], dtype=np.int64))
+        self._get_index().remove_ids(np.array([vec_id], dtype=np.int64))
         del self._store[vec_id]
 
         return {"status": f"ID {vec_id} removed from store."}
@@ -292,15 +326,17 @@ class VectorStore:
                 "error": f"Entry length exceeds maximum length of {self.max_entry_length} characters."
             }
 
-        self._index.remove_ids(np.array([vec_id], dtype=np.int64))
+        index = self._get_index()
+        index.remove_ids(np.array([vec_id], dtype=np.int64))
         vector = self._embed(new_text)
-        self._index.add_with_ids(vector, np.array([vec_id], dtype=np.int64))
+        index.add_with_ids(vector, np.array([vec_id], dtype=np.int64))
         self._store[vec_id] = new_text
 
         return {"status": f"ID {vec_id} updated."}
 
     def clear(self) -> dict[str, str]:
-        self._index.reset()
+        if self._index is not None:
+            self._index.reset()
         self._store.clear()
         self._next_id = 0
 
@@ -317,7 +353,7 @@ class VectorStore:
         q_vec = self._embed(query)
 
         # scores and ids come back with one row each (shape == (1, top_k))
-        scores, ids = self._index.search(q_vec, min(top_k, len(self._store)))
+        scores, ids = self._get_index().search(q_vec, min(top_k, len(self._store)))
 
         results = []
         for score, vid in zip(scores[0], ids[0]):
@@ -359,7 +395,8 @@ class VectorStore:
         """
         self._next_id = snapshot_data["next_id"]
         self._store = {int(k): v for k, v in snapshot_data["store"].items()}
-        self._index.reset()
+        if self._index is not None:
+            self._index.reset()
 
         if self._store:
             # Re-embed every stored text in one batch
@@ -369,4 +406,4 @@ class VectorStore:
             vectors = self._embed(texts)
 
             # Re-populate the index with the known IDs
-            self._index.add_with_ids(vectors, ids)
+            self._get_index().add_with_ids(vectors, ids)
@@ -2,6 +2,13 @@ import random
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.keyword_index import (
+    KeywordIndex,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
+
 DEFAULT_STATE = {
     "generated_ids": set(),
     "user_count": 4,
@@ -85,6 +92,7 @@ class MessageAPI:
             "message_count", DEFAULT_STATE_COPY["message_count"]
         )
         self.current_user = scenario.get("current_user", DEFAULT_STATE_COPY["current_user"])
+        self._build_indexes()
 
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, MessageAPI):
@@ -101,6 +109,31 @@ class MessageAPI:
 
         return True
 
+    def _build_indexes(self) -> None:
+        """
+        Build the secondary indexes over `user_map` and `inbox`.
+
+        The indexes are private attributes, so they are not part of the state compared by `__eq__` and the state checker.
+        Every method that mutates `user_map` or `inbox` must keep them in sync.
+        """
+        self._user_ids = set(self.user_map.values())
+        # Each inbox entry gets a key that increases with its position in the inbox
+        self._next_message_key = 0
+        self._messages: Dict[int, Dict[str, str]] = {}
+        self._message_keys_by_receiver: Dict[str, List[int]] = {}
+        self._message_keyword_index = KeywordIndex()
+        for message in self.inbox:
+            self._index_message(message)
+
+    def _index_message(self, message: Dict[str, str]) -> None:
+        message_key = self._next_message_key
+        self._next_message_key += 1
+        # Only the first item of an inbox entry is considered, same as in the methods below
+        receiver_id, message_content = list(message.items())[0]
+        self._messages[message_key] = message
+        self._message_keys_by_receiver.setdefault(receiver_id, []).append(message_key)
+        self._message_keyword_index.add(message_key, message_content)
+
     def _generate_id(self):
         """
         Generate a unique ID for a message.
@@ -116,6 +149,7 @@ class MessageAPI:
         self.generated_ids.add(new_id)
         return {"new_id": new_id}
 
+    @read_only
     def list_users(self) -> Dict[str, List[str]]:
         """
         List all users in the workspace.
@@ -125,6 +159,7 @@ class MessageAPI:
         """
         return {"user_list": list(self.user_map.keys())}
 
+    @read_only
     def get_user_id(self, user: str) -> Dict[str, Optional[str]]:
         """
         Get user ID from user name.
@@ -150,7 +185,7 @@ class MessageAPI:
             login_status (bool): True if login was successful, False otherwise.
             message (str): A message describing the result of the login attempt.
         """
-        if user_id not in [id for id in self.user_map.values()]:
+        if user_id not in self._user_ids:
             return {"login_status": False, "message": f"User ID '{user_id}' not found."}
         self.current_user = user_id
         return {
@@ -158,6 +193,7 @@ class MessageAPI:
             "message": f"User '{user_id}' logged in successfully.",
         }
 
+    @read_only
     def message_get_login_status(self) -> Dict[str, bool]:
         """
         Get the login status of the current user.
@@ -182,12 +218,13 @@ class MessageAPI:
         if not self.current_user:
             return {"error": "No user is currently logged in."}
         # Validate receiver existence
-        if receiver_id not in self.user_map.values():
+        if receiver_id not in self._user_ids:
             return {"error": f"Receiver ID '{receiver_id}' not found."}
         # Generate a unique message ID
         message_id = self._generate_id()
         # Store the message in the inbox
         self.inbox.append({receiver_id: message})
+        self._index_message(self.inbox[-1])
         self.message_count += 1
         return {
             "sent_status": True,
@@ -209,18 +246,37 @@ class MessageAPI:
         if not self.current_user:
             return {"error": "No user is currently logged in."}
 
-        # Loop through the inbox in reverse order to find the first message sent to the receiver
-        for message in self.inbox[::-1]:
-            receiver, _ = list(message.items())[0]
-            if receiver == receiver_id:
-                self.inbox.remove(message)
-                return {
-                    "deleted_status": True,
-                    "message_id": receiver,
-                    "message": f"Receiver {receiver_id}'s first message deleted successfully.",
-                }
-        return {"error": f"Receiver ID {receiver_id} not found."}
+        # The last key in the receiver's list is the latest message sent to the receiver
+        message_keys = self._message_keys_by_receiver.get(receiver_id)
+        if not message_keys:
+            return {"error": f"Receiver ID {receiver_id} not found."}
+        message = self._messages[message_keys[-1]]
+
+        # Same as `self.inbox.remove(message)`: the first inbox entry equal to the message is removed, which is an earlier duplicate rather than the latest message if there is one
+        index = self.inbox.index(message)
+        del self.inbox[index]
+        # Keys increase with the inbox position, and `_messages` keeps them in that order
+        removed_key = list(self._messages)[index]
+        removed_receiver_id = list(self._messages.pop(removed_key).keys())[0]
+        self._message_keyword_index.remove(removed_key)
+        receiver_keys = self._message_keys_by_receiver[removed_receiver_id]
+        was_first_message = receiver_keys[0] == removed_key
+        receiver_keys.remove(removed_key)
+        if not receiver_keys:
+            del self._message_keys_by_receiver[removed_receiver_id]
+        elif was_first_message:
+            # The receiver's first message is now a later one, which can move the receiver after others
+            self._message_keys_by_receiver = dict(
+                sorted(self._message_keys_by_receiver.items(), key=lambda item: item[1][0])
+            )
+
+        return {
+            "deleted_status": True,
+            "message_id": receiver_id,
+            "message": f"Receiver {receiver_id}'s first message deleted successfully.",
+        }
 
+    @read_only
     def view_messages_sent(self) -> Dict[str, Union[Dict[str, List[str]], str]]:
         """
         View all historical messages sent by the current user.
@@ -231,15 +287,14 @@ class MessageAPI:
         """
         if not self.current_user:
             return {"error": "No user is currently logged in."}
-        # Dictionary to collect messages grouped by receiver
-        sent_messages = {}
-        # Loop through the inbox and collect messages sent by the current user
-        for message in self.inbox:
-            receiver, message_content = list(message.items())[0]
-            if receiver not in sent_messages:
-                sent_messages[receiver] = [message_content]
-            else:
-                sent_messages[receiver].append(message_content)
+        # Receivers are kept in the order of their first message in the inbox, and their messages in inbox order
+        sent_messages = {
+            receiver: [
+                list(self._messages[message_key].values())[0]
+                for message_key in message_keys
+            ]
+            for receiver, message_keys in self._message_keys_by_receiver.items()
+        }
         return {"messages": sent_messages}
 
     def add_contact(self, user_name: str) -> Dict[str, Union[bool, str]]:
@@ -256,15 +311,17 @@ class MessageAPI:
             return {"error": f"User name '{user_name}' already exists."}
         self.user_count += 1
         user_id = f"USR{str(self.user_count).zfill(3)}"
-        if user_id in self.user_map.values():
+        if user_id in self._user_ids:
             return {"error": f"User ID '{user_id}' already exists."}
         self.user_map[user_name] = user_id
+        self._user_ids.add(user_id)
         return {
             "added_status": True,
             "user_id": user_id,
             "message": f"Contact '{user_name}' added successfully.",
         }
 
+    @read_only
     def search_messages(
         self, keyword: str
     ) -> Dict[str, Union[List[Dict[str, Union[str, List[str]]]], str]]:
@@ -279,21 +336,19 @@ class MessageAPI:
         """
         if not self.current_user:
             return {"error": "No user is currently logged in."}
-        keyword_lower = keyword.lower()
         results = []
-        # Iterate through the inbox to search for the keyword in messages
-        # for message_id, message_data in self.inbox.items():
-        for message_data in self.inbox:
-            receiver_id, message_content = list(message_data.items())[0]
-            if keyword_lower in message_content.lower():
-                results.append(
-                    {
-                        "receiver_id": receiver_id,
-                        "message": message_content,
-                    }
-                )
+        # Message keys increase with the inbox position, so sorting them restores the inbox order
+        for message_key in sorted(self._message_keyword_index.search(keyword)):
+            receiver_id, message_content = list(self._messages[message_key].items())[0]
+            results.append(
+                {
+                    "receiver_id": receiver_id,
+                    "message": message_content,
+                }
+            )
         return {"results": results}
 
+    @read_only
     def get_message_stats(self) -> Dict[str, Union[Dict[str, int], str]]:
         """
         Get statistics about messages for the current user.
@@ -304,18 +359,9 @@ class MessageAPI:
         """
         if not self.current_user:
             return {"error": "No user is currently logged in."}
-        sent_count = 0
-        received_count = 0
-        contacts = set()
-        # Loop through the inbox to calculate stats
-        for message_data in self.inbox:
-            receiver_id, message_content = list(message_data.items())[0]
-            received_count += 1
-            contacts.add(receiver_id)
-        total_contacts = len(contacts)
         return {
             "stats": {
-                "received_count": received_count,
-                "total_contacts": total_contacts,
+                "received_count": len(self.inbox),
+                "total_contacts": len(self._message_keys_by_receiver),
             }
         }
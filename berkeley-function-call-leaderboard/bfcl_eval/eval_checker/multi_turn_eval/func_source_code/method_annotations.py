@@ -0,0 +1,40 @@
+from typing import Callable, Optional
+
+"""
+Read/write annotations of the backend methods exposed to the model.
+
+`execute_multi_turn_func_call` runs the read-only calls a model emits in one step concurrently, and every other call sequentially, in order.
+Methods are writes unless annotated with `@read_only`, so a backend that is not annotated keeps the sequential behavior.
+"""
+
+_READ_ONLY_ATTRIBUTE = "__bfcl_read_only__"
+
+
+def read_only(method: Optional[Callable] = None, *, unless: Optional[str] = None):
+    """
+    Mark a backend method as read-only: it neither mutates its instance (or any state shared with other instances), nor depends on the order in which it runs relative to other read-only calls, eg. by drawing from a seeded random generator.
+
+    Args:
+        unless (str, optional): Name of a boolean instance attribute. When it is true, the method is treated as a write, eg. for a method that only draws from a random generator in some configurations.
+
+    Usage: `@read_only` or `@read_only(unless="_enable_random_insertion")`.
+    """
+
+    def decorator(method: Callable) -> Callable:
+        # Only the attribute name is stored, so that the decorated method itself is unchanged
+        setattr(method, _READ_ONLY_ATTRIBUTE, unless or True)
+        return method
+
+    if method is not None:
+        return decorator(method)
+    return decorator
+
+
+def is_read_only(bound_method: Callable) -> bool:
+    """
+    Whether the bound backend method is read-only for its instance, in the instance's current configuration.
+    """
+    annotation = getattr(bound_method, _READ_ONLY_ATTRIBUTE, False)
+    if isinstance(annotation, str):
+        return not getattr(bound_method.__self__, annotation, False)
+    return annotation
@@ -1,6 +1,13 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.keyword_index import (
+    KeywordIndex,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
+
 DEFAULT_STATE = {
     "username": "john",
     "password": "john123",
@@ -48,6 +55,36 @@ class TwitterAPI:
         self.tweet_counter = scenario.get(
             "tweet_counter", DEFAULT_STATE_COPY["tweet_counter"]
         )
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """
+        Build the secondary indexes over `tweets` (by username, by tag, and by content keyword).
+
+        The indexes are private attributes, so they are not part of the state compared by the state checker.
+        Every method that mutates `tweets` must keep them in sync.
+        """
+        # Position of each tweet in `self.tweets`, used to return results in the same order as iterating over it
+        self._tweet_positions: Dict[int, int] = {}
+        self._tweet_ids_by_username: Dict[str, List[int]] = {}
+        self._tweet_ids_by_tag: Dict[str, set] = {}
+        self._tweet_content_index = KeywordIndex()
+        # Tweets whose tags cannot be lower-cased; `search_tweets` evaluates them one by one, same as the original scan
+        self._unindexed_tag_tweet_ids: set = set()
+        for tweet_id, tweet in self.tweets.items():
+            self._index_tweet(tweet_id, tweet)
+
+    def _index_tweet(self, tweet_id: int, tweet: Dict[str, Union[int, str, List[str]]]) -> None:
+        self._tweet_positions[tweet_id] = len(self._tweet_positions)
+        self._tweet_ids_by_username.setdefault(tweet["username"], []).append(tweet_id)
+        self._tweet_content_index.add(tweet_id, tweet["content"])
+        try:
+            tags = {tag.lower() for tag in tweet["tags"]}
+        except (AttributeError, TypeError):
+            self._unindexed_tag_tweet_ids.add(tweet_id)
+            return
+        for tag in tags:
+            self._tweet_ids_by_tag.setdefault(tag, set()).add(tweet_id)
 
     def authenticate_twitter(self, username: str, password: str) -> Dict[str, bool]:
         """
@@ -64,6 +101,7 @@ class TwitterAPI:
             return {"authentication_status": True}
         return {"authentication_status": False}
 
+    @read_only
     def posting_get_login_status(self) -> Dict[str, Union[bool, str]]:
         """
         Get the login status of the current user.
@@ -100,7 +138,13 @@ class TwitterAPI:
             "tags": tags,
             "mentions": mentions,
         }
-        self.tweets[self.tweet_counter] = tweet
+        if self.tweet_counter in self.tweets:
+            # Overwriting an existing tweet keeps its position in the dict, so just rebuild the indexes
+            self.tweets[self.tweet_counter] = tweet
+            self._build_indexes()
+        else:
+            self.tweets[self.tweet_counter] = tweet
+            self._index_tweet(self.tweet_counter, tweet)
         self.tweet_counter += 1
         return tweet
 
@@ -189,6 +233,7 @@ class TwitterAPI:
         self.following_list.append(username_to_follow)
         return {"follow_status": True}
 
+    @read_only
     def list_all_following(self) -> List[str]:
         """
         List all users that the authenticated user is following.
@@ -219,6 +264,7 @@ class TwitterAPI:
         self.following_list.remove(username_to_unfollow)
         return {"unfollow_status": True}
 
+    @read_only
     def get_tweet(self, tweet_id: int) -> Dict[str, Union[int, str, List[str]]]:
         """
         Retrieve a specific tweet.
@@ -237,6 +283,7 @@ class TwitterAPI:
 
         return self.tweets[tweet_id]
 
+    @read_only
     def get_user_tweets(self, username: str) -> List[Dict[str, Union[int, str, List[str]]]]:
         """
         Retrieve all tweets from a specific user.
@@ -251,8 +298,12 @@ class TwitterAPI:
                 - tags (List[str]): List of tags associated with the tweet.
                 - mentions (List[str]): List of users mentioned in the tweet.
         """
-        return [tweet for tweet in self.tweets.values() if tweet["username"] == username]
+        return [
+            self.tweets[tweet_id]
+            for tweet_id in self._tweet_ids_by_username.get(username, [])
+        ]
 
+    @read_only
     def search_tweets(self, keyword: str) -> List[Dict[str, Union[int, str, List[str]]]]:
         """
         Search for tweets containing a specific keyword.
@@ -267,13 +318,24 @@ class TwitterAPI:
                 - tags (List[str]): List of tags associated with the tweet.
                 - mentions (List[str]): List of users mentioned in the tweet.
         """
+        keyword_lower = keyword.lower()
+        matching_tweet_ids = self._tweet_content_index.search(keyword_lower)
+        matching_tweet_ids |= self._tweet_ids_by_tag.get(keyword_lower, set())
+        for tweet_id in self._unindexed_tag_tweet_ids:
+            tweet = self.tweets[tweet_id]
+            if keyword_lower in tweet["content"].lower() or keyword_lower in [
+                tag.lower() for tag in tweet["tags"]
+            ]:
+                matching_tweet_ids.add(tweet_id)
+
         return [
-            tweet
-            for tweet in self.tweets.values()
-            if keyword.lower() in tweet["content"].lower()
-            or keyword.lower() in [tag.lower() for tag in tweet["tags"]]
+            self.tweets[tweet_id]
+            for tweet_id in sorted(
+                matching_tweet_ids, key=self._tweet_positions.__getitem__
+            )
         ]
 
+    @read_only
     def get_tweet_comments(self, tweet_id: int) -> List[Dict[str, str]]:
         """
         Retrieve all comments for a specific tweet.
@@ -289,6 +351,7 @@ class TwitterAPI:
             return {"error": f"Tweet with ID {tweet_id} not found."}
         return self.comments.get(tweet_id, [])
 
+    @read_only
     def get_user_stats(self, username: str) -> Dict[str, int]:
         """
         Get statistics for a specific user.
@@ -300,9 +363,7 @@ class TwitterAPI:
             following_count (int): Number of users the specified user is following.
             retweet_count (int): Number of retweets made by the user.
         """
-        tweet_count = len(
-            [tweet for tweet in self.tweets.values() if tweet["username"] == username]
-        )
+        tweet_count = len(self._tweet_ids_by_username.get(username, []))
         following_count = len(self.following_list) if username == self.username else 0
         retweet_count = len(self.retweets.get(username, []))
 
@@ -1,6 +1,10 @@
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
+
 DEFAULT_STATE = {
     "ticket_queue": [],
     "ticket_counter": 1,
@@ -45,6 +49,35 @@ class TicketAPI:
             "ticket_counter", DEFAULT_STATE_COPY["ticket_counter"]
         )
         self.current_user = scenario.get("current_user", DEFAULT_STATE_COPY["current_user"])
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """
+        Build the secondary indexes over `ticket_queue` (by ticket ID and by creator).
+
+        The indexes are private attributes, so they are not part of the state compared by the state checker.
+        Ticket IDs and creators cannot be changed through `edit_ticket`, so only `create_ticket` needs to update them.
+        """
+        self._ticket_by_id: Dict[int, Dict[str, Union[int, str]]] = {}
+        self._tickets_by_creator: Dict[str, List[Dict[str, Union[int, str]]]] = {}
+        # Some scenarios contain tickets without an `id` or `created_by` field.
+        # The lookups on these fields then fall back to scanning the queue, so that they fail with the same error as before.
+        self._all_tickets_have_id = True
+        self._all_tickets_have_creator = True
+        for ticket in self.ticket_queue:
+            self._index_ticket(ticket)
+
+    def _index_ticket(self, ticket: Dict[str, Union[int, str]]) -> None:
+        if "id" in ticket:
+            # `_find_ticket` returns the first ticket with a given ID
+            self._ticket_by_id.setdefault(ticket["id"], ticket)
+        else:
+            self._all_tickets_have_id = False
+
+        if "created_by" in ticket:
+            self._tickets_by_creator.setdefault(ticket["created_by"], []).append(ticket)
+        else:
+            self._all_tickets_have_creator = False
 
     def create_ticket(
         self, title: str, description: str = "", priority: int = 1
@@ -77,9 +110,11 @@ class TicketAPI:
             "created_by": self.current_user,
         }
         self.ticket_queue.append(ticket)
+        self._index_ticket(ticket)
         self.ticket_counter += 1
         return ticket
 
+    @read_only
     def get_ticket(self, ticket_id: int) -> Dict[str, Union[int, str]]:
         """
         Get a specific ticket by its ID.
@@ -185,6 +220,9 @@ class TicketAPI:
             priority (int): Priority level of the ticket.
             created_by (str): Username of the ticket creator.
         """
+        if self._all_tickets_have_id:
+            return self._ticket_by_id.get(ticket_id)
+
         for ticket in self.ticket_queue:
             if ticket["id"] == ticket_id:
                 return ticket
@@ -207,6 +245,7 @@ class TicketAPI:
             return {"success": True}
         return {"success": False}
 
+    @read_only
     def ticket_get_login_status(self) -> Dict[str, bool]:
         """
         Get the username of the currently authenticated user.
@@ -229,6 +268,7 @@ class TicketAPI:
             return {"success": True}
         return {"success": False}
 
+    @read_only
     def get_user_tickets(
         self, status: Optional[str] = None
     ) -> List[Dict[str, Union[int, str]]]:
@@ -249,11 +289,14 @@ class TicketAPI:
         if not self.current_user:
             return [{"error": "User not authenticated. Please log in to view tickets."}]
 
-        user_tickets = [
-            ticket
-            for ticket in self.ticket_queue
-            if ticket["created_by"] == self.current_user
-        ]
+        if self._all_tickets_have_creator:
+            user_tickets = list(self._tickets_by_creator.get(self.current_user, []))
+        else:
+            user_tickets = [
+                ticket
+                for ticket in self.ticket_queue
+                if ticket["created_by"] == self.current_user
+            ]
 
         if status:
             user_tickets = [
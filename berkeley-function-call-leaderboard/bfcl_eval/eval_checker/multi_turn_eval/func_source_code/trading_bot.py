@@ -12,6 +12,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     TRANSACTION_HISTORY_EXTENSION,
     WATCH_LIST_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 CURRENT_TIME = datetime(2024, 9, 1, 10, 30)
 
@@ -212,6 +215,7 @@ class TradingBot:
 
         return random_date.strftime("%Y-%m-%d %H:%M:%S")
 
+    @read_only
     def get_current_time(self) -> Dict[str, str]:
         """
         Get the current time.
@@ -243,6 +247,7 @@ class TradingBot:
             self.market_status = "Closed"
             return {"status": "Closed"}
 
+    @read_only
     def get_symbol_by_name(self, name: str) -> Dict[str, str]:
         """
         Get the symbol of a stock by company name.
@@ -271,6 +276,7 @@ class TradingBot:
 
         return {"symbol": symbol_map.get(name, "Stock not found")}
 
+    @read_only
     def get_stock_info(self, symbol: str) -> Dict[str, Union[float, int, str]]:
         """
         Get the details of a stock.
@@ -294,6 +300,7 @@ class TradingBot:
             return stock
         return self.stocks[symbol]
 
+    @read_only
     def get_order_details(self, order_id: int) -> Dict[str, Union[str, float, int]]:
         """
         Get the details of an order.
@@ -461,6 +468,7 @@ class TradingBot:
             "new_balance": self.account_info["balance"],
         }
 
+    @read_only
     def get_account_info(self) -> Dict[str, Union[int, float]]:
         """
         Get account information.
@@ -493,6 +501,7 @@ class TradingBot:
         self.authenticated = True
         return {"status": "Logged in successfully"}
 
+    @read_only
     def trading_get_login_status(self) -> Dict[str, bool]:
         """
         Get the login status.
@@ -562,6 +571,7 @@ class TradingBot:
         self.watch_list.remove(symbol)
         return {"status": f"Stock {symbol} removed from watchlist successfully."}
 
+    @read_only
     def get_watchlist(self) -> Dict[str, List[str]]:
         """
         Get the watchlist.
@@ -578,6 +588,7 @@ class TradingBot:
             return watch_list
         return {"watchlist": self.watch_list}
 
+    @read_only
     def get_order_history(self) -> Dict[str, List[Dict[str, Union[str, int, float]]]]:
         """
         Get the stock order ID history.
@@ -592,6 +603,7 @@ class TradingBot:
 
         return {"history": list(self.orders.keys())}
 
+    @read_only
     def get_transaction_history(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> Dict[str, List[Dict[str, Union[str, float]]]]:
@@ -639,6 +651,7 @@ class TradingBot:
         return {"transaction_history": filtered_history}
 
     # below contains a list of functions to be nested
+    @read_only
     def get_available_stocks(self, sector: str) -> Dict[str, List[str]]:
         """
         Get a list of stock symbols in the given sector.
@@ -659,6 +672,7 @@ class TradingBot:
             sector_map["Automobile"].extend(AUTOMOBILE_EXTENSION)
         return {"stock_list": sector_map.get(sector, [])}
 
+    @read_only
     def filter_stocks_by_price(
         self, stocks: List[str], min_price: float, max_price: float
     ) -> Dict[str, List[str]]:
@@ -696,6 +710,7 @@ class TradingBot:
                 self.watch_list.append(stock)
         return {"symbol": self.watch_list}
 
+    @read_only
     def notify_price_change(self, stocks: List[str], threshold: float) -> Dict[str, str]:
         """
         Notify if there is a significant price change in the stocks.
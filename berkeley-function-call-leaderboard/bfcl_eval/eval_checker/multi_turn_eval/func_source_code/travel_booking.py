@@ -7,6 +7,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     BOOKING_RECORD_EXTENSION,
     CREDIT_CARD_EXTENSION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 DEFAULT_STATE = {
     "random_seed": 141053,
@@ -154,6 +157,7 @@ class TravelAPI:
             "scope": grant_type,
         }
 
+    @read_only
     def travel_get_login_status(self) -> Dict[str, bool]:
         """
         Get the status of the login
@@ -164,6 +168,7 @@ class TravelAPI:
         is_not_loggedin = self.token_expires_in is None or self.token_expires_in == 0
         return {"status": not is_not_loggedin}
 
+    @read_only
     def get_budget_fiscal_year(
         self,
         lastModifiedAfter: Optional[str] = None,
@@ -440,6 +445,7 @@ class TravelAPI:
 
         return {"travel_cost_list": travel_cost_list}
 
+    @read_only
     def get_credit_card_balance(
         self, access_token: str, card_id: str
     ) -> Dict[str, Union[float, str]]:
@@ -585,6 +591,7 @@ class TravelAPI:
             "booking_history": {},
         }
 
+    @read_only
     def retrieve_invoice(
         self,
         access_token: str,
@@ -625,6 +632,7 @@ class TravelAPI:
         }
         return {"invoice": invoice}
 
+    @read_only
     def get_booking_history(
         self,
         access_token: str,
@@ -653,6 +661,7 @@ class TravelAPI:
         # Simply return a copy of the booking records to avoid accidental mutation
         return {"booking_history": deepcopy(self.booking_record)}
 
+    @read_only
     def list_all_airports(self) -> List[str]:
         """
         List all available airports
@@ -710,6 +719,7 @@ class TravelAPI:
         del self.booking_record[booking_id]
         return {"cancel_status": True}
 
+    @read_only
     def compute_exchange_rate(
         self, base_currency: str, target_currency: str, value: float
     ) -> float:
@@ -743,6 +753,7 @@ class TravelAPI:
                 return {"exchanged_value": round(value / val, 2)}
         raise ValueError("No available exchange rate for the given currencies.")
 
+    @read_only
     def verify_traveler_information(
         self, first_name: str, last_name: str, date_of_birth: str, passport_number: str
     ) -> Dict[str, Union[bool, str]]:
@@ -817,6 +828,7 @@ class TravelAPI:
         self.budget_limit = budget_limit
         return {"budget_limit": budget_limit}
 
+    @read_only
     def get_nearest_airport_by_city(self, location: str) -> Dict[str, str]:
         """
         Get the nearest airport to the given location
@@ -891,6 +903,7 @@ class TravelAPI:
             "insurance_status": True,
         }
 
+    @read_only
     def contact_customer_support(self, booking_id: str, message: str) -> Dict[str, str]:
         """
         Contact travel booking customer support, get immediate support on an issue with an online call.
@@ -908,6 +921,7 @@ class TravelAPI:
             "customer_support_message": "Thank you for contacting customer support. Your message has been received and we will get back to you shortly."
         }
 
+    @read_only
     def get_all_credit_cards(self) -> Dict[str, Dict[str, Union[str, int, float]]]:
         """
         Get all registered credit cards
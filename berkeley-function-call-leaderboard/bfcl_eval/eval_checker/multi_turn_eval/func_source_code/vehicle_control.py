@@ -8,6 +8,9 @@ from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import
     LONG_WEATHER_EXTENSION,
     PARKING_BRAKE_INSTRUCTION,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
 
 MAX_FUEL_LEVEL = 50
 MIN_FUEL_LEVEL = 0.0
@@ -292,6 +295,7 @@ class VehicleControlAPI:
             "humidityLevel": self.humidityLevel,
         }
 
+    # Not read-only: the result is drawn from the seeded random generator of the instance
     def get_outside_temperature_from_google(self) -> Dict[str, float]:
         """
         Gets the outside temperature.
@@ -303,6 +307,7 @@ class VehicleControlAPI:
             return LONG_WEATHER_EXTENSION
         return {"outsideTemperature": self._random.uniform(-10.0, 40.0)}
 
+    @read_only
     def get_outside_temperature_from_weather_com(self) -> Dict[str, float]:
         """
         Gets the outside temperature.
@@ -328,6 +333,7 @@ class VehicleControlAPI:
             self.headLightStatus = "off"
             return {"headlightStatus": "off"}
 
+    @read_only
     def displayCarStatus(self, option: str) -> Dict[str, Union[str, float, Dict[str, str]]]:
         """
         Displays the status of the vehicle based on the provided display option.
@@ -499,6 +505,7 @@ class VehicleControlAPI:
                 "distanceToNextVehicle": distanceToNextVehicle,
             }
 
+    # Not read-only: the result is drawn from the seeded random generator of the instance
     def get_current_speed(self) -> Dict[str, float]:
         """
         Gets the current speed of the vehicle.
@@ -507,6 +514,7 @@ class VehicleControlAPI:
         """
         return {"currentSpeed": self._random.uniform(0.0, 120.0)}
 
+    @read_only
     def display_log(self, messages: List[str]):
         """
         Displays the log messages.
@@ -517,6 +525,7 @@ class VehicleControlAPI:
         """
         return {"log": messages}
 
+    @read_only
     def estimate_drive_feasibility_by_mileage(self, distance: float) -> Dict[str, bool]:
         """
         Estimates the milage of the vehicle given the distance needed to drive.
@@ -530,6 +539,7 @@ class VehicleControlAPI:
         else:
             return {"canDrive": True}
 
+    @read_only
     def liter_to_gallon(self, liter: float) -> Dict[str, float]:
         """
         Converts the liter to gallon.
@@ -540,6 +550,7 @@ class VehicleControlAPI:
         """
         return {"gallon": liter * 0.264172}
 
+    @read_only
     def gallon_to_liter(self, gallon: float) -> Dict[str, float]:
         """
         Converts the gallon to liter.
@@ -550,6 +561,7 @@ class VehicleControlAPI:
         """
         return {"liter": gallon * 3.78541}
 
+    @read_only
     def estimate_distance(self, cityA: str, cityB: str) -> Dict[str, float]:
         """
         Estimates the distance between two cities.
@@ -615,6 +627,7 @@ class VehicleControlAPI:
             distance["intermediaryCities"] = INTERMEDIARY_CITIES
         return distance
 
+    @read_only
     def get_zipcode_based_on_city(self, city: str) -> Dict[str, str]:
         """
         Gets the zipcode based on the city.
@@ -659,6 +672,7 @@ class VehicleControlAPI:
         self.destination = destination
         return {"status": "Navigating to " + destination}
 
+    @read_only
     def check_tire_pressure(self):
         """
         Checks the tire pressure of the vehicle.
@@ -694,6 +708,7 @@ class VehicleControlAPI:
             tire_status["car_info"] = CAR_STATUS_METADATA_EXTENSION
         return tire_status
 
+    @read_only
     def find_nearest_tire_shop(self) -> Dict[str, str]:
         """
         Finds the nearest tire shop.
@@ -7,6 +7,13 @@ from urllib.parse import urlparse
 
 import html2text
 import requests
+from bfcl_eval.constants.eval_config import WEB_SEARCH_CORPUS_PATH
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    read_only,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.web_search_corpus import (
+    WebSearchCorpus,
+)
 from bs4 import BeautifulSoup
 from serpapi import GoogleSearch
 
@@ -27,6 +34,14 @@ ERROR_TEMPLATES = [
     ),
 ]
 
+# Shared by all WebSearchAPI instances, so that the converted pages are cached across test entries
+WEB_SEARCH_CORPUS = WebSearchCorpus(WEB_SEARCH_CORPUS_PATH)
+
+# "live": query the search engine and fetch pages over the network (default)
+# "record": same as live, but also store every response in the web search corpus
+# "replay": serve every response from the web search corpus, without any network access
+WEB_SEARCH_MODES = ["live", "record", "replay"]
+
 
 class WebSearchAPI:
     def __init__(self):
@@ -49,6 +64,12 @@ class WebSearchAPI:
         # Use a separate random generator for perturbations to keep it reproducible if needed
         self._perturb_rng = random.Random(42)
 
+        self._web_search_mode = os.getenv("BFCL_WEB_SEARCH_MODE", "live").lower()
+        if self._web_search_mode not in WEB_SEARCH_MODES:
+            raise ValueError(
+                f"Invalid BFCL_WEB_SEARCH_MODE '{self._web_search_mode}'. Supported modes are: {WEB_SEARCH_MODES}."
+            )
+
     def _apply_random_insertion(self, text: str) -> str:
         """
         Apply random text insertion perturbation to the given text.
@@ -85,6 +106,8 @@ class WebSearchAPI:
         # It's there to match the signature of functions in the multi-turn evaluation code
         self.show_snippet = initial_config["show_snippet"]
 
+    # The random insertion perturbation draws from a seeded random generator shared by the calls, so the calls must then run in order
+    @read_only(unless="_enable_random_insertion")
     def search_engine_query(
         self,
         keywords: str,
@@ -173,6 +196,16 @@ class WebSearchAPI:
             - 'href' (str): The URL of the search result.
             - 'body' (str): A brief description or snippet from the search result.
         """
+        if self._web_search_mode == "replay":
+            raw_results = WEB_SEARCH_CORPUS.get_search_results(keywords, region, max_results)
+            if raw_results is None:
+                print(
+                    f"❗️❗️ [WebSearchAPI] No recorded search results for '{keywords}' (region '{region}') in the web search corpus at {WEB_SEARCH_CORPUS.corpus_dir}."
+                )
+                # Return empty list instead of error dict to avoid empty response errors
+                return []
+            return self._format_search_results(raw_results, max_results)
+
         # Check which API to use (prefer Serper.dev if available)
         serper_api_key = os.getenv("SERPER_API_KEY")
         serpapi_key = os.getenv("SERPAPI_API_KEY")
@@ -181,10 +214,10 @@ class WebSearchAPI:
         
         if use_serper:
             # Serper.dev implementation
-            return self._search_with_serper(keywords, max_results, region)
+            raw_results = self._search_with_serper(keywords, max_results, region)
         elif serpapi_key:
             # SerpAPI implementation (fallback)
-            return self._search_with_serpapi(keywords, max_results, region)
+            raw_results = self._search_with_serpapi(keywords, max_results, region)
         else:
             # No API key configured
             error_msg = "No search API key configured. Please set either SERPER_API_KEY or SERPAPI_API_KEY in your .env file."
@@ -192,13 +225,70 @@ class WebSearchAPI:
             # Return empty list instead of error dict to avoid empty response errors
             return []
 
+        if raw_results is None:
+            # The search failed and the error has already been printed; failures are not recorded
+            return []
+        if self._web_search_mode == "record":
+            WEB_SEARCH_CORPUS.put_search_results(keywords, region, max_results, raw_results)
+        return self._format_search_results(raw_results, max_results)
+
+    def _format_search_results(self, raw_results: list, max_results: Optional[int]) -> list:
+        """
+        Convert the raw search engine results (dicts with `title`, `link` and `snippet`) to the format returned by `search_engine_query`.
+        """
+        results = []
+        for result in raw_results[:max_results]:
+            # Ensure all required fields exist with defaults to avoid KeyError
+            title = result.get("title", "")
+            link = result.get("link", "")
+            snippet = result.get("snippet", "")
+            
+            # Ensure title and link are not empty (required fields)
+            if not title or not link:
+                continue  # Skip invalid results
+            
+            if self.show_snippet:
+                # Apply random insertion perturbation to the body/snippet
+                body = self._apply_random_insertion(snippet) if snippet else ""
+                results.append(
+                    {
+                        "title": title,
+                        "href": link,
+                        "body": body,
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "title": title,
+                        "href": link,
+                    }
+                )
+        
+        # Always return a list, even if empty, to avoid empty response errors
+        return results
+
+    @staticmethod
+    def _extract_raw_results(organic_results: list) -> list:
+        """
+        Keep only the fields of the organic search results that are used, so that they can be recorded compactly.
+        """
+        return [
+            {
+                "title": result.get("title", ""),
+                "link": result.get("link", ""),
+                "snippet": result.get("snippet", ""),
+            }
+            for result in organic_results
+        ]
+
     def _search_with_serper(
         self,
         keywords: str,
         max_results: Optional[int] = 10,
         region: Optional[str] = "wt-wt",
-    ) -> list:
-        """Search using Serper.dev API."""
+    ) -> Optional[list]:
+        """Search using Serper.dev API. Returns the raw organic results, or None if the search failed."""
         backoff = 2  # initial back-off in seconds
         serper_api_key = os.getenv("SERPER_API_KEY")
         
@@ -241,8 +331,7 @@ class WebSearchAPI:
                         + "*" * 100
                     )
                     print(error_block)
-                    # Return empty list instead of error dict to avoid empty response errors
-                    return []
+                    return None
             except Exception as e:
                 error_block = (
                     "*" * 100
@@ -250,59 +339,21 @@ class WebSearchAPI:
                     + "*" * 100
                 )
                 print(error_block)
-                # Return empty list instead of error dict to avoid empty response errors
-                return []
+                return None
             
             break  # Success
         
         # Parse Serper.dev response format
         # Serper.dev returns results in "organic" key
-        if "organic" not in search_results or not search_results["organic"]:
-            # Return empty list instead of error dict to avoid empty response errors
-            return []
-        
-        organic_results = search_results["organic"]
-        
-        # Convert to the desired format matching BFCL expectations
-        results = []
-        for result in organic_results[:max_results]:
-            # Ensure all required fields exist with defaults to avoid KeyError
-            title = result.get("title", "")
-            link = result.get("link", "")
-            snippet = result.get("snippet", "")
-            
-            # Ensure title and link are not empty (required fields)
-            if not title or not link:
-                continue  # Skip invalid results
-            
-            if self.show_snippet:
-                # Apply random insertion perturbation to the body/snippet
-                body = self._apply_random_insertion(snippet) if snippet else ""
-                results.append(
-                    {
-                        "title": title,
-                        "href": link,
-                        "body": body,
-                    }
-                )
-            else:
-                results.append(
-                    {
-                        "title": title,
-                        "href": link,
-                    }
-                )
-        
-        # Always return a list, even if empty, to avoid empty response errors
-        return results
+        return self._extract_raw_results(search_results.get("organic") or [])
 
     def _search_with_serpapi(
         self,
         keywords: str,
         max_results: Optional[int] = 10,
         region: Optional[str] = "wt-wt",
-    ) -> list:
-        """Search using SerpAPI (original implementation)."""
+    ) -> Optional[list]:
+        """Search using SerpAPI (original implementation). Returns the raw organic results, or None if the search failed."""
         backoff = 2  # initial back-off in seconds
         params = {
             "engine": "duckduckgo",
@@ -336,8 +387,7 @@ class WebSearchAPI:
                         + "*" * 100
                     )
                     print(error_block)
-                    # Return empty list instead of error dict to avoid empty response errors
-                    return []
+                    return None
 
             # SerpAPI sometimes returns the error in the payload instead of raising
             if "error" in search_results and "429" in str(search_results["error"]):
@@ -354,45 +404,13 @@ class WebSearchAPI:
 
             break  # Success – no rate-limit error detected
 
-        if "organic_results" not in search_results or not search_results["organic_results"]:
-            # Return empty list instead of error dict to avoid empty response errors
-            return []
+        if "error" in search_results:
+            # Not a rate-limit error, so don't retry; don't record it either
+            return None
 
-        search_results = search_results["organic_results"]
-
-        # Convert the search results to the desired format
-        results = []
-        for result in search_results[:max_results]:
-            # Ensure all required fields exist with defaults to avoid KeyError
-            title = result.get("title", "")
-            link = result.get("link", "")
-            snippet = result.get("snippet", "")
-            
-            # Ensure title and link are not empty (required fields)
-            if not title or not link:
-                continue  # Skip invalid results
-            
-            if self.show_snippet:
-                # Apply random insertion perturbation to the body/snippet
-                body = self._apply_random_insertion(snippet) if snippet else ""
-                results.append(
-                    {
-                        "title": title,
-                        "href": link,
-                        "body": body,
-                    }
-                )
-            else:
-                results.append(
-                    {
-                        "title": title,
-                        "href": link,
-                    }
-                )
-
-        # Always return a list, even if empty, to avoid empty response errors
-        return results
+        return self._extract_raw_results(search_results.get("organic_results") or [])
 
+    @read_only(unless="_enable_random_insertion")
     def fetch_url_content(self, url: str, mode: str = "raw") -> str:
         """
         This function retrieves content from the provided URL and processes it based on the selected mode.
@@ -408,6 +426,48 @@ class WebSearchAPI:
         if not url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid URL: {url}")
 
+        try:
+            html = self._get_page_html(url)
+
+            # Note: Un-comment this when we want to simulate a random error
+            # Flip a coin to simulate a random error
+            # if self._random.random() < 0.95:
+            #     return {"error": self._fake_requests_get_error_msg(url)}
+
+            # Process the response based on the mode
+            # The converted text only depends on the page, so it is cached; the perturbation is applied afterwards
+            if mode == "raw":
+                content = html
+            elif mode in ("markdown", "truncate"):
+                content = WEB_SEARCH_CORPUS.get_converted(
+                    html,
+                    mode,
+                    _html_to_markdown if mode == "markdown" else _html_to_truncated_text,
+                    persist=self._web_search_mode != "live",
+                )
+            else:
+                raise ValueError(f"Unsupported mode: {mode}")
+
+            return {"content": self._apply_random_insertion(content)}
+
+        except Exception as e:
+            return {"error": f"An error occurred while fetching {url}: {str(e)}"}
+
+    def _get_page_html(self, url: str) -> str:
+        """
+        Return the raw HTML of `url`, either fetched over the network or served from the web search corpus, depending on the mode.
+        Raises an exception with the same message as the original failure if the page could not be fetched.
+        """
+        if self._web_search_mode == "replay":
+            record = WEB_SEARCH_CORPUS.get_page(url)
+            if record is None:
+                raise Exception(
+                    f"URL not found in the web search corpus at {WEB_SEARCH_CORPUS.corpus_dir}"
+                )
+            if "error" in record:
+                raise Exception(record["error"])
+            return record["html"]
+
         try:
             # A header that mimics a browser request. This helps avoid 403 Forbidden errors.
             # TODO: Is this the best way to do this?
@@ -433,39 +493,14 @@ class WebSearchAPI:
             }
             response = requests.get(url, headers=headers, timeout=20, allow_redirects=True)
             response.raise_for_status()
-
-            # Note: Un-comment this when we want to simulate a random error
-            # Flip a coin to simulate a random error
-            # if self._random.random() < 0.95:
-            #     return {"error": self._fake_requests_get_error_msg(url)}
-
-            # Process the response based on the mode
-            if mode == "raw":
-                content = self._apply_random_insertion(response.text)
-                return {"content": content}
-
-            elif mode == "markdown":
-                converter = html2text.HTML2Text()
-                markdown = converter.handle(response.text)
-                content = self._apply_random_insertion(markdown)
-                return {"content": content}
-
-            elif mode == "truncate":
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Remove scripts and styles
-                for script_or_style in soup(["script", "style"]):
-                    script_or_style.extract()
-
-                # Extract and clean text
-                text = soup.get_text(separator="\n", strip=True)
-                content = self._apply_random_insertion(text)
-                return {"content": content}
-            else:
-                raise ValueError(f"Unsupported mode: {mode}")
-
         except Exception as e:
-            return {"error": f"An error occurred while fetching {url}: {str(e)}"}
+            if self._web_search_mode == "record":
+                WEB_SEARCH_CORPUS.put_page(url, error=str(e))
+            raise
+
+        if self._web_search_mode == "record":
+            WEB_SEARCH_CORPUS.put_page(url, html=response.text)
+        return response.text
 
     def _fake_requests_get_error_msg(self, url: str) -> str:
         """
@@ -484,3 +519,19 @@ class WebSearchAPI:
         template = self._rng.choice(ERROR_TEMPLATES)
 
         return template.format(**context)
+
+
+def _html_to_markdown(html: str) -> str:
+    converter = html2text.HTML2Text()
+    return converter.handle(html)
+
+
+def _html_to_truncated_text(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Remove scripts and styles
+    for script_or_style in soup(["script", "style"]):
+        script_or_style.extract()
+
+    # Extract and clean text
+    return soup.get_text(separator="\n", strip=True)
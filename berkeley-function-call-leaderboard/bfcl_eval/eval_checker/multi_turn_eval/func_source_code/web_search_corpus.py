@@ -0,0 +1,153 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+DEFAULT_MAX_CONVERTED_CACHE_ENTRIES = 512
+
+
+class WebSearchCorpus:
+    """
+    A local, compressed record of the network responses seen by `WebSearchAPI`, so that the web search categories can be replayed deterministically and offline.
+
+    Three kinds of records are stored, each as a gzip-compressed JSON file named after the content hash of its key:
+        - `search/`: the raw results returned by the search engine for a (keywords, region) pair, before any formatting or perturbation.
+        - `page/`: the raw HTML fetched for a URL, or the error raised while fetching it.
+        - `converted/`: the markdown/truncated text converted from a page's HTML, keyed by the hash of the HTML and the conversion mode.
+
+    Converted texts are additionally kept in an in-memory LRU cache, so repeated fetches of the same page skip the (slow) HTML conversion even in live mode.
+    """
+
+    def __init__(
+        self,
+        corpus_dir: Path,
+        max_converted_cache_entries: int = DEFAULT_MAX_CONVERTED_CACHE_ENTRIES,
+    ):
+        self.corpus_dir = Path(corpus_dir)
+        self.max_converted_cache_entries = max_converted_cache_entries
+        self._converted_cache: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    #### Search results ####
+
+    def get_search_results(
+        self, keywords: str, region: str, max_results: Optional[int]
+    ) -> Optional[list[dict]]:
+        """
+        Return the recorded search results for the query, or None if the query was never recorded with at least `max_results` requested results (None meaning unlimited).
+        """
+        record = self._read("search", self._search_key(keywords, region))
+        if record is None or self._result_limit(record["max_results"]) < self._result_limit(
+            max_results
+        ):
+            return None
+        return record["results"]
+
+    def put_search_results(
+        self, keywords: str, region: str, max_results: Optional[int], results: list[dict]
+    ) -> None:
+        key = self._search_key(keywords, region)
+        existing_record = self._read("search", key)
+        # Keep the record that covers the most results, so it can serve any smaller request
+        if existing_record is not None and self._result_limit(
+            existing_record["max_results"]
+        ) > self._result_limit(max_results):
+            return
+        self._write(
+            "search",
+            key,
+            {
+                "keywords": keywords,
+                "region": region,
+                "max_results": max_results,
+                "results": results,
+            },
+        )
+
+    @staticmethod
+    def _result_limit(max_results: Optional[int]) -> float:
+        # A search without `max_results` returns every result the engine has
+        return float("inf") if max_results is None else max_results
+
+    #### Web pages ####
+
+    def get_page(self, url: str) -> Optional[dict]:
+        """
+        Return the recorded page for `url`, as a dict with either a `html` or an `error` key, or None if the URL was never recorded.
+        """
+        return self._read("page", self._hash(url))
+
+    def put_page(self, url: str, html: Optional[str] = None, error: Optional[str] = None) -> None:
+        record = {"url": url}
+        if error is not None:
+            record["error"] = error
+        else:
+            record["html"] = html
+        self._write("page", self._hash(url), record)
+
+    #### Converted text ####
+
+    def get_converted(
+        self, html: str, mode: str, convert: Callable[[str], str], persist: bool
+    ) -> str:
+        """
+        Return `convert(html)`, using the in-memory cache and, if `persist` is True, the on-disk corpus.
+        """
+        key = f"{self._hash(html)}_{mode}"
+        with self._lock:
+            if key in self._converted_cache:
+                self._converted_cache.move_to_end(key)
+                return self._converted_cache[key]
+
+        record = self._read("converted", key) if persist else None
+        if record is not None:
+            text = record["text"]
+        else:
+            text = convert(html)
+            if persist:
+                self._write("converted", key, {"mode": mode, "text": text})
+
+        with self._lock:
+            self._converted_cache[key] = text
+            while len(self._converted_cache) > self.max_converted_cache_entries:
+                self._converted_cache.popitem(last=False)
+        return text
+
+    #### Storage helpers ####
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _search_key(self, keywords: str, region: str) -> str:
+        return self._hash(json.dumps([keywords, region]))
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.corpus_dir / kind / key[:2] / f"{key}.json.gz"
+
+    def _read(self, kind: str, key: str) -> Optional[dict]:
+        path = self._path(kind, key)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # A corrupted record is treated as missing and will be overwritten when recording
+            return None
+
+    def _write(self, kind: str, key: str, record: dict) -> None:
+        path = self._path(kind, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that concurrent readers never see a partial record
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"❗️❗️ [WebSearchAPI] Failed to write web search corpus file {path}: {e}")
@@ -3,11 +3,25 @@ import importlib
 import inspect
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from bfcl_eval.constants.executable_backend_config import (
     CLASS_FILE_PATH_MAPPING,
+    MAX_CONCURRENT_READ_ONLY_CALLS,
     STATELESS_CLASSES,
 )
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.method_annotations import (
+    is_read_only,
+)
+
+# Matches the name of every function called in a function call string
+FUNC_NAME_PATTERN = re.compile(r"\b([a-zA-Z_]\w*)\s*(?=\()")
+
+# Shared by all inference threads, created on first use
+_read_only_call_executor: Optional[ThreadPoolExecutor] = None
+_read_only_call_executor_lock = threading.Lock()
 
 
 def execute_multi_turn_func_call(
@@ -26,6 +40,8 @@ def execute_multi_turn_func_call(
         model_name += "_eval"
 
     class_method_name_mapping = {}
+    # Whether each method name in `class_method_name_mapping` resolves to a read-only method
+    read_only_method_mapping = {}
     involved_instances = {}
     for class_name in involved_classes:
         module_name = CLASS_FILE_PATH_MAPPING[class_name]
@@ -59,47 +75,107 @@ def execute_multi_turn_func_call(
             if method_name.startswith("_"):
                 continue
             class_method_name_mapping[method_name] = instance_name
+            read_only_method_mapping[method_name] = is_read_only(method)
 
-    execution_results = []
-    for func_call in func_call_list:
+    # Consecutive read-only calls are executed concurrently; any other call waits for them, and runs alone
+    # The results are stored by position, so they are returned in the order of the calls
+    execution_results = [None] * len(func_call_list)
+    read_only_batch = []
+    for index, func_call in enumerate(func_call_list):
         # Add the instance name to the method calls
-        func_call = _process_method_calls(func_call, class_method_name_mapping)
-
-        # Evaluate the function call
-        try:
-            # We need to make a copy here because otherwise the `eval(func_call)` would error. 
-            func_call_copy = func_call
-            # Before calling `eval`, we need to make sure that the function call is safe
-            # We do so by checking if the function is `kill` or `exit`, etc.
-            # Extract the function name first
-            if "(" in func_call_copy:
-                func_call_copy = func_call_copy.split("(")[0]
-            # Situation where the function call is a method call
-            if "." in func_call_copy:
-                func_call_copy = func_call_copy.split(".")[1]
-            if func_call_copy in ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]:
-                raise Exception(f"Function call {func_call_copy} is not allowed.")
-
-            func_call_result = eval(func_call)
-
-            if type(func_call_result) == str:
-                pass
-            elif type(func_call_result) == dict:
-                # Some function returns a object instance, which is not serializable
-                try:
-                    func_call_result = json.dumps(func_call_result)
-                except:
-                    func_call_result = str(func_call_result)
-            else:
-                func_call_result = str(func_call_result)
+        processed_func_call = _process_method_calls(func_call, class_method_name_mapping)
+
+        if _is_read_only_call(func_call, read_only_method_mapping):
+            read_only_batch.append((index, processed_func_call))
+            continue
+
+        _execute_read_only_batch(read_only_batch, execution_results)
+        read_only_batch = []
+        execution_results[index] = _execute_func_call(processed_func_call)
 
-            execution_results.append(func_call_result)
-        except Exception as e:
-            execution_results.append(f"Error during execution: {str(e)}")
+    _execute_read_only_batch(read_only_batch, execution_results)
 
     return execution_results, involved_instances
 
 
+def _execute_func_call(func_call: str) -> str:
+    """
+    Evaluate one function call, whose method names are already prefixed with their instance name, and return its result as a string.
+    """
+    try:
+        # We need to make a copy here because otherwise the `eval(func_call)` would error. 
+        func_call_copy = func_call
+        # Before calling `eval`, we need to make sure that the function call is safe
+        # We do so by checking if the function is `kill` or `exit`, etc.
+        # Extract the function name first
+        if "(" in func_call_copy:
+            func_call_copy = func_call_copy.split("(")[0]
+        # Situation where the function call is a method call
+        if "." in func_call_copy:
+            func_call_copy = func_call_copy.split(".")[1]
+        if func_call_copy in ["kill", "exit", "quit", "remove", "unlink", "popen", "Popen", "run"]:
+            raise Exception(f"Function call {func_call_copy} is not allowed.")
+
+        func_call_result = eval(func_call)
+
+        if type(func_call_result) == str:
+            pass
+        elif type(func_call_result) == dict:
+            # Some function returns a object instance, which is not serializable
+            try:
+                func_call_result = json.dumps(func_call_result)
+            except:
+                func_call_result = str(func_call_result)
+        else:
+            func_call_result = str(func_call_result)
+
+        return func_call_result
+    except Exception as e:
+        return f"Error during execution: {str(e)}"
+
+
+def _is_read_only_call(func_call: str, read_only_method_mapping: dict) -> bool:
+    """
+    Whether every function called in `func_call`, including the nested ones, is a read-only backend method.
+    Anything else (a write, an unknown function or a builtin) makes the call sequential.
+    """
+    func_names = FUNC_NAME_PATTERN.findall(func_call)
+    return bool(func_names) and all(
+        read_only_method_mapping.get(func_name, False) for func_name in func_names
+    )
+
+
+def _execute_read_only_batch(batch: list[tuple[int, str]], execution_results: list) -> None:
+    """
+    Execute the read-only calls of `batch`, a list of (position, function call), concurrently, and store their results at their position.
+    """
+    if len(batch) <= 1 or MAX_CONCURRENT_READ_ONLY_CALLS <= 1:
+        for index, func_call in batch:
+            execution_results[index] = _execute_func_call(func_call)
+        return
+
+    # The first call runs in the calling thread, which would otherwise sit idle while waiting for the others
+    futures = [
+        (index, _get_read_only_call_executor().submit(_execute_func_call, func_call))
+        for index, func_call in batch[1:]
+    ]
+    first_index, first_func_call = batch[0]
+    execution_results[first_index] = _execute_func_call(first_func_call)
+    for index, future in futures:
+        execution_results[index] = future.result()
+
+
+def _get_read_only_call_executor() -> ThreadPoolExecutor:
+    global _read_only_call_executor
+    with _read_only_call_executor_lock:
+        if _read_only_call_executor is None:
+            _read_only_call_executor = ThreadPoolExecutor(
+                max_workers=MAX_CONCURRENT_READ_ONLY_CALLS - 1,
+                thread_name_prefix="bfcl-read-only-call",
+            )
+        return _read_only_call_executor
+
+
 def is_empty_execute_response(input_list: list):
     if len(input_list) == 0:
         return True
@@ -137,10 +213,7 @@ def _process_method_calls(function_call_string: str, instance_mapping: dict) ->
             return f"{instance_mapping[func_name]}.{func_name}"
         return func_name
 
-    # Regular expression to match function names
-    pattern = r"\b([a-zA-Z_]\w*)\s*(?=\()"
-
     # Replace function names with their class-prepended versions
-    processed_string = re.sub(pattern, replace_function, function_call_string)
+    processed_string = FUNC_NAME_PATTERN.sub(replace_function, function_call_string)
 
     return processed_string
@@ -1,2 +1,7 @@
-from bfcl_eval.model_handler.api_inference.openrouter import OpenRouterHandler
+def __getattr__(name):
+    # Lazy re-export, so that importing any single handler module from this package doesn't also import the OpenAI SDK
+    if name == "OpenRouterHandler":
+        from bfcl_eval.model_handler.api_inference.openrouter import OpenRouterHandler
 
+        return OpenRouterHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
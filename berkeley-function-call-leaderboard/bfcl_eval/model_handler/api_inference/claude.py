@@ -4,10 +4,12 @@ import time
 from typing import Any
 
 from anthropic import Anthropic, RateLimitError
-from anthropic.types import TextBlock, ToolUseBlock
+from anthropic.types import Message, TextBlock, ToolUseBlock
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.http_transport import shared_http_client
+from bfcl_eval.model_handler.streaming import StreamTimer
 from bfcl_eval.model_handler.utils import (
     combine_consecutive_user_prompts,
     convert_to_function_call,
@@ -33,7 +35,13 @@ class ClaudeHandler(BaseHandler):
     ) -> None:
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.ANTHROPIC
-        self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        try:
+            self.client = Anthropic(
+                api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=shared_http_client()
+            )
+        except TypeError:
+            # Recent SDK releases are built on `httpx2` and reject `httpx` clients; they keep their own connection pool
+            self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
     def decode_ast(self, result, language, has_tool_call_tag):
         if not self.is_fc_model:
@@ -57,12 +65,33 @@ class ClaudeHandler(BaseHandler):
 
     @retry_with_backoff(error_type=RateLimitError)
     def generate_with_backoff(self, **kwargs):
+        if self.streaming:
+            return self._generate_streaming(**kwargs)
+
         start_time = time.time()
         api_response = self.client.messages.create(**kwargs)
         end_time = time.time()
 
         return api_response, end_time - start_time
 
+    def _generate_streaming(self, **kwargs) -> tuple[Message, float]:
+        """
+        Stream the message; the SDK accumulates the events into the same `Message` a non-streamed request returns.
+        """
+        timer = StreamTimer()
+        with self.client.messages.stream(**kwargs) as stream:
+            for event in stream:
+                # Text, thinking and tool input all arrive as content block deltas
+                if event.type == "content_block_delta":
+                    timer.mark_token()
+            api_response = stream.get_final_message()
+        stats = timer.finish(api_response.usage.output_tokens)
+
+        return api_response, stats.latency
+
+    def supports_streaming(self) -> bool:
+        return True
+
     def _get_max_tokens(self):
         """
         max_tokens is required to be set when querying, so we default to the model's max tokens
@@ -148,7 +177,8 @@ class ClaudeHandler(BaseHandler):
 
         if inference_data["caching_enabled"] and len(tools) > 0:
             # Add the cache control flag to the last tool
-            tools[-1]["cache_control"] = {"type": "ephemeral"}
+            # The converted tools are frozen, as they are shared through the `convert_to_tool` cache, so only the last one is copied
+            tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
 
         inference_data["tools"] = tools
 
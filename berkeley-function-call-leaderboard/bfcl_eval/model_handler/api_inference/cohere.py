@@ -8,6 +8,7 @@ import cohere
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from bfcl_eval.model_handler.utils import (
     convert_to_tool,
     retry_with_backoff,
@@ -30,7 +31,12 @@ class CohereHandler(BaseHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.COHERE
         self.is_fc_model = True
-        self.client = cohere.ClientV2(api_key=os.getenv("COHERE_API_KEY"))
+        self.client = cohere.ClientV2(
+            api_key=os.getenv("COHERE_API_KEY"),
+            httpx_client=shared_http_client(),
+            # Cohere's own default; it would otherwise take the read timeout of the http client
+            timeout=300,
+        )
 
     def decode_ast(self, result, language, has_tool_call_tag):
         decoded_output = []
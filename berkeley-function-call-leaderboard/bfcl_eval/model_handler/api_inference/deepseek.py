@@ -10,6 +10,7 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI, RateLimitError
 from overrides import override
 
@@ -26,7 +27,8 @@ class DeepSeekAPIHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.OPENAI_COMPLETIONS
         self.client = OpenAI(
-            base_url="https://api.deepseek.com", api_key=os.getenv("DEEPSEEK_API_KEY")
+            base_url="https://api.deepseek.com", api_key=os.getenv("DEEPSEEK_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     # The deepseek API is unstable at the moment, and will frequently give empty responses, so retry on JSONDecodeError is necessary
@@ -1,5 +1,6 @@
 import os
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 from bfcl_eval.model_handler.api_inference.mining import MiningHandler
 
@@ -17,4 +18,5 @@ class DMCitoHandler(MiningHandler):
         self.client = OpenAI(
             base_url= os.getenv("DMCITO_BASE_URL"),
             api_key=os.getenv("DMCITO_API_KEY"),
+            http_client=shared_http_client(),
         )
\ No newline at end of file
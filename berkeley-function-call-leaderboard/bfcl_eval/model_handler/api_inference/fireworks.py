@@ -6,6 +6,7 @@ from bfcl_eval.model_handler.api_inference.openai_completion import (
     OpenAICompletionsHandler,
 )
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -24,6 +25,7 @@ class FireworksHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://api.fireworks.ai/inference/v1",
             api_key=os.getenv("FIREWORKS_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     #### FC methods ####
@@ -1,5 +1,6 @@
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -16,4 +17,8 @@ class FunctionaryHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.OPENAI_COMPLETIONS
 
-        self.client = OpenAI(base_url="http://localhost:8000/v1", api_key="functionary")
+        self.client = OpenAI(
+            base_url="http://localhost:8000/v1",
+            api_key="functionary",
+            http_client=shared_http_client(),
+        )
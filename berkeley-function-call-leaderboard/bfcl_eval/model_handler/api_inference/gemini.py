@@ -5,6 +5,8 @@ from typing import Any
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import SHARED_HTTP_TRANSPORT
+from bfcl_eval.model_handler.streaming import StreamTimer
 from bfcl_eval.model_handler.utils import (
     convert_to_tool,
     default_decode_ast_prompting,
@@ -17,8 +19,11 @@ from bfcl_eval.model_handler.utils import (
 from google import genai
 from google.genai.types import (
     AutomaticFunctionCallingConfig,
+    Candidate,
     Content,
     GenerateContentConfig,
+    GenerateContentResponse,
+    HttpOptions,
     Part,
     ThinkingConfig,
     Tool,
@@ -41,7 +46,11 @@ class GeminiHandler(BaseHandler):
             raise ValueError(
                 "GOOGLE_API_KEY environment variable must be set for Gemini models"
             )
-        self.client = genai.Client(api_key=api_key)
+        self.client = genai.Client(
+            api_key=api_key,
+            # Shared connection pool, sized from the number of threads, see `SharedHTTPTransport`
+            http_options=HttpOptions(client_args={"transport": SHARED_HTTP_TRANSPORT}),
+        )
 
     @staticmethod
     def _substitute_prompt_role(prompts: list[dict]) -> list[dict]:
@@ -80,12 +89,72 @@ class GeminiHandler(BaseHandler):
     # Both rate limit and invalid function description will trigger google.genai.errors.ClientError
     @retry_with_backoff(error_message_pattern=r".*RESOURCE_EXHAUSTED.*")
     def generate_with_backoff(self, **kwargs):
+        if self.streaming:
+            return self._generate_streaming(**kwargs)
+
         start_time = time.time()
         api_response = self.client.models.generate_content(**kwargs)
         end_time = time.time()
 
         return api_response, end_time - start_time
 
+    def _generate_streaming(self, **kwargs) -> tuple[GenerateContentResponse, float]:
+        """
+        Stream the response and rebuild the `GenerateContentResponse` a non-streamed request returns, recording the time to first token on the way.
+        """
+        timer = StreamTimer()
+        parts: list[Part] = []
+        finish_reason, usage_metadata = None, None
+        for chunk in self.client.models.generate_content_stream(**kwargs):
+            # The usage of the whole response is reported on the last chunk
+            usage_metadata = chunk.usage_metadata or usage_metadata
+            if not chunk.candidates:
+                continue
+            candidate = chunk.candidates[0]
+            finish_reason = candidate.finish_reason or finish_reason
+            if not candidate.content or not candidate.content.parts:
+                continue
+            timer.mark_token()
+            for part in candidate.content.parts:
+                previous = parts[-1] if parts else None
+                # Text arrives in pieces; consecutive pieces of the same kind (answer or thought) are merged into one part, as in a non-streamed response
+                if (
+                    previous is not None
+                    and part.text is not None
+                    and previous.text is not None
+                    and bool(part.thought) == bool(previous.thought)
+                ):
+                    parts[-1] = previous.model_copy(
+                        update={
+                            "text": previous.text + part.text,
+                            "thought_signature": part.thought_signature
+                            or previous.thought_signature,
+                        }
+                    )
+                else:
+                    parts.append(part)
+
+        stats = timer.finish(
+            usage_metadata.candidates_token_count if usage_metadata else 0
+        )
+        api_response = GenerateContentResponse(
+            candidates=(
+                [
+                    Candidate(
+                        content=Content(role="model", parts=parts),
+                        finish_reason=finish_reason,
+                    )
+                ]
+                if parts
+                else []
+            ),
+            usage_metadata=usage_metadata,
+        )
+        return api_response, stats.latency
+
+    def supports_streaming(self) -> bool:
+        return True
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
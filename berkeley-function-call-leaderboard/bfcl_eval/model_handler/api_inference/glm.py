@@ -1,6 +1,7 @@
 import os
 
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 import httpx
 
@@ -19,4 +20,5 @@ class GLMAPIHandler(OpenAICompletionsHandler):
             api_key=os.getenv("GLM_API_KEY"),
             base_url="https://open.bigmodel.cn/api/paas/v4/",
             timeout=httpx.Timeout(timeout=300.0, connect=8.0),
+            http_client=shared_http_client(),
         )
@@ -1,6 +1,7 @@
 import os
 
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -17,5 +18,6 @@ class GoGoAgentHandler(OpenAICompletionsHandler):
         self.is_fc_model = False
 
         self.client = OpenAI(
-            base_url="https://api.gogoagent.ai", api_key=os.getenv("GOGOAGENT_API_KEY")
+            base_url="https://api.gogoagent.ai", api_key=os.getenv("GOGOAGENT_API_KEY"),
+            http_client=shared_http_client(),
         )
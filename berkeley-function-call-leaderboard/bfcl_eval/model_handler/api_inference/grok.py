@@ -4,6 +4,7 @@ from typing import Any
 from bfcl_eval.model_handler.api_inference.openai_completion import (
     OpenAICompletionsHandler,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 from overrides import override
 
@@ -21,6 +22,7 @@ class GrokHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://api.x.ai/v1",
             api_key=os.getenv("GROK_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     @override
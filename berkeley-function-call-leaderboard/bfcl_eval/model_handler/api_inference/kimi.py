@@ -1,5 +1,6 @@
 import os
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -19,5 +20,6 @@ class KimiHandler(OpenAICompletionsHandler):
             # If API Key is from US platform, use the above URL
             # If API Key is from China platform, use the below URL
             base_url="https://api.moonshot.cn/v1", 
-            api_key=os.getenv("KIMI_API_KEY")
+            api_key=os.getenv("KIMI_API_KEY"),
+            http_client=shared_http_client(),
         )
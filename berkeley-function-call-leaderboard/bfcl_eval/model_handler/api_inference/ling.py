@@ -12,6 +12,7 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI, RateLimitError
 from overrides import override
 
@@ -28,7 +29,11 @@ class LingAPIHandler(OpenAICompletionsHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.OPENAI_COMPLETIONS
         api_url = "https://bailingchat.alipay.com"
-        self.client = OpenAI(base_url=api_url, api_key=os.getenv("LING_API_KEY"))
+        self.client = OpenAI(
+            base_url=api_url,
+            api_key=os.getenv("LING_API_KEY"),
+            http_client=shared_http_client(),
+        )
 
     @retry_with_backoff(error_type=[RateLimitError, json.JSONDecodeError])
     def generate_with_backoff(self, **kwargs):
@@ -7,6 +7,7 @@ from bfcl_eval.model_handler.api_inference.openai_completion import (
     OpenAICompletionsHandler,
 )
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -24,6 +25,7 @@ class MiningHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url= os.getenv("MINING_BASE_URL"),
             api_key=os.getenv("MINING_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     def decode_ast(self, result, language, has_tool_call_tag):
@@ -6,6 +6,7 @@ from typing import Any
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from bfcl_eval.model_handler.utils import (
     convert_to_function_call,
     convert_to_tool,
@@ -30,7 +31,9 @@ class MistralHandler(BaseHandler):
         super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
         self.model_style = ModelStyle.MISTRAL
 
-        self.client = Mistral(api_key=os.getenv("MISTRAL_API_KEY"))
+        self.client = Mistral(
+            api_key=os.getenv("MISTRAL_API_KEY"), client=shared_http_client()
+        )
 
     def decode_ast(self, result, language, has_tool_call_tag):
         if self.is_fc_model:
@@ -10,6 +10,7 @@ from bfcl_eval.model_handler.utils import (
     default_decode_ast_prompting,
     default_decode_execute_prompting,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 from overrides import override
 
@@ -35,6 +36,7 @@ class NemotronHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://integrate.api.nvidia.com/v1",
             api_key=os.getenv("NVIDIA_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     # Although Nemotron is a FC model, its endpoint does not take in function docs, but instead have them as part of the system prompt.
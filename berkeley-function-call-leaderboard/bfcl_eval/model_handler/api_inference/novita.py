@@ -2,6 +2,7 @@ import os
 
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -19,6 +20,7 @@ class NovitaHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://api.novita.ai/v3/openai",
             api_key=os.getenv("NOVITA_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     #### FC methods ####
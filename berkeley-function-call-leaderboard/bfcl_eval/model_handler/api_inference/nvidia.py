@@ -10,6 +10,7 @@ from bfcl_eval.model_handler.utils import (
     default_decode_execute_prompting,
     system_prompt_pre_processing_chat_model,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 
 
@@ -27,6 +28,7 @@ class NvidiaHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://integrate.api.nvidia.com/v1",
             api_key=os.getenv("NVIDIA_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     def decode_ast(self, result, language, has_tool_call_tag):
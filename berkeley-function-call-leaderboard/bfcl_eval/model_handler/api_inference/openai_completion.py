@@ -7,18 +7,26 @@ from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
 from bfcl_eval.model_handler.base_handler import BaseHandler
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.model_handler.utils import (
+    StreamingToolCallDecoder,
     convert_to_function_call,
     convert_to_tool,
     default_decode_ast_prompting,
+    default_decode_ast_prompting_batch,
     default_decode_execute_prompting,
+    default_decode_execute_prompting_batch,
     format_execution_results_prompting,
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
+from bfcl_eval.model_handler.streaming import StreamTimer, iter_server_sent_events
 from openai import OpenAI, RateLimitError
+from openai.types.chat import ChatCompletion
 
 
 class OpenAICompletionsHandler(BaseHandler):
+    batch_api_supported = True
+
     def __init__(
         self,
         model_name,
@@ -47,6 +55,9 @@ class OpenAICompletionsHandler(BaseHandler):
         if headers_env := os.getenv("OPENAI_DEFAULT_HEADERS"):
             kwargs["default_headers"] = json.loads(headers_env)
 
+        # Shared connection pool, sized from the number of threads, see `SharedHTTPTransport`
+        kwargs["http_client"] = shared_http_client()
+
         return kwargs
 
     def decode_ast(self, result, language, has_tool_call_tag):
@@ -66,17 +77,134 @@ class OpenAICompletionsHandler(BaseHandler):
         else:
             return default_decode_execute_prompting(result)
 
+    def _decode_ast_batch(self, results, language, has_tool_call_tag):
+        if not self._uses_own_decoder(OpenAICompletionsHandler):
+            return super()._decode_ast_batch(results, language, has_tool_call_tag)
+        if not self.is_fc_model:
+            return default_decode_ast_prompting_batch(results, language, has_tool_call_tag)
+
+        decoded_results = []
+        for result in results:
+            try:
+                decoded_results.append(
+                    [
+                        {name: json.loads(arguments)}
+                        for invoked_function in result
+                        for name, arguments in [next(iter(invoked_function.items()))]
+                    ]
+                )
+            except Exception:
+                # Fall back to the per-item decoder so that the exception is exactly the one `decode_ast` raises
+                try:
+                    decoded_results.append(
+                        self.decode_ast(result, language, has_tool_call_tag)
+                    )
+                except Exception as e:
+                    decoded_results.append(e)
+        return decoded_results
+
+    def _decode_execute_batch(self, results, has_tool_call_tag):
+        if not self._uses_own_decoder(OpenAICompletionsHandler):
+            return super()._decode_execute_batch(results, has_tool_call_tag)
+        if not self.is_fc_model:
+            # `decode_execute` never forwards the tool call tag flag for prompting models
+            return default_decode_execute_prompting_batch(results)
+        return super()._decode_execute_batch(results, has_tool_call_tag)
+
     @retry_with_backoff(error_type=RateLimitError)
     def generate_with_backoff(self, **kwargs):
+        # Subclasses that always stream (eg. Qwen) override `_generate_streaming`
+        if self.streaming:
+            return self._generate_streaming(**kwargs)
+
         start_time = time.time()
         api_response = self.client.chat.completions.create(**kwargs)
         end_time = time.time()
 
         return api_response, end_time - start_time
 
+    def _generate_streaming(self, **kwargs) -> tuple[Any, float]:
+        """
+        Stream the chat completion and rebuild the `ChatCompletion` a non-streamed request returns, recording the time to first token on the way.
+        """
+        timer = StreamTimer()
+        # FC models send their tool calls as structured deltas, only the text of prompting models is decoded
+        tool_call_decoder = None if self.is_fc_model else StreamingToolCallDecoder()
+        raw_response = self.client.chat.completions.with_raw_response.create(
+            **kwargs, stream=True, stream_options={"include_usage": True}
+        )
+
+        content_parts, reasoning_parts = [], []
+        tool_calls: dict[int, dict] = {}
+        response_fields, finish_reason, usage = {}, None, None
+        for chunk in iter_server_sent_events(raw_response.http_response):
+            response_fields = {
+                "id": chunk.get("id"),
+                "created": chunk.get("created"),
+                "model": chunk.get("model"),
+            }
+            # With `include_usage`, the usage comes in a last chunk without choices
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+            if not chunk.get("choices"):
+                continue
+            choice = chunk["choices"][0]
+            finish_reason = choice.get("finish_reason") or finish_reason
+            delta = choice.get("delta") or {}
+            if delta.get("content"):
+                timer.mark_token()
+                content_parts.append(delta["content"])
+                if (
+                    tool_call_decoder is not None
+                    and tool_call_decoder.feed(delta["content"]) is not None
+                ):
+                    timer.mark_tool_calls()
+            # Not part of the OpenAI schema, but sent by many OpenAI-compatible providers (DeepSeek, vLLM, ...)
+            if delta.get("reasoning_content"):
+                timer.mark_token()
+                reasoning_parts.append(delta["reasoning_content"])
+            for tool_call in delta.get("tool_calls") or []:
+                timer.mark_token()
+                aggregated = tool_calls.setdefault(
+                    tool_call.get("index", 0),
+                    {"id": "", "type": "function", "function": {"name": "", "arguments": ""}},
+                )
+                if tool_call.get("id"):
+                    aggregated["id"] = tool_call["id"]
+                function = tool_call.get("function") or {}
+                aggregated["function"]["name"] += function.get("name") or ""
+                aggregated["function"]["arguments"] += function.get("arguments") or ""
+
+        if usage is None:
+            # The provider ignored `stream_options`; the token counts are unknown
+            usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        stats = timer.finish(usage["completion_tokens"])
+
+        message = {
+            "role": "assistant",
+            # Like in non-streamed responses, there is no content when the model only calls tools
+            "content": "".join(content_parts) if content_parts or not tool_calls else None,
+        }
+        if tool_calls:
+            message["tool_calls"] = [tool_calls[index] for index in sorted(tool_calls)]
+        if reasoning_parts:
+            message["reasoning_content"] = "".join(reasoning_parts)
+
+        # Built the same (lenient) way the SDK builds the response of a regular request
+        api_response = ChatCompletion.construct(
+            **response_fields,
+            object="chat.completion",
+            choices=[{"index": 0, "message": message, "finish_reason": finish_reason}],
+            usage=usage,
+        )
+        return api_response, stats.latency
+
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._build_query_kwargs_FC(inference_data))
+
+    def _build_query_kwargs_FC(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
         inference_data["inference_input_log"] = {"message": repr(message), "tools": tools}
@@ -91,7 +219,7 @@ class OpenAICompletionsHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         inference_data["message"] = []
@@ -216,15 +344,20 @@ class OpenAICompletionsHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
-        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
-
         return self.generate_with_backoff(
-            messages=inference_data["message"],
-            model=self.model_name,
-            temperature=self.temperature,
-            store=False,
+            **self._build_query_kwargs_prompting(inference_data)
         )
 
+    def _build_query_kwargs_prompting(self, inference_data: dict) -> dict:
+        inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
+
+        return {
+            "messages": inference_data["message"],
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "store": False,
+        }
+
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
         test_entry_id: str = test_entry["id"]
@@ -295,3 +428,25 @@ class OpenAICompletionsHandler(BaseHandler):
                 "role": "assistant",
                 "content": str(response_data["model_responses"]),
             }
+
+    #### Streaming methods ####
+
+    def supports_streaming(self) -> bool:
+        # Subclasses with their own `generate_with_backoff` send their requests differently
+        return (
+            type(self).generate_with_backoff is OpenAICompletionsHandler.generate_with_backoff
+        )
+
+    #### Batch API methods ####
+
+    def _batch_api_endpoint(self) -> str:
+        return "/v1/chat/completions"
+
+    def _batch_request_body(self, inference_data: dict) -> dict:
+        if self._is_fc_mode():
+            return self._build_query_kwargs_FC(inference_data)
+        return self._build_query_kwargs_prompting(inference_data)
+
+    def _batch_response_to_api_response(self, response_body: dict) -> Any:
+        # Built the same (lenient) way the SDK builds the response of a regular request
+        return ChatCompletion.construct(**response_body)
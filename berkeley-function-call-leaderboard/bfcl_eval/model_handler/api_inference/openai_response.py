@@ -14,11 +14,14 @@ from bfcl_eval.model_handler.utils import (
     retry_with_backoff,
     system_prompt_pre_processing_chat_model,
 )
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI, RateLimitError
 from openai.types.responses import Response
 
 
 class OpenAIResponsesHandler(BaseHandler):
+    batch_api_supported = True
+
     def __init__(
         self,
         model_name,
@@ -47,6 +50,9 @@ class OpenAIResponsesHandler(BaseHandler):
         if headers_env := os.getenv("OPENAI_DEFAULT_HEADERS"):
             kwargs["default_headers"] = json.loads(headers_env)
 
+        # Shared connection pool, sized from the number of threads, see `SharedHTTPTransport`
+        kwargs["http_client"] = shared_http_client()
+
         return kwargs
 
     @staticmethod
@@ -88,6 +94,9 @@ class OpenAIResponsesHandler(BaseHandler):
     #### FC methods ####
 
     def _query_FC(self, inference_data: dict):
+        return self.generate_with_backoff(**self._build_query_kwargs_FC(inference_data))
+
+    def _build_query_kwargs_FC(self, inference_data: dict) -> dict:
         message: list[dict] = inference_data["message"]
         tools = inference_data["tools"]
 
@@ -121,7 +130,7 @@ class OpenAIResponsesHandler(BaseHandler):
         if len(tools) > 0:
             kwargs["tools"] = tools
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_FC(self, inference_data: dict, test_entry: dict) -> dict:
         for round_idx in range(len(test_entry["question"])):
@@ -213,6 +222,11 @@ class OpenAIResponsesHandler(BaseHandler):
     #### Prompting methods ####
 
     def _query_prompting(self, inference_data: dict):
+        return self.generate_with_backoff(
+            **self._build_query_kwargs_prompting(inference_data)
+        )
+
+    def _build_query_kwargs_prompting(self, inference_data: dict) -> dict:
         inference_data["inference_input_log"] = {"message": repr(inference_data["message"])}
 
         kwargs = {
@@ -237,7 +251,7 @@ class OpenAIResponsesHandler(BaseHandler):
             del kwargs["reasoning"]
             del kwargs["include"]
 
-        return self.generate_with_backoff(**kwargs)
+        return kwargs
 
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
@@ -305,3 +319,17 @@ class OpenAIResponsesHandler(BaseHandler):
         )
 
         return inference_data
+
+    #### Batch API methods ####
+
+    def _batch_api_endpoint(self) -> str:
+        return "/v1/responses"
+
+    def _batch_request_body(self, inference_data: dict) -> dict:
+        if self._is_fc_mode():
+            return self._build_query_kwargs_FC(inference_data)
+        return self._build_query_kwargs_prompting(inference_data)
+
+    def _batch_response_to_api_response(self, response_body: dict) -> Response:
+        # Built the same (lenient) way the SDK builds the response of a regular request
+        return Response.construct(**response_body)
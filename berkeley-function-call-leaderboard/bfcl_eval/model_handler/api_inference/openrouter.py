@@ -3,6 +3,7 @@ from typing import Any
 
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
 from openai import OpenAI
 from overrides import override
 
@@ -31,6 +32,7 @@ class OpenRouterHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=os.getenv("OPENROUTER_API_KEY"),
+            http_client=shared_http_client(),
         )
 
     #### FC methods ####
@@ -3,6 +3,9 @@ from typing import Any
 
 from bfcl_eval.model_handler.api_inference.openai_completion import OpenAICompletionsHandler
 from bfcl_eval.constants.enums import ModelStyle
+from bfcl_eval.model_handler.http_transport import shared_http_client
+from bfcl_eval.model_handler.streaming import StreamTimer
+from bfcl_eval.model_handler.utils import StreamingToolCallDecoder
 from openai import OpenAI
 from overrides import override
 from qwen_agent.llm import get_chat_model
@@ -14,6 +17,7 @@ class QwenAPIHandler(OpenAICompletionsHandler):
 
     For Qwen's hosted service, the QwQ series, and Qwen3 series with reasoning enabled only support streaming response for both prompting and FC mode.
     So to make things simple, we will just use streaming response for all Qwen model variants.
+    With `bfcl generate --stream`, the stream is read (and timed) in `_generate_streaming` instead of while parsing the response.
 
     """
 
@@ -30,8 +34,38 @@ class QwenAPIHandler(OpenAICompletionsHandler):
         self.client = OpenAI(
             base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
             api_key=os.getenv("QWEN_API_KEY"),
+            http_client=shared_http_client(),
         )
 
+    @override
+    def _generate_streaming(self, **kwargs) -> tuple[list, float]:
+        """
+        Read the stream the query methods always request, timing it, and return its chunks for the `_parse_query_response_*` methods to aggregate, as they do with the stream itself.
+        """
+        timer = StreamTimer()
+        # FC models send their tool calls as structured deltas, only the text of prompting models is decoded
+        tool_call_decoder = None if self.is_fc_model else StreamingToolCallDecoder()
+        chunks = []
+        for chunk in self.client.chat.completions.create(**kwargs):
+            chunks.append(chunk)
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if getattr(delta, "reasoning_content", None) or getattr(delta, "tool_calls", None):
+                timer.mark_token()
+            if getattr(delta, "content", None):
+                timer.mark_token()
+                if (
+                    tool_call_decoder is not None
+                    and tool_call_decoder.feed(delta.content) is not None
+                ):
+                    timer.mark_tool_calls()
+
+        # The usage comes in the last chunk, see `stream_options` in the query methods
+        usage = chunks[-1].usage if chunks else None
+        stats = timer.finish(usage.completion_tokens if usage else None)
+        return chunks, stats.latency
+
     #### FC methods ####
 
     @override
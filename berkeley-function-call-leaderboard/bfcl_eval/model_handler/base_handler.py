@@ -1,6 +1,7 @@
 import json
+import time
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from bfcl_eval.constants.category_mapping import VERSION_PREFIX
 from bfcl_eval.constants.default_prompts import (
@@ -18,6 +19,14 @@ from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import (
     execute_multi_turn_func_call,
     is_empty_execute_response,
 )
+from bfcl_eval.model_handler.decode_stats import DECODE_THROUGHPUT_STATS
+from bfcl_eval.model_handler.pipeline import (
+    InferenceSteps,
+    ModelQuery,
+    run_inference_steps_inline,
+)
+from bfcl_eval.model_handler.streaming import StreamingStats, pop_streaming_stats
+from bfcl_eval.model_handler.tracing import trace_span
 from bfcl_eval.model_handler.utils import add_memory_instruction_system_prompt
 from bfcl_eval.utils import *
 from overrides import final
@@ -36,6 +45,8 @@ class BaseHandler:
     registry_dir_name: str
     model_name_underline_replaced: str
     model_style: ModelStyle
+    # Opt-in per handler class, see `supports_batch_api`
+    batch_api_supported: bool = False
 
     def __init__(
         self, model_name, temperature, registry_name, is_fc_model, **kwargs
@@ -60,6 +71,8 @@ class BaseHandler:
         # Replace the slash with underscore to avoid creating subdirectories
         self.registry_dir_name = registry_name.replace("/", "_")
         self.temperature = temperature
+        # Set by `bfcl generate --stream`, for handlers whose `supports_streaming()` is True
+        self.streaming = False
 
         # Set any additional attributes passed via kwargs
         for _key, _value in kwargs.items():
@@ -74,8 +87,7 @@ class BaseHandler:
         # This method is used to retrive model response for each model.
 
         # FC model
-        # TODO: Let all models have the is_fc_model attribute and remove the "FC" check
-        if "FC" in self.registry_name or self.is_fc_model:
+        if self._is_fc_mode():
             if contain_multi_turn_interaction(test_entry["id"]):
                 return self.inference_multi_turn_FC(
                     test_entry, include_input_log, exclude_state_log
@@ -91,6 +103,10 @@ class BaseHandler:
             else:
                 return self.inference_single_turn_prompting(test_entry, include_input_log)
 
+    def _is_fc_mode(self) -> bool:
+        # TODO: Let all models have the is_fc_model attribute and remove the "FC" check
+        return "FC" in self.registry_name or self.is_fc_model
+
     @final
     def inference_multi_turn_FC(
         self,
@@ -98,6 +114,19 @@ class BaseHandler:
         include_input_log: bool,
         exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
+        return run_inference_steps_inline(
+            self._inference_multi_turn_FC_steps(
+                test_entry, include_input_log, exclude_state_log
+            )
+        )
+
+    @final
+    def _inference_multi_turn_FC_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> InferenceSteps:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
         test_entry_id: str = test_entry["id"]
@@ -110,6 +139,9 @@ class BaseHandler:
         total_input_token_count: list[list[float]] = []
         total_output_token_count: list[list[float]] = []
         total_latency: list[list[float]] = []
+        # Only filled in streaming mode, None for the steps that were not streamed
+        total_time_to_first_token: list[list[Optional[float]]] = []
+        total_output_tokens_per_second: list[list[Optional[float]]] = []
         all_model_response: list[list] = (
             []
         )  # The model response that will be used for later evaluation
@@ -121,15 +153,16 @@ class BaseHandler:
         all_reasoning_content: list[list] = []
 
         # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
-        _, involved_instances = execute_multi_turn_func_call(
-            [],
-            initial_config,
-            involved_classes,
-            self.model_name_underline_replaced,
-            test_entry_id,
-            long_context=("long_context" in test_category or "composite" in test_category),
-            is_evaL_run=False,
-        )
+        with trace_span("backend_execution"):
+            _, involved_instances = execute_multi_turn_func_call(
+                [],
+                initial_config,
+                involved_classes,
+                self.model_name_underline_replaced,
+                test_entry_id,
+                long_context=("long_context" in test_category or "composite" in test_category),
+                is_evaL_run=False,
+            )
 
         if is_memory(test_category):
             assert (
@@ -145,29 +178,32 @@ class BaseHandler:
             )
 
         if not exclude_state_log:
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
-                    continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
-            if len(state_log) > 0:
-                all_inference_log.append(state_log)
+            with trace_span("state_logging"):
+                state_log = []
+                for class_name, class_instance in involved_instances.items():
+                    if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
+                        continue
+                    # Avoid modification in future turns
+                    class_instance = deepcopy(class_instance)
+                    state_log.append(
+                        {
+                            "role": "state_info",
+                            "class_name": class_name,
+                            "content": {
+                                key: value
+                                for key, value in vars(class_instance).items()
+                                if not key.startswith("_")
+                            },
+                        }
+                    )
+                if len(state_log) > 0:
+                    all_inference_log.append(state_log)
 
         inference_data: dict = {}
-        inference_data = self._pre_query_processing_FC(inference_data, test_entry)
-        inference_data = self._compile_tools(inference_data, test_entry)
+        with trace_span("pre_processing"):
+            inference_data = self._pre_query_processing_FC(inference_data, test_entry)
+        with trace_span("tool_compilation"):
+            inference_data = self._compile_tools(inference_data, test_entry)
 
         all_multi_turn_messages: list[list[dict]] = test_entry["question"]
         for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
@@ -176,7 +212,8 @@ class BaseHandler:
             if str(turn_idx) in holdout_function:
                 test_entry["function"].extend(holdout_function[str(turn_idx)])
                 # Since we have added new functions, we need to recompile the tools
-                inference_data = self._compile_tools(inference_data, test_entry)
+                with trace_span("tool_compilation", turn=turn_idx):
+                    inference_data = self._compile_tools(inference_data, test_entry)
                 assert (
                     len(current_turn_message) == 0
                 ), "Holdout turn should not have user message."
@@ -205,6 +242,8 @@ class BaseHandler:
             current_turn_input_token_count: list[float] = []
             current_turn_output_token_count: list[float] = []
             current_turn_latency: list[float] = []
+            current_turn_time_to_first_token: list[Optional[float]] = []
+            current_turn_output_tokens_per_second: list[Optional[float]] = []
             current_turn_reasoning_content = []
 
             count = 0
@@ -217,7 +256,10 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_FC(inference_data)
+                # The request is sent by whoever drives these steps, see `bfcl_eval.model_handler.pipeline`
+                api_response, query_latency, streaming_stats = yield ModelQuery(
+                    self._prepare_query_FC(inference_data), turn=turn_idx, step=count
+                )
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -230,7 +272,8 @@ class BaseHandler:
                     )
 
                 # Try parsing the model response
-                model_response_data = self._parse_query_response_FC(api_response)
+                with trace_span("response_parsing", turn=turn_idx, step=count):
+                    model_response_data = self._parse_query_response_FC(api_response)
                 model_responses = model_response_data["model_responses"]
 
                 # Add the assistant message to the chat history
@@ -242,6 +285,12 @@ class BaseHandler:
                 current_turn_input_token_count.append(model_response_data["input_token"])
                 current_turn_output_token_count.append(model_response_data["output_token"])
                 current_turn_latency.append(query_latency)
+                current_turn_time_to_first_token.append(
+                    streaming_stats.time_to_first_token if streaming_stats else None
+                )
+                current_turn_output_tokens_per_second.append(
+                    streaming_stats.output_tokens_per_second if streaming_stats else None
+                )
 
                 current_turn_response.append(model_responses)
 
@@ -259,9 +308,10 @@ class BaseHandler:
 
                 # Try decoding the model response
                 try:
-                    decoded_model_responses = self.decode_execute(
-                        model_responses, has_tool_call_tag=False
-                    )
+                    with trace_span("decode", turn=turn_idx, step=count):
+                        decoded_model_responses = self.decode_execute(
+                            model_responses, has_tool_call_tag=False
+                        )
                     current_step_inference_log.append(
                         {
                             "role": "handler_log",
@@ -293,17 +343,18 @@ class BaseHandler:
                     break
 
                 # Obtain the execution results
-                execution_results, involved_instances = execute_multi_turn_func_call(
-                    decoded_model_responses,
-                    initial_config,
-                    involved_classes,
-                    self.model_name_underline_replaced,
-                    test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
-                    is_evaL_run=False,
-                )
+                with trace_span("backend_execution", turn=turn_idx, step=count):
+                    execution_results, involved_instances = execute_multi_turn_func_call(
+                        decoded_model_responses,
+                        initial_config,
+                        involved_classes,
+                        self.model_name_underline_replaced,
+                        test_entry_id,
+                        long_context=(
+                            "long_context" in test_category or "composite" in test_category
+                        ),
+                        is_evaL_run=False,
+                    )
 
                 # Add the execution results to the chat history for the next turn
                 inference_data = self._add_execution_results_FC(
@@ -338,30 +389,33 @@ class BaseHandler:
             total_input_token_count.append(current_turn_input_token_count)
             total_output_token_count.append(current_turn_output_token_count)
             total_latency.append(current_turn_latency)
+            total_time_to_first_token.append(current_turn_time_to_first_token)
+            total_output_tokens_per_second.append(current_turn_output_tokens_per_second)
 
             if not exclude_state_log:
-                state_log = []
-                for class_name, class_instance in involved_instances.items():
-                    if (
-                        class_name in STATELESS_CLASSES
-                        or class_name in OMIT_STATE_INFO_CLASSES
-                    ):
-                        continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
-                    state_log.append(
-                        {
-                            "role": "state_info",
-                            "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
-                        }
-                    )
-                if len(state_log) > 0:
-                    all_inference_log.append(state_log)
+                with trace_span("state_logging", turn=turn_idx):
+                    state_log = []
+                    for class_name, class_instance in involved_instances.items():
+                        if (
+                            class_name in STATELESS_CLASSES
+                            or class_name in OMIT_STATE_INFO_CLASSES
+                        ):
+                            continue
+                        # Avoid modification in future turns
+                        class_instance = deepcopy(class_instance)
+                        state_log.append(
+                            {
+                                "role": "state_info",
+                                "class_name": class_name,
+                                "content": {
+                                    key: value
+                                    for key, value in vars(class_instance).items()
+                                    if not key.startswith("_")
+                                },
+                            }
+                        )
+                    if len(state_log) > 0:
+                        all_inference_log.append(state_log)
 
             if force_quit:
                 break
@@ -379,8 +433,12 @@ class BaseHandler:
             "input_token_count": total_input_token_count,
             "output_token_count": total_output_token_count,
             "latency": total_latency,
-            "inference_log": all_inference_log,
         }
+        # Streaming metrics are only recorded if at least one step was streamed
+        if any(value is not None for turn in total_time_to_first_token for value in turn):
+            metadata["time_to_first_token"] = total_time_to_first_token
+            metadata["output_tokens_per_second"] = total_output_tokens_per_second
+        metadata["inference_log"] = all_inference_log
 
         if not all(
             all(content == "" for content in single_turn_reasoning_content)
@@ -397,6 +455,19 @@ class BaseHandler:
         include_input_log: bool,
         exclude_state_log: bool,
     ) -> tuple[list[list], dict]:
+        return run_inference_steps_inline(
+            self._inference_multi_turn_prompting_steps(
+                test_entry, include_input_log, exclude_state_log
+            )
+        )
+
+    @final
+    def _inference_multi_turn_prompting_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> InferenceSteps:
         initial_config: dict = test_entry.get("initial_config", {})
         involved_classes: list = test_entry["involved_classes"]
         test_entry_id: str = test_entry["id"]
@@ -409,6 +480,10 @@ class BaseHandler:
         total_input_token_count: list[list[float]] = []
         total_output_token_count: list[list[float]] = []
         total_latency: list[list[float]] = []
+        # Only filled in streaming mode, None for the steps that were not streamed
+        total_time_to_first_token: list[list[Optional[float]]] = []
+        total_output_tokens_per_second: list[list[Optional[float]]] = []
+        total_time_to_first_tool_call: list[list[Optional[float]]] = []
         # The model response that will be used for later evaluation
         all_model_response: list[list] = []
         # Only for reasoning models, reasoning content will be stored as part of metadata and in inference log
@@ -418,15 +493,16 @@ class BaseHandler:
         force_quit = False  # Whether the model has been forced to quit. If True, this whole entry will be failed.
 
         # Execute no function call, but just to get a reference to all the instances to get the initial state for logging purpose
-        _, involved_instances = execute_multi_turn_func_call(
-            [],
-            initial_config,
-            involved_classes,
-            self.model_name_underline_replaced,
-            test_entry_id,
-            long_context=("long_context" in test_category or "composite" in test_category),
-            is_evaL_run=False,
-        )
+        with trace_span("backend_execution"):
+            _, involved_instances = execute_multi_turn_func_call(
+                [],
+                initial_config,
+                involved_classes,
+                self.model_name_underline_replaced,
+                test_entry_id,
+                long_context=("long_context" in test_category or "composite" in test_category),
+                is_evaL_run=False,
+            )
 
         if is_memory(test_category):
             assert (
@@ -442,27 +518,29 @@ class BaseHandler:
             )
 
         if not exclude_state_log:
-            state_log = []
-            for class_name, class_instance in involved_instances.items():
-                if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
-                    continue
-                # Avoid modification in future turns
-                class_instance = deepcopy(class_instance)
-                state_log.append(
-                    {
-                        "role": "state_info",
-                        "class_name": class_name,
-                        "content": {
-                            key: value
-                            for key, value in vars(class_instance).items()
-                            if not key.startswith("_")
-                        },
-                    }
-                )
-            if len(state_log) > 0:
-                all_inference_log.append(state_log)
+            with trace_span("state_logging"):
+                state_log = []
+                for class_name, class_instance in involved_instances.items():
+                    if class_name in STATELESS_CLASSES or class_name in OMIT_STATE_INFO_CLASSES:
+                        continue
+                    # Avoid modification in future turns
+                    class_instance = deepcopy(class_instance)
+                    state_log.append(
+                        {
+                            "role": "state_info",
+                            "class_name": class_name,
+                            "content": {
+                                key: value
+                                for key, value in vars(class_instance).items()
+                                if not key.startswith("_")
+                            },
+                        }
+                    )
+                if len(state_log) > 0:
+                    all_inference_log.append(state_log)
 
-        inference_data: dict = self._pre_query_processing_prompting(test_entry)
+        with trace_span("pre_processing"):
+            inference_data: dict = self._pre_query_processing_prompting(test_entry)
 
         all_multi_turn_messages: list[list[dict]] = test_entry["question"]
         for turn_idx, current_turn_message in enumerate(all_multi_turn_messages):
@@ -498,6 +576,9 @@ class BaseHandler:
             current_turn_input_token_count: list[float] = []
             current_turn_output_token_count: list[float] = []
             current_turn_latency: list[float] = []
+            current_turn_time_to_first_token: list[Optional[float]] = []
+            current_turn_output_tokens_per_second: list[Optional[float]] = []
+            current_turn_time_to_first_tool_call: list[Optional[float]] = []
 
             count = 0
             while True:
@@ -509,7 +590,10 @@ class BaseHandler:
                 # Add to the current_turn_inference_log at beginning of each step so that we don't need to bother dealing with the break statements
                 current_turn_inference_log[f"step_{count}"] = current_step_inference_log
 
-                api_response, query_latency = self._query_prompting(inference_data)
+                # The request is sent by whoever drives these steps, see `bfcl_eval.model_handler.pipeline`
+                api_response, query_latency, streaming_stats = yield ModelQuery(
+                    self._prepare_query_prompting(inference_data), turn=turn_idx, step=count
+                )
 
                 # This part of logging is disabled by default because it is too verbose and will make the result file extremely large
                 # It is only useful to see if the inference pipeline is working as expected (eg, does it convert all the inputs correctly)
@@ -522,7 +606,8 @@ class BaseHandler:
                     )
 
                 # Try parsing the model response
-                model_response_data = self._parse_query_response_prompting(api_response)
+                with trace_span("response_parsing", turn=turn_idx, step=count):
+                    model_response_data = self._parse_query_response_prompting(api_response)
                 model_responses = model_response_data["model_responses"]
 
                 # Add the assistant message to the chat history
@@ -534,6 +619,15 @@ class BaseHandler:
                 current_turn_input_token_count.append(model_response_data["input_token"])
                 current_turn_output_token_count.append(model_response_data["output_token"])
                 current_turn_latency.append(query_latency)
+                current_turn_time_to_first_token.append(
+                    streaming_stats.time_to_first_token if streaming_stats else None
+                )
+                current_turn_output_tokens_per_second.append(
+                    streaming_stats.output_tokens_per_second if streaming_stats else None
+                )
+                current_turn_time_to_first_tool_call.append(
+                    streaming_stats.time_to_first_tool_call if streaming_stats else None
+                )
 
                 current_turn_response.append(model_responses)
                 reasoning_content = model_response_data.get("reasoning_content", "")
@@ -550,9 +644,10 @@ class BaseHandler:
 
                 # Try decoding the model response
                 try:
-                    decoded_model_responses = self.decode_execute(
-                        model_responses, has_tool_call_tag=False
-                    )
+                    with trace_span("decode", turn=turn_idx, step=count):
+                        decoded_model_responses = self.decode_execute(
+                            model_responses, has_tool_call_tag=False
+                        )
                     current_step_inference_log.append(
                         {
                             "role": "handler_log",
@@ -585,17 +680,18 @@ class BaseHandler:
                     break
 
                 # Obtain the execution results
-                execution_results, involved_instances = execute_multi_turn_func_call(
-                    decoded_model_responses,
-                    initial_config,
-                    involved_classes,
-                    self.model_name_underline_replaced,
-                    test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
-                    is_evaL_run=False,
-                )
+                with trace_span("backend_execution", turn=turn_idx, step=count):
+                    execution_results, involved_instances = execute_multi_turn_func_call(
+                        decoded_model_responses,
+                        initial_config,
+                        involved_classes,
+                        self.model_name_underline_replaced,
+                        test_entry_id,
+                        long_context=(
+                            "long_context" in test_category or "composite" in test_category
+                        ),
+                        is_evaL_run=False,
+                    )
 
                 # Add the execution results to the chat history for the next turn
                 inference_data = self._add_execution_results_prompting(
@@ -629,30 +725,34 @@ class BaseHandler:
             total_input_token_count.append(current_turn_input_token_count)
             total_output_token_count.append(current_turn_output_token_count)
             total_latency.append(current_turn_latency)
+            total_time_to_first_token.append(current_turn_time_to_first_token)
+            total_output_tokens_per_second.append(current_turn_output_tokens_per_second)
+            total_time_to_first_tool_call.append(current_turn_time_to_first_tool_call)
 
             if not exclude_state_log:
-                state_log = []
-                for class_name, class_instance in involved_instances.items():
-                    if (
-                        class_name in STATELESS_CLASSES
-                        or class_name in OMIT_STATE_INFO_CLASSES
-                    ):
-                        continue
-                    # Avoid modification in future turns
-                    class_instance = deepcopy(class_instance)
-                    state_log.append(
-                        {
-                            "role": "state_info",
-                            "class_name": class_name,
-                            "content": {
-                                key: value
-                                for key, value in vars(class_instance).items()
-                                if not key.startswith("_")
-                            },
-                        }
-                    )
-                if len(state_log) > 0:
-                    all_inference_log.append(state_log)
+                with trace_span("state_logging", turn=turn_idx):
+                    state_log = []
+                    for class_name, class_instance in involved_instances.items():
+                        if (
+                            class_name in STATELESS_CLASSES
+                            or class_name in OMIT_STATE_INFO_CLASSES
+                        ):
+                            continue
+                        # Avoid modification in future turns
+                        class_instance = deepcopy(class_instance)
+                        state_log.append(
+                            {
+                                "role": "state_info",
+                                "class_name": class_name,
+                                "content": {
+                                    key: value
+                                    for key, value in vars(class_instance).items()
+                                    if not key.startswith("_")
+                                },
+                            }
+                        )
+                    if len(state_log) > 0:
+                        all_inference_log.append(state_log)
 
             if force_quit:
                 break
@@ -670,8 +770,13 @@ class BaseHandler:
             "input_token_count": total_input_token_count,
             "output_token_count": total_output_token_count,
             "latency": total_latency,
-            "inference_log": all_inference_log,
         }
+        # Streaming metrics are only recorded if at least one step was streamed
+        if any(value is not None for turn in total_time_to_first_token for value in turn):
+            metadata["time_to_first_token"] = total_time_to_first_token
+            metadata["output_tokens_per_second"] = total_output_tokens_per_second
+            metadata["time_to_first_tool_call"] = total_time_to_first_tool_call
+        metadata["inference_log"] = all_inference_log
         # We only include reasoning content if it exists and is not empty
         if not all(
             all(content == "" for content in single_turn_reasoning_content)
@@ -685,53 +790,76 @@ class BaseHandler:
     def inference_single_turn_FC(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
-        inference_data: dict = {}
-        inference_data = self._pre_query_processing_FC(inference_data, test_entry)
-        inference_data = self._compile_tools(inference_data, test_entry)
-        inference_data = self.add_first_turn_message_FC(
-            inference_data, test_entry["question"][0]
-        )
+        inference_data = self._prepare_single_turn_FC(test_entry)
 
-        api_response, query_latency = self._query_FC(inference_data)
+        with trace_span("model_query"):
+            api_response, query_latency = self._query_FC(inference_data)
+        streaming_stats = pop_streaming_stats()
 
         # Try parsing the model response
-        model_response_data = self._parse_query_response_FC(api_response)
-
-        # Process the metadata
-        metadata = {}
-        if include_input_log:
-            metadata["inference_log"] = [
-                {
-                    "role": "inference_input",
-                    "content": inference_data.get("inference_input_log", ""),
-                }
-            ]
-        metadata["input_token_count"] = model_response_data["input_token"]
-        metadata["output_token_count"] = model_response_data["output_token"]
-        metadata["latency"] = query_latency
-
-        if (
-            "reasoning_content" in model_response_data
-            and model_response_data["reasoning_content"] != ""
-        ):
-            metadata["reasoning_content"] = model_response_data["reasoning_content"]
-
-        return model_response_data["model_responses"], metadata
+        with trace_span("response_parsing"):
+            model_response_data = self._parse_query_response_FC(api_response)
+
+        return self._build_single_turn_result(
+            inference_data,
+            model_response_data,
+            query_latency,
+            include_input_log,
+            streaming_stats,
+        )
 
     @final
     def inference_single_turn_prompting(
         self, test_entry: dict, include_input_log: bool
     ) -> tuple[any, dict]:
-        inference_data: dict = self._pre_query_processing_prompting(test_entry)
-        inference_data = self.add_first_turn_message_prompting(
-            inference_data, test_entry["question"][0]
-        )
+        inference_data = self._prepare_single_turn_prompting(test_entry)
 
-        api_response, query_latency = self._query_prompting(inference_data)
+        with trace_span("model_query"):
+            api_response, query_latency = self._query_prompting(inference_data)
+        streaming_stats = pop_streaming_stats()
 
         # Try parsing the model response
-        model_response_data = self._parse_query_response_prompting(api_response)
+        with trace_span("response_parsing"):
+            model_response_data = self._parse_query_response_prompting(api_response)
+
+        return self._build_single_turn_result(
+            inference_data,
+            model_response_data,
+            query_latency,
+            include_input_log,
+            streaming_stats,
+        )
+
+    @final
+    def _prepare_single_turn_FC(self, test_entry: dict) -> dict:
+        inference_data: dict = {}
+        with trace_span("pre_processing"):
+            inference_data = self._pre_query_processing_FC(inference_data, test_entry)
+        with trace_span("tool_compilation"):
+            inference_data = self._compile_tools(inference_data, test_entry)
+        inference_data = self.add_first_turn_message_FC(
+            inference_data, test_entry["question"][0]
+        )
+        return inference_data
 
+    @final
+    def _prepare_single_turn_prompting(self, test_entry: dict) -> dict:
+        with trace_span("pre_processing"):
+            inference_data: dict = self._pre_query_processing_prompting(test_entry)
+        inference_data = self.add_first_turn_message_prompting(
+            inference_data, test_entry["question"][0]
+        )
+        return inference_data
+
+    @final
+    def _build_single_turn_result(
+        self,
+        inference_data: dict,
+        model_response_data: dict,
+        query_latency: float,
+        include_input_log: bool,
+        streaming_stats: Optional[StreamingStats] = None,
+    ) -> tuple[any, dict]:
         # Process the metadata
         metadata = {}
         if include_input_log:
@@ -744,6 +872,11 @@ class BaseHandler:
         metadata["input_token_count"] = model_response_data["input_token"]
         metadata["output_token_count"] = model_response_data["output_token"]
         metadata["latency"] = query_latency
+        if streaming_stats is not None:
+            metadata["time_to_first_token"] = streaming_stats.time_to_first_token
+            metadata["output_tokens_per_second"] = streaming_stats.output_tokens_per_second
+            if streaming_stats.time_to_first_tool_call is not None:
+                metadata["time_to_first_tool_call"] = streaming_stats.time_to_first_tool_call
 
         if (
             "reasoning_content" in model_response_data
@@ -765,6 +898,79 @@ class BaseHandler:
         """
         raise NotImplementedError
 
+    @final
+    def decode_ast_batch(
+        self, results: list, language: ReturnFormat, has_tool_call_tag: bool
+    ) -> list:
+        """
+        Decode many raw model outputs at once, same as calling `decode_ast` on each of them.
+
+        Returns:
+            list: For each result, either the decoded output, or the exception `decode_ast` raised for it.
+        """
+        start_time = time.perf_counter()
+        decoded_results = self._decode_ast_batch(results, language, has_tool_call_tag)
+        DECODE_THROUGHPUT_STATS.record(
+            type(self).__name__, "decode_ast", len(results), time.perf_counter() - start_time
+        )
+        return decoded_results
+
+    @final
+    def decode_execute_batch(self, results: list, has_tool_call_tag: bool) -> list:
+        """
+        Decode many raw model outputs at once, same as calling `decode_execute` on each of them.
+
+        Returns:
+            list: For each result, either the decoded output, or the exception `decode_execute` raised for it.
+        """
+        start_time = time.perf_counter()
+        decoded_results = self._decode_execute_batch(results, has_tool_call_tag)
+        DECODE_THROUGHPUT_STATS.record(
+            type(self).__name__,
+            "decode_execute",
+            len(results),
+            time.perf_counter() - start_time,
+        )
+        return decoded_results
+
+    def _decode_ast_batch(
+        self, results: list, language: ReturnFormat, has_tool_call_tag: bool
+    ) -> list:
+        """
+        Handlers with a faster way to decode many outputs at once can override this method.
+        The default implementation simply calls `decode_ast` on each result.
+        """
+        decoded_results = []
+        for result in results:
+            try:
+                decoded_results.append(self.decode_ast(result, language, has_tool_call_tag))
+            except Exception as e:
+                decoded_results.append(e)
+        return decoded_results
+
+    def _decode_execute_batch(self, results: list, has_tool_call_tag: bool) -> list:
+        """
+        Handlers with a faster way to decode many outputs at once can override this method.
+        The default implementation simply calls `decode_execute` on each result.
+        """
+        decoded_results = []
+        for result in results:
+            try:
+                decoded_results.append(self.decode_execute(result, has_tool_call_tag))
+            except Exception as e:
+                decoded_results.append(e)
+        return decoded_results
+
+    def _uses_own_decoder(self, owner_class: type) -> bool:
+        """
+        Whether `decode_ast` and `decode_execute` are the ones defined by `owner_class`.
+        A batch decoder override must fall back to the per-item methods when a subclass customizes them.
+        """
+        return (
+            type(self).decode_ast is owner_class.decode_ast
+            and type(self).decode_execute is owner_class.decode_execute
+        )
+
     @final
     def write(self, result, result_dir, update_mode=False):
         # Use the internal registry name to decide the result directory to avoid
@@ -991,3 +1197,107 @@ class BaseHandler:
         By default, execution results are added back as a `user` role message, as most models don't support the `tool` role in prompting mode.
         """
         raise NotImplementedError
+
+    #### Pipelined inference methods ####
+
+    def inference_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> InferenceSteps:
+        """
+        Same as `inference` for a multi-turn test entry, but as inference steps that yield each model request instead of sending it (see `bfcl_eval.model_handler.pipeline`).
+        Handlers that override `inference` should override this method accordingly.
+        """
+        if self._is_fc_mode():
+            return self._inference_multi_turn_FC_steps(
+                test_entry, include_input_log, exclude_state_log
+            )
+        else:
+            return self._inference_multi_turn_prompting_steps(
+                test_entry, include_input_log, exclude_state_log
+            )
+
+    def _prepare_query_FC(self, inference_data: dict) -> Callable[[], tuple[Any, float]]:
+        """
+        Return the request of `_query_FC` as a callable, which may be sent later and from another thread.
+        Handlers that do CPU-heavy work before sending the request can override this method to do that work right away, so that the pipelined inference keeps it off the threads waiting for the model.
+        """
+        return lambda: self._query_FC(inference_data)
+
+    def _prepare_query_prompting(
+        self, inference_data: dict
+    ) -> Callable[[], tuple[Any, float]]:
+        """
+        Return the request of `_query_prompting` as a callable, see `_prepare_query_FC`.
+        """
+        return lambda: self._query_prompting(inference_data)
+
+    #### Streaming methods ####
+
+    def supports_streaming(self) -> bool:
+        """
+        Whether the handler can stream its responses to record the time to first token and the decode speed of each step (`bfcl generate --stream`).
+        Handlers that return True consume the stream in their query methods when `self.streaming` is set, rebuild the response object a non-streamed request returns, and finish a `StreamTimer` from `model_handler/streaming.py`.
+        """
+        return False
+
+    #### Batch API methods ####
+
+    def supports_batch_api(self) -> bool:
+        """
+        Whether single-turn entries can be sent through the provider's batch API instead of one synchronous request each (`bfcl generate --batch-api`).
+        Handler classes opt in by setting `batch_api_supported = True`, and implement `_batch_api_endpoint`, `_batch_request_body` and `_batch_response_to_api_response`, and have an OpenAI-compatible `self.client`.
+        The attribute is looked up on the handler's own class only: subclasses usually send their requests differently (other parameters, other client calls), so they have to opt in again.
+        """
+        return type(self).__dict__.get("batch_api_supported", False)
+
+    @final
+    def build_batch_request(self, test_entry: dict) -> tuple[dict, dict]:
+        """
+        Prepare a single-turn entry the same way `inference_single_turn_FC` / `inference_single_turn_prompting` does, but return the request instead of sending it.
+
+        Returns:
+            tuple: The request body, and the inference data to pass to `ingest_batch_response` along with the response.
+        """
+        if self._is_fc_mode():
+            inference_data = self._prepare_single_turn_FC(test_entry)
+        else:
+            inference_data = self._prepare_single_turn_prompting(test_entry)
+        return self._batch_request_body(inference_data), inference_data
+
+    @final
+    def ingest_batch_response(
+        self, inference_data: dict, response_body: dict, include_input_log: bool
+    ) -> tuple[any, dict]:
+        """
+        Turn the batch API response to a request from `build_batch_request` into the same (result, metadata) as the synchronous single-turn inference.
+        """
+        api_response = self._batch_response_to_api_response(response_body)
+        if self._is_fc_mode():
+            model_response_data = self._parse_query_response_FC(api_response)
+        else:
+            model_response_data = self._parse_query_response_prompting(api_response)
+        # The batch API reports no per-request latency; 0 keeps these entries out of the latency statistics
+        return self._build_single_turn_result(
+            inference_data, model_response_data, 0, include_input_log
+        )
+
+    def _batch_api_endpoint(self) -> str:
+        """
+        The API route the batch requests are run against, eg. `/v1/chat/completions`.
+        """
+        raise NotImplementedError
+
+    def _batch_request_body(self, inference_data: dict) -> dict:
+        """
+        The request body that `_query_FC` (or `_query_prompting`) would send for this inference data. It must also set `inference_data["inference_input_log"]`, like the query methods do.
+        """
+        raise NotImplementedError
+
+    def _batch_response_to_api_response(self, response_body: dict) -> Any:
+        """
+        Convert a response body from the batch output file into the response object that `_parse_query_response_FC` (or `_parse_query_response_prompting`) expects.
+        """
+        raise NotImplementedError
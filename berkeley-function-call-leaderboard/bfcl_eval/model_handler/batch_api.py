@@ -0,0 +1,174 @@
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from tqdm import tqdm
+
+# Limits of a single batch on the OpenAI Batch API; larger request sets are split into several batches
+BATCH_MAX_REQUESTS = 50000
+BATCH_MAX_FILE_BYTES = 200 * 1024 * 1024
+BATCH_COMPLETION_WINDOW = "24h"
+# Batch status polling backoff: batches take minutes to hours, so there is no point in polling often
+BATCH_POLL_INITIAL_INTERVAL = 5.0
+BATCH_POLL_MAX_INTERVAL = 60.0
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_batch_request_line(custom_id: str, endpoint: str, body: dict) -> dict:
+    return {"custom_id": custom_id, "method": "POST", "url": endpoint, "body": body}
+
+
+def split_batch_request_lines(request_lines: list[dict]) -> list[list[dict]]:
+    """
+    Split the request lines into chunks that each fit in one batch.
+    """
+    chunks: list[list[dict]] = []
+    current_chunk: list[dict] = []
+    current_bytes = 0
+    for request_line in request_lines:
+        line_bytes = len(json.dumps(request_line).encode("utf-8")) + 1
+        if current_chunk and (
+            len(current_chunk) >= BATCH_MAX_REQUESTS
+            or current_bytes + line_bytes > BATCH_MAX_FILE_BYTES
+        ):
+            chunks.append(current_chunk)
+            current_chunk, current_bytes = [], 0
+        current_chunk.append(request_line)
+        current_bytes += line_bytes
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def submit_batch(client, request_lines: list[dict], endpoint: str, input_file_path: Path):
+    """
+    Write the request lines to `input_file_path`, upload it and create a batch for it.
+
+    Returns:
+        Batch: The created batch.
+    """
+    input_file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(input_file_path, "w", encoding="utf-8") as f:
+        for request_line in request_lines:
+            f.write(json.dumps(request_line) + "\n")
+
+    with open(input_file_path, "rb") as f:
+        input_file = client.files.create(file=f, purpose="batch")
+    return client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=endpoint,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+
+
+def wait_for_batch(client, batch_id: str, poll_timeout: Optional[float] = None):
+    """
+    Poll the batch with exponential backoff until it reaches a terminal status.
+
+    Returns:
+        Batch: The batch in its terminal status.
+    """
+    poll_interval = BATCH_POLL_INITIAL_INTERVAL
+    deadline = None if poll_timeout is None else time.monotonic() + poll_timeout
+    last_reported = None
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        progress = (
+            batch.status,
+            counts.completed if counts else None,
+            counts.failed if counts else None,
+        )
+        if progress != last_reported:
+            if counts:
+                tqdm.write(
+                    f"📦 Batch {batch_id}: {batch.status} ({counts.completed}/{counts.total} completed, {counts.failed} failed)"
+                )
+            else:
+                tqdm.write(f"📦 Batch {batch_id}: {batch.status}")
+            last_reported = progress
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            return batch
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(
+                f"Batch {batch_id} is still {batch.status} after {poll_timeout} seconds."
+            )
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, BATCH_POLL_MAX_INTERVAL)
+
+
+def read_batch_results(client, batch, output_file_path: Path) -> dict[str, dict]:
+    """
+    Download the output and error files of a finished batch (also saved to `output_file_path`).
+
+    Returns:
+        dict: custom_id -> `{"body": response body}` for the requests that succeeded, or `{"error": message}` for those that failed. Requests that the batch never ran (eg. when it expired) are absent.
+    """
+    results: dict[str, dict] = {}
+    lines: list[str] = []
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if file_id:
+            lines.extend(client.files.content(file_id).text.splitlines())
+
+    output_file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file_path, "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+    for line in lines:
+        if not line.strip():
+            continue
+        output_line = json.loads(line)
+        custom_id = output_line["custom_id"]
+        response = output_line.get("response") or {}
+        if output_line.get("error"):
+            results[custom_id] = {"error": json.dumps(output_line["error"])}
+        elif response.get("status_code") != 200:
+            results[custom_id] = {
+                "error": f"Status code {response.get('status_code')}: {json.dumps(response.get('body'))}"
+            }
+        else:
+            results[custom_id] = {"body": response["body"]}
+    return results
+
+
+def run_batch_requests(
+    client,
+    request_lines: list[dict],
+    endpoint: str,
+    work_dir: Path,
+    poll_timeout: Optional[float] = None,
+) -> tuple[dict[str, dict], dict[str, str]]:
+    """
+    Submit the request lines as one or more batches, wait for them, and collect the results. The batch input and output files are kept in `work_dir`.
+
+    Returns:
+        tuple: The results (see `read_batch_results`) of all batches, and the id of the batch each custom_id was sent in.
+    """
+    batches = []
+    batch_id_of: dict[str, str] = {}
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    for chunk_index, chunk in enumerate(split_batch_request_lines(request_lines)):
+        batch = submit_batch(
+            client,
+            chunk,
+            endpoint,
+            work_dir / f"{timestamp}_{chunk_index}_input.jsonl",
+        )
+        tqdm.write(f"📦 Submitted batch {batch.id} with {len(chunk)} requests.")
+        batches.append(batch)
+        for request_line in chunk:
+            batch_id_of[request_line["custom_id"]] = batch.id
+
+    results: dict[str, dict] = {}
+    for batch in batches:
+        batch = wait_for_batch(client, batch.id, poll_timeout)
+        if batch.status != "completed":
+            tqdm.write(
+                f"⚠️ Batch {batch.id} ended with status '{batch.status}'{f': {batch.errors}' if batch.errors else ''}."
+            )
+        results.update(
+            read_batch_results(client, batch, work_dir / f"{batch.id}_output.jsonl")
+        )
+    return results, batch_id_of
@@ -0,0 +1,53 @@
+import threading
+from collections import defaultdict
+
+
+class DecodeThroughputStats:
+    """
+    Process-wide record of how many model outputs each handler decoded, and how long it took.
+
+    It is fed by `BaseHandler.decode_ast_batch` and `BaseHandler.decode_execute_batch`, and summarized at the end of the evaluation so that slow decoders are easy to spot.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (handler class name, decode method) -> [item count, total seconds]
+        self._stats: defaultdict[tuple[str, str], list] = defaultdict(lambda: [0, 0.0])
+
+    def record(self, handler_name: str, method: str, item_count: int, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats[(handler_name, method)]
+            stats[0] += item_count
+            stats[1] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> list[dict]:
+        """
+        Return one row per (handler, decode method), slowest throughput first.
+        """
+        with self._lock:
+            rows = [
+                {
+                    "handler": handler_name,
+                    "method": method,
+                    "items": item_count,
+                    "seconds": seconds,
+                    "items_per_second": item_count / seconds if seconds > 0 else float("inf"),
+                }
+                for (handler_name, method), (item_count, seconds) in self._stats.items()
+            ]
+        return sorted(rows, key=lambda row: row["items_per_second"])
+
+    def format_summary(self) -> str:
+        lines = []
+        for row in self.summary():
+            lines.append(
+                f"  {row['handler']}.{row['method']}: {row['items']} items in {row['seconds']:.3f}s ({row['items_per_second']:.0f} items/s)"
+            )
+        return "\n".join(lines)
+
+
+DECODE_THROUGHPUT_STATS = DecodeThroughputStats()
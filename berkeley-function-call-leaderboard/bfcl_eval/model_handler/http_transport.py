@@ -0,0 +1,166 @@
+import atexit
+import importlib.util
+import os
+import threading
+from typing import Optional
+
+import httpx
+from bfcl_eval.model_handler.tracing import trace_span
+
+# httpx keeps at most 20 idle connections per client by default, so with more threads than that, connections are constantly closed and re-opened (each with a new TLS handshake); the shared pool is sized from the number of threads instead
+HTTP_POOL_MIN_CONNECTIONS = 100
+# Extra connections on top of the number of threads, for retries and health checks
+HTTP_POOL_HEADROOM_CONNECTIONS = 10
+# Idle connections are kept open this long (httpx default: 5s), so that they survive the gap between two turns of a multi-turn entry
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+
+class SharedHTTPTransport(httpx.BaseTransport):
+    """
+    One connection pool shared by the SDK clients of every handler in the process, so that connections (and their TLS sessions) are reused across handlers, threads and models.
+
+    The underlying `httpx.HTTPTransport` is only built on the first request, so the pool can be sized by `configure_http_transport` after the handlers are created. It also counts the requests sent and the connections opened, see `stats`.
+
+    Settings read from the environment:
+        BFCL_HTTP2: `auto` (default, on if the `h2` package is installed), `1` or `0`. HTTP/2 is only negotiated with servers that support it over TLS.
+        BFCL_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept open.
+        BFCL_HTTP_CONNECT_TIMEOUT / BFCL_HTTP_READ_TIMEOUT: Timeouts in seconds for the clients from `shared_http_client`; the SDK defaults are used when unset.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._transport: Optional[httpx.HTTPTransport] = None
+        # Transports replaced by a larger pool; closed at exit, as requests may still be using them
+        self._retired_transports: list[httpx.HTTPTransport] = []
+        self._max_concurrency = 0
+        self._request_count = 0
+        self._connection_count = 0
+        self._tls_handshake_count = 0
+
+    def configure(self, max_concurrency: int) -> None:
+        with self._lock:
+            if max_concurrency <= self._max_concurrency:
+                return
+            self._max_concurrency = max_concurrency
+            # Rebuilt with the larger pool on the next request
+            if self._transport is not None:
+                self._retired_transports.append(self._transport)
+                self._transport = None
+
+    def _get_transport(self) -> httpx.HTTPTransport:
+        with self._lock:
+            if self._transport is None:
+                max_connections = max(
+                    HTTP_POOL_MIN_CONNECTIONS,
+                    self._max_concurrency + HTTP_POOL_HEADROOM_CONNECTIONS,
+                )
+                self._transport = httpx.HTTPTransport(
+                    http2=_http2_enabled(),
+                    limits=httpx.Limits(
+                        max_connections=max_connections,
+                        max_keepalive_connections=max_connections,
+                        keepalive_expiry=float(
+                            os.getenv("BFCL_HTTP_KEEPALIVE_EXPIRY", HTTP_KEEPALIVE_EXPIRY)
+                        ),
+                    ),
+                )
+            return self._transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self._request_count += 1
+
+        outer_trace = request.extensions.get("trace")
+
+        def trace(event_name: str, info: dict) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                with self._lock:
+                    self._connection_count += 1
+            elif event_name == "connection.start_tls.complete":
+                with self._lock:
+                    self._tls_handshake_count += 1
+            if outer_trace is not None:
+                outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        # Until the response headers are received; the body is read by the caller afterwards
+        with trace_span("network_request", host=request.url.host):
+            return self._get_transport().handle_request(request)
+
+    def close(self) -> None:
+        # The clients built by `shared_http_client` close their transport when they are closed or garbage collected, but the pool outlives them; it is closed at exit
+        pass
+
+    def _close(self) -> None:
+        with self._lock:
+            transports = self._retired_transports + [self._transport]
+            self._retired_transports = []
+            self._transport = None
+        for transport in transports:
+            if transport is not None:
+                transport.close()
+
+    def stats(self) -> dict:
+        """
+        Return the number of requests sent, and of TCP connections and TLS handshakes made for them.
+        """
+        with self._lock:
+            return {
+                "requests": self._request_count,
+                "connections": self._connection_count,
+                "tls_handshakes": self._tls_handshake_count,
+            }
+
+    def format_stats(self, since: Optional[dict] = None) -> Optional[str]:
+        """
+        Summarize the connection reuse, over the requests sent after the `since` snapshot of `stats` if given.
+        """
+        stats = self.stats()
+        if since is not None:
+            stats = {key: value - since[key] for key, value in stats.items()}
+        if stats["requests"] == 0:
+            return None
+        reuse_rate = max(0.0, 1 - stats["connections"] / stats["requests"])
+        return f"{stats['requests']} requests over {stats['connections']} connections ({stats['tls_handshakes']} TLS handshakes), {reuse_rate:.1%} reused"
+
+
+def _http2_enabled() -> bool:
+    setting = os.getenv("BFCL_HTTP2", "auto").lower()
+    if setting == "auto":
+        return importlib.util.find_spec("h2") is not None
+    return setting in ("1", "true", "yes")
+
+
+def _timeout_from_env() -> httpx.Timeout:
+    connect_timeout = os.getenv("BFCL_HTTP_CONNECT_TIMEOUT")
+    read_timeout = os.getenv("BFCL_HTTP_READ_TIMEOUT")
+    if connect_timeout is None and read_timeout is None:
+        # The httpx default, which the OpenAI and Anthropic SDKs take as "not set" and replace with their own defaults
+        return httpx.Timeout(5.0)
+    return httpx.Timeout(
+        float(read_timeout) if read_timeout is not None else 600.0,
+        connect=float(connect_timeout) if connect_timeout is not None else 5.0,
+    )
+
+
+SHARED_HTTP_TRANSPORT = SharedHTTPTransport()
+atexit.register(SHARED_HTTP_TRANSPORT._close)
+
+
+def configure_http_transport(max_concurrency: int) -> None:
+    """
+    Size the shared connection pool for `max_concurrency` requests in flight. The pool only ever grows, as other handlers may still be using it.
+    """
+    SHARED_HTTP_TRANSPORT.configure(max_concurrency)
+
+
+def shared_http_client() -> httpx.Client:
+    """
+    An `httpx.Client` on the shared connection pool, to pass as the `http_client` of an SDK client.
+    """
+    return httpx.Client(
+        transport=SHARED_HTTP_TRANSPORT,
+        timeout=_timeout_from_env(),
+        # Same as the OpenAI and Anthropic SDKs' own clients
+        follow_redirects=True,
+    )
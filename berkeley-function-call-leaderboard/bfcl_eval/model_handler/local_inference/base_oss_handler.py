@@ -1,21 +1,41 @@
 import os
-import subprocess
-import threading
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-import requests
 from bfcl_eval.constants.enums import ModelStyle
 from bfcl_eval.constants.eval_config import LOCAL_SERVER_PORT
 from bfcl_eval.model_handler.base_handler import BaseHandler
+from bfcl_eval.model_handler.local_inference.endpoint_pool import (
+    EndpointPool,
+    parse_endpoint_url,
+)
+from bfcl_eval.model_handler.local_inference.prompt_token_counter import (
+    PromptTokenCounter,
+)
+from bfcl_eval.model_handler.local_inference.server_manager import (
+    LOCAL_SERVER_POOL,
+    LocalServerSpec,
+    wait_for_server_ready,
+)
+from bfcl_eval.model_handler.local_inference.server_metrics import (
+    fetch_prefix_cache_stats,
+    merge_prefix_cache_stats,
+)
+from bfcl_eval.model_handler.pipeline import InferenceSteps
+from bfcl_eval.model_handler.streaming import StreamTimer, iter_server_sent_events
+from bfcl_eval.model_handler.tracing import trace_span
 from bfcl_eval.model_handler.utils import (
+    StreamingToolCallDecoder,
     default_decode_ast_prompting,
     default_decode_execute_prompting,
+    formulate_system_prompt,
+    function_doc_set_hash,
     system_prompt_pre_processing_chat_model,
 )
-from bfcl_eval.utils import contain_multi_turn_interaction
+from bfcl_eval.utils import contain_multi_turn_interaction, extract_prompt_format_from_id
 from openai import OpenAI
+from openai.types import Completion
 from overrides import EnforceOverrides, final, override
 
 
@@ -42,8 +62,32 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         self.local_server_endpoint = os.getenv("LOCAL_SERVER_ENDPOINT", "localhost")
         self.local_server_port = os.getenv("LOCAL_SERVER_PORT", LOCAL_SERVER_PORT)
 
-        self.base_url = f"http://{self.local_server_endpoint}:{self.local_server_port}/v1"
-        self.client = OpenAI(base_url=self.base_url, api_key="EMPTY")
+        # Several replicas of the model can be listed in LOCAL_SERVER_ENDPOINTS (comma-separated `host:port`), in which case it takes precedence over LOCAL_SERVER_ENDPOINT and LOCAL_SERVER_PORT
+        endpoints = os.getenv("LOCAL_SERVER_ENDPOINTS")
+        if endpoints:
+            root_urls = [
+                parse_endpoint_url(endpoint, self.local_server_port)
+                for endpoint in endpoints.split(",")
+                if endpoint.strip()
+            ]
+        else:
+            root_urls = [
+                parse_endpoint_url(self.local_server_endpoint, self.local_server_port)
+            ]
+        max_concurrent_requests_per_endpoint = os.getenv(
+            "LOCAL_SERVER_MAX_CONCURRENT_REQUEST_PER_ENDPOINT"
+        )
+        self.endpoint_pool = EndpointPool(
+            root_urls,
+            max_concurrent_requests_per_endpoint=(
+                int(max_concurrent_requests_per_endpoint)
+                if max_concurrent_requests_per_endpoint
+                else None
+            ),
+            strategy=os.getenv("LOCAL_SERVER_LOAD_BALANCING", "least_outstanding"),
+        )
+        # The server we launch (or wait for) in `spin_up_local_server`
+        self.base_url = self.endpoint_pool.endpoints[0].base_url
 
     @override
     def inference(
@@ -60,6 +104,17 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         else:
             return self.inference_single_turn_prompting(test_entry, include_input_log)
 
+    @override
+    def inference_steps(
+        self,
+        test_entry: dict,
+        include_input_log: bool,
+        exclude_state_log: bool,
+    ) -> InferenceSteps:
+        return self._inference_multi_turn_prompting_steps(
+            test_entry, include_input_log, exclude_state_log
+        )
+
     @override
     def decode_ast(self, result, language, has_tool_call_tag):
         return default_decode_ast_prompting(result, language, has_tool_call_tag)
@@ -81,7 +136,9 @@ class OSSHandler(BaseHandler, EnforceOverrides):
         Spin up a local server for the model.
         If the server is already running, skip the setup.
         """
-        from transformers import AutoConfig, AutoTokenizer
+        # Some models can only be served by one backend (eg. the mock model, see `MockModelHandler`)
+        if hasattr(self, "server_backend"):
+            backend = self.server_backend
 
         # Determine the model source
         if local_model_path is not None:
@@ -111,8 +168,8 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 "trust_remote_code": True,
             }
 
-        self.tokenizer = AutoTokenizer.from_pretrained(**load_kwargs)
-        config = AutoConfig.from_pretrained(**load_kwargs)
+        self.tokenizer, config = self._load_tokenizer_and_config(load_kwargs)
+        self.prompt_token_counter = PromptTokenCounter(self.tokenizer)
 
         if hasattr(config, "max_position_embeddings"):
             self.max_context_length = config.max_position_embeddings
@@ -125,146 +182,69 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 )
         print(f"Max context length: {self.max_context_length}")
 
-        self._server_process = process = None
-        self._stdout_thread = stdout_thread = None
-        self._stderr_thread = stderr_thread = None
-        # Event to signal threads to stop; no need to see logs after server is ready
-        # declare early so it always exists
-        self._stop_event = threading.Event()
-        try:
-            if not skip_server_setup:
-                if backend == "vllm":
-                    process = subprocess.Popen(
-                        [
-                            "vllm",
-                            "serve",
-                            str(self.model_path_or_id),
-                            "--port",
-                            str(self.local_server_port),
-                            "--dtype",
-                            str(self.dtype),
-                            "--tensor-parallel-size",
-                            str(num_gpus),
-                            "--gpu-memory-utilization",
-                            str(gpu_memory_utilization),
-                            "--trust-remote-code",
-                        ],
-                        stdout=subprocess.PIPE,  # Capture stdout
-                        stderr=subprocess.PIPE,  # Capture stderr
-                        text=True,  # To get the output as text instead of bytes
-                    )
-                elif backend == "sglang":
-
-                    process = subprocess.Popen(
-                        [
-                            "python",
-                            "-m",
-                            "sglang.launch_server",
-                            "--model-path",
-                            str(self.model_path_or_id),
-                            "--port",
-                            str(self.local_server_port),
-                            "--dtype",
-                            str(self.dtype),
-                            "--tp",
-                            str(num_gpus),
-                            "--mem-fraction-static",
-                            str(gpu_memory_utilization),
-                            "--trust-remote-code",
-                        ],
-                        stdout=subprocess.PIPE,  # Capture stdout
-                        stderr=subprocess.PIPE,  # Capture stderr
-                        text=True,  # To get the output as text instead of bytes
-                    )
-                else:
-                    raise ValueError(f"Backend {backend} is not supported.")
-
-                def log_subprocess_output(pipe, stop_event):
-                    # Read lines until stop event is set
-                    while not stop_event.is_set():
-                        line = pipe.readline()
-                        if line:
-                            print(line, end="")
-                        else:
-                            break
-                    pipe.close()
-                    print("server log tracking thread stopped successfully.")
-
-                # Start threads to read and print stdout and stderr
-                stdout_thread = threading.Thread(
-                    target=log_subprocess_output, args=(process.stdout, self._stop_event)
-                )
-                stderr_thread = threading.Thread(
-                    target=log_subprocess_output, args=(process.stderr, self._stop_event)
-                )
-                stdout_thread.setDaemon(True)
-                stderr_thread.setDaemon(True)
-                stdout_thread.start()
-                stderr_thread.start()
-
-            self._server_process = process
-            self._stdout_thread = stdout_thread
-            self._stderr_thread = stderr_thread
-
-            # Wait for the server to be ready
-            server_ready = False
-            while not server_ready:
-                # Check if the process has terminated unexpectedly
-                if not skip_server_setup and process.poll() is not None:
-                    # Output the captured logs
-                    stdout, stderr = process.communicate()
-                    print(stdout)
-                    print(stderr)
-                    raise Exception(
-                        f"Subprocess terminated unexpectedly with code {process.returncode}"
-                    )
-                try:
-                    # Make a simple request to check if the server is up
-                    response = requests.get(f"{self.base_url}/models")
-                    if response.status_code == 200:
-                        server_ready = True
-                        print("server is ready!")
-                except requests.exceptions.ConnectionError:
-                    # If the connection is not ready, wait and try again
-                    time.sleep(1)
-
-            # Signal threads to stop reading output
-            self._stop_event.set()
-
-        except Exception as e:
-            # Clean-up everything we already started, then re-raise
-            if self._server_process and self._server_process.poll() is None:
-                self._server_process.terminate()
-            if self._stop_event:
-                self._stop_event.set()
-            if self._stdout_thread:
-                self._stdout_thread.join(timeout=2)
-            if self._stderr_thread:
-                self._stderr_thread.join(timeout=2)
-            raise e
+        self.server_spec = LocalServerSpec(
+            backend=backend,
+            model_path_or_id=str(self.model_path_or_id),
+            port=int(self.local_server_port),
+            dtype=str(self.dtype),
+            num_gpus=num_gpus,
+            gpu_memory_utilization=gpu_memory_utilization,
+        )
+        if skip_server_setup:
+            # Wait for the existing server to be ready
+            if len(self.endpoint_pool) > 1:
+                self.endpoint_pool.wait_until_ready()
+            else:
+                wait_for_server_ready(self.base_url)
+        elif len(self.endpoint_pool) > 1:
+            raise ValueError(
+                "Multiple endpoints are set in LOCAL_SERVER_ENDPOINTS, which can only be used with servers that are already running. Please use --skip-server-setup."
+            )
+        else:
+            # Reuses a warm server with the same spec (from an earlier model in this run, or from `bfcl serve start`) when there is one
+            LOCAL_SERVER_POOL.acquire(self.server_spec, self.base_url)
+
+    def _load_tokenizer_and_config(self, load_kwargs: dict) -> tuple[Any, Any]:
+        """
+        Load the tokenizer and the model config from Hugging Face (or from the local model path).
+        """
+        from transformers import AutoConfig, AutoTokenizer
+
+        return AutoTokenizer.from_pretrained(**load_kwargs), AutoConfig.from_pretrained(
+            **load_kwargs
+        )
 
     def shutdown_local_server(self):
-        """Terminate the locally launched OSS model server if it is still running."""
-        # Ensure the server process is terminated properly
-        process = getattr(self, "_server_process", None)
-        if process and process.poll() is None:
-            process.terminate()
-            try:
-                # Wait for the process to terminate fully
-                process.wait(timeout=15)
-                print("Process terminated successfully.")
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()  # Wait again to ensure it's fully terminated
-                print("Process killed.")
-
-        # Tell the log-reader threads to stop and wait for them
-        if getattr(self, "_stop_event", None):
-            self._stop_event.set()
-        if getattr(self, "_stdout_thread", None):
-            self._stdout_thread.join(timeout=2)
-        if getattr(self, "_stderr_thread", None):
-            self._stderr_thread.join(timeout=2)
+        """
+        Release the local OSS model server.
+        The server is kept warm in `LOCAL_SERVER_POOL`, in case the next model of the run uses the same weights; the pool stops it when it is no longer needed.
+        """
+        pass
+
+    def prompt_prefix_key(self, test_entry: dict) -> tuple:
+        """
+        A key shared by the test entries whose prompts start with the same long prefix (the rendered system prompt and the function docs), so that the generation scheduler can send them to the server back to back and make better use of its prefix cache.
+        """
+        system_prompt = formulate_system_prompt(
+            format_sensitivity_config=extract_prompt_format_from_id(test_entry["id"]),
+            functions=test_entry["function"],
+        )
+        return (hash(system_prompt), function_doc_set_hash(test_entry["function"]))
+
+    def read_prefix_cache_stats(self) -> Optional[dict]:
+        """
+        Snapshot of the server's prefix cache statistics (summed over the replicas), see `fetch_prefix_cache_stats`.
+        """
+        return merge_prefix_cache_stats(
+            [
+                fetch_prefix_cache_stats(endpoint.metrics_url)
+                for endpoint in self.endpoint_pool.endpoints
+            ]
+        )
+
+    @override
+    def supports_streaming(self) -> bool:
+        return True
 
     #### Prompting methods ####
 
@@ -277,17 +257,37 @@ class OSSHandler(BaseHandler, EnforceOverrides):
             "OSS Models should implement their own prompt formatting."
         )
 
+    @final
     @override
     def _query_prompting(self, inference_data: dict):
+        return self._send_completion_request(self._build_completion_request(inference_data))
+
+    @override
+    def _prepare_query_prompting(self, inference_data: dict) -> Callable[[], tuple[Any, float]]:
+        # The prompt is rendered and tokenized right away, only the request itself is left to the query thread
+        request_kwargs = self._build_completion_request(inference_data)
+        return lambda: self._send_completion_request(request_kwargs)
+
+    def _build_completion_request(self, inference_data: dict) -> dict:
+        """
+        Render the prompt and build the keyword arguments of the completion request.
+        """
         # We use the OpenAI Completions API
         function: list[dict] = inference_data["function"]
         message: list[dict] = inference_data["message"]
 
-        formatted_prompt: str = self._format_prompt(message, function)
+        with trace_span("prompt_rendering"):
+            formatted_prompt: str = self._format_prompt(message, function)
         inference_data["inference_input_log"] = {"formatted_prompt": formatted_prompt}
 
         # Tokenize the formatted prompt to get token count
-        input_token_count = len(self.tokenizer.tokenize(formatted_prompt))
+        # Only the part appended since the previous step of this conversation is tokenized, see `PromptTokenCounter`
+        with trace_span("tokenization"):
+            input_token_count, inference_data["prompt_token_state"] = (
+                self.prompt_token_counter.count(
+                    formatted_prompt, inference_data.get("prompt_token_state")
+                )
+            )
 
         # Determine the number of tokens to request. Cap it at 4096 if the model has a larger limit.
         if self.max_context_length < input_token_count + 2:
@@ -299,34 +299,99 @@ class OSSHandler(BaseHandler, EnforceOverrides):
                 self.max_context_length - input_token_count - 2,
             )
 
-        extra_body = {}
-        if hasattr(self, "stop_token_ids"):
-            extra_body["stop_token_ids"] = self.stop_token_ids
-        if hasattr(self, "skip_special_tokens"):
-            extra_body["skip_special_tokens"] = self.skip_special_tokens
+        extra_body = self._build_extra_body(inference_data)
 
-        start_time = time.time()
+        request_kwargs = {
+            "model": self.model_path_or_id,
+            "temperature": self.temperature,
+            "prompt": formatted_prompt,
+            "max_tokens": leftover_tokens_count,
+            "timeout": 72000,  # Avoid timeout errors
+        }
         if len(extra_body) > 0:
-            api_response = self.client.completions.create(
-                model=self.model_path_or_id,
-                temperature=self.temperature,
-                prompt=formatted_prompt,
-                max_tokens=leftover_tokens_count,
-                extra_body=extra_body,
-                timeout=72000,  # Avoid timeout errors
-            )
-        else:
-            api_response = self.client.completions.create(
-                model=self.model_path_or_id,
-                temperature=self.temperature,
-                prompt=formatted_prompt,
-                max_tokens=leftover_tokens_count,
-                timeout=72000,  # Avoid timeout errors
+            request_kwargs["extra_body"] = extra_body
+
+        return request_kwargs
+
+    def _send_completion_request(self, request_kwargs: dict) -> tuple[Completion, float]:
+        # Sent to the least busy healthy replica, see `EndpointPool`
+        if self.streaming:
+            # The whole stream is read while the replica is leased, so that it counts as busy until the response is complete
+            return self.endpoint_pool.call(
+                lambda client: self._generate_streaming(client, **request_kwargs)
             )
+
+        start_time = time.time()
+        api_response = self.endpoint_pool.call(
+            lambda client: client.completions.create(**request_kwargs)
+        )
         end_time = time.time()
 
         return api_response, end_time - start_time
 
+    def _generate_streaming(self, client: OpenAI, **kwargs) -> tuple[Completion, float]:
+        """
+        Stream the completion and rebuild the `Completion` a non-streamed request returns, recording the time to first token on the way.
+        """
+        timer = StreamTimer()
+        tool_call_decoder = StreamingToolCallDecoder()
+        raw_response = client.completions.with_raw_response.create(
+            **kwargs, stream=True, stream_options={"include_usage": True}
+        )
+
+        text_parts = []
+        response_fields, finish_reason, usage = {}, None, None
+        for chunk in iter_server_sent_events(raw_response.http_response):
+            response_fields = {
+                "id": chunk.get("id"),
+                "created": chunk.get("created"),
+                "model": chunk.get("model"),
+            }
+            # With `include_usage`, the usage comes in a last chunk without choices
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+            if not chunk.get("choices"):
+                continue
+            choice = chunk["choices"][0]
+            finish_reason = choice.get("finish_reason") or finish_reason
+            if choice.get("text"):
+                timer.mark_token()
+                text_parts.append(choice["text"])
+                if tool_call_decoder.feed(choice["text"]) is not None:
+                    timer.mark_tool_calls()
+
+        if usage is None:
+            # The server ignored `stream_options`; the token counts are unknown
+            usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        stats = timer.finish(usage["completion_tokens"])
+
+        # Built the same (lenient) way the SDK builds the response of a regular request
+        api_response = Completion.construct(
+            **response_fields,
+            object="text_completion",
+            choices=[
+                {
+                    "index": 0,
+                    "text": "".join(text_parts),
+                    "finish_reason": finish_reason,
+                    "logprobs": None,
+                }
+            ],
+            usage=usage,
+        )
+        return api_response, stats.latency
+
+    def _build_extra_body(self, inference_data: dict) -> dict:
+        """
+        Backend-specific request parameters, sent as `extra_body` of the completion request.
+        """
+        extra_body = {}
+        if hasattr(self, "stop_token_ids"):
+            extra_body["stop_token_ids"] = self.stop_token_ids
+        if hasattr(self, "skip_special_tokens"):
+            extra_body["skip_special_tokens"] = self.skip_special_tokens
+        return extra_body
+
     @override
     def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
         functions: list = test_entry["function"]
@@ -0,0 +1,268 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from bfcl_eval.model_handler.http_transport import shared_http_client
+from bfcl_eval.model_handler.local_inference.server_manager import (
+    SERVER_READY_INITIAL_POLL_INTERVAL,
+    SERVER_READY_MAX_POLL_INTERVAL,
+    get_served_model_ids,
+)
+from openai import APIConnectionError, InternalServerError, OpenAI
+
+LOAD_BALANCING_STRATEGIES = ["least_outstanding", "power_of_two"]
+
+# A replica is ejected from the rotation after this many requests in a row failed to reach it (connection errors, timeouts, 5xx)
+ENDPOINT_EJECTION_CONSECUTIVE_FAILURES = 3
+# An ejected replica is health-checked again after a cooldown, which doubles (up to the max) every time it is ejected again without serving a request in between
+ENDPOINT_EJECTION_INITIAL_COOLDOWN = 5.0
+ENDPOINT_EJECTION_MAX_COOLDOWN = 60.0
+# How long a request waits for an ejected replica to come back when every replica is ejected, before giving up
+ALL_ENDPOINTS_EJECTED_WAIT_TIMEOUT = 120.0
+
+# Errors that mean the replica itself is unhealthy (as opposed to eg. a bad request), so the request is retried on another replica
+_REPLICA_FAILURE_ERRORS = (APIConnectionError, InternalServerError)
+
+
+def parse_endpoint_url(endpoint: str, default_port) -> str:
+    """
+    Normalize an endpoint given as `host`, `host:port` or `http(s)://host:port[/v1]` to its root url, `http(s)://host:port`.
+    """
+    endpoint = endpoint.strip()
+    if "://" not in endpoint:
+        endpoint = f"http://{endpoint}"
+    parts = urlsplit(endpoint)
+    port = parts.port if parts.port is not None else default_port
+    host = parts.hostname
+    # `hostname` strips the brackets of an IPv6 address, which the url needs to tell it from the port
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{parts.scheme}://{host}:{port}"
+
+
+class _Endpoint:
+    def __init__(self, root_url: str, max_concurrent_requests: Optional[int]):
+        self.root_url = root_url
+        self.base_url = f"{root_url}/v1"
+        # Prometheus metrics endpoint, served by vLLM by default and by SGLang with `--enable-metrics`
+        self.metrics_url = f"{root_url}/metrics"
+        self.client = OpenAI(
+            base_url=self.base_url, api_key="EMPTY", http_client=shared_http_client()
+        )
+        self.max_concurrent_requests = max_concurrent_requests
+
+        self.outstanding_requests = 0
+        self.served_requests = 0
+        self.consecutive_failures = 0
+        self.ejected = False
+        self.ejection_cooldown = ENDPOINT_EJECTION_INITIAL_COOLDOWN
+        self.readmit_after = 0.0
+
+
+class EndpointPool:
+    """
+    Spreads the requests of one handler over several OpenAI-compatible replicas of the same model.
+
+    Each request goes to the replica with the fewest requests in flight (`least_outstanding`), or to the less busy of two random replicas (`power_of_two`), among the healthy replicas that are under their concurrency cap.
+    When all replicas are at their cap, the request waits for a slot.
+    With more than one replica, a replica that fails `ENDPOINT_EJECTION_CONSECUTIVE_FAILURES` requests in a row is ejected; a background health check polls its `/models` route after a cooldown and puts it back into rotation once it answers.
+    Requests that fail because their replica is unhealthy are retried on another replica.
+
+    With a single endpoint, this behaves like the plain `OpenAI` client it replaces.
+    """
+
+    def __init__(
+        self,
+        root_urls: list[str],
+        max_concurrent_requests_per_endpoint: Optional[int] = None,
+        strategy: str = "least_outstanding",
+    ):
+        if not root_urls:
+            raise ValueError("At least one endpoint is required.")
+        if strategy not in LOAD_BALANCING_STRATEGIES:
+            raise ValueError(
+                f"Unknown load balancing strategy '{strategy}'. Supported strategies: {LOAD_BALANCING_STRATEGIES}."
+            )
+        self.endpoints = [
+            _Endpoint(root_url, max_concurrent_requests_per_endpoint)
+            for root_url in dict.fromkeys(root_urls)
+        ]
+        self.strategy = strategy
+        self._condition = threading.Condition()
+        # Whether the health check thread is running; it exits once no replica is ejected
+        self._health_check_running = False
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    @property
+    def total_capacity(self) -> Optional[int]:
+        """
+        The number of requests the pool serves concurrently when every replica is healthy, or None if the replicas have no concurrency cap.
+        """
+        if any(endpoint.max_concurrent_requests is None for endpoint in self.endpoints):
+            return None
+        return sum(endpoint.max_concurrent_requests for endpoint in self.endpoints)
+
+    def call(self, request_fn: Callable[[OpenAI], object]):
+        """
+        Run `request_fn` with the client of a replica picked by the load balancer, retrying on another replica if the picked one turns out to be unhealthy.
+
+        Args:
+            request_fn (Callable): Sends the request with the given `OpenAI` client and returns the response.
+        """
+        tried: set[str] = set()
+        while True:
+            try:
+                with self._lease(exclude=tried) as endpoint:
+                    return request_fn(endpoint.client)
+            except _REPLICA_FAILURE_ERRORS as e:
+                tried.add(endpoint.root_url)
+                if len(tried) >= len(self.endpoints):
+                    raise
+                print(f"Request to {endpoint.root_url} failed ({e}), retrying on another endpoint.")
+
+    @contextmanager
+    def _lease(self, exclude: set[str]):
+        endpoint = self._acquire(exclude)
+        # Any error other than a replica failure means the replica answered (eg. with a 400 for a prompt that is too long), so it still counts as healthy
+        succeeded = True
+        try:
+            yield endpoint
+        except _REPLICA_FAILURE_ERRORS:
+            succeeded = False
+            raise
+        finally:
+            self._release(endpoint, succeeded)
+
+    def _acquire(self, exclude: set[str]) -> _Endpoint:
+        ejected_wait_deadline = None
+        with self._condition:
+            while True:
+                candidates = [
+                    endpoint
+                    for endpoint in self.endpoints
+                    if not endpoint.ejected and endpoint.root_url not in exclude
+                ]
+                available = [
+                    endpoint
+                    for endpoint in candidates
+                    if endpoint.max_concurrent_requests is None
+                    or endpoint.outstanding_requests < endpoint.max_concurrent_requests
+                ]
+                if available:
+                    endpoint = self._pick(available)
+                    endpoint.outstanding_requests += 1
+                    return endpoint
+
+                if candidates:
+                    # Every usable replica is at its concurrency cap; wait for a request to finish
+                    ejected_wait_deadline = None
+                    self._condition.wait()
+                    continue
+
+                # Every usable replica is ejected; wait for the health check to readmit one
+                if ejected_wait_deadline is None:
+                    ejected_wait_deadline = time.monotonic() + ALL_ENDPOINTS_EJECTED_WAIT_TIMEOUT
+                remaining = ejected_wait_deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(
+                        f"No healthy endpoint available among {[endpoint.root_url for endpoint in self.endpoints]}."
+                    )
+                self._condition.wait(timeout=remaining)
+
+    def _pick(self, available: list[_Endpoint]) -> _Endpoint:
+        if self.strategy == "power_of_two" and len(available) > 1:
+            available = random.sample(available, 2)
+        # Ties go to the replica that has served the fewest requests, so that an idle fleet is filled evenly
+        return min(
+            available,
+            key=lambda endpoint: (endpoint.outstanding_requests, endpoint.served_requests),
+        )
+
+    def _release(self, endpoint: _Endpoint, succeeded: bool) -> None:
+        with self._condition:
+            endpoint.outstanding_requests -= 1
+            endpoint.served_requests += 1
+            if succeeded:
+                endpoint.consecutive_failures = 0
+                endpoint.ejection_cooldown = ENDPOINT_EJECTION_INITIAL_COOLDOWN
+            else:
+                endpoint.consecutive_failures += 1
+                # A lone replica is never ejected, there would be nowhere else to send the requests
+                if (
+                    len(self.endpoints) > 1
+                    and not endpoint.ejected
+                    and endpoint.consecutive_failures >= ENDPOINT_EJECTION_CONSECUTIVE_FAILURES
+                ):
+                    self._eject(
+                        endpoint, f"{endpoint.consecutive_failures} consecutive failures"
+                    )
+            self._condition.notify_all()
+
+    def _eject(self, endpoint: _Endpoint, reason: str) -> None:
+        # Must be called with `self._condition` held
+        endpoint.ejected = True
+        endpoint.readmit_after = time.monotonic() + endpoint.ejection_cooldown
+        print(
+            f"Ejected endpoint {endpoint.root_url} ({reason}), checking again in {endpoint.ejection_cooldown:.0f}s."
+        )
+        endpoint.ejection_cooldown = min(
+            endpoint.ejection_cooldown * 2, ENDPOINT_EJECTION_MAX_COOLDOWN
+        )
+        if not self._health_check_running:
+            self._health_check_running = True
+            threading.Thread(target=self._health_check_loop, daemon=True).start()
+
+    def _health_check_loop(self) -> None:
+        while True:
+            with self._condition:
+                ejected = [endpoint for endpoint in self.endpoints if endpoint.ejected]
+                if not ejected:
+                    self._health_check_running = False
+                    return
+                now = time.monotonic()
+                due = [endpoint for endpoint in ejected if endpoint.readmit_after <= now]
+                if not due:
+                    next_check = min(endpoint.readmit_after for endpoint in ejected)
+                    self._condition.wait(timeout=next_check - now)
+                    continue
+
+            # Probe outside the lock, so that requests to the healthy replicas are not held up
+            healthy = {
+                endpoint.root_url: get_served_model_ids(endpoint.base_url) is not None
+                for endpoint in due
+            }
+            with self._condition:
+                for endpoint in due:
+                    if healthy[endpoint.root_url]:
+                        endpoint.ejected = False
+                        endpoint.consecutive_failures = 0
+                        print(f"Endpoint {endpoint.root_url} is healthy again.")
+                    else:
+                        self._eject(endpoint, "health check failed")
+                self._condition.notify_all()
+
+    def wait_until_ready(self) -> None:
+        """
+        Block until at least one replica answers `/models`, polling with exponential backoff. Replicas that are not up by then are ejected, and join the rotation once the health check sees them answer.
+        """
+        poll_interval = SERVER_READY_INITIAL_POLL_INTERVAL
+        while True:
+            ready = {
+                endpoint.root_url: get_served_model_ids(endpoint.base_url) is not None
+                for endpoint in self.endpoints
+            }
+            if any(ready.values()):
+                break
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, SERVER_READY_MAX_POLL_INTERVAL)
+
+        with self._condition:
+            for endpoint in self.endpoints:
+                if not ready[endpoint.root_url]:
+                    self._eject(endpoint, "not ready")
+        print(f"{sum(ready.values())}/{len(self.endpoints)} endpoints are ready!")
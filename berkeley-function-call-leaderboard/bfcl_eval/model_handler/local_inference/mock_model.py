@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+from typing import Any
+
+from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
+from bfcl_eval.model_handler.local_inference.mock_server import MOCK_CHARS_PER_TOKEN
+from overrides import override
+
+"""
+Note:
+This handler talks to the mock model server (`mock_server`), which replays the ground truth instead of running a model. It is meant for load-testing and profiling the pipeline itself, without a GPU or network access; its scores are meaningless.
+It formats prompts with a ChatML-style template, like `QuickTestingOSSHandler` does through the tokenizer's chat template, but needs no tokenizer: token counts are approximated from the text length.
+"""
+
+# The context length the mock model claims, large enough that no test entry is cut off
+MOCK_MAX_CONTEXT_LENGTH = 131072
+
+
+class _ApproximateTokenizer:
+    """
+    Stands in for the Hugging Face tokenizer; one token per `MOCK_CHARS_PER_TOKEN` characters, same as the mock server.
+    """
+
+    model_max_length = MOCK_MAX_CONTEXT_LENGTH
+
+    def tokenize(self, text: str) -> list[str]:
+        return [
+            text[start : start + MOCK_CHARS_PER_TOKEN]
+            for start in range(0, len(text), MOCK_CHARS_PER_TOKEN)
+        ]
+
+
+class MockModelHandler(OSSHandler):
+    def __init__(
+        self,
+        model_name,
+        temperature,
+        registry_name,
+        is_fc_model,
+        dtype="bfloat16",
+        **kwargs,
+    ) -> None:
+        super().__init__(model_name, temperature, registry_name, is_fc_model, **kwargs)
+        # Launched as `python -m bfcl_eval.model_handler.local_inference.mock_server`, whatever `--backend` says
+        self.server_backend = "mock"
+
+    @override
+    def _load_tokenizer_and_config(self, load_kwargs: dict) -> tuple[Any, Any]:
+        return _ApproximateTokenizer(), SimpleNamespace(
+            max_position_embeddings=MOCK_MAX_CONTEXT_LENGTH
+        )
+
+    @override
+    def _format_prompt(self, messages, function):
+        formatted_prompt = ""
+        for message in messages:
+            formatted_prompt += (
+                f"<|im_start|>{message['role']}\n{message['content']}<|im_end|>\n"
+            )
+        formatted_prompt += "<|im_start|>assistant\n"
+        return formatted_prompt
+
+    @override
+    def _build_extra_body(self, inference_data: dict) -> dict:
+        extra_body = super()._build_extra_body(inference_data)
+        # Tells the mock server which answer to replay
+        extra_body["bfcl_mock"] = {
+            "test_entry_id": inference_data["test_entry_id"],
+            "turn_idx": inference_data["turn_idx"],
+            "step_idx": inference_data["step_idx"],
+        }
+        return extra_body
+
+    @override
+    def _pre_query_processing_prompting(self, test_entry: dict) -> dict:
+        inference_data = super()._pre_query_processing_prompting(test_entry)
+        inference_data["test_entry_id"] = test_entry["id"]
+        inference_data["turn_idx"] = 0
+        inference_data["step_idx"] = 0
+        return inference_data
+
+    @override
+    def _add_next_turn_user_message_prompting(
+        self, inference_data: dict, user_message: list[dict]
+    ) -> dict:
+        inference_data["turn_idx"] += 1
+        inference_data["step_idx"] = 0
+        return super()._add_next_turn_user_message_prompting(inference_data, user_message)
+
+    @override
+    def _add_assistant_message_prompting(
+        self, inference_data: dict, model_response_data: dict
+    ) -> dict:
+        inference_data["step_idx"] += 1
+        return super()._add_assistant_message_prompting(inference_data, model_response_data)
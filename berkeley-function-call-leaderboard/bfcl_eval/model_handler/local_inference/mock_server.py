@@ -0,0 +1,564 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import time
+import uuid
+from http import HTTPStatus
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+
+from bfcl_eval.constants.eval_config import POSSIBLE_ANSWER_PATH
+from bfcl_eval.utils import load_file
+
+"""
+An OpenAI-compatible mock model server, to load-test the generation pipeline (scheduler, endpoint pool, result writer, decoders, multi-turn backends) without a GPU or network access.
+
+It answers `/v1/completions` and `/v1/chat/completions` by replaying the ground truth from `possible_answer` (or the responses recorded in a previous result directory, with `--replay-dir`), in the prompting format (eg. `[func(a=1)]`).
+Entries without ground truth (eg. irrelevance) and every step after the first one of a turn get a plain text answer, which ends the turn.
+The latency of each request, the share of requests that fail with 429 or 500, and the token counts are configurable, so the harness can be driven at 1000+ concurrent requests on a laptop.
+Streamed requests (`"stream": true`) are answered with server-sent events, one chunk per token: the base latency passes before the first token, and the time per output token between tokens.
+
+The server needs to know which test entry, turn and step a request is for; `MockModelHandler` (model `bfcl-mock-model`) sends them in the `bfcl_mock` field of the request body. Requests without it get the plain text answer.
+
+Usage:
+    bfcl generate --model bfcl-mock-model --backend mock --test-category all
+or, with a server started separately:
+    python -m bfcl_eval.model_handler.local_inference.mock_server --port 1053 --latency 0.5 --latency-distribution lognormal --rate-limit-rate 0.01
+    bfcl generate --model bfcl-mock-model --test-category all --skip-server-setup
+
+When the server is launched by `bfcl generate` / `bfcl serve start`, the options default to the `BFCL_MOCK_*` environment variables listed in `--help`.
+"""
+
+MOCK_MODEL_ID = "bfcl-mock-model"
+# Token counts are approximated from the text length, both by the server (for the usage it reports) and by `MockModelHandler` (for the max tokens it requests)
+MOCK_CHARS_PER_TOKEN = 4
+# Answer for the entries with no ground truth, and for every step after the first one of a turn; it contains no function call, so it ends the turn
+MOCK_NO_CALL_RESPONSE = "I have completed the request."
+# Large enough that no connection is refused when 1000+ requests arrive at once
+MOCK_SERVER_LISTEN_BACKLOG = 4096
+LATENCY_DISTRIBUTIONS = ["constant", "uniform", "exponential", "lognormal"]
+
+# Test entry ids that differ from their ground truth id by a variant infix, eg. `memory_kv_0-customer-0` -> `memory_0-customer-0`, `web_search_no_snippet_3` -> `web_search_3`
+_GROUND_TRUTH_ID_PATTERN = re.compile(r"^(memory|web_search)_[a-z_]+?_(\d+)")
+
+
+def approximate_token_count(text: str) -> int:
+    return max(1, math.ceil(len(text) / MOCK_CHARS_PER_TOKEN))
+
+
+def _format_function_calls(function_calls: list[dict]) -> str:
+    """
+    Render `[{func_name: {param: value}}]` as `[func_name(param=value)]`.
+    """
+    formatted_calls = []
+    for function_call in function_calls:
+        for func_name, arguments in function_call.items():
+            if isinstance(arguments, str):
+                arguments = json.loads(arguments)
+            formatted_arguments = ", ".join(
+                f"{param}={value!r}" for param, value in arguments.items()
+            )
+            formatted_calls.append(f"{func_name}({formatted_arguments})")
+    return f"[{', '.join(formatted_calls)}]"
+
+
+def _as_response_text(result) -> str:
+    if isinstance(result, str):
+        return result
+    if isinstance(result, list) and all(isinstance(item, dict) for item in result):
+        # Function calls recorded for FC models
+        return _format_function_calls(result)
+    return json.dumps(result)
+
+
+class MockAnswerBook:
+    """
+    Picks the response for a given test entry, turn and step, from the ground truth or from recorded results.
+    """
+
+    def __init__(self, replay_dir: Optional[str] = None):
+        self.ground_truth: dict[str, list] = {}
+        for file_path in sorted(POSSIBLE_ANSWER_PATH.glob("*.json")):
+            for entry in load_file(file_path):
+                self.ground_truth[entry["id"]] = entry["ground_truth"]
+
+        self.recorded_results: dict[str, object] = {}
+        if replay_dir:
+            for file_path in sorted(Path(replay_dir).rglob("*_result.json")):
+                for entry in load_file(file_path):
+                    self.recorded_results[entry["id"]] = entry["result"]
+
+    def response_for(self, test_entry_id: Optional[str], turn_idx: int, step_idx: int) -> str:
+        if test_entry_id is None:
+            return MOCK_NO_CALL_RESPONSE
+
+        if test_entry_id in self.recorded_results:
+            result = self.recorded_results[test_entry_id]
+            if isinstance(result, list) and result and isinstance(result[0], list):
+                # Multi-turn result: one list of step responses per turn
+                if turn_idx < len(result) and step_idx < len(result[turn_idx]):
+                    return _as_response_text(result[turn_idx][step_idx])
+                return MOCK_NO_CALL_RESPONSE
+            return _as_response_text(result) if step_idx == 0 else MOCK_NO_CALL_RESPONSE
+
+        ground_truth = self.ground_truth.get(test_entry_id)
+        if ground_truth is None:
+            ground_truth = self.ground_truth.get(
+                _GROUND_TRUTH_ID_PATTERN.sub(r"\1_\2", test_entry_id)
+            )
+        if not ground_truth or step_idx > 0:
+            return MOCK_NO_CALL_RESPONSE
+
+        if isinstance(ground_truth[0], dict):
+            # Single-turn: `{func_name: {param: [acceptable values]}}`, where `""` marks an optional parameter that can be left out
+            return _format_function_calls(
+                [
+                    {
+                        func_name: {
+                            param: values[0]
+                            for param, values in params.items()
+                            if values and values[0] != ""
+                        }
+                    }
+                    for function_call in ground_truth
+                    for func_name, params in function_call.items()
+                ]
+            )
+        if isinstance(ground_truth[0], list):
+            # Multi-turn: one list of function call strings per turn
+            if turn_idx < len(ground_truth) and ground_truth[turn_idx]:
+                return f"[{', '.join(ground_truth[turn_idx])}]"
+            return MOCK_NO_CALL_RESPONSE
+        # Agentic: the acceptable final answers
+        return str(ground_truth[0])
+
+
+class LatencyModel:
+    """
+    Samples the time to wait before answering a request: a base latency drawn from the distribution, plus a fixed time per output token.
+    """
+
+    def __init__(
+        self,
+        distribution: str,
+        mean: float,
+        stddev: float,
+        time_per_output_token: float,
+        rng: random.Random,
+    ):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {distribution}, expected one of {LATENCY_DISTRIBUTIONS}."
+            )
+        self.distribution = distribution
+        self.mean = mean
+        self.stddev = stddev
+        self.time_per_output_token = time_per_output_token
+        self.rng = rng
+
+    def sample_first_token_latency(self) -> float:
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            half_width = math.sqrt(3) * self.stddev
+            return max(0.0, self.rng.uniform(self.mean - half_width, self.mean + half_width))
+        if self.distribution == "exponential":
+            return self.rng.expovariate(1 / self.mean)
+        if self.distribution == "lognormal":
+            sigma_squared = math.log(1 + (self.stddev / self.mean) ** 2)
+            return self.rng.lognormvariate(
+                math.log(self.mean) - sigma_squared / 2, math.sqrt(sigma_squared)
+            )
+        return self.mean
+
+    def sample(self, output_token_count: int) -> float:
+        return self.sample_first_token_latency() + self.time_per_output_token * output_token_count
+
+
+class MockModelServer:
+    """
+    Serves the mock model over HTTP/1.1 on an asyncio event loop. The latency of a request is an `asyncio.sleep`, so thousands of requests can be in flight in a single thread (a thread per connection tops out at a few hundred on a small machine).
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        answer_book: MockAnswerBook,
+        latency_model: LatencyModel,
+        error_rate: float,
+        rate_limit_rate: float,
+        rng: random.Random,
+    ):
+        self.model_id = model_id
+        self.answer_book = answer_book
+        self.latency_model = latency_model
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.rng = rng
+        # Exposed on `/metrics`
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.error_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(
+            self._handle_connection, host, port, backlog=MOCK_SERVER_LISTEN_BACKLOG
+        )
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            # Keep-alive: serve requests on the connection until the client closes it
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    header_line = await reader.readline()
+                    if header_line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header_line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status_code, content_type, content, extra_headers = await self._route(
+                    method, target.split("?", 1)[0].rstrip("/"), body
+                )
+                response_head = [
+                    f"HTTP/1.1 {status_code} {HTTPStatus(status_code).phrase}",
+                    f"Content-Type: {content_type}",
+                ] + [f"{name}: {value}" for name, value in extra_headers.items()]
+                if isinstance(content, bytes):
+                    response_head.append(f"Content-Length: {len(content)}")
+                    writer.write(
+                        ("\r\n".join(response_head) + "\r\n\r\n").encode("latin-1") + content
+                    )
+                    await writer.drain()
+                else:
+                    # Streamed response, sent with the chunked transfer encoding as the events are produced
+                    response_head.append("Transfer-Encoding: chunked")
+                    writer.write(("\r\n".join(response_head) + "\r\n\r\n").encode("latin-1"))
+                    try:
+                        # Each event is held back until the next one is ready, so that the last one (`[DONE]`) goes out in the same write as the end of the body
+                        pending_event = None
+                        async for event in content:
+                            if pending_event is not None:
+                                writer.write(_chunk(pending_event))
+                                await writer.drain()
+                            pending_event = event
+                    finally:
+                        await content.aclose()
+                    writer.write((_chunk(pending_event) if pending_event else b"") + b"0\r\n\r\n")
+                    await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(
+        self, method: str, path: str, body: bytes
+    ) -> tuple[int, str, Union[bytes, AsyncIterator[bytes]], dict]:
+        if method == "GET" and path == "/v1/models":
+            return _json_response(
+                200,
+                {
+                    "object": "list",
+                    "data": [{"id": self.model_id, "object": "model", "owned_by": "bfcl"}],
+                },
+            )
+        if method == "GET" and path == "/metrics":
+            metrics = (
+                f"bfcl_mock_requests_total {self.request_count}\n"
+                f"bfcl_mock_rate_limited_total {self.rate_limited_count}\n"
+                f"bfcl_mock_errors_total {self.error_count}\n"
+                f"bfcl_mock_requests_in_flight {self.in_flight}\n"
+                f"bfcl_mock_max_requests_in_flight {self.max_in_flight}\n"
+            )
+            return 200, "text/plain; version=0.0.4", metrics.encode("utf-8"), {}
+        if method == "POST" and path in ("/v1/completions", "/v1/chat/completions"):
+            self.request_count += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                status_code, content_type, content, headers = await self._complete(
+                    path, json.loads(body or b"{}")
+                )
+            except BaseException:
+                self.in_flight -= 1
+                raise
+            if isinstance(content, bytes):
+                self.in_flight -= 1
+                return status_code, content_type, content, headers
+            # A streamed request stays in flight until its last event is sent
+            return status_code, content_type, self._in_flight_until_done(content), headers
+        return _json_response(404, {"error": {"message": f"Unknown route {method} {path}"}})
+
+    async def _in_flight_until_done(self, events: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        try:
+            async for event in events:
+                yield event
+        finally:
+            self.in_flight -= 1
+
+    async def _complete(
+        self, path: str, body: dict
+    ) -> tuple[int, str, Union[bytes, AsyncIterator[bytes]], dict]:
+        # Injected failures are answered right away, like a real server rejecting a request
+        roll = self.rng.random()
+        if roll < self.rate_limit_rate:
+            self.rate_limited_count += 1
+            return _json_response(
+                429,
+                {
+                    "error": {
+                        "message": "Rate limit reached (injected by the mock server).",
+                        "type": "rate_limit_error",
+                    }
+                },
+                headers={"Retry-After": "1"},
+            )
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.error_count += 1
+            return _json_response(
+                500,
+                {
+                    "error": {
+                        "message": "Internal error (injected by the mock server).",
+                        "type": "server_error",
+                    }
+                },
+            )
+
+        mock_info = body.get("bfcl_mock") or {}
+        text = self.answer_book.response_for(
+            mock_info.get("test_entry_id"),
+            mock_info.get("turn_idx", 0),
+            mock_info.get("step_idx", 0),
+        )
+        if path == "/v1/completions":
+            prompt_token_count = approximate_token_count(str(body.get("prompt", "")))
+        else:
+            prompt_token_count = approximate_token_count(json.dumps(body.get("messages", [])))
+        completion_token_count = approximate_token_count(text)
+
+        if body.get("stream"):
+            return (
+                200,
+                "text/event-stream",
+                self._stream_events(
+                    path,
+                    body.get("model", self.model_id),
+                    text,
+                    prompt_token_count,
+                    completion_token_count,
+                    include_usage=(body.get("stream_options") or {}).get(
+                        "include_usage", False
+                    ),
+                ),
+                {},
+            )
+
+        await asyncio.sleep(self.latency_model.sample(completion_token_count))
+        return _json_response(
+            200,
+            _completion_payload(
+                path,
+                body.get("model", self.model_id),
+                text,
+                prompt_token_count,
+                completion_token_count,
+            ),
+        )
+
+
+    async def _stream_events(
+        self,
+        path: str,
+        model: str,
+        text: str,
+        prompt_token_count: int,
+        completion_token_count: int,
+        include_usage: bool,
+    ) -> AsyncIterator[bytes]:
+        response_id = uuid.uuid4().hex
+        await asyncio.sleep(self.latency_model.sample_first_token_latency())
+        for start in range(0, len(text), MOCK_CHARS_PER_TOKEN):
+            if self.latency_model.time_per_output_token > 0:
+                await asyncio.sleep(self.latency_model.time_per_output_token)
+            yield _server_sent_event(
+                _completion_chunk(
+                    path, response_id, model, text[start : start + MOCK_CHARS_PER_TOKEN], None
+                )
+            )
+        yield _server_sent_event(_completion_chunk(path, response_id, model, "", "stop"))
+        if include_usage:
+            usage_chunk = _completion_chunk(path, response_id, model, "", None)
+            usage_chunk["choices"] = []
+            usage_chunk["usage"] = {
+                "prompt_tokens": prompt_token_count,
+                "completion_tokens": completion_token_count,
+                "total_tokens": prompt_token_count + completion_token_count,
+            }
+            yield _server_sent_event(usage_chunk)
+        yield b"data: [DONE]\n\n"
+
+
+def _chunk(data: bytes) -> bytes:
+    # One chunk of a body sent with the chunked transfer encoding
+    return f"{len(data):x}\r\n".encode("latin-1") + data + b"\r\n"
+
+
+def _server_sent_event(payload: dict) -> bytes:
+    return f"data: {json.dumps(payload)}\n\n".encode("utf-8")
+
+
+def _completion_chunk(
+    path: str, response_id: str, model: str, text: str, finish_reason: Optional[str]
+) -> dict:
+    if path == "/v1/completions":
+        return {
+            "id": f"cmpl-{response_id}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {"index": 0, "text": text, "finish_reason": finish_reason, "logprobs": None}
+            ],
+        }
+    return {
+        "id": f"chatcmpl-{response_id}",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "delta": {"role": "assistant", "content": text} if text else {},
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+
+
+def _json_response(
+    status_code: int, payload: dict, headers: Optional[dict] = None
+) -> tuple[int, str, bytes, dict]:
+    return status_code, "application/json", json.dumps(payload).encode("utf-8"), headers or {}
+
+
+def _completion_payload(
+    path: str, model: str, text: str, prompt_token_count: int, completion_token_count: int
+) -> dict:
+    usage = {
+        "prompt_tokens": prompt_token_count,
+        "completion_tokens": completion_token_count,
+        "total_tokens": prompt_token_count + completion_token_count,
+    }
+    if path == "/v1/completions":
+        return {
+            "id": f"cmpl-{uuid.uuid4().hex}",
+            "object": "text_completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "text": text, "finish_reason": "stop", "logprobs": None}],
+            "usage": usage,
+        }
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": usage,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock model server for load-testing BFCL.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.getenv("LOCAL_SERVER_PORT", 1053)))
+    parser.add_argument("--model", default=MOCK_MODEL_ID, help="The model id served.")
+    parser.add_argument(
+        "--replay-dir",
+        default=os.getenv("BFCL_MOCK_REPLAY_DIR"),
+        help="A result directory (eg. `result/MODEL_NAME`) whose recorded responses are replayed instead of the ground truth, for the entries it has. [BFCL_MOCK_REPLAY_DIR]",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=float(os.getenv("BFCL_MOCK_LATENCY", 0)),
+        help="Mean latency of a request, in seconds. [BFCL_MOCK_LATENCY]",
+    )
+    parser.add_argument(
+        "--latency-distribution",
+        choices=LATENCY_DISTRIBUTIONS,
+        default=os.getenv("BFCL_MOCK_LATENCY_DISTRIBUTION", "constant"),
+        help="[BFCL_MOCK_LATENCY_DISTRIBUTION]",
+    )
+    parser.add_argument(
+        "--latency-stddev",
+        type=float,
+        default=float(os.getenv("BFCL_MOCK_LATENCY_STDDEV", 0)),
+        help="Standard deviation of the latency, for the uniform and lognormal distributions. [BFCL_MOCK_LATENCY_STDDEV]",
+    )
+    parser.add_argument(
+        "--time-per-output-token",
+        type=float,
+        default=float(os.getenv("BFCL_MOCK_TIME_PER_OUTPUT_TOKEN", 0)),
+        help="Seconds added to the latency per output token. [BFCL_MOCK_TIME_PER_OUTPUT_TOKEN]",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=float(os.getenv("BFCL_MOCK_ERROR_RATE", 0)),
+        help="Share of the requests answered with a 500 error. [BFCL_MOCK_ERROR_RATE]",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=float(os.getenv("BFCL_MOCK_RATE_LIMIT_RATE", 0)),
+        help="Share of the requests answered with a 429 error. [BFCL_MOCK_RATE_LIMIT_RATE]",
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    server = MockModelServer(
+        model_id=args.model,
+        answer_book=MockAnswerBook(args.replay_dir),
+        latency_model=LatencyModel(
+            args.latency_distribution,
+            args.latency,
+            args.latency_stddev,
+            args.time_per_output_token,
+            rng,
+        ),
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        rng=rng,
+    )
+    print(f"Mock model server serving {args.model} on http://{args.host}:{args.port}/v1")
+    asyncio.run(server.serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from bisect import bisect_right
+from typing import Optional
+
+# Incremental counting restarts tokenization this many tokens before the end of the shared prefix, so that the tokens right before the appended text are always re-tokenized together with it
+INCREMENTAL_TOKENIZATION_BACKOFF_TOKENS = 8
+
+# Text used to check, once per tokenizer, that tokenizing a prompt in two pieces (split at a line start) gives the same tokens as tokenizing it at once
+_SPLIT_INVARIANCE_PROBE = (
+    "<|im_start|>system\nYou are a helpful assistant.\n\n# Tools\n"
+    '{"name": "get_weather", "arguments": {"city": "San Francisco, CA"}}\n'
+    "<|im_end|>\n<|im_start|>user\nWhat's the weather like?\n    Indented line\n"
+    "[get_weather(city='Berkeley')]\n\n\nDone.\n<|im_start|>assistant\n"
+)
+
+
+class PromptTokenState:
+    """
+    The tokenization of the last prompt sent for a conversation, kept so that the next step only needs to tokenize what was appended.
+    """
+
+    def __init__(self, prompt: str, token_ends: list[int]):
+        self.prompt = prompt
+        # End character offset of each token in `prompt`
+        self.token_ends = token_ends
+
+
+class PromptTokenCounter:
+    """
+    Counts the tokens of the formatted prompts of a conversation without re-tokenizing the whole conversation on every step.
+
+    Multi-turn prompts mostly grow by appending messages, so the previous prompt and the new one share a long prefix.
+    The tokens of that prefix are reused up to a token boundary at the start of a line a few tokens before the end of the shared prefix, and only the rest of the prompt is tokenized.
+    This relies on the tokenizer giving the same tokens when the text is split at a line start, which is checked once with a probe; if it does not hold (eg. for tokenizers that prepend a space to the input), or if the tokenizer has no Rust backend, every prompt is tokenized in full, same as before.
+    """
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        # The Rust tokenizer behind a `PreTrainedTokenizerFast`; calling it directly skips the conversion of ids back to token strings that `tokenizer.tokenize` does
+        self._backend = getattr(tokenizer, "backend_tokenizer", None)
+        self.supports_incremental = self._backend is not None and self._is_split_invariant()
+
+    def _encode(self, text: str):
+        return self._backend.encode(text, add_special_tokens=False)
+
+    def _is_split_invariant(self) -> bool:
+        try:
+            full_encoding = self._encode(_SPLIT_INVARIANCE_PROBE)
+            if len(full_encoding.ids) != len(self.tokenizer.tokenize(_SPLIT_INVARIANCE_PROBE)):
+                return False
+            for cut in _line_start_token_boundaries(_SPLIT_INVARIANCE_PROBE, full_encoding):
+                head = self._encode(_SPLIT_INVARIANCE_PROBE[:cut]).ids
+                tail = self._encode(_SPLIT_INVARIANCE_PROBE[cut:]).ids
+                if head + tail != full_encoding.ids:
+                    return False
+        except Exception:
+            return False
+        return True
+
+    def count(
+        self, prompt: str, previous_state: Optional[PromptTokenState] = None
+    ) -> tuple[int, Optional[PromptTokenState]]:
+        """
+        Count the tokens in `prompt`.
+
+        Args:
+            prompt (str): The formatted prompt.
+            previous_state (PromptTokenState, optional): The state returned when counting the previous prompt of the same conversation.
+
+        Returns:
+            tuple: The token count, and the state to pass in when counting the next prompt of the conversation (None if incremental counting is not supported).
+        """
+        if not self.supports_incremental:
+            return len(self.tokenizer.tokenize(prompt)), None
+
+        reused_token_ends: list[int] = []
+        cut = 0
+        if previous_state is not None:
+            shared_prefix_length = _common_prefix_length(previous_state.prompt, prompt)
+            previous_token_ends = previous_state.token_ends
+            # Only tokens ending strictly before the end of the shared prefix are candidates, minus a few for safety
+            reusable_count = (
+                bisect_right(previous_token_ends, shared_prefix_length - 1)
+                - INCREMENTAL_TOKENIZATION_BACKOFF_TOKENS
+            )
+            # Restart at a line start, as that is always a boundary of the tokenizer's pre-tokenization
+            while reusable_count > 0:
+                token_end = previous_token_ends[reusable_count - 1]
+                if (
+                    token_end > 0
+                    and prompt[token_end - 1] == "\n"
+                    and not prompt[token_end].isspace()
+                ):
+                    break
+                reusable_count -= 1
+            if reusable_count > 0:
+                reused_token_ends = previous_token_ends[:reusable_count]
+                cut = reused_token_ends[-1]
+
+        encoding = self._encode(prompt[cut:])
+        token_ends = reused_token_ends + [cut + end for _, end in encoding.offsets]
+        return len(token_ends), PromptTokenState(prompt, token_ends)
+
+
+def _line_start_token_boundaries(text: str, encoding) -> list[int]:
+    return [
+        end
+        for _, end in encoding.offsets[:-1]
+        if 0 < end < len(text) and text[end - 1] == "\n" and not text[end].isspace()
+    ]
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    if b.startswith(a):
+        return len(a)
+    # Binary search on slice comparisons, which run in C
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
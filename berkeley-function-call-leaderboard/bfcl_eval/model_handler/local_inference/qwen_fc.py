@@ -6,6 +6,8 @@ from bfcl_eval.model_handler.local_inference.base_oss_handler import OSSHandler
 from bfcl_eval.model_handler.utils import convert_to_function_call
 from overrides import override
 
+TOOL_CALL_PATTERN = re.compile(r"<tool_call>\n(.*?)\n</tool_call>", re.DOTALL)
+
 
 class QwenFCHandler(OSSHandler):
     def __init__(
@@ -44,6 +46,23 @@ class QwenFCHandler(OSSHandler):
             decoded_result.append({item["name"]: item["arguments"]})
         return convert_to_function_call(decoded_result)
 
+    @override
+    def _decode_ast_batch(self, results, language, has_tool_call_tag) -> list:
+        if not self._uses_own_decoder(QwenFCHandler):
+            return super()._decode_ast_batch(results, language, has_tool_call_tag)
+
+        decoded_results = []
+        for result in results:
+            # Outputs without any tool call tag can never decode to a function call, so skip the regex scan on them
+            if isinstance(result, str) and "<tool_call>" not in result:
+                decoded_results.append([])
+                continue
+            try:
+                decoded_results.append(self.decode_ast(result, language, has_tool_call_tag))
+            except Exception as e:
+                decoded_results.append(e)
+        return decoded_results
+
     @override
     def _format_prompt(self, messages, function):
         """
@@ -292,8 +311,7 @@ class QwenFCHandler(OSSHandler):
 
     @staticmethod
     def _extract_tool_calls(input_string):
-        pattern = r"<tool_call>\n(.*?)\n</tool_call>"
-        matches = re.findall(pattern, input_string, re.DOTALL)
+        matches = TOOL_CALL_PATTERN.findall(input_string)
 
         # Process matches into a list of dictionaries
         result = []
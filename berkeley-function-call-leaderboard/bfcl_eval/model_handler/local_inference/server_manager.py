@@ -0,0 +1,384 @@
+import atexit
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import requests
+from bfcl_eval.constants.eval_config import LOCAL_SERVER_REGISTRY_PATH
+
+# Health check backoff while waiting for a model server to come up: start fast (small models load in seconds), then back off so that a multi-minute weight load isn't polled every second
+SERVER_READY_INITIAL_POLL_INTERVAL = 0.5
+SERVER_READY_MAX_POLL_INTERVAL = 5.0
+SERVER_HEALTH_CHECK_TIMEOUT = 5
+
+
+@dataclass(frozen=True)
+class LocalServerSpec:
+    """
+    Everything that determines which model server is launched. Two runs with equal specs can share the same server.
+    """
+
+    backend: str
+    model_path_or_id: str
+    port: int
+    dtype: str
+    num_gpus: int
+    gpu_memory_utilization: float
+
+    def command(self) -> list[str]:
+        if self.backend == "vllm":
+            return [
+                "vllm",
+                "serve",
+                str(self.model_path_or_id),
+                "--port",
+                str(self.port),
+                "--dtype",
+                str(self.dtype),
+                "--tensor-parallel-size",
+                str(self.num_gpus),
+                "--gpu-memory-utilization",
+                str(self.gpu_memory_utilization),
+                "--trust-remote-code",
+            ]
+        elif self.backend == "sglang":
+            return [
+                "python",
+                "-m",
+                "sglang.launch_server",
+                "--model-path",
+                str(self.model_path_or_id),
+                "--port",
+                str(self.port),
+                "--dtype",
+                str(self.dtype),
+                "--tp",
+                str(self.num_gpus),
+                "--mem-fraction-static",
+                str(self.gpu_memory_utilization),
+                "--trust-remote-code",
+                "--enable-metrics",
+            ]
+        elif self.backend == "mock":
+            # No GPU or weights needed, see `mock_server`
+            return [
+                "python",
+                "-m",
+                "bfcl_eval.model_handler.local_inference.mock_server",
+                "--model",
+                str(self.model_path_or_id),
+                "--port",
+                str(self.port),
+            ]
+        else:
+            raise ValueError(f"Backend {self.backend} is not supported.")
+
+
+def get_served_model_ids(base_url: str) -> Optional[list[str]]:
+    """
+    The ids of the models served by the OpenAI-compatible server at `base_url`, or None if no server is answering there.
+    """
+    try:
+        response = requests.get(f"{base_url}/models", timeout=SERVER_HEALTH_CHECK_TIMEOUT)
+    except requests.exceptions.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    try:
+        return [model["id"] for model in response.json().get("data", [])]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return []
+
+
+def wait_for_server_ready(
+    base_url: str,
+    process: Optional[subprocess.Popen] = None,
+    timeout: Optional[float] = None,
+) -> None:
+    """
+    Block until the server at `base_url` answers `/models`, polling with exponential backoff.
+
+    Args:
+        base_url (str): The OpenAI-compatible base url of the server.
+        process (subprocess.Popen, optional): The server process, if we launched it. If it exits while we wait, an exception is raised instead of waiting forever.
+        timeout (float, optional): Give up after this many seconds. Wait forever by default.
+    """
+    poll_interval = SERVER_READY_INITIAL_POLL_INTERVAL
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        # Check if the process has terminated unexpectedly
+        if process is not None and process.poll() is not None:
+            raise Exception(
+                f"Subprocess terminated unexpectedly with code {process.returncode}"
+            )
+        if get_served_model_ids(base_url) is not None:
+            print("server is ready!")
+            return
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"Server at {base_url} was not ready after {timeout} seconds.")
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, SERVER_READY_MAX_POLL_INTERVAL)
+
+
+def is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _terminate_process_group(pid: int, timeout: float = 15) -> None:
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not is_process_alive(pid):
+            return
+        time.sleep(0.5)
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+#### Persistent servers (`bfcl serve`) ####
+
+
+def _registry_record_path(port: int):
+    return LOCAL_SERVER_REGISTRY_PATH / f"{port}.json"
+
+
+def read_server_record(port: int) -> Optional[dict]:
+    record_path = _registry_record_path(port)
+    if not record_path.exists():
+        return None
+    with open(record_path) as f:
+        return json.load(f)
+
+
+def list_server_records() -> list[dict]:
+    if not LOCAL_SERVER_REGISTRY_PATH.exists():
+        return []
+    records = []
+    for record_path in sorted(LOCAL_SERVER_REGISTRY_PATH.glob("*.json")):
+        with open(record_path) as f:
+            records.append(json.load(f))
+    return records
+
+
+def start_persistent_server(
+    spec: LocalServerSpec, base_url: str, wait: bool = True
+) -> dict:
+    """
+    Launch a model server that outlives the current process, and record it in the registry so that later `bfcl generate` runs (and `bfcl serve stop`) can find it.
+    If a server with the same spec is already recorded and alive, it is reused.
+
+    Returns:
+        dict: The registry record of the server.
+    """
+    record = read_server_record(spec.port)
+    if record is not None and is_process_alive(record["pid"]):
+        if LocalServerSpec(**record["spec"]) == spec:
+            print(f"A server for {spec.model_path_or_id} is already running on port {spec.port}.")
+            if wait:
+                wait_for_server_ready(base_url)
+            return record
+        raise RuntimeError(
+            f"Port {spec.port} is already used by a server for {record['spec']['model_path_or_id']}. Stop it first with `bfcl serve stop --port {spec.port}`."
+        )
+    if get_served_model_ids(base_url) is not None:
+        raise RuntimeError(
+            f"Another server, not started by `bfcl serve`, is already answering at {base_url}."
+        )
+
+    LOCAL_SERVER_REGISTRY_PATH.mkdir(parents=True, exist_ok=True)
+    log_path = LOCAL_SERVER_REGISTRY_PATH / f"{spec.port}.log"
+    with open(log_path, "a") as log_file:
+        process = subprocess.Popen(
+            spec.command(),
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            # Own process group, so the server survives this CLI call and can be stopped as a whole (including its workers)
+            start_new_session=True,
+        )
+    record = {
+        "pid": process.pid,
+        "spec": asdict(spec),
+        "base_url": base_url,
+        "log_file": str(log_path),
+        "started_at": time.time(),
+    }
+    with open(_registry_record_path(spec.port), "w") as f:
+        json.dump(record, f, indent=2)
+
+    if wait:
+        try:
+            wait_for_server_ready(base_url, process)
+        except Exception:
+            print(f"Server failed to start, see the log at {log_path}")
+            stop_persistent_server(spec.port)
+            raise
+    return record
+
+
+def stop_persistent_server(port: int) -> bool:
+    """
+    Stop the server recorded for `port`, and remove its record.
+
+    Returns:
+        bool: Whether a recorded server was found.
+    """
+    record = read_server_record(port)
+    if record is None:
+        return False
+    _terminate_process_group(record["pid"])
+    _registry_record_path(port).unlink(missing_ok=True)
+    return True
+
+
+def find_compatible_server(spec: LocalServerSpec, base_url: str) -> bool:
+    """
+    Whether a server that can be used for `spec` is already answering at `base_url` (eg. one started with `bfcl serve start`, or by a previous run).
+
+    A server recorded in the registry must have been started with the same spec. For servers we know nothing about, serving the same model id is taken as compatible.
+    Raises if a different model is being served there, since we couldn't start our own server on that port anyway.
+    """
+    served_model_ids = get_served_model_ids(base_url)
+    if served_model_ids is None:
+        return False
+
+    record = read_server_record(spec.port)
+    if record is not None and is_process_alive(record["pid"]):
+        compatible = LocalServerSpec(**record["spec"]) == spec
+    else:
+        compatible = str(spec.model_path_or_id) in served_model_ids
+    if not compatible:
+        raise RuntimeError(
+            f"The server already running at {base_url} (serving {served_model_ids}) does not match {spec.model_path_or_id} with the requested settings. Stop it first (`bfcl serve stop --port {spec.port}` if it was started with `bfcl serve start`)."
+        )
+    return True
+
+
+#### In-process warm pool ####
+
+
+class _PooledServer:
+    def __init__(self, spec: LocalServerSpec, process: subprocess.Popen):
+        self.spec = spec
+        self.process = process
+        # Event to signal the log threads to stop; no need to see logs after server is ready
+        self.stop_event = threading.Event()
+        self.log_threads: list[threading.Thread] = []
+
+
+class LocalServerPool:
+    """
+    Keeps the model servers launched by this process warm between `spin_up_local_server` calls.
+
+    When several models are generated in one run, consecutive models that use the same weights and server settings reuse the server instead of loading the weights again.
+    A server is only stopped when another spec needs its port, or when the pool is shut down (at the end of the generation run, or at interpreter exit).
+    """
+
+    def __init__(self):
+        self._servers: dict[int, _PooledServer] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, spec: LocalServerSpec, base_url: str) -> Optional[subprocess.Popen]:
+        """
+        Make sure a server for `spec` is running and ready at `base_url`.
+
+        Returns:
+            subprocess.Popen | None: The server process if it is owned by this pool, None if an external server (eg. from `bfcl serve start`) is reused.
+        """
+        with self._lock:
+            pooled = self._servers.get(spec.port)
+            if pooled is not None:
+                if pooled.spec == spec and pooled.process.poll() is None:
+                    print(f"Reusing the warm {spec.backend} server for {spec.model_path_or_id}.")
+                    wait_for_server_ready(base_url, pooled.process)
+                    return pooled.process
+                self._stop(spec.port)
+
+            if find_compatible_server(spec, base_url):
+                print(f"Reusing the server already running at {base_url}.")
+                return None
+
+            process = subprocess.Popen(
+                spec.command(),
+                stdout=subprocess.PIPE,  # Capture stdout
+                stderr=subprocess.PIPE,  # Capture stderr
+                text=True,  # To get the output as text instead of bytes
+            )
+            pooled = _PooledServer(spec, process)
+            self._servers[spec.port] = pooled
+
+            def log_subprocess_output(pipe, stop_event):
+                # Read lines until stop event is set
+                while not stop_event.is_set():
+                    line = pipe.readline()
+                    if line:
+                        print(line, end="")
+                    else:
+                        break
+                pipe.close()
+                print("server log tracking thread stopped successfully.")
+
+            # Start threads to read and print stdout and stderr
+            for pipe in (process.stdout, process.stderr):
+                log_thread = threading.Thread(
+                    target=log_subprocess_output, args=(pipe, pooled.stop_event), daemon=True
+                )
+                log_thread.start()
+                pooled.log_threads.append(log_thread)
+
+            try:
+                wait_for_server_ready(base_url, process)
+            except Exception:
+                self._stop(spec.port)
+                raise
+            finally:
+                # Signal threads to stop reading output
+                pooled.stop_event.set()
+            return process
+
+    def _stop(self, port: int) -> None:
+        pooled = self._servers.pop(port, None)
+        if pooled is None:
+            return
+        pooled.stop_event.set()
+        process = pooled.process
+        if process.poll() is None:
+            process.terminate()
+            try:
+                # Wait for the process to terminate fully
+                process.wait(timeout=15)
+                print("Process terminated successfully.")
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()  # Wait again to ensure it's fully terminated
+                print("Process killed.")
+        for log_thread in pooled.log_threads:
+            log_thread.join(timeout=2)
+
+    def stop(self, port: int) -> None:
+        with self._lock:
+            self._stop(port)
+
+    def shutdown_all(self) -> None:
+        with self._lock:
+            for port in list(self._servers):
+                self._stop(port)
+
+
+LOCAL_SERVER_POOL = LocalServerPool()
+atexit.register(LOCAL_SERVER_POOL.shutdown_all)
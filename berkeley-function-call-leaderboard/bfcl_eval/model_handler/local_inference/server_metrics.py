@@ -0,0 +1,92 @@
+from typing import Optional
+
+import requests
+
+# Prefix cache counters (in tokens) exposed by vLLM; the name changed across versions, so every known name is tried in order
+VLLM_PREFIX_CACHE_COUNTER_NAMES = [
+    ("vllm:prefix_cache_hits_total", "vllm:prefix_cache_queries_total"),
+    ("vllm:gpu_prefix_cache_hits_total", "vllm:gpu_prefix_cache_queries_total"),
+]
+# Prefix cache hit rate gauges exposed by older vLLM versions and by SGLang (when launched with `--enable-metrics`)
+PREFIX_CACHE_HIT_RATE_GAUGE_NAMES = [
+    "vllm:gpu_prefix_cache_hit_rate",
+    "sglang:cache_hit_rate",
+]
+
+
+def parse_prometheus_metrics(text: str) -> dict[str, float]:
+    """
+    Parse the Prometheus text exposition format into {metric name: value}, summing the samples of a metric across its label sets.
+    """
+    metrics: dict[str, float] = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name_and_labels, _, value = line.rpartition(" ")
+        name = name_and_labels.split("{", 1)[0].strip()
+        try:
+            metrics[name] = metrics.get(name, 0.0) + float(value)
+        except ValueError:
+            continue
+    return metrics
+
+
+def fetch_prefix_cache_stats(metrics_url: str, timeout: float = 5) -> Optional[dict]:
+    """
+    Read the prefix cache statistics from the server's metrics endpoint.
+
+    Returns:
+        dict | None: `{"hits": ..., "queries": ...}` cumulative token counters when the server exposes them, otherwise `{"hit_rate": ...}` from a gauge. None if the endpoint is unreachable or has no prefix cache metric.
+    """
+    try:
+        response = requests.get(metrics_url, timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        return None
+
+    metrics = parse_prometheus_metrics(response.text)
+    for hits_name, queries_name in VLLM_PREFIX_CACHE_COUNTER_NAMES:
+        if hits_name in metrics and queries_name in metrics:
+            return {"hits": metrics[hits_name], "queries": metrics[queries_name]}
+    for gauge_name in PREFIX_CACHE_HIT_RATE_GAUGE_NAMES:
+        if gauge_name in metrics:
+            return {"hit_rate": metrics[gauge_name]}
+    return None
+
+
+def merge_prefix_cache_stats(stats_list: list[Optional[dict]]) -> Optional[dict]:
+    """
+    Combine the `fetch_prefix_cache_stats` snapshots of several replicas: token counters are summed, and hit rate gauges are averaged when no replica exposes counters.
+    """
+    stats_list = [stats for stats in stats_list if stats is not None]
+    counters = [stats for stats in stats_list if "hits" in stats]
+    if counters:
+        return {
+            "hits": sum(stats["hits"] for stats in counters),
+            "queries": sum(stats["queries"] for stats in counters),
+        }
+    if stats_list:
+        return {"hit_rate": sum(stats["hit_rate"] for stats in stats_list) / len(stats_list)}
+    return None
+
+
+def compute_prefix_cache_hit_rate(
+    stats_before: Optional[dict], stats_after: Optional[dict]
+) -> Optional[float]:
+    """
+    The prefix cache hit rate over the period between two `fetch_prefix_cache_stats` snapshots.
+    For servers that only expose a hit rate gauge, this is the gauge value at the end of the period.
+    """
+    if stats_after is None:
+        return None
+    if "hit_rate" in stats_after:
+        return stats_after["hit_rate"]
+
+    hits = stats_after["hits"]
+    queries = stats_after["queries"]
+    if stats_before is not None and "hits" in stats_before:
+        hits -= stats_before["hits"]
+        queries -= stats_before["queries"]
+    if queries <= 0:
+        return None
+    return hits / queries
@@ -1,18 +1,19 @@
-from tree_sitter import Language, Parser
 import tree_sitter_java
+from bfcl_eval.model_handler.parser.tree_sitter_utils import (
+    TreeSitterParserPool,
+    contains_error_node,
+)
+from tree_sitter import Language
 
 JAVA_LANGUAGE = Language(tree_sitter_java.language(), "java")
 
-parser = Parser()
-parser.set_language(JAVA_LANGUAGE)
+JAVA_PARSER_POOL = TreeSitterParserPool(JAVA_LANGUAGE)
 
 
 def parse_java_function_call(source_code):
-    tree = parser.parse(bytes(source_code, "utf8"))
+    tree = JAVA_PARSER_POOL.get().parse(bytes(source_code, "utf8"))
     root_node = tree.root_node
-    sexp_result = root_node.sexp()
-
-    if "ERROR" in sexp_result:
+    if contains_error_node(root_node):
         raise SyntaxError("Error parsing java the source code.")
 
     def get_text(node):
@@ -133,3 +134,19 @@ def parse_java_function_call(source_code):
 
     result = traverse(root_node)
     return result if result else {}
+
+
+def parse_java_function_calls(source_codes: list[str]) -> list:
+    """
+    Bulk version of `parse_java_function_call`, for decoding many model outputs in one call.
+
+    Returns:
+        list: For each source code, either the parsed function calls, or the exception raised while parsing it, so that one malformed output does not fail the whole batch.
+    """
+    results = []
+    for source_code in source_codes:
+        try:
+            results.append(parse_java_function_call(source_code))
+        except Exception as e:
+            results.append(e)
+    return results
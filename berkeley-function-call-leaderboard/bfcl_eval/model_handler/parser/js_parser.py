@@ -1,18 +1,20 @@
-from tree_sitter import Language, Parser
 import tree_sitter_javascript
+from bfcl_eval.model_handler.parser.tree_sitter_utils import (
+    TreeSitterParserPool,
+    contains_error_node,
+)
+from tree_sitter import Language
 
 JS_LANGUAGE = Language(tree_sitter_javascript.language(), "javascript")
 
-parser = Parser()
-parser.set_language(JS_LANGUAGE)
+JS_PARSER_POOL = TreeSitterParserPool(JS_LANGUAGE)
 
 
 def parse_javascript_function_call(source_code):
     # Parse the source code
-    tree = parser.parse(bytes(source_code, "utf8"))
+    tree = JS_PARSER_POOL.get().parse(bytes(source_code, "utf8"))
     root_node = tree.root_node
-    sexp_result = root_node.sexp()
-    if "ERROR" in sexp_result:
+    if contains_error_node(root_node):
         raise SyntaxError("Error js parsing the source code.")
 
     # Function to recursively extract argument details
@@ -61,3 +63,19 @@ def parse_javascript_function_call(source_code):
                                 )
                         result = [{function_name: parameters}]
                         return result
+
+
+def parse_javascript_function_calls(source_codes: list[str]) -> list:
+    """
+    Bulk version of `parse_javascript_function_call`, for decoding many model outputs in one call.
+
+    Returns:
+        list: For each source code, either the parsed function calls, or the exception raised while parsing it, so that one malformed output does not fail the whole batch.
+    """
+    results = []
+    for source_code in source_codes:
+        try:
+            results.append(parse_javascript_function_call(source_code))
+        except Exception as e:
+            results.append(e)
+    return results
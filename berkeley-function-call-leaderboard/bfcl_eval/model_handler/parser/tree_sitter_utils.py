@@ -0,0 +1,38 @@
+import threading
+
+from tree_sitter import Language, Node, Parser
+
+
+class TreeSitterParserPool:
+    """
+    Hands out one tree-sitter `Parser` per thread for a given language.
+
+    A `Parser` keeps mutable state while parsing, so sharing a single module-level instance across the generation/evaluation thread pool is unsafe.
+    Creating a parser is cheap but not free, so each thread creates its own on first use and then keeps reusing it.
+    """
+
+    def __init__(self, language: Language):
+        self.language = language
+        self._local = threading.local()
+
+    def get(self) -> Parser:
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = Parser()
+            parser.set_language(self.language)
+            self._local.parser = parser
+        return parser
+
+
+def contains_error_node(node: Node) -> bool:
+    """
+    Whether the tree under `node` contains an ERROR node.
+
+    This is equivalent to `"ERROR" in node.sexp()`, without serializing the whole tree to a string.
+    `has_error` alone is not enough, as it is also True for trees that only contain MISSING nodes (which the sexp check never flagged), so we only descend into the subtrees it flags.
+    """
+    if not node.has_error:
+        return False
+    if node.type == "ERROR":
+        return True
+    return any(contains_error_node(child) for child in node.children)
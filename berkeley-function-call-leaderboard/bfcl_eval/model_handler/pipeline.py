@@ -0,0 +1,170 @@
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generator, NamedTuple, Optional
+
+from bfcl_eval.model_handler.streaming import StreamingStats, pop_streaming_stats
+from bfcl_eval.model_handler.tracing import trace_span
+
+"""
+Pipelined multi-turn inference (`bfcl generate --pipeline`).
+
+The multi-turn inference loops of `BaseHandler` are written as generators ("inference steps") that yield a `ModelQuery` wherever they need a model response, and receive its `QueryResult` back.
+The generator does all the CPU-side work of a step (response parsing, decoding, backend execution, logging, prompt rendering for the next request); the query only sends the request and waits for the model.
+
+`run_inference_steps_inline` drives the steps in the calling thread, which is the regular, one-thread-per-test-entry inference.
+`PipelinedInferenceExecutor` drives many test entries at once on two shared thread pools: the query pool sends the requests, and the CPU pool advances the generators.
+A thread that receives a model response hands the test entry to the CPU pool and picks up the next pending request right away, so the CPU work of one conversation overlaps with the requests of the others, and a test entry only holds a thread while it is actually sending a request or computing.
+As the stages of a test entry run on different threads, its `inference` trace span is split into one span per stage, each carrying the test entry's attributes.
+"""
+
+
+class QueryResult(NamedTuple):
+    api_response: Any
+    latency: float
+    # Only set if the request was streamed, see `bfcl_eval.model_handler.streaming`
+    streaming_stats: Optional[StreamingStats]
+
+
+class ModelQuery:
+    """
+    A model request prepared by the inference steps, to be sent by whoever drives them.
+    """
+
+    def __init__(self, send: Callable[[], tuple[Any, float]], **span_attributes):
+        """
+        Args:
+            send (Callable): Sends the request and returns `(api_response, latency)`, like `_query_FC` / `_query_prompting`.
+            **span_attributes: Attributes of the `model_query` trace span, eg. the turn and step indices.
+        """
+        self.send = send
+        self.span_attributes = span_attributes
+
+    def run(self) -> QueryResult:
+        with trace_span("model_query", **self.span_attributes):
+            api_response, latency = self.send()
+        # The streaming stats are kept per thread, so they must be collected by the thread that sent the request
+        return QueryResult(api_response, latency, pop_streaming_stats())
+
+
+# Yields the model queries, receives their results, and returns `(model_response, metadata)` like `BaseHandler.inference`
+InferenceSteps = Generator[ModelQuery, QueryResult, tuple[Any, dict]]
+
+
+def run_inference_steps_inline(steps: InferenceSteps) -> tuple[Any, dict]:
+    """
+    Drive the inference steps in the calling thread, sending each model query as soon as it is yielded.
+    """
+    try:
+        query = next(steps)
+        while True:
+            try:
+                query_result = query.run()
+            except Exception as e:
+                # Raised at the `yield`, so that the traceback goes through the inference loop
+                query = steps.throw(e)
+            else:
+                query = steps.send(query_result)
+    except StopIteration as stop:
+        return stop.value
+
+
+class _PipelinedTestEntry:
+    def __init__(self, start: Callable[[], InferenceSteps], span_attributes: dict):
+        self.start = start
+        self.span_attributes = span_attributes
+        self.steps: Optional[InferenceSteps] = None
+        self.future: Future = Future()
+
+
+class PipelinedInferenceExecutor:
+    """
+    Runs the inference steps of many test entries concurrently on a query pool and a CPU pool shared by all of them.
+
+    The size of the query pool bounds the number of model requests in flight, like the number of threads does for the regular inference.
+    The CPU pool also runs the backend execution, which can wait on the network (eg. `WebSearchAPI`), so it defaults to the `ThreadPoolExecutor` sizing for mixed workloads rather than to the number of CPUs.
+    """
+
+    def __init__(self, num_query_threads: int, num_cpu_threads: Optional[int] = None):
+        self.num_query_threads = num_query_threads
+        self.num_cpu_threads = num_cpu_threads or min(32, (os.cpu_count() or 1) + 4)
+        self._query_pool = ThreadPoolExecutor(
+            max_workers=self.num_query_threads, thread_name_prefix="bfcl-query"
+        )
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=self.num_cpu_threads, thread_name_prefix="bfcl-pipeline"
+        )
+
+    @property
+    def max_active_test_entries(self) -> int:
+        # Enough test entries for every query thread to have a request ready while others are in their CPU stage
+        return self.num_query_threads + self.num_cpu_threads
+
+    def submit_steps(self, start: Callable[[], InferenceSteps], **span_attributes) -> Future:
+        """
+        Run the inference steps returned by `start` (called on the CPU pool).
+
+        Args:
+            start (Callable): Returns the inference steps of the test entry.
+            **span_attributes: Attributes of the `inference` trace spans of the test entry, eg. the model and the test entry id.
+
+        Returns:
+            Future: Resolves to the `(model_response, metadata)` returned by the steps, or to the exception they raised.
+        """
+        test_entry = _PipelinedTestEntry(start, span_attributes)
+        self._cpu_pool.submit(self._advance, test_entry, None, None)
+        return test_entry.future
+
+    def submit_blocking(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Run `fn` on the query pool as a whole, for work that is a single model request anyway (eg. a single-turn test entry).
+        """
+        return self._query_pool.submit(fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        self._query_pool.shutdown(wait=True)
+        self._cpu_pool.shutdown(wait=True)
+
+    def __enter__(self) -> "PipelinedInferenceExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    def _advance(
+        self,
+        test_entry: _PipelinedTestEntry,
+        query_result: Optional[QueryResult],
+        query_error: Optional[Exception],
+    ) -> None:
+        """
+        Run the CPU stage of the test entry up to its next model query (on the CPU pool).
+        """
+        try:
+            with trace_span("inference", **test_entry.span_attributes):
+                if test_entry.steps is None:
+                    test_entry.steps = test_entry.start()
+                    query = next(test_entry.steps)
+                elif query_error is not None:
+                    query = test_entry.steps.throw(query_error)
+                else:
+                    query = test_entry.steps.send(query_result)
+        except StopIteration as stop:
+            test_entry.future.set_result(stop.value)
+            return
+        except Exception as e:
+            test_entry.future.set_exception(e)
+            return
+
+        self._query_pool.submit(self._send, test_entry, query)
+
+    def _send(self, test_entry: _PipelinedTestEntry, query: ModelQuery) -> None:
+        """
+        Send the model query of the test entry, and hand it back to the CPU pool (on the query pool).
+        """
+        try:
+            with trace_span("inference", **test_entry.span_attributes):
+                query_result = query.run()
+        except Exception as e:
+            self._cpu_pool.submit(self._advance, test_entry, None, e)
+            return
+        self._cpu_pool.submit(self._advance, test_entry, query_result, None)
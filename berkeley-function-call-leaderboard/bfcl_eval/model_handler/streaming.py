@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import httpx
+
+"""
+Timing of streamed model responses (`bfcl generate --stream`).
+
+Handlers that support streaming consume the stream inside `generate_with_backoff` and rebuild the same response object a non-streamed request returns, so that the `_parse_query_response_*` methods are shared by both modes.
+OpenAI-style streams are read from the raw HTTP response with `iter_server_sent_events` rather than the SDK's `Stream`, which stops reading at `[DONE]` and so closes the connection instead of returning it to the shared pool; a new connection (and TLS handshake) per request would inflate the time to first token.
+The streamed text of prompting models is also fed to a `StreamingToolCallDecoder`, to record when the tool calls are complete, in the default Python format, ahead of the end of the response.
+The time to first token and decode speed are handed to `BaseHandler` through a thread-local slot rather than the return value, so the `(api_response, latency)` contract of the query methods, and every subclass overriding them, stay unchanged.
+"""
+
+_last_streaming_stats = threading.local()
+
+
+@dataclass
+class StreamingStats:
+    # Seconds from sending the request to receiving the first generated token (text, reasoning or tool call)
+    time_to_first_token: float
+    # Seconds from sending the request to receiving the end of the stream
+    latency: float
+    output_token_count: int
+    # Seconds from sending the request to decoding the first complete tool call from the streamed text, see `StreamingToolCallDecoder`; None if no tool call was decoded before the end of the stream
+    time_to_first_tool_call: Optional[float] = None
+
+    @property
+    def output_tokens_per_second(self) -> Optional[float]:
+        # Decode speed after the first token, ie. the inverse of the mean inter-token latency
+        decode_time = self.latency - self.time_to_first_token
+        if self.output_token_count <= 1 or decode_time <= 0:
+            return None
+        return (self.output_token_count - 1) / decode_time
+
+
+class StreamTimer:
+    """
+    Created right before sending a streamed request; `mark_token` is called on every chunk that carries generated content, `mark_tool_calls` when the tool calls decoded so far are complete, `finish` at the end of the stream.
+    """
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.first_token_time: Optional[float] = None
+        self.first_tool_call_time: Optional[float] = None
+
+    def mark_token(self) -> None:
+        if self.first_token_time is None:
+            self.first_token_time = time.time()
+
+    def mark_tool_calls(self) -> None:
+        if self.first_tool_call_time is None:
+            self.first_tool_call_time = time.time()
+
+    def finish(self, output_token_count: Optional[int]) -> StreamingStats:
+        end_time = time.time()
+        stats = StreamingStats(
+            # An empty response has no first token; its whole latency is spent waiting for it
+            time_to_first_token=(self.first_token_time or end_time) - self.start_time,
+            latency=end_time - self.start_time,
+            output_token_count=output_token_count or 0,
+            time_to_first_tool_call=(
+                self.first_tool_call_time - self.start_time
+                if self.first_tool_call_time is not None
+                else None
+            ),
+        )
+        _last_streaming_stats.value = stats
+        return stats
+
+
+def pop_streaming_stats() -> Optional[StreamingStats]:
+    """
+    Return the stats of the last stream finished by the calling thread, and clear them; None if the last query was not streamed.
+    """
+    stats = getattr(_last_streaming_stats, "value", None)
+    _last_streaming_stats.value = None
+    return stats
+
+
+def iter_server_sent_events(http_response: httpx.Response) -> Iterator[dict]:
+    """
+    Yield the JSON payload of each `data:` event of an OpenAI-style stream, reading the body to its end so that the connection can be reused.
+    """
+    try:
+        for line in http_response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                continue
+            payload = json.loads(data)
+            if isinstance(payload, dict) and payload.get("error"):
+                raise RuntimeError(f"Error event in the response stream: {payload['error']}")
+            yield payload
+    finally:
+        http_response.close()
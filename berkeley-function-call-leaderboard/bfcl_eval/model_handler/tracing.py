@@ -0,0 +1,377 @@
+import atexit
+import itertools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+# Upper bounds (in seconds) of the Prometheus histogram buckets of the span durations; harness phases take microseconds to milliseconds, model requests seconds to minutes
+SPAN_DURATION_BUCKETS = [
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0,
+]
+
+
+class Span:
+    """
+    One timed phase of the inference of a test entry (eg. `model_query`, `decode`, `backend_execution`).
+
+    Attributes are inherited from the enclosing span of the same thread, so that every span of an entry carries its `test_entry_id`.
+    """
+
+    __slots__ = (
+        "name",
+        "span_id",
+        "parent",
+        "attributes",
+        "thread_id",
+        "start_time_ns",
+        "duration_ns",
+        "exporter_state",
+    )
+
+    def __init__(self, name: str, span_id: int, parent: Optional["Span"], attributes: dict):
+        self.name = name
+        self.span_id = span_id
+        self.parent = parent
+        self.attributes = attributes
+        self.thread_id = threading.get_ident()
+        self.start_time_ns = 0
+        self.duration_ns = 0
+        # Per-exporter data kept between `on_start` and `on_end`
+        self.exporter_state: dict = {}
+
+
+class _SpanContext:
+    __slots__ = ("tracer", "name", "attributes", "span", "start_counter_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        self.span = self.tracer._start_span(self.name, self.attributes)
+        self.start_counter_ns = time.perf_counter_ns()
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.span.duration_ns = time.perf_counter_ns() - self.start_counter_ns
+        if exc_type is not None:
+            self.span.attributes = {**self.span.attributes, "error": exc_type.__name__}
+        self.tracer._end_span(self.span)
+
+
+class _NoopSpanContext:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+_NOOP_SPAN_CONTEXT = _NoopSpanContext()
+
+
+class Tracer:
+    """
+    Records spans and hands them to the configured exporters (see `configure_tracing`). Without exporters, `span` is a no-op.
+    """
+
+    def __init__(self):
+        self.exporters: list = []
+        self.phase_stats = PhaseStats()
+        self._local = threading.local()
+        self._span_ids = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return len(self.exporters) > 0
+
+    def span(self, name: str, **attributes):
+        if not self.exporters:
+            return _NOOP_SPAN_CONTEXT
+        return _SpanContext(self, name, attributes)
+
+    def _start_span(self, name: str, attributes: dict) -> Span:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        parent = stack[-1] if stack else None
+        if parent is not None:
+            attributes = {**parent.attributes, **attributes}
+        span = Span(name, next(self._span_ids), parent, attributes)
+        span.start_time_ns = time.time_ns()
+        stack.append(span)
+        for exporter in self.exporters:
+            exporter.on_start(span)
+        return span
+
+    def _end_span(self, span: Span) -> None:
+        stack = self._local.stack
+        # Spans are closed in the reverse order they are opened, as they are only used as context managers
+        if stack and stack[-1] is span:
+            stack.pop()
+        self.phase_stats.record(span.name, span.duration_ns / 1e9)
+        for exporter in self.exporters:
+            exporter.on_end(span)
+
+    def close(self) -> None:
+        exporters, self.exporters = self.exporters, []
+        for exporter in exporters:
+            exporter.close()
+
+
+class PhaseStats:
+    """
+    Duration histogram of the spans, per span name; shared by the Prometheus endpoint and the summary printed at the end of a run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "count": 0,
+                    "sum": 0.0,
+                    "max": 0.0,
+                    "buckets": [0] * (len(SPAN_DURATION_BUCKETS) + 1),
+                }
+            stats["count"] += 1
+            stats["sum"] += duration
+            stats["max"] = max(stats["max"], duration)
+            stats["buckets"][bisect_left(SPAN_DURATION_BUCKETS, duration)] += 1
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                name: {**stats, "buckets": list(stats["buckets"])}
+                for name, stats in self._stats.items()
+            }
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# HELP bfcl_span_duration_seconds Duration of each phase of the inference.",
+            "# TYPE bfcl_span_duration_seconds histogram",
+        ]
+        for name, stats in sorted(self.snapshot().items()):
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(
+                SPAN_DURATION_BUCKETS + [float("inf")], stats["buckets"]
+            ):
+                cumulative_count += bucket_count
+                le = "+Inf" if upper_bound == float("inf") else repr(upper_bound)
+                lines.append(
+                    f'bfcl_span_duration_seconds_bucket{{phase="{name}",le="{le}"}} {cumulative_count}'
+                )
+            lines.append(f'bfcl_span_duration_seconds_sum{{phase="{name}"}} {stats["sum"]}')
+            lines.append(f'bfcl_span_duration_seconds_count{{phase="{name}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self) -> Optional[str]:
+        """
+        A table of the time spent in each phase, slowest first.
+        """
+        snapshot = self.snapshot()
+        if not snapshot:
+            return None
+        lines = [f"{'Phase':<22}{'Count':>10}{'Total (s)':>12}{'Mean (ms)':>12}{'Max (ms)':>12}"]
+        for name, stats in sorted(snapshot.items(), key=lambda item: -item[1]["sum"]):
+            lines.append(
+                f"{name:<22}{stats['count']:>10}{stats['sum']:>12.2f}"
+                f"{stats['sum'] / stats['count'] * 1000:>12.2f}{stats['max'] * 1000:>12.2f}"
+            )
+        return "\n".join(lines)
+
+
+#### Exporters ####
+
+
+class ChromeTraceExporter:
+    """
+    Writes the spans as a Chrome trace (Trace Event Format), to open in `chrome://tracing` or https://ui.perfetto.dev.
+    Events are streamed to the file as they end, so memory does not grow with the length of the run.
+    """
+
+    def __init__(self, trace_file: str):
+        self.trace_file = Path(trace_file)
+        self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.trace_file, "w", encoding="utf-8")
+        self._file.write("[\n")
+        self._pid = os.getpid()
+        self._named_threads: set[int] = set()
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        event = {
+            "name": span.name,
+            "ph": "X",
+            "ts": span.start_time_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": self._pid,
+            "tid": span.thread_id,
+            "args": span.attributes,
+        }
+        with self._lock:
+            if self._file.closed:
+                return
+            if span.thread_id not in self._named_threads:
+                self._named_threads.add(span.thread_id)
+                thread_name_event = {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": span.thread_id,
+                    "args": {"name": _thread_name(span.thread_id)},
+                }
+                self._file.write(json.dumps(thread_name_event) + ",\n")
+            self._file.write(json.dumps(event, default=str) + ",\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            # The trailing comma of the last event is allowed by the format, but some viewers want a well-formed array
+            self._file.write("{}]\n")
+            self._file.close()
+
+
+class PrometheusExporter:
+    """
+    Serves the span duration histograms on `http://host:port/metrics`, for Prometheus to scrape during the run.
+    """
+
+    def __init__(self, port: int, phase_stats: PhaseStats, host: str = "0.0.0.0"):
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                content = phase_stats.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        # The histograms are kept by `PhaseStats`
+        pass
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class OTLPExporter:
+    """
+    Sends the spans to an OpenTelemetry collector over OTLP/HTTP. Needs the `opentelemetry-sdk` and `opentelemetry-exporter-otlp-proto-http` packages.
+    """
+
+    def __init__(self, endpoint: str):
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.trace import set_span_in_context
+        except ImportError as e:
+            raise ImportError(
+                "Exporting traces over OTLP requires the OpenTelemetry SDK. Please install it with `pip install opentelemetry-sdk opentelemetry-exporter-otlp-proto-http`."
+            ) from e
+
+        self._set_span_in_context = set_span_in_context
+        # A provider of our own rather than the global one, so that we don't interfere with the SDKs' own instrumentation
+        self._provider = TracerProvider(resource=Resource.create({"service.name": "bfcl"}))
+        self._provider.add_span_processor(
+            BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint))
+        )
+        self._tracer = self._provider.get_tracer("bfcl_eval")
+
+    def on_start(self, span: Span) -> None:
+        parent_otel_span = (
+            span.parent.exporter_state.get("otel_span") if span.parent is not None else None
+        )
+        span.exporter_state["otel_span"] = self._tracer.start_span(
+            span.name,
+            context=(
+                self._set_span_in_context(parent_otel_span)
+                if parent_otel_span is not None
+                else None
+            ),
+            start_time=span.start_time_ns,
+        )
+
+    def on_end(self, span: Span) -> None:
+        otel_span = span.exporter_state.pop("otel_span", None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            otel_span.set_attribute(
+                key, value if isinstance(value, (str, bool, int, float)) else str(value)
+            )
+        otel_span.end(end_time=span.start_time_ns + span.duration_ns)
+
+    def close(self) -> None:
+        self._provider.shutdown()
+
+
+def _thread_name(thread_id: int) -> str:
+    for thread in threading.enumerate():
+        if thread.ident == thread_id:
+            return thread.name
+    return str(thread_id)
+
+
+TRACER = Tracer()
+atexit.register(TRACER.close)
+
+
+def trace_span(name: str, **attributes):
+    """
+    Time the enclosed block as a span named `name`, eg. `with trace_span("decode", step=step_idx): ...`. A no-op unless tracing is configured.
+    """
+    return TRACER.span(name, **attributes)
+
+
+def configure_tracing(
+    trace_file: Optional[str] = None,
+    metrics_port: Optional[int] = None,
+    otlp_endpoint: Optional[str] = None,
+) -> None:
+    """
+    Enable tracing with the given exporters. Tracing stays disabled (at no cost) if none is given.
+
+    Args:
+        trace_file (str, optional): Write a Chrome trace to this path.
+        metrics_port (int, optional): Serve the span duration histograms for Prometheus on this port.
+        otlp_endpoint (str, optional): Send the spans to this OTLP/HTTP endpoint (eg. `http://localhost:4318/v1/traces`).
+    """
+    if trace_file:
+        TRACER.exporters.append(ChromeTraceExporter(trace_file))
+    if metrics_port:
+        TRACER.exporters.append(PrometheusExporter(metrics_port, TRACER.phase_stats))
+    if otlp_endpoint:
+        TRACER.exporters.append(OTLPExporter(otlp_endpoint))
@@ -1,17 +1,27 @@
 import ast
 import builtins
 import copy
+import hashlib
 import json
+import marshal
 import operator
 import re
-from functools import reduce
+import threading
+from collections import OrderedDict
+from functools import lru_cache, reduce
 from typing import TYPE_CHECKING, Callable, List, Optional, Type, Union
 
 from bfcl_eval.constants.default_prompts import *
 from bfcl_eval.constants.enums import ModelStyle, ReturnFormat
 from bfcl_eval.constants.type_mappings import GORILLA_TO_OPENAPI
-from bfcl_eval.model_handler.parser.java_parser import parse_java_function_call
-from bfcl_eval.model_handler.parser.js_parser import parse_javascript_function_call
+from bfcl_eval.model_handler.parser.java_parser import (
+    parse_java_function_call,
+    parse_java_function_calls,
+)
+from bfcl_eval.model_handler.parser.js_parser import (
+    parse_javascript_function_call,
+    parse_javascript_function_calls,
+)
 from bfcl_eval.model_handler.parser.json_parser import parse_json_function_call
 from bfcl_eval.model_handler.parser.xml_parser import (
     parse_concise_xml_function_call,
@@ -30,6 +40,63 @@ if TYPE_CHECKING:
         MemoryAPI,
     )
 
+# Delimiters of the tool call region in the model output, see `ast_parse`
+TOOL_CALL_TAG_OPEN = "<TOOLCALL>"
+TOOL_CALL_TAG_CLOSE = "</TOOLCALL>"
+XML_FUNCTIONS_OPEN = "<functions>"
+XML_FUNCTIONS_CLOSE = "</functions>"
+
+
+class _BoundedCache:
+    """
+    A thread-safe LRU mapping, used to memoize the outputs rendered from function docs (see `convert_to_tool` and `formulate_system_prompt`).
+    Values are handed out to every caller as is, so they must be immutable (see `_freeze`).
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+#### Compiled tool schema ####
+# Maximum number of (function doc set, model style, type mapping) combinations whose converted tools are kept in memory
+MAX_COMPILED_TOOL_SCHEMA_CACHE_ENTRIES = 4096
+
+# The multi-turn categories only use a dozen backend function doc sets, so the same tools get converted again and again (at the start of every entry, and on every miss-func holdout turn).
+# The cached tools are frozen, so they can be shared by every caller without copying them.
+_COMPILED_TOOL_SCHEMA_CACHE = _BoundedCache(MAX_COMPILED_TOOL_SCHEMA_CACHE_ENTRIES)
+
+#### Rendered system prompt ####
+# Maximum number of rendered function doc blocks, and of rendered system prompts, kept in memory
+MAX_RENDERED_PROMPT_CACHE_ENTRIES = 4096
+
+# (function doc set hash, function doc format) -> rendered function doc block, shared by every prompt variation using that doc format
+_RENDERED_FUNCTION_DOC_CACHE = _BoundedCache(MAX_RENDERED_PROMPT_CACHE_ENTRIES)
+# (function doc set hash, return format, tool call tag, function doc format, prompt format, prompt style) -> rendered system prompt
+_RENDERED_SYSTEM_PROMPT_CACHE = _BoundedCache(MAX_RENDERED_PROMPT_CACHE_ENTRIES)
+
 
 def _cast_to_openai_type(properties, mapping):
     for key, value in properties.items():
@@ -76,7 +143,85 @@ def _cast_to_openai_type(properties, mapping):
     return properties
 
 
+def function_doc_set_hash(functions) -> str:
+    # `marshal` serializes the JSON-like function docs several times faster than `json.dumps`, and keeps the key order, which is preserved in the converted tools and therefore in the prompt sent to the model.
+    # Its output depends on the Python version, so the hash is only meant for in-memory cache keys.
+    try:
+        serialized = marshal.dumps(functions, 2)
+    except ValueError:
+        # Eg. subclasses of dict or list, which `marshal` rejects
+        serialized = b"json:" + json.dumps(functions).encode()
+    return hashlib.sha256(serialized).hexdigest()
+
+
+class _FrozenDict(dict):
+    """
+    A dict that can't be modified in place, for the tool schemas shared through the `convert_to_tool` cache.
+    It is still a `dict`, so it is serialized (`json.dumps`, the SDKs' request bodies) and printed exactly like one; `{**frozen_dict}` or `dict(frozen_dict)` give a modifiable copy.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("The converted tools are shared through the tool schema cache and can't be modified; copy them first.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+class _FrozenList(list):
+    """
+    The list counterpart of `_FrozenDict`.
+    """
+
+    _immutable = _FrozenDict._immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_FrozenList, (list(self),))
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+
 def convert_to_tool(functions, mapping, model_style):
+    """
+    Convert the function docs into the tool schema expected by `model_style`.
+
+    The conversion is cached on (function doc set hash, model style, type mapping). The returned list is a fresh list, but the tools in it are frozen, since they are shared with every other caller that converted the same function docs: to modify a tool, replace it with a copy, eg. `tools[-1] = {**tools[-1], ...}`.
+    """
+    cache_key = (
+        function_doc_set_hash(functions),
+        model_style,
+        json.dumps(mapping),
+    )
+    cached = _COMPILED_TOOL_SCHEMA_CACHE.get(cache_key)
+    if cached is None:
+        cached = tuple(_freeze(_convert_to_tool(functions, mapping, model_style)))
+        _COMPILED_TOOL_SCHEMA_CACHE.put(cache_key, cached)
+    return list(cached)
+
+
+def _convert_to_tool(functions, mapping, model_style):
     functions = copy.deepcopy(functions)
     oai_tool = []
     for item in functions:
@@ -256,10 +401,14 @@ def ast_parse(
     language: ReturnFormat = ReturnFormat.PYTHON,
     has_tool_call_tag: bool = False,
 ) -> list[dict]:
+    # The tool call regions are located with plain substring searches, which are equivalent to (and much cheaper than) the regexes r"<TOOLCALL>(.*?)</TOOLCALL>", r"<functions>(.*?)</functions>" and r"\[.*\]" on long reasoning outputs
     if has_tool_call_tag:
-        match = re.search(r"<TOOLCALL>(.*?)</TOOLCALL>", input_str, re.DOTALL)
-        if match:
-            input_str = match.group(1).strip()
+        region = find_tool_call_region(input_str, TOOL_CALL_TAG_OPEN, TOOL_CALL_TAG_CLOSE)
+        if region:
+            start, end = region
+            input_str = input_str[
+                start + len(TOOL_CALL_TAG_OPEN) : end - len(TOOL_CALL_TAG_CLOSE)
+            ].strip()
         else:
             raise ValueError(f"No tool call tag found in input string: {input_str}")
 
@@ -287,32 +436,188 @@ def ast_parse(
 
     elif language == ReturnFormat.VERBOSE_XML:
         # Remove ```xml and anything before/after XML
-        match = re.search(r"<functions>(.*?)</functions>", input_str, re.DOTALL)
-        if not match:
+        region = find_tool_call_region(input_str, XML_FUNCTIONS_OPEN, XML_FUNCTIONS_CLOSE)
+        if not region:
             raise ValueError(
                 f"No XML function call found in input string: {input_str}. Missing <functions> tag."
             )
-        return parse_verbose_xml_function_call(match.group(0))
+        return parse_verbose_xml_function_call(input_str[region[0] : region[1]])
 
     elif language == ReturnFormat.CONCISE_XML:
         # Remove anything before/after <functions> and </functions>
-        match = re.search(r"<functions>(.*?)</functions>", input_str, re.DOTALL)
-        if not match:
+        region = find_tool_call_region(input_str, XML_FUNCTIONS_OPEN, XML_FUNCTIONS_CLOSE)
+        if not region:
             raise ValueError(
                 f"No XML function call found in input string: {input_str}. Missing <functions> tag."
             )
-        return parse_concise_xml_function_call(match.group(0))
+        return parse_concise_xml_function_call(input_str[region[0] : region[1]])
 
     elif language == ReturnFormat.JSON:
-        json_match = re.search(r"\[.*\]", input_str, re.DOTALL)
-        if json_match:
-            input_str = json_match.group(0)
+        # From the first "[" to the last "]"
+        start = input_str.find("[")
+        end = input_str.rfind("]")
+        if start != -1 and end > start:
+            input_str = input_str[start : end + 1]
         return parse_json_function_call(input_str)
 
     else:
         raise NotImplementedError(f"Unsupported language: {language}")
 
 
+def find_tool_call_region(
+    text: str, open_marker: str, close_marker: str
+) -> Optional[tuple[int, int]]:
+    """
+    Find the first `open_marker ... close_marker` region of `text`.
+
+    Returns:
+        Optional[tuple[int, int]]: The (start, end) indices of the region, markers included, or None if there is no complete region.
+    """
+    region_start = text.find(open_marker)
+    if region_start == -1:
+        return None
+    region_end = text.find(close_marker, region_start + len(open_marker))
+    if region_end == -1:
+        return None
+    return region_start, region_end + len(close_marker)
+
+
+class StreamingToolCallDecoder:
+    """
+    Incremental counterpart of `ast_parse`, for handlers that receive the model output as a stream of chunks.
+
+    Each chunk is scanned once for the tool call region (`<TOOLCALL>...</TOOLCALL>` when `has_tool_call_tag` is set, `<functions>...</functions>` for the XML formats, the top-level `[...]` list for JSON and Python), carrying over just enough of the previous chunk to find a marker split across chunks.
+    As soon as the region is complete, `feed` decodes and returns the tool calls, so the caller can act on them before the response ends (see `StreamTimer.mark_tool_calls`). `finish` always decodes the whole output, exactly like `ast_parse`.
+    The Java and JavaScript formats have no closing delimiter without the tool call tag, so they are only decoded by `finish`.
+    """
+
+    def __init__(
+        self,
+        language: ReturnFormat = ReturnFormat.PYTHON,
+        has_tool_call_tag: bool = False,
+    ):
+        self.language = language
+        self.has_tool_call_tag = has_tool_call_tag
+        self.tool_calls: Optional[list[dict]] = None
+
+        self._chunks: list[str] = []
+        # Position of the next chunk in the whole output
+        self._offset = 0
+        self._done = False
+
+        if has_tool_call_tag:
+            self._markers = (TOOL_CALL_TAG_OPEN, TOOL_CALL_TAG_CLOSE)
+        elif language in (ReturnFormat.VERBOSE_XML, ReturnFormat.CONCISE_XML):
+            self._markers = (XML_FUNCTIONS_OPEN, XML_FUNCTIONS_CLOSE)
+        else:
+            self._markers = None
+        # The last characters seen, in case a marker is split across chunks
+        self._carry = ""
+        self._region_open = False
+
+        # JSON and Python: bracket depth of the top-level list, ignoring brackets inside strings
+        self._scans_brackets = self._markers is None and language in (
+            ReturnFormat.JSON,
+            ReturnFormat.PYTHON,
+        )
+        self._string_quotes = "\"'" if language == ReturnFormat.PYTHON else '"'
+        self._list_start = 0
+        self._depth = 0
+        self._string_quote: Optional[str] = None
+        self._escaped = False
+
+    @property
+    def text(self) -> str:
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, chunk: str) -> Optional[list[dict]]:
+        """
+        Consume the next chunk of the model output.
+
+        Returns:
+            Optional[list[dict]]: The decoded tool calls, the first time a complete tool call region is seen; None otherwise, including when the region can't be decoded.
+        """
+        if not chunk:
+            return None
+        self._chunks.append(chunk)
+        chunk_offset = self._offset
+        self._offset += len(chunk)
+        if self._done:
+            return None
+
+        if self._markers is not None:
+            if not self._scan_markers(chunk):
+                return None
+            # The region found so far is the first one, so decoding the text up to it gives the final result for the tagged formats
+            region_text = self.text
+        elif self._scans_brackets:
+            list_end = self._scan_brackets(chunk, chunk_offset)
+            if list_end is None:
+                return None
+            region_text = self.text[self._list_start : list_end]
+        else:
+            return None
+
+        self._done = True
+        try:
+            self.tool_calls = ast_parse(region_text, self.language, self.has_tool_call_tag)
+        except Exception:
+            return None
+        return self.tool_calls
+
+    def finish(self) -> list[dict]:
+        """
+        Decode the complete model output. Raises the same errors as `ast_parse`.
+        """
+        return ast_parse(self.text, self.language, self.has_tool_call_tag)
+
+    def _scan_markers(self, chunk: str) -> bool:
+        open_marker, close_marker = self._markers
+        window = self._carry + chunk
+        position = 0
+        if not self._region_open:
+            position = window.find(open_marker)
+            if position == -1:
+                self._carry = window[-(len(open_marker) - 1) :]
+                return False
+            self._region_open = True
+            position += len(open_marker)
+        if window.find(close_marker, position) != -1:
+            return True
+        # Keep enough to find a close marker split across chunks, but never the end of the open marker
+        self._carry = window[max(position, len(window) - len(close_marker) + 1) :]
+        return False
+
+    def _scan_brackets(self, chunk: str, chunk_offset: int) -> Optional[int]:
+        """
+        Returns the end position of the top-level list in the whole output, once the chunk closes it.
+        """
+        for index, char in enumerate(chunk):
+            if self._depth == 0:
+                if char == "[":
+                    self._depth = 1
+                    self._list_start = chunk_offset + index
+                continue
+            if self._string_quote is not None:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == self._string_quote:
+                    self._string_quote = None
+            elif char in self._string_quotes:
+                self._string_quote = char
+            elif char == "[":
+                self._depth += 1
+            elif char == "]":
+                self._depth -= 1
+                if self._depth == 0:
+                    return chunk_offset + index + 1
+        return None
+
+
 def resolve_ast_call(elem):
     # Handle nested attributes for deeply nested module paths
     func_parts = []
@@ -472,16 +777,21 @@ def format_execution_results_prompting(
     return repr(tool_results)
 
 
-def default_decode_ast_prompting(
-    result: str,
-    language: ReturnFormat = ReturnFormat.PYTHON,
-    has_tool_call_tag: bool = False,
-) -> list[dict]:
+def _wrap_prompting_output(result: str) -> str:
     result = result.strip("`\n ")
     if not result.startswith("["):
         result = "[" + result
     if not result.endswith("]"):
         result = result + "]"
+    return result
+
+
+def default_decode_ast_prompting(
+    result: str,
+    language: ReturnFormat = ReturnFormat.PYTHON,
+    has_tool_call_tag: bool = False,
+) -> list[dict]:
+    result = _wrap_prompting_output(result)
     decoded_output = ast_parse(result, language, has_tool_call_tag)
     return decoded_output
 
@@ -490,17 +800,71 @@ def default_decode_execute_prompting(
     result: str, has_tool_call_tag: bool = False
 ) -> list[str]:
     # Note: For execute, there are only Python entries, so we don't need to check the language.
-    result = result.strip("`\n ")
-    if not result.startswith("["):
-        result = "[" + result
-    if not result.endswith("]"):
-        result = result + "]"
+    result = _wrap_prompting_output(result)
     decoded_output = ast_parse(
         result, language=ReturnFormat.PYTHON, has_tool_call_tag=has_tool_call_tag
     )
     return decoded_output_to_execution_list(decoded_output)
 
 
+def default_decode_ast_prompting_batch(
+    results: list,
+    language: ReturnFormat = ReturnFormat.PYTHON,
+    has_tool_call_tag: bool = False,
+) -> list:
+    """
+    Batch version of `default_decode_ast_prompting`. Java and JavaScript outputs are handed to the bulk tree-sitter parsers in one call.
+
+    Returns:
+        list: For each result, either the decoded output, or the exception raised while decoding it.
+    """
+    decoded_results = [None] * len(results)
+    wrapped_results = []  # (index, wrapped result)
+    for index, result in enumerate(results):
+        try:
+            wrapped_results.append((index, _wrap_prompting_output(result)))
+        except Exception as e:
+            decoded_results[index] = e
+
+    if not has_tool_call_tag and language in (ReturnFormat.JAVA, ReturnFormat.JAVASCRIPT):
+        bulk_parser = (
+            parse_java_function_calls
+            if language == ReturnFormat.JAVA
+            else parse_javascript_function_calls
+        )
+        # Same as `ast_parse`, remove the [ and ] from the string
+        bulk_decoded = bulk_parser([result[1:-1] for _, result in wrapped_results])
+        for (index, _), decoded_output in zip(wrapped_results, bulk_decoded):
+            decoded_results[index] = decoded_output
+    else:
+        for index, result in wrapped_results:
+            try:
+                decoded_results[index] = ast_parse(result, language, has_tool_call_tag)
+            except Exception as e:
+                decoded_results[index] = e
+    return decoded_results
+
+
+def default_decode_execute_prompting_batch(
+    results: list, has_tool_call_tag: bool = False
+) -> list:
+    """
+    Batch version of `default_decode_execute_prompting`.
+
+    Returns:
+        list: For each result, either the decoded output, or the exception raised while decoding it.
+    """
+    decoded_results = []
+    for result in results:
+        try:
+            decoded_results.append(
+                default_decode_execute_prompting(result, has_tool_call_tag)
+            )
+        except Exception as e:
+            decoded_results.append(e)
+    return decoded_results
+
+
 def parse_nested_value(value):
     """
     Parse a potentially nested value from the AST output.
@@ -662,16 +1026,39 @@ def add_memory_instruction_system_prompt(
 def formulate_system_prompt(format_sensitivity_config: str, functions: list[dict]) -> str:
     """
     Formulate the default system prompt based on the provided parameters.
+
+    The rendered prompt is memoized on (function doc set hash, return format, tool call tag, function doc format, prompt format, prompt style), and the rendered function doc block is shared by all prompt variations that use the same function doc format.
     """
-    (
-        return_format,
-        has_tool_call_tag,
-        function_doc_format,
-        prompt_format,
-        prompt_style,
-    ) = parse_prompt_variation_params(format_sensitivity_config)
+    prompt_variation_params = parse_prompt_variation_params(format_sensitivity_config)
+    functions_hash = function_doc_set_hash(functions)
+
+    cache_key = (functions_hash, *prompt_variation_params)
+    system_prompt = _RENDERED_SYSTEM_PROMPT_CACHE.get(cache_key)
+    if system_prompt is None:
+        system_prompt = _render_system_prompt(
+            functions, functions_hash, *prompt_variation_params
+        )
+        _RENDERED_SYSTEM_PROMPT_CACHE.put(cache_key, system_prompt)
+    return system_prompt
+
 
-    formatted_function_doc = format_function_doc(functions, function_doc_format)
+def _render_system_prompt(
+    functions: list[dict],
+    functions_hash: str,
+    return_format: str,
+    has_tool_call_tag: bool,
+    function_doc_format: str,
+    prompt_format: str,
+    prompt_style: str,
+) -> str:
+    formatted_function_doc = _RENDERED_FUNCTION_DOC_CACHE.get(
+        (functions_hash, function_doc_format)
+    )
+    if formatted_function_doc is None:
+        formatted_function_doc = format_function_doc(functions, function_doc_format)
+        _RENDERED_FUNCTION_DOC_CACHE.put(
+            (functions_hash, function_doc_format), formatted_function_doc
+        )
 
     prompt_template = PROMPT_TEMPLATE_MAPPING[prompt_format]
     style_template = PROMPT_STYLE_TEMPLATES[prompt_style]
@@ -882,6 +1269,7 @@ def _generate_function_doc_python(functions: list[dict]) -> str:
     return "\n\n".join(docs)
 
 
+@lru_cache(maxsize=256)
 def parse_prompt_variation_params(input_str: str) -> tuple[str, bool, str, str, str]:
     """
     Parse a query string of the form:
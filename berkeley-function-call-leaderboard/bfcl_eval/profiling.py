@@ -0,0 +1,381 @@
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+# Default time between two stack samples; lower values give finer profiles but slow the profiled run down more, since every sample walks the stacks of all threads under the GIL
+DEFAULT_SAMPLING_INTERVAL = 0.005
+
+# Differences in time per entry below this are considered noise when comparing against a baseline
+MIN_REGRESSION_MS_PER_ENTRY = 0.5
+
+# Subsystems of the harness, matched in order against the (forward-slash) path of the file of each frame; the first match wins
+SUBSYSTEM_PATH_PATTERNS = [
+    ("func_source_code", "bfcl_eval/eval_checker/multi_turn_eval/func_source_code/"),
+    ("multi_turn_utils", "bfcl_eval/eval_checker/multi_turn_eval/multi_turn_utils.py"),
+    ("multi_turn_checker", "bfcl_eval/eval_checker/multi_turn_eval/"),
+    ("ast_checker", "bfcl_eval/eval_checker/ast_eval/"),
+    ("agentic_checker", "bfcl_eval/eval_checker/agentic_eval/"),
+    ("eval_runner", "bfcl_eval/eval_checker/"),
+    ("parsers", "bfcl_eval/model_handler/parser/"),
+    ("tracing", "bfcl_eval/model_handler/tracing.py"),
+    ("handlers", "bfcl_eval/model_handler/"),
+    ("generation", "bfcl_eval/_llm_response_generation.py"),
+    ("utils_io", "bfcl_eval/utils.py"),
+    ("bfcl_other", "bfcl_eval/"),
+]
+
+# Time spent outside the harness is bucketed by the library it is spent in; the names are bracketed to tell them apart from the harness subsystems
+WAITING_BUCKET = "(waiting)"
+HTTP_CLIENT_BUCKET = "(http client)"
+JSON_BUCKET = "(json)"
+OTHER_BUCKET = "(other)"
+# A thread whose innermost Python frame is in one of these modules is blocked on a lock, queue, future or selector
+WAITING_PATH_PATTERNS = [
+    "/threading.py",
+    "/queue.py",
+    "/selectors.py",
+    "/concurrent/futures/",
+    "/multiprocessing/",
+    "/asyncio/",
+]
+HTTP_CLIENT_PATH_PATTERNS = [
+    "/httpx/",
+    "/httpcore/",
+    "/h11/",
+    "/h2/",
+    "/anyio/",
+    "/openai/",
+    "/anthropic/",
+    "/google/genai/",
+    "/requests/",
+    "/urllib3/",
+    "/ssl.py",
+    "/socket.py",
+    "/http/client.py",
+]
+# cProfile reports the time of C functions under `~`; these builtins block the thread
+WAITING_BUILTIN_PATTERN = re.compile(
+    r"acquire|sleep|select|poll|wait|_thread\.lock|\.join"
+)
+HTTP_CLIENT_BUILTIN_PATTERN = re.compile(r"recv|send|connect|_ssl\.")
+
+# Worker threads of the same pool are merged in the flamegraph, eg. `ThreadPoolExecutor-0_12` -> `ThreadPoolExecutor-0`
+_THREAD_INDEX_SUFFIX = re.compile(r"_\d+$")
+
+
+def classify_path(filename: str) -> Optional[str]:
+    """
+    Return the harness subsystem a source file belongs to, or None if it is not part of `bfcl_eval`.
+    """
+    path = filename.replace(os.sep, "/")
+    for subsystem, pattern in SUBSYSTEM_PATH_PATTERNS:
+        if pattern in path:
+            return subsystem
+    return None
+
+
+def classify_leaf(filename: str, function_name: str) -> str:
+    """
+    Return the bucket the time of a frame is charged to when it is the innermost frame of a sample: its harness subsystem, or the library it is spent in.
+    """
+    subsystem = classify_path(filename)
+    if subsystem is not None:
+        return subsystem
+    if filename == "~":
+        if WAITING_BUILTIN_PATTERN.search(function_name):
+            return WAITING_BUCKET
+        if HTTP_CLIENT_BUILTIN_PATTERN.search(function_name):
+            return HTTP_CLIENT_BUCKET
+        if "json" in function_name:
+            return JSON_BUCKET
+        return OTHER_BUCKET
+    path = filename.replace(os.sep, "/")
+    if any(pattern in path for pattern in WAITING_PATH_PATTERNS):
+        return WAITING_BUCKET
+    if any(pattern in path for pattern in HTTP_CLIENT_PATH_PATTERNS):
+        return HTTP_CLIENT_BUCKET
+    if "/json/" in path:
+        return JSON_BUCKET
+    return OTHER_BUCKET
+
+
+def _frame_label(code) -> str:
+    # Semicolons separate the frames in the collapsed stack format
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(
+        ";", ","
+    )
+
+
+#### Profilers ####
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler: a background thread snapshots the Python stack of every other thread every `interval` seconds.
+
+    Unlike `cProfile`, it sees all the worker threads, and the cost does not grow with the number of function calls, so the relative cost of the subsystems is not skewed by call-heavy code.
+    With the `cpu` clock, each sample is weighted by the CPU time its thread used since the previous sample, so threads blocked on the network or on a lock count for nothing; with the `wall` clock, by the elapsed time, which shows where the threads wait.
+    """
+
+    name = "sampling"
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL, clock: str = "cpu"):
+        if clock not in ("cpu", "wall"):
+            raise ValueError(f"Unknown clock '{clock}'. Choose from 'cpu' or 'wall'.")
+        if clock == "cpu" and not hasattr(time, "pthread_getcpuclockid"):
+            print("⚠️  Per-thread CPU clocks are not supported on this platform, sampling wall-clock time instead.")
+            clock = "wall"
+        self.interval = interval
+        self.clock = clock
+        # (thread group, stack of code objects, outermost first) -> seconds
+        self.samples: dict[tuple, float] = defaultdict(float)
+        self.sample_count = 0
+        # Thread id -> CPU time of the thread at the previous sample
+        self._thread_cpu_times: dict[int, float] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _thread_cpu_time(self, thread_id: int) -> Optional[float]:
+        try:
+            return time.clock_gettime(time.pthread_getcpuclockid(thread_id))
+        except OSError:
+            # The thread exited between listing and reading its clock
+            return None
+
+    def start(self) -> None:
+        if self.clock == "cpu":
+            # Only the CPU time used from now on is charged to the threads that already exist
+            for thread_id in sys._current_frames():
+                cpu_time = self._thread_cpu_time(thread_id)
+                if cpu_time is not None:
+                    self._thread_cpu_times[thread_id] = cpu_time
+        self._thread = threading.Thread(
+            target=self._run, name="bfcl-sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_thread_id = threading.get_ident()
+        last_sample_time = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            now = time.perf_counter()
+            elapsed = now - last_sample_time
+            last_sample_time = now
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                if self.clock == "cpu":
+                    cpu_time = self._thread_cpu_time(thread_id)
+                    if cpu_time is None:
+                        continue
+                    last_cpu_time = self._thread_cpu_times.get(thread_id, 0.0)
+                    self._thread_cpu_times[thread_id] = cpu_time
+                    # Thread ids are reused once a thread exits; the clock of the new thread restarts from zero
+                    weight = cpu_time - last_cpu_time if cpu_time >= last_cpu_time else cpu_time
+                    if weight <= 0:
+                        continue
+                else:
+                    weight = elapsed
+                stack = []
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stack.reverse()
+                thread_group = _THREAD_INDEX_SUFFIX.sub(
+                    "", thread_names.get(thread_id, str(thread_id))
+                )
+                self.samples[(thread_group, tuple(stack))] += weight
+            self.sample_count += 1
+
+    def summarize(self) -> dict[str, dict]:
+        """
+        Return the self time (innermost frame) and inclusive time (anywhere in the stack) of each subsystem, in seconds of the sampled clock summed over the threads.
+        """
+        summary = defaultdict(lambda: {"self_seconds": 0.0, "inclusive_seconds": 0.0})
+        for (_, stack), seconds in self.samples.items():
+            if not stack:
+                continue
+            leaf = stack[-1]
+            summary[classify_leaf(leaf.co_filename, leaf.co_name)]["self_seconds"] += seconds
+            for subsystem in {classify_path(code.co_filename) for code in stack} - {None}:
+                summary[subsystem]["inclusive_seconds"] += seconds
+        return dict(summary)
+
+    def write(self, output_path: Path) -> Path:
+        """
+        Write the samples in the collapsed stack format (one `thread;outer;...;inner <microseconds>` line per stack), which `flamegraph.pl`, `inferno` and speedscope.app turn into a flamegraph.
+        """
+        output_path = output_path.with_suffix(".folded")
+        with open(output_path, "w") as f:
+            for (thread_group, stack), seconds in sorted(
+                self.samples.items(), key=lambda item: -item[1]
+            ):
+                frames = ";".join([thread_group] + [_frame_label(code) for code in stack])
+                f.write(f"{frames} {round(seconds * 1e6)}\n")
+        return output_path
+
+
+class CProfileProfiler:
+    """
+    Deterministic profiler, for when exact call counts are needed or stack sampling is not available (`sys._current_frames` is CPython-only).
+
+    `cProfile` only profiles the thread it is enabled in, so one profiler is enabled in each thread started while profiling, and their stats are merged at the end.
+    Its overhead is per function call, which inflates call-heavy code (parsers, checkers) relative to I/O.
+    """
+
+    name = "cprofile"
+
+    def __init__(self):
+        self._profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self.stats: Optional[pstats.Stats] = None
+
+    def _new_profile(self) -> cProfile.Profile:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        return profile
+
+    def _enable_in_new_thread(self, frame, event, arg) -> None:
+        # `threading.setprofile` installs this hook in each new thread; enabling cProfile replaces it with cProfile's own
+        self._new_profile().enable()
+
+    def start(self) -> None:
+        threading.setprofile(self._enable_in_new_thread)
+        self._new_profile().enable()
+
+    def stop(self) -> None:
+        threading.setprofile(None)
+        # The profile of the calling thread is the first one; the worker threads have exited by now
+        self._profiles[0].disable()
+        for profile in self._profiles:
+            profile.create_stats()
+        self.stats = pstats.Stats(self._profiles[0])
+        for profile in self._profiles[1:]:
+            if profile.stats:
+                self.stats.add(profile)
+
+    def summarize(self) -> dict[str, dict]:
+        """
+        Return the self time of each subsystem, in wall-clock seconds summed over the threads. cProfile has no stacks, so the inclusive time is not available.
+        """
+        summary = defaultdict(lambda: {"self_seconds": 0.0, "inclusive_seconds": None})
+        for (filename, _, function_name), (_, _, self_time, _, _) in self.stats.stats.items():
+            summary[classify_leaf(filename, function_name)]["self_seconds"] += self_time
+        return dict(summary)
+
+    def write(self, output_path: Path) -> Path:
+        """
+        Write the stats in the `pstats` format, which `snakeviz`, `flameprof` and `gprof2dot` render.
+        """
+        output_path = output_path.with_suffix(".pstats")
+        self.stats.dump_stats(output_path)
+        return output_path
+
+
+def create_profiler(profiler: str, interval: float = DEFAULT_SAMPLING_INTERVAL, clock: str = "cpu"):
+    if profiler == "sampling":
+        if hasattr(sys, "_current_frames"):
+            return SamplingProfiler(interval, clock)
+        print("⚠️  Stack sampling is not supported by this interpreter, falling back to cProfile.")
+        return CProfileProfiler()
+    if profiler == "cprofile":
+        return CProfileProfiler()
+    raise ValueError(f"Unknown profiler '{profiler}'. Choose from 'sampling' or 'cprofile'.")
+
+
+#### Reporting ####
+
+
+def count_result_entries(result_dir: Path, result_file_pattern: str) -> int:
+    """
+    Count the entries in the result files under `result_dir`, to normalize the profile per test entry.
+    """
+    entry_count = 0
+    for result_file in Path(result_dir).rglob(result_file_pattern):
+        with open(result_file) as f:
+            entry_count += sum(1 for line in f if line.strip())
+    return entry_count
+
+
+def build_stage_summary(
+    subsystem_times: dict[str, dict], entry_count: int, wall_seconds: float
+) -> dict:
+    subsystems = {}
+    for subsystem, times in sorted(
+        subsystem_times.items(), key=lambda item: -item[1]["self_seconds"]
+    ):
+        subsystems[subsystem] = {
+            **times,
+            "self_ms_per_entry": (
+                times["self_seconds"] * 1000 / entry_count if entry_count else None
+            ),
+        }
+    return {
+        "entries": entry_count,
+        "wall_seconds": wall_seconds,
+        "subsystems": subsystems,
+    }
+
+
+def format_stage_summary(stage_summary: dict) -> list[list]:
+    total_self_seconds = sum(
+        times["self_seconds"] for times in stage_summary["subsystems"].values()
+    )
+    rows = []
+    for subsystem, times in stage_summary["subsystems"].items():
+        rows.append(
+            [
+                subsystem,
+                f"{times['self_seconds']:.3f}",
+                (
+                    f"{times['self_seconds'] / total_self_seconds:.1%}"
+                    if total_self_seconds
+                    else "-"
+                ),
+                (
+                    f"{times['inclusive_seconds']:.3f}"
+                    if times["inclusive_seconds"] is not None
+                    else "-"
+                ),
+                (
+                    f"{times['self_ms_per_entry']:.3f}"
+                    if times["self_ms_per_entry"] is not None
+                    else "-"
+                ),
+            ]
+        )
+    return rows
+
+
+def compare_with_baseline(summary: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Report the harness subsystems whose self time per entry exceeds the baseline by more than `tolerance` times; time spent waiting and in libraries is not compared.
+    """
+    regressions = []
+    for stage, stage_summary in summary.items():
+        baseline_subsystems = baseline.get(stage, {}).get("subsystems", {})
+        for subsystem, times in stage_summary["subsystems"].items():
+            if subsystem.startswith("("):
+                continue
+            baseline_times = baseline_subsystems.get(subsystem)
+            if baseline_times is None or baseline_times["self_ms_per_entry"] is None:
+                continue
+            old, new = baseline_times["self_ms_per_entry"], times["self_ms_per_entry"]
+            if new is not None and new > old * tolerance and new - old > MIN_REGRESSION_MS_PER_ENTRY:
+                regressions.append(
+                    f"{stage} {subsystem}: {old:.3f}ms -> {new:.3f}ms per entry"
+                )
+    return regressions
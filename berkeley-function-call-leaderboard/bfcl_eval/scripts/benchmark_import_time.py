@@ -0,0 +1,140 @@
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+"""
+This script benchmarks the import time of the `bfcl` CLI, and checks that none of the heavy dependencies (vendor SDKs, PyTorch, FAISS, etc.) are imported at startup.
+Those should only be imported when they are actually needed (eg. the handler class of the model being run, or the memory backend on its first vector operation).
+
+Each measurement is done in a fresh interpreter using `python -X importtime`, so that the numbers are not affected by modules already being cached in `sys.modules`.
+The script exits with a non-zero code if the median import time exceeds `--max-seconds` or if any of the heavy modules is imported, so it can be used as a regression check.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard/bfcl_eval/scripts
+python benchmark_import_time.py
+```
+"""
+
+# Top-level packages that must not be imported when the CLI starts
+HEAVY_MODULES = [
+    "anthropic",
+    "boto3",
+    "cohere",
+    "faiss",
+    "google.genai",
+    "mistralai",
+    "openai",
+    "pandas",
+    "qwen_agent",
+    "rank_bm25",
+    "sentence_transformers",
+    "torch",
+    "transformers",
+    "writerai",
+]
+
+# Run the subprocesses from the folder containing `bfcl_eval`, so that this works without installing the package
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+DEFAULT_TARGET_MODULES = [
+    "bfcl_eval.__main__",
+]
+
+
+def measure_import(module_name: str) -> tuple[float, dict[str, float]]:
+    """
+    Import `module_name` in a fresh interpreter.
+
+    Returns:
+        A tuple of the total import time of `module_name` in seconds, and a dict mapping every imported module to its cumulative import time in seconds.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        cwd=PACKAGE_ROOT,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Failed to import {module_name}:\n{completed.stderr}")
+
+    cumulative_times = {}
+    for line in completed.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        cumulative_times[name.strip()] = int(cumulative) / 1e6
+
+    return cumulative_times[module_name], cumulative_times
+
+
+def find_heavy_modules(imported_modules) -> list[str]:
+    return sorted(
+        heavy
+        for heavy in HEAVY_MODULES
+        if any(name == heavy or name.startswith(heavy + ".") for name in imported_modules)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the import time of BFCL.")
+    parser.add_argument(
+        "--module",
+        type=str,
+        nargs="+",
+        default=DEFAULT_TARGET_MODULES,
+        help="The module(s) to import.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of fresh interpreters per module."
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=1.0,
+        help="Fail if the median import time of any module exceeds this value.",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Number of slowest imports to display."
+    )
+    args = parser.parse_args()
+
+    has_failure = False
+    for module_name in args.module:
+        total_times = []
+        # Keep the breakdown of the last run for display purposes
+        cumulative_times = {}
+        for _ in range(args.repeat):
+            total_time, cumulative_times = measure_import(module_name)
+            total_times.append(total_time)
+
+        median_time = statistics.median(total_times)
+        print("-" * 100)
+        print(
+            f"{module_name}: median {median_time:.3f}s, min {min(total_times):.3f}s, max {max(total_times):.3f}s over {args.repeat} runs"
+        )
+        print(f"Slowest {args.top} imports (cumulative):")
+        slowest = sorted(cumulative_times.items(), key=lambda x: x[1], reverse=True)
+        for name, cumulative in slowest[: args.top]:
+            print(f"    {cumulative:8.3f}s  {name}")
+
+        heavy_modules = find_heavy_modules(cumulative_times.keys())
+        if heavy_modules:
+            has_failure = True
+            print(f"❌ Heavy modules imported at startup: {heavy_modules}")
+        if median_time > args.max_seconds:
+            has_failure = True
+            print(
+                f"❌ Median import time {median_time:.3f}s exceeds the limit of {args.max_seconds:.3f}s"
+            )
+        if not heavy_modules and median_time <= args.max_seconds:
+            print("✅ Import time check passed.")
+
+    sys.exit(1 if has_failure else 0)
+
+
+if __name__ == "__main__":
+    main()
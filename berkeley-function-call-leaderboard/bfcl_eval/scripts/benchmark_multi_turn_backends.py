@@ -0,0 +1,468 @@
+import argparse
+import importlib
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
+
+from bfcl_eval.constants.executable_backend_config import (
+    CLASS_FILE_PATH_MAPPING,
+    STATELESS_CLASSES,
+)
+from bfcl_eval.eval_checker.multi_turn_eval.multi_turn_utils import _process_method_calls
+from bfcl_eval.utils import (
+    load_dataset_entry,
+    load_ground_truth_entry,
+    parse_test_category_argument,
+)
+
+"""
+This script stress-tests the multi-turn backends (`func_source_code`) as the scenario size grows.
+
+For each multi-turn test entry, the initial configuration of every involved class is scaled up by the given factors (eg. 10x, 100x, 1000x the number of files, messages, tweets, tickets, orders, bookings, etc.), by replicating the records already in the scenario under new synthetic keys.
+The ground truth function calls from `possible_answer/BFCL_v4_multi_turn_*.json` are then replayed, in order, against the scaled backends.
+The latency of every call is recorded per class and method, and a second replay under `tracemalloc` records the memory used by the loaded state and the peak memory allocated by each call.
+
+The results are stored as JSON. When `--baseline` points to a previous result file, methods whose median latency regressed by more than `--tolerance` are reported and the script exits with a non-zero code.
+
+To run this script, use the following command:
+```
+cd berkeley-function-call-leaderboard/bfcl_eval/scripts
+python benchmark_multi_turn_backends.py --scale 1 10 100 1000 --output backend_benchmark.json
+```
+"""
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+# The fields of each backend's scenario that hold its data volume
+SCALABLE_FIELDS = {
+    "GorillaFileSystem": ["root"],
+    "MessageAPI": ["user_map", "inbox"],
+    "TwitterAPI": ["tweets", "comments"],
+    "TicketAPI": ["ticket_queue"],
+    "TradingBot": ["orders", "stocks", "watch_list", "transaction_history"],
+    "TravelAPI": ["credit_card_list", "booking_record"],
+}
+
+# Synthetic numeric IDs start from here, so that they never collide with the IDs in the scenarios or those generated during the replay
+SYNTHETIC_ID_START = 10_000_000
+
+# Latency differences below this are considered noise when comparing against a baseline
+MIN_REGRESSION_MICROSECONDS = 5.0
+
+
+#### Scenario scaling ####
+
+
+class _SyntheticIdGenerator:
+    def __init__(self):
+        self._next_id = SYNTHETIC_ID_START
+
+    def __call__(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+
+def _replicate_value(value, copy_index: int, new_id: _SyntheticIdGenerator):
+    """
+    Return a copy of a single record, with its identifying fields made unique.
+    """
+    if isinstance(value, str):
+        return f"{value}_bench{copy_index}"
+    value = deepcopy(value)
+    if isinstance(value, dict) and isinstance(value.get("id"), int):
+        value["id"] = new_id()
+    return value
+
+
+def _replicate_key(key, value, copy_index: int, new_id: _SyntheticIdGenerator):
+    """
+    Return a new unique key for a copy of a record stored in a dict, and the updated record.
+    """
+    if isinstance(key, int) or (isinstance(key, str) and key.isdigit()):
+        synthetic_id = new_id()
+        if isinstance(value, dict) and "id" in value:
+            value["id"] = synthetic_id
+        return (synthetic_id if isinstance(key, int) else str(synthetic_id)), value
+    return f"{key}_bench{copy_index}", value
+
+
+def scale_collection(collection, factor: int, new_id: _SyntheticIdGenerator):
+    """
+    Grow a list or dict of records to `factor` times its size, by appending copies of its own records.
+    The original records are kept as-is and in place, so the ground truth calls still apply to them.
+    """
+    if factor <= 1 or not collection:
+        return collection
+
+    if isinstance(collection, list):
+        scaled = list(collection)
+        for copy_index in range(1, factor):
+            for item in collection:
+                scaled.append(_replicate_value(item, copy_index, new_id))
+        return scaled
+
+    if isinstance(collection, dict):
+        scaled = dict(collection)
+        for copy_index in range(1, factor):
+            for key, value in collection.items():
+                # String values (eg. the IDs in `user_map`) are suffixed to stay unique as well
+                value = _replicate_value(value, copy_index, new_id)
+                new_key, value = _replicate_key(key, value, copy_index, new_id)
+                scaled[new_key] = value
+        return scaled
+
+    return collection
+
+
+def scale_file_system(root: dict, factor: int) -> dict:
+    """
+    Grow the file system to `factor` times its size, by copying the content of the top-level directory into sibling directories.
+    """
+    if factor <= 1 or not root:
+        return root
+    root = dict(root)
+    root_name = list(root.keys())[0]
+    top_level = dict(root[root_name])
+    contents = top_level.get("contents", {})
+    scaled_contents = dict(contents)
+    for copy_index in range(1, factor):
+        scaled_contents[f"bench_copy_{copy_index}"] = {
+            "type": "directory",
+            "contents": deepcopy(contents),
+        }
+    top_level["contents"] = scaled_contents
+    root[root_name] = top_level
+    return root
+
+
+def scale_initial_config(initial_config: dict, factor: int) -> dict:
+    new_id = _SyntheticIdGenerator()
+    scaled_config = {}
+    for class_name, class_config in initial_config.items():
+        class_config = dict(class_config)
+        for field in SCALABLE_FIELDS.get(class_name, []):
+            if field not in class_config:
+                continue
+            if class_name == "GorillaFileSystem":
+                class_config[field] = scale_file_system(class_config[field], factor)
+            else:
+                class_config[field] = scale_collection(class_config[field], factor, new_id)
+        scaled_config[class_name] = class_config
+    return scaled_config
+
+
+#### Replay ####
+
+
+def load_instances(
+    initial_config: dict, involved_classes: list, long_context: bool
+) -> tuple[dict, dict]:
+    """
+    Instantiate the involved classes with the given configuration.
+
+    Returns:
+        A tuple of the instances keyed by class name, and the time (in seconds) it took to load each of their scenarios.
+    """
+    instances = {}
+    load_times = {}
+    for class_name in involved_classes:
+        module = importlib.import_module(CLASS_FILE_PATH_MAPPING[class_name])
+        instance = getattr(module, class_name)()
+        # Same as in `execute_multi_turn_func_call`, the backends may mutate the configuration they are given
+        class_initial_config = deepcopy(initial_config.get(class_name, {}))
+        start_time = time.perf_counter()
+        if class_name not in STATELESS_CLASSES:
+            instance._load_scenario(class_initial_config, long_context=long_context)
+        load_times[class_name] = time.perf_counter() - start_time
+        instances[class_name] = instance
+    return instances, load_times
+
+
+def compile_calls(func_calls: list[str], instances: dict) -> list[tuple]:
+    """
+    Compile the ground truth calls ahead of time, so that only the call itself is measured.
+
+    Returns:
+        A list of (class name, method name, code object) tuples. Calls to unknown methods are skipped.
+    """
+    method_owner = {}
+    instance_mapping = {}
+    for class_name, instance in instances.items():
+        for method_name in dir(instance):
+            if method_name.startswith("_") or not callable(getattr(instance, method_name)):
+                continue
+            method_owner[method_name] = class_name
+            instance_mapping[method_name] = f"instances[{class_name!r}]"
+
+    compiled_calls = []
+    for func_call in func_calls:
+        match = re.match(r"\s*([a-zA-Z_]\w*)\s*\(", func_call)
+        if not match or match.group(1) not in method_owner:
+            continue
+        method_name = match.group(1)
+        processed_call = _process_method_calls(func_call, instance_mapping)
+        compiled_calls.append(
+            (method_owner[method_name], method_name, compile(processed_call, "<call>", "eval"))
+        )
+    return compiled_calls
+
+
+def replay_entry(
+    test_entry: dict,
+    ground_truth: list[list[str]],
+    factor: int,
+    latency_samples: dict,
+    memory_samples: dict,
+    error_counts: dict,
+    repeat: int,
+) -> None:
+    initial_config = scale_initial_config(test_entry["initial_config"], factor)
+    involved_classes = test_entry["involved_classes"]
+    long_context = "long_context" in test_entry["id"] or "composite" in test_entry["id"]
+    func_calls = [func_call for turn in ground_truth for func_call in turn]
+
+    # Latency pass(es); the scenario is reloaded every time as the calls mutate the state
+    for _ in range(repeat):
+        instances, load_times = load_instances(initial_config, involved_classes, long_context)
+        for class_name, load_time in load_times.items():
+            latency_samples[class_name]["_load_scenario"].append(load_time)
+        namespace = {"instances": instances}
+        for class_name, method_name, code in compile_calls(func_calls, instances):
+            start_time = time.perf_counter()
+            try:
+                eval(code, namespace)
+            except Exception:
+                error_counts[class_name][method_name] += 1
+            latency_samples[class_name][method_name].append(time.perf_counter() - start_time)
+
+    # Memory pass
+    tracemalloc.start()
+    try:
+        for class_name in involved_classes:
+            baseline_memory = tracemalloc.get_traced_memory()[0]
+            instances, _ = load_instances(initial_config, [class_name], long_context)
+            memory_samples[class_name]["_load_scenario"].append(
+                tracemalloc.get_traced_memory()[0] - baseline_memory
+            )
+            del instances
+
+        instances, _ = load_instances(initial_config, involved_classes, long_context)
+        namespace = {"instances": instances}
+        for class_name, method_name, code in compile_calls(func_calls, instances):
+            tracemalloc.reset_peak()
+            current_memory = tracemalloc.get_traced_memory()[0]
+            try:
+                eval(code, namespace)
+            except Exception:
+                pass
+            memory_samples[class_name][method_name].append(
+                tracemalloc.get_traced_memory()[1] - current_memory
+            )
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(latency_samples: dict, memory_samples: dict, error_counts: dict) -> dict:
+    summary = {}
+    for class_name in sorted(latency_samples):
+        summary[class_name] = {}
+        for method_name in sorted(latency_samples[class_name]):
+            latencies = sorted(latency_samples[class_name][method_name])
+            memories = memory_samples[class_name].get(method_name, [0])
+            summary[class_name][method_name] = {
+                "count": len(latencies),
+                "errors": error_counts[class_name][method_name],
+                "mean_us": statistics.fmean(latencies) * 1e6,
+                "p50_us": latencies[len(latencies) // 2] * 1e6,
+                "p95_us": latencies[int(len(latencies) * 0.95)] * 1e6,
+                "max_us": latencies[-1] * 1e6,
+                "mean_peak_memory_kb": statistics.fmean(memories) / 1024,
+                "max_peak_memory_kb": max(memories) / 1024,
+            }
+    return summary
+
+
+def run_benchmark(
+    test_categories: list[str], scales: list[int], limit: int, repeat: int
+) -> dict:
+    results = {}
+    for factor in scales:
+        latency_samples = defaultdict(lambda: defaultdict(list))
+        memory_samples = defaultdict(lambda: defaultdict(list))
+        error_counts = defaultdict(lambda: defaultdict(int))
+
+        start_time = time.perf_counter()
+        num_entries = 0
+        for test_category in test_categories:
+            test_entries = load_dataset_entry(
+                test_category, include_language_specific_hint=False
+            )
+            ground_truth_entries = {
+                entry["id"]: entry["ground_truth"]
+                for entry in load_ground_truth_entry(test_category)
+            }
+            if limit is not None:
+                test_entries = test_entries[:limit]
+            for test_entry in test_entries:
+                replay_entry(
+                    test_entry,
+                    ground_truth_entries[test_entry["id"]],
+                    factor,
+                    latency_samples,
+                    memory_samples,
+                    error_counts,
+                    repeat,
+                )
+                num_entries += 1
+
+        results[str(factor)] = summarize(latency_samples, memory_samples, error_counts)
+        print(
+            f"Scale {factor}x: replayed {num_entries} entries in {time.perf_counter() - start_time:.1f}s"
+        )
+    return results
+
+
+#### Reporting ####
+
+
+def print_report(results: dict, top: int) -> None:
+    for factor, summary in results.items():
+        print("-" * 100)
+        print(f"Scale {factor}x")
+        print(
+            f"    {'class':<20}{'calls':>8}{'mean (us)':>12}{'load p50 (us)':>16}{'state (KB)':>12}"
+        )
+        rows = []
+        for class_name, methods in summary.items():
+            calls = [stats for name, stats in methods.items() if name != "_load_scenario"]
+            total_calls = sum(stats["count"] for stats in calls)
+            total_time = sum(stats["mean_us"] * stats["count"] for stats in calls)
+            load_stats = methods.get("_load_scenario", {})
+            print(
+                f"    {class_name:<20}{total_calls:>8}{(total_time / total_calls if total_calls else 0):>12.1f}"
+                f"{load_stats.get('p50_us', 0):>16.1f}{load_stats.get('mean_peak_memory_kb', 0):>12.1f}"
+            )
+            rows.extend(
+                (stats["p95_us"], f"{class_name}.{name}")
+                for name, stats in methods.items()
+                if name != "_load_scenario"
+            )
+        print(f"  Slowest {top} methods by p95 latency:")
+        for p95, name in sorted(rows, reverse=True)[:top]:
+            print(f"    {p95:12.1f} us  {name}")
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for factor, summary in results.items():
+        baseline_summary = baseline.get(factor, {})
+        for class_name, methods in summary.items():
+            for method_name, stats in methods.items():
+                baseline_stats = baseline_summary.get(class_name, {}).get(method_name)
+                if baseline_stats is None:
+                    continue
+                old, new = baseline_stats["p50_us"], stats["p50_us"]
+                if new > old * tolerance and new - old > MIN_REGRESSION_MICROSECONDS:
+                    regressions.append(
+                        f"{factor}x {class_name}.{method_name}: p50 {old:.1f}us -> {new:.1f}us"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Stress-test the multi-turn backends with scaled-up scenarios."
+    )
+    parser.add_argument(
+        "--test-category",
+        type=str,
+        nargs="+",
+        default=["multi_turn"],
+        help="The multi-turn test categories (or group) whose ground truth to replay.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="The data volume multipliers to benchmark.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Only replay the first N entries of each category.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of latency replays per entry and scale.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="multi_turn_backend_benchmark.json",
+        help="Path of the JSON file to write the results to.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="Path of a previous result file to compare against.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Report a regression when the median latency exceeds the baseline by this factor.",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of slowest methods to display."
+    )
+    args = parser.parse_args()
+
+    test_categories = parse_test_category_argument(args.test_category)
+    results = run_benchmark(test_categories, args.scale, args.limit, args.repeat)
+    print_report(results, args.top)
+
+    output = {
+        "metadata": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "test_categories": test_categories,
+            "scales": args.scale,
+            "limit": args.limit,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(output, f, indent=2)
+    print(f"Results saved to {output_path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) compared to {args.baseline}:")
+            for regression in regressions:
+                print(f"    {regression}")
+            sys.exit(1)
+        print(f"✅ No regression compared to {args.baseline}.")
+
+
+if __name__ == "__main__":
+    main()
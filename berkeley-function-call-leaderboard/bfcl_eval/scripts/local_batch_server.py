@@ -0,0 +1,337 @@
+import argparse
+import json
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import requests
+
+"""
+A local stand-in for the OpenAI Files and Batches API, to validate `bfcl generate --batch-api` offline.
+
+It implements the routes the batch pipeline uses (`POST /v1/files`, `GET /v1/files/{id}/content`, `POST /v1/batches`, `GET /v1/batches/{id}`, `POST /v1/batches/{id}/cancel`).
+Submitted batches are run in the background: each request is forwarded to the OpenAI-compatible server given by `--upstream` (eg. a local vLLM/SGLang server), or answered with an empty assistant message when no upstream is set.
+
+Usage:
+    python -m bfcl_eval.scripts.local_batch_server --port 8090 --upstream http://localhost:1053/v1
+    OPENAI_BASE_URL=http://localhost:8090/v1 bfcl generate --model gpt-4o-2024-11-20-FC --test-category simple_python --batch-api
+"""
+
+
+class BatchStore:
+    def __init__(self, upstream: Optional[str], upstream_api_key: str, processing_delay: float):
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.upstream_api_key = upstream_api_key
+        self.processing_delay = processing_delay
+        self.lock = threading.Lock()
+        self.files: dict[str, dict] = {}
+        self.file_contents: dict[str, bytes] = {}
+        self.batches: dict[str, dict] = {}
+
+    def add_file(self, filename: str, purpose: str, content: bytes) -> dict:
+        file_object = {
+            "id": f"file-{uuid.uuid4().hex}",
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+        with self.lock:
+            self.files[file_object["id"]] = file_object
+            self.file_contents[file_object["id"]] = content
+        return file_object
+
+    def create_batch(self, input_file_id: str, endpoint: str, completion_window: str, metadata) -> dict:
+        now = int(time.time())
+        batch = {
+            "id": f"batch_{uuid.uuid4().hex}",
+            "object": "batch",
+            "endpoint": endpoint,
+            "errors": None,
+            "input_file_id": input_file_id,
+            "completion_window": completion_window,
+            "status": "validating",
+            "output_file_id": None,
+            "error_file_id": None,
+            "created_at": now,
+            "in_progress_at": None,
+            "expires_at": now + 24 * 3600,
+            "finalizing_at": None,
+            "completed_at": None,
+            "failed_at": None,
+            "expired_at": None,
+            "cancelling_at": None,
+            "cancelled_at": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+            "metadata": metadata,
+        }
+        with self.lock:
+            self.batches[batch["id"]] = batch
+        threading.Thread(target=self._run_batch, args=(batch["id"],), daemon=True).start()
+        return batch
+
+    def _run_batch(self, batch_id: str) -> None:
+        with self.lock:
+            batch = self.batches[batch_id]
+            content = self.file_contents.get(batch["input_file_id"])
+        if content is None:
+            self._update(
+                batch_id,
+                status="failed",
+                failed_at=int(time.time()),
+                errors={
+                    "object": "list",
+                    "data": [{"code": "invalid_file", "message": "Input file not found."}],
+                },
+            )
+            return
+
+        request_lines = [
+            json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip()
+        ]
+        self._update(
+            batch_id,
+            status="in_progress",
+            in_progress_at=int(time.time()),
+            request_counts={"total": len(request_lines), "completed": 0, "failed": 0},
+        )
+
+        output_lines, error_lines = [], []
+        for request_line in request_lines:
+            if self.batches[batch_id]["status"] == "cancelling":
+                break
+            time.sleep(self.processing_delay)
+            output_line = {
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": request_line["custom_id"],
+                "response": None,
+                "error": None,
+            }
+            try:
+                status_code, body = self._send(request_line["url"], request_line["body"])
+                output_line["response"] = {
+                    "status_code": status_code,
+                    "request_id": uuid.uuid4().hex,
+                    "body": body,
+                }
+            except Exception as e:
+                status_code = None
+                output_line["error"] = {"code": "upstream_error", "message": str(e)}
+            with self.lock:
+                counts = self.batches[batch_id]["request_counts"]
+                if status_code == 200:
+                    counts["completed"] += 1
+                    output_lines.append(output_line)
+                else:
+                    counts["failed"] += 1
+                    error_lines.append(output_line)
+
+        updates = {"status": "finalizing", "finalizing_at": int(time.time())}
+        if output_lines:
+            updates["output_file_id"] = self.add_file(
+                f"{batch_id}_output.jsonl", "batch_output", _to_jsonl(output_lines)
+            )["id"]
+        if error_lines:
+            updates["error_file_id"] = self.add_file(
+                f"{batch_id}_error.jsonl", "batch_output", _to_jsonl(error_lines)
+            )["id"]
+        self._update(batch_id, **updates)
+        if self.batches[batch_id]["status"] == "cancelling":
+            self._update(batch_id, status="cancelled", cancelled_at=int(time.time()))
+        else:
+            self._update(batch_id, status="completed", completed_at=int(time.time()))
+
+    def _send(self, url: str, body: dict) -> tuple[int, dict]:
+        if self.upstream is None:
+            return 200, _stub_response(url, body)
+        # The request urls are `/v1/...`, and the upstream base url already ends with `/v1`
+        route = url[len("/v1"):] if url.startswith("/v1/") else url
+        response = requests.post(
+            f"{self.upstream}{route}",
+            json=body,
+            headers={"Authorization": f"Bearer {self.upstream_api_key}"},
+            timeout=600,
+        )
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, {"error": {"message": response.text}}
+
+    def _update(self, batch_id: str, **fields) -> None:
+        with self.lock:
+            self.batches[batch_id].update(fields)
+
+    def cancel_batch(self, batch_id: str) -> Optional[dict]:
+        with self.lock:
+            batch = self.batches.get(batch_id)
+            if batch is None:
+                return None
+            if batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+                batch["status"] = "cancelling"
+                batch["cancelling_at"] = int(time.time())
+            return dict(batch)
+
+
+def _to_jsonl(lines: list[dict]) -> bytes:
+    return "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+
+
+def _stub_response(url: str, body: dict) -> dict:
+    now = int(time.time())
+    if url.endswith("/responses"):
+        return {
+            "id": f"resp_{uuid.uuid4().hex}",
+            "object": "response",
+            "created_at": now,
+            "model": body.get("model", ""),
+            "status": "completed",
+            "output": [
+                {
+                    "id": f"msg_{uuid.uuid4().hex}",
+                    "type": "message",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [{"type": "output_text", "text": "", "annotations": []}],
+                }
+            ],
+            "parallel_tool_calls": True,
+            "tool_choice": "auto",
+            "tools": [],
+            "usage": {
+                "input_tokens": 0,
+                "input_tokens_details": {"cached_tokens": 0},
+                "output_tokens": 0,
+                "output_tokens_details": {"reasoning_tokens": 0},
+                "total_tokens": 0,
+            },
+        }
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": now,
+        "model": body.get("model", ""),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": ""},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def make_request_handler(store: BatchStore):
+    class BatchRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status_code: int, payload: dict) -> None:
+            self._send_bytes(status_code, json.dumps(payload).encode("utf-8"), "application/json")
+
+        def _send_bytes(self, status_code: int, content: bytes, content_type: str) -> None:
+            self.send_response(status_code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def _not_found(self) -> None:
+            self._send_json(
+                404, {"error": {"message": f"Unknown route {self.command} {self.path}"}}
+            )
+
+        def _read_body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        def do_GET(self):
+            parts = self.path.split("?", 1)[0].strip("/").split("/")
+            if parts[:2] == ["v1", "files"] and len(parts) == 4 and parts[3] == "content":
+                content = store.file_contents.get(parts[2])
+                if content is None:
+                    return self._not_found()
+                return self._send_bytes(200, content, "application/octet-stream")
+            if parts[:2] == ["v1", "files"] and len(parts) == 3 and parts[2] in store.files:
+                return self._send_json(200, store.files[parts[2]])
+            if parts[:2] == ["v1", "batches"] and len(parts) == 3 and parts[2] in store.batches:
+                with store.lock:
+                    return self._send_json(200, store.batches[parts[2]])
+            return self._not_found()
+
+        def do_POST(self):
+            parts = self.path.split("?", 1)[0].strip("/").split("/")
+            body = self._read_body()
+            if parts == ["v1", "files"]:
+                fields = _parse_multipart(self.headers.get("Content-Type", ""), body)
+                filename, content = fields["file"]
+                return self._send_json(
+                    200, store.add_file(filename, fields["purpose"][1].decode(), content)
+                )
+            if parts == ["v1", "batches"]:
+                payload = json.loads(body)
+                if payload["input_file_id"] not in store.files:
+                    return self._send_json(400, {"error": {"message": "Input file not found."}})
+                return self._send_json(
+                    200,
+                    store.create_batch(
+                        payload["input_file_id"],
+                        payload["endpoint"],
+                        payload.get("completion_window", "24h"),
+                        payload.get("metadata"),
+                    ),
+                )
+            if parts[:2] == ["v1", "batches"] and len(parts) == 4 and parts[3] == "cancel":
+                batch = store.cancel_batch(parts[2])
+                if batch is None:
+                    return self._not_found()
+                return self._send_json(200, batch)
+            return self._not_found()
+
+        def log_message(self, format, *args):
+            pass
+
+    return BatchRequestHandler
+
+
+def _parse_multipart(content_type: str, body: bytes) -> dict[str, tuple[Optional[str], bytes]]:
+    message = BytesParser(policy=HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + body
+    )
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        fields[name] = (part.get_filename(), part.get_payload(decode=True))
+    return fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenAI Files and Batches API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument(
+        "--upstream",
+        default=None,
+        help="Base url (ending with /v1) of an OpenAI-compatible server to run the batch requests against. Without it, every request gets an empty assistant message.",
+    )
+    parser.add_argument("--upstream-api-key", default="EMPTY")
+    parser.add_argument(
+        "--processing-delay",
+        type=float,
+        default=0.0,
+        help="Seconds to wait before running each request, to exercise the status polling.",
+    )
+    args = parser.parse_args()
+
+    store = BatchStore(args.upstream, args.upstream_api_key, args.processing_delay)
+    server = ThreadingHTTPServer((args.host, args.port), make_request_handler(store))
+    print(f"Local batch server listening on http://{args.host}:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import json
 import os
 import re
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
@@ -761,6 +762,22 @@ def process_agentic_test_case(test_cases: list[dict]) -> list[dict]:
     return test_cases
 
 
+@lru_cache(maxsize=None)
+def _read_multi_turn_func_doc_lines(func_collection: str) -> tuple[str, ...]:
+    with open(
+        MULTI_TURN_FUNC_DOC_PATH / MULTI_TURN_FUNC_DOC_FILE_MAPPING[func_collection]
+    ) as f:
+        return tuple(f.readlines())
+
+
+def _load_multi_turn_func_doc(func_collection: str) -> list[dict]:
+    """
+    Load the function doc of a multi-turn backend class. The file is only read once per process.
+    Each call parses a fresh copy, since the function docs get modified in place later on (e.g. by `add_language_specific_hint_to_function_doc`).
+    """
+    return [json.loads(line) for line in _read_multi_turn_func_doc_lines(func_collection)]
+
+
 def populate_test_cases_with_predefined_functions(test_cases: list[dict]) -> list[dict]:
     """
     Multi-turn and Agentic test cases don't have the function doc in the prompt. We need to add them here.
@@ -772,9 +789,7 @@ def populate_test_cases_with_predefined_functions(test_cases: list[dict]) -> lis
         entry["function"] = []
         for func_collection in involved_classes:
             # func_doc is a list of dict
-            func_doc = load_file(
-                MULTI_TURN_FUNC_DOC_PATH / MULTI_TURN_FUNC_DOC_FILE_MAPPING[func_collection]
-            )
+            func_doc = _load_multi_turn_func_doc(func_collection)
             entry["function"].extend(func_doc)
 
         # Handle Miss Func category; we need to remove the holdout function doc
@@ -0,0 +1,87 @@
+import random
+
+from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.message_api import (
+    MessageAPI,
+)
+
+
+def _load(inbox):
+    api = MessageAPI()
+    api._load_scenario({"inbox": inbox, "current_user": "USR001"})
+    return api
+
+
+def _baseline_delete_message(inbox, receiver_id):
+    """
+    `MessageAPI.delete_message` before the indexes were added, applied to a plain inbox list.
+    """
+    for message in inbox[::-1]:
+        receiver, _ = list(message.items())[0]
+        if receiver == receiver_id:
+            inbox.remove(message)
+            return
+
+
+def _baseline_view_messages_sent(inbox):
+    sent_messages = {}
+    for message in inbox:
+        receiver, message_content = list(message.items())[0]
+        sent_messages.setdefault(receiver, []).append(message_content)
+    return sent_messages
+
+
+def _baseline_search_messages(inbox, keyword):
+    results = []
+    for message in inbox:
+        receiver_id, message_content = list(message.items())[0]
+        if keyword.lower() in message_content.lower():
+            results.append({"receiver_id": receiver_id, "message": message_content})
+    return results
+
+
+def test_delete_message_with_duplicates_removes_first_equal_entry():
+    api = _load([{"USR002": "hi"}, {"USR003": "x"}, {"USR002": "hi"}])
+
+    api.delete_message("USR002")
+
+    assert api.inbox == [{"USR003": "x"}, {"USR002": "hi"}]
+    # The receivers follow the order of their first message in the remaining inbox
+    assert list(api.view_messages_sent()["messages"].items()) == [
+        ("USR003", ["x"]),
+        ("USR002", ["hi"]),
+    ]
+    assert api.search_messages("hi")["results"] == [
+        {"receiver_id": "USR002", "message": "hi"}
+    ]
+
+
+def test_delete_message_matches_baseline_on_random_inboxes():
+    rng = random.Random(0)
+    receivers = ["USR002", "USR003", "USR004"]
+    contents = ["hi", "hello there", "upload the file"]
+
+    for _ in range(200):
+        inbox = [
+            {rng.choice(receivers): rng.choice(contents)} for _ in range(rng.randint(0, 8))
+        ]
+        expected_inbox = [dict(message) for message in inbox]
+        api = _load(inbox)
+
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.3:
+                receiver_id, content = rng.choice(receivers), rng.choice(contents)
+                api.send_message(receiver_id, content)
+                expected_inbox.append({receiver_id: content})
+            else:
+                receiver_id = rng.choice(receivers)
+                api.delete_message(receiver_id)
+                _baseline_delete_message(expected_inbox, receiver_id)
+
+            assert api.inbox == expected_inbox
+            assert list(api.view_messages_sent()["messages"].items()) == list(
+                _baseline_view_messages_sent(expected_inbox).items()
+            )
+            for keyword in ["hi", "the"]:
+                assert api.search_messages(keyword)["results"] == _baseline_search_messages(
+                    expected_inbox, keyword
+                )